@@ -0,0 +1,55 @@
+"""
+Benchmark a batch of small vectors against as many `Vector` objects, for an add, a dot product and the norms.
+
+Run it from the root of the repository with ``python -m benchmarks.batch``.
+"""
+import argparse
+import random
+import time
+import typing as t
+
+from hypemaths import Vector, VectorBatch
+
+
+def _best_of(func: t.Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def _objects(first: t.List[Vector], second: t.List[Vector]) -> None:
+    sums = [a + b for a, b in zip(first, second)]
+    [a @ b for a, b in zip(sums, second)]
+    [Vector.absolute(vector) for vector in sums]
+
+
+def _batched(first: VectorBatch, second: VectorBatch) -> None:
+    sums = first + second
+    sums @ second
+    sums.norms()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dimensions", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'count':>9} {'objects':>10} {'batch':>10} {'speedup':>8}")
+    for count in args.counts:
+        points = [[random.random() for _ in range(args.dimensions)] for _ in range(2 * count)]
+        first, second = [Vector(*p) for p in points[:count]], [Vector(*p) for p in points[count:]]
+        batch_first, batch_second = VectorBatch(points[:count]), VectorBatch(points[count:])
+
+        objects = _best_of(lambda: _objects(first, second), args.repeat)
+        batched = _best_of(lambda: _batched(batch_first, batch_second), args.repeat)
+        print(f"{count:>9} {objects:>9.3f}s {batched:>9.3f}s {objects / batched:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark the factorizations of dense matrices: Cholesky against LU on symmetric positive definite covariance matrices,
+and the QR and singular value factorizations of tall least squares problems.
+
+Run it from the root of the repository with ``python -m benchmarks.decompositions``.
+"""
+import argparse
+import time
+import typing as t
+
+from hypemaths import Matrix, Vector
+from hypemaths.linalg import CholeskyDecomposition, LUDecomposition, QRDecomposition, SVDDecomposition
+from hypemaths.random import Generator
+
+
+def covariance(generator: Generator, size: int) -> Matrix:
+    """The sample covariance of ``2 * size`` normal observations of ``size`` variables, positive definite."""
+    samples = generator.normal((2 * size, size))
+    return (samples.transpose() @ samples) / (2 * size)
+
+
+def best_time(function: t.Callable[[], t.Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 32, 96])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = Generator(args.seed)
+
+    print(f"{'size':>6} {'factorization':>14} {'factorize':>12} {'solve':>12} {'speedup':>8}")
+    for size in args.sizes:
+        matrix = covariance(generator, size)
+        rhs = Vector([1.0] * size)
+
+        lu_time = best_time(lambda: LUDecomposition(matrix), args.repeat)
+        cholesky_time = best_time(lambda: CholeskyDecomposition(matrix), args.repeat)
+        lu, cholesky = LUDecomposition(matrix), CholeskyDecomposition(matrix)
+
+        for name, factorize, decomposition in (("lu", lu_time, lu), ("cholesky", cholesky_time, cholesky)):
+            solve = best_time(lambda: decomposition.solve(rhs), args.repeat)
+            print(
+                f"{size:>6} {name:>14} {factorize * 1e3:>10.3f}ms {solve * 1e3:>10.3f}ms "
+                f"{lu_time / factorize:>7.2f}x"
+            )
+
+    print(f"\n{'rows':>6} {'cols':>6} {'factorization':>14} {'factorize':>12} {'solve':>12}")
+    for size in args.sizes:
+        matrix = generator.normal((2 * size, size))
+        rhs = Vector([1.0] * 2 * size)
+
+        for name, factorization in (("qr", QRDecomposition), ("svd", SVDDecomposition)):
+            factorize = best_time(lambda: factorization(matrix), args.repeat)
+            decomposition = factorization(matrix)
+            solve = best_time(lambda: decomposition.solve(rhs), args.repeat)
+            print(f"{2 * size:>6} {size:>6} {name:>14} {factorize * 1e3:>10.3f}ms {solve * 1e3:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark the queries of a hot loop on an unchanged matrix, reusing the results cached on it against computing them on
+every call, as after a write.
+
+Run it from the root of the repository with ``python -m benchmarks.derived_cache``.
+"""
+import argparse
+import timeit
+import typing as t
+
+from hypemaths import Matrix
+from hypemaths.random import Generator
+
+QUERIES: t.Dict[str, t.Callable[[Matrix], t.Any]] = {
+    "dims": lambda matrix: matrix.dims,
+    "size": lambda matrix: matrix.size,
+    "trace": lambda matrix: matrix.trace(),
+    "sum": lambda matrix: matrix.sum(),
+    "frobenius_norm": lambda matrix: matrix.frobenius_norm(),
+    "determinant": lambda matrix: matrix.determinant(),
+}
+
+
+def per_call(function: t.Callable[[], t.Any], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 32, 128])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = Generator(args.seed)
+
+    print(f"{'size':>6} {'query':>16} {'cached':>12} {'computed':>12} {'speedup':>9}")
+    for size in args.sizes:
+        matrix = generator.normal((size, size))
+        cached = {name: per_call(lambda: query(matrix), args.number) for name, query in QUERIES.items()}
+        info = matrix.cache_info()
+
+        for name, query in QUERIES.items():
+
+            def computed() -> t.Any:
+                matrix.cache_clear()
+                return query(matrix)
+
+            uncached = per_call(computed, args.number)
+            print(
+                f"{size:>6} {name:>16} {cached[name] * 1e6:>10.2f}us {uncached * 1e6:>10.2f}us {uncached / cached[name]:>8.1f}x"
+            )
+
+        print(f"{'':>6} {'cache':>16} hits={info.hits} misses={info.misses} hit rate={info.hit_rate:.1%}")
+
+
+if __name__ == "__main__":
+    main()
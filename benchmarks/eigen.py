@@ -0,0 +1,59 @@
+"""
+Benchmark finding the leading eigenpairs of a sparse symmetric matrix with `top_k_eigen`, against the full dense
+eigendecomposition while it still fits in memory.
+
+Run it from the root of the repository with ``python -m benchmarks.eigen``.
+"""
+import argparse
+import random
+import time
+
+from hypemaths import SparseMatrix
+from hypemaths.linalg import eigvals, top_k_eigen
+
+
+def ranking_matrix(size: int, generator: random.Random) -> SparseMatrix:
+    """A sparse symmetric matrix of a few nonzeros per row, with a handful of dominant eigenvalues."""
+    cells = {}
+    for row in range(size):
+        cells[row, row] = generator.random() + (10 - row if row < 5 else 0)
+        for _ in range(2):
+            col, value = generator.randrange(size), generator.uniform(-0.1, 0.1)
+            cells[row, col] = cells.get((row, col), 0) + value
+            cells[col, row] = cells.get((col, row), 0) + value
+
+    return SparseMatrix((size, size), [(row, col, value) for (row, col), value in cells.items()])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10_000, 50_000])
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--dense-limit", type=int, default=200, help="The largest matrix also fully decomposed.")
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    print(f"{'size':>7} {'nonzeros':>9} {'lanczos':>9} {'subspace':>9} {'dense':>9}")
+    for size in args.sizes:
+        matrix = ranking_matrix(size, generator)
+
+        start = time.perf_counter()
+        top_k_eigen(matrix, args.k)
+        lanczos = time.perf_counter() - start
+
+        start = time.perf_counter()
+        top_k_eigen(matrix, args.k, symmetric=False)
+        subspace = time.perf_counter() - start
+
+        dense = "-"
+        if size <= args.dense_limit:
+            dense_matrix = matrix.to_dense()
+            start = time.perf_counter()
+            eigvals(dense_matrix)
+            dense = f"{time.perf_counter() - start:.3f}s"
+
+        print(f"{size:>7} {matrix.nnz:>9} {lanczos:>8.3f}s {subspace:>8.3f}s {dense:>9}")
+
+
+if __name__ == "__main__":
+    main()
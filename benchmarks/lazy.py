@@ -0,0 +1,53 @@
+"""
+Benchmark a chain of elementwise operations computed eagerly, with a matrix per step, against the same chain recorded
+lazily and evaluated in a single fused pass. Both the time and the peak memory are reported.
+
+Run it from the root of the repository with ``python -m benchmarks.lazy``.
+"""
+import argparse
+import time
+import tracemalloc
+import typing as t
+
+from hypemaths import Matrix, settings
+
+
+def _chain(a: Matrix, b: Matrix, c: Matrix, length: int) -> Matrix:
+    result = a + b - c
+    for step in range(length):
+        result = (result + a) * 0.5 if step % 2 else result - c
+    return result
+
+
+def _measure(func: t.Callable) -> t.Tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 512])
+    parser.add_argument("--chain", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'eager':>10} {'lazy':>10} {'eager peak':>12} {'lazy peak':>12}")
+    for size in args.sizes:
+        a, b, c = (Matrix.get_randomized_matrix((size, size), 0, 1) for _ in range(3))
+
+        eager_time, eager_peak = _measure(lambda: _chain(a, b, c, args.chain))
+        with settings.override(lazy=True):
+            lazy_time, lazy_peak = _measure(lambda: _chain(a, b, c, args.chain).evaluate())
+
+        print(
+            f"{size:>6} {eager_time:>9.3f}s {lazy_time:>9.3f}s "
+            f"{eager_peak / 2 ** 20:>9.1f}MiB {lazy_peak / 2 ** 20:>9.1f}MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the matrix multiplication kernels against each other, to find the sizes from which the blocked kernel and
+the Strassen algorithm start to pay off on a given machine.
+
+Run it from the root of the repository with ``python -m benchmarks.matmul``.
+"""
+import argparse
+import random
+import time
+import typing as t
+from array import array
+
+from hypemaths.core.matmul import blocked_matmul, naive_matmul, strassen_matmul
+
+
+def _best_of(func: t.Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[32, 64, 128, 256, 384, 512])
+    parser.add_argument("--block-size", type=int, default=64)
+    parser.add_argument("--strassen-threshold", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'naive':>10} {'blocked':>10} {'strassen':>10}  fastest")
+    for size in args.sizes:
+        a = array("d", [random.random() for _ in range(size * size)])
+        b = array("d", [random.random() for _ in range(size * size)])
+
+        timings = {
+            "naive": _best_of(lambda: naive_matmul(a, b, size, size, size), args.repeat),
+            "blocked": _best_of(lambda: blocked_matmul(a, b, size, size, size, args.block_size), args.repeat),
+            "strassen": _best_of(
+                lambda: strassen_matmul(a, b, size, size, size, args.strassen_threshold, args.block_size), args.repeat
+            ),
+        }
+
+        fastest = min(timings, key=timings.get)
+        print(
+            f"{size:>6} {timings['naive']:>9.3f}s {timings['blocked']:>9.3f}s {timings['strassen']:>9.3f}s  {fastest}"
+        )
+
+
+if __name__ == "__main__":
+    main()
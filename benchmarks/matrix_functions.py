@@ -0,0 +1,68 @@
+"""
+Benchmark the integer powers of row stochastic Markov transition matrices, by binary exponentiation against repeated
+multiplication, and the matrix exponential of general, triangular and diagonal matrices.
+
+Run it from the root of the repository with ``python -m benchmarks.matrix_functions``.
+"""
+import argparse
+import time
+import typing as t
+
+from hypemaths import Matrix
+from hypemaths.random import Generator
+
+
+def transition_matrix(generator: Generator, size: int) -> Matrix:
+    """A random ``size x size`` matrix of nonnegative rows summing to 1."""
+    weights = generator.uniform((size, size))
+    return Matrix([[value / sum(row) for value in row] for row in weights])
+
+
+def repeated_power(matrix: Matrix, exponent: int) -> Matrix:
+    power = matrix
+    for _ in range(exponent - 1):
+        power = power @ matrix
+    return power
+
+
+def timed(function: t.Callable[[], t.Any]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 32, 64])
+    parser.add_argument("--exponents", type=int, nargs="+", default=[16, 1000, 5000])
+    parser.add_argument("--repeated-limit", type=int, default=1000, help="The largest power also multiplied out.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = Generator(args.seed)
+
+    print(f"{'size':>6} {'exponent':>9} {'binary':>12} {'repeated':>12} {'speedup':>9}")
+    for size in args.sizes:
+        matrix = transition_matrix(generator, size)
+        for exponent in args.exponents:
+            binary = timed(lambda: matrix ** exponent)
+            if exponent <= args.repeated_limit:
+                repeated = timed(lambda: repeated_power(matrix, exponent))
+                print(f"{size:>6} {exponent:>9} {binary * 1e3:>10.3f}ms {repeated * 1e3:>10.3f}ms {repeated / binary:>8.1f}x")
+            else:
+                print(f"{size:>6} {exponent:>9} {binary * 1e3:>10.3f}ms {'-':>12} {'-':>9}")
+
+    print(f"\n{'size':>6} {'structure':>10} {'power':>12} {'expm':>12}")
+    for size in args.sizes:
+        general = generator.normal((size, size), std=1 / size)
+        upper = Matrix([[value if col >= row else 0.0 for col, value in enumerate(values)] for row, values in enumerate(general)])
+        diagonal = Matrix([[value if col == row else 0.0 for col, value in enumerate(values)] for row, values in enumerate(general)])
+
+        for name, matrix in (("general", general), ("upper", upper), ("diagonal", diagonal)):
+            power = timed(lambda: matrix ** args.exponents[-1])
+            exponential = timed(matrix.expm)
+            print(f"{size:>6} {name:>10} {power * 1e3:>10.3f}ms {exponential * 1e3:>10.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark the memoization of the inverses of a fixed pool of matrices, asked again and again in a random order, as a
+service would: recomputing every inverse, against memoizing them keyed by frozen matrices, and by mutable ones which
+are frozen on every call.
+
+Run it from the root of the repository with ``python -m benchmarks.memoize``.
+"""
+import argparse
+import random
+import time
+
+import hypemaths as hm
+from hypemaths.linalg import LUDecomposition
+from hypemaths.random import Generator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pool", type=int, default=2000, help="The number of distinct matrices.")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generator = Generator(args.seed)
+    pool = generator.matrices(args.pool, (args.size, args.size), "normal")
+    frozen_pool = [matrix.freeze() for matrix in pool]
+    order = random.Random(args.seed).choices(range(args.pool), k=args.requests)
+
+    @hm.memoize(maxsize=args.pool)
+    def inverse(matrix: hm.Matrix) -> hm.Matrix:
+        return LUDecomposition(matrix).inverse()
+
+    cases = (
+        # Factorized from scratch, the inverse cached along with the LU factorization of a matrix is not reused.
+        ("recomputed", lambda index: LUDecomposition(pool[index]).inverse()),
+        ("memoized, frozen", lambda index: inverse(frozen_pool[index])),
+        ("memoized, mutable", lambda index: inverse(pool[index])),
+    )
+
+    print(f"{'inverse':>18} {'total':>10} {'per request':>14} {'hit rate':>9}")
+    for name, request in cases:
+        inverse.cache_clear()
+        start = time.perf_counter()
+        for index in order:
+            request(index)
+        elapsed = time.perf_counter() - start
+
+        info = inverse.cache_info()
+        rate = f"{info.hits / (info.hits + info.misses):.1%}" if info.misses else "-"
+        print(f"{name:>18} {elapsed:>9.3f}s {elapsed / args.requests * 1e6:>12.2f}us {rate:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure the bytes taken by every `Point` and `Vector` object, against the objects with a `__dict__` they replaced.
+
+Run it from the root of the repository with ``python -m benchmarks.memory``.
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+import typing as t
+
+from hypemaths import Point, Vector
+
+
+class _DictPoint:
+    """A point keeping its coordinates in a `__dict__`, as `Point` did before being slotted."""
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+class _DictVector:
+    """A vector copying its first points into `__dict__` attributes, as `Vector` did before being slotted."""
+    def __init__(self, *points: float) -> None:
+        self.points = list(points)
+        for attribute, value in zip("xyzw", self.points):
+            setattr(self, attribute, value)
+
+
+def _bytes_per_instance(factory: t.Callable[..., t.Any], dimensions: int, count: int) -> float:
+    coordinates = [[random.random() for _ in range(dimensions)] for _ in range(count)]
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(*values) for values in coordinates]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding the instances is not part of them.
+    return (after - before - instances.__sizeof__()) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+
+    cases = [
+        ("Point", 2, Point, _DictPoint),
+        ("Vector", 2, Vector, _DictVector),
+        ("Vector", 3, Vector, _DictVector),
+        ("Vector", 4, Vector, _DictVector),
+    ]
+
+    print(f"{'object':>8} {'dims':>5} {'slotted':>10} {'__dict__':>10} {'saved':>7}")
+    for name, dimensions, slotted, legacy in cases:
+        slotted_bytes = _bytes_per_instance(slotted, dimensions, args.count)
+        legacy_bytes = _bytes_per_instance(legacy, dimensions, args.count)
+        print(
+            f"{name:>8} {dimensions:>5} {slotted_bytes:>9.1f}B {legacy_bytes:>9.1f}B "
+            f"{1 - slotted_bytes / legacy_bytes:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
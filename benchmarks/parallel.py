@@ -0,0 +1,54 @@
+"""
+Benchmark the scaling of the parallel backend from 1 to N worker processes, on a matrix product and an elementwise
+addition, reporting the speedup and the efficiency (the speedup divided by the number of workers).
+
+Run it from the root of the repository with ``python -m benchmarks.parallel``.
+"""
+import argparse
+import os
+import time
+import typing as t
+
+from hypemaths import Matrix, settings, use_backend
+
+
+def _best_of(func: t.Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--workers", type=int, nargs="+", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers = args.workers or sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+
+    a = Matrix.get_randomized_matrix((args.size, args.size), 0, 1)
+    b = Matrix.get_randomized_matrix((args.size, args.size), 0, 1)
+    operations = {"matmul": lambda: a.matmul(b), "add": lambda: a.add(b)}
+
+    print(f"{args.size}x{args.size} matrices, {cores} cores")
+    print(f"{'workers':>8} {'operation':>10} {'time':>10} {'speedup':>8} {'efficiency':>11}")
+    baselines = {}
+    for count in workers:
+        # A single worker is timed in the calling process, as the baseline without any dispatching.
+        with settings.override(parallel_workers=count, parallel_threshold=0), use_backend("parallel"):
+            for name, operation in operations.items():
+                operation()
+                timing = _best_of(operation, args.repeat)
+                baseline = baselines.setdefault(name, timing)
+                speedup = baseline / timing
+                print(f"{count:>8} {name:>10} {timing:>9.3f}s {speedup:>7.2f}x {speedup / count:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
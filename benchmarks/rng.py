@@ -0,0 +1,52 @@
+"""
+Benchmark drawing random matrices with `hypemaths.random.Generator`, against `Matrix.get_randomized_matrix`, and with
+a growing number of worker processes.
+
+Run it from the root of the repository with ``python -m benchmarks.rng``.
+"""
+import argparse
+import time
+import typing as t
+
+from hypemaths import Matrix
+from hypemaths.random import Generator
+
+
+def _best_of(func: t.Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=32)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    dims = (args.size, args.size)
+    generator = Generator(0)
+
+    cases = {
+        "get_randomized_matrix": lambda: [Matrix.get_randomized_matrix(dims, 0, 1) for _ in range(args.count)],
+        "uniform": lambda: [generator.uniform(dims) for _ in range(args.count)],
+        "normal": lambda: [generator.normal(dims) for _ in range(args.count)],
+        "integers": lambda: [generator.integers(dims, 0, 100) for _ in range(args.count)],
+        "sparse (1%)": lambda: [generator.sparse(dims, 0.01) for _ in range(args.count)],
+    }
+    for workers in args.workers:
+        cases[f"matrices, {workers} workers"] = lambda workers=workers: generator.matrices(args.count, dims, workers=workers)
+
+    print(f"{args.count} matrices of {dims}")
+    for name, func in cases.items():
+        print(f"{name:>24} {_best_of(func, args.repeat):>9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
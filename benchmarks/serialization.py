@@ -0,0 +1,55 @@
+"""
+Benchmark loading many small cached matrices, from the pickled nested lists, from pickled matrices, and from files in
+the binary format, either read or memory-mapped.
+
+Run it from the root of the repository with ``python -m benchmarks.serialization``.
+"""
+import argparse
+import os
+import pickle
+import tempfile
+import time
+import typing as t
+
+from hypemaths import Matrix
+
+
+def _timed(func: t.Callable) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--size", type=int, default=64)
+    args = parser.parse_args()
+
+    matrices = [Matrix.get_randomized_matrix((args.size, args.size), 0, 1) for _ in range(args.count)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"{index}.hm") for index in range(args.count)]
+        for path, matrix in zip(paths, matrices):
+            matrix.save(path)
+
+        nested = [pickle.dumps(matrix.matrix) for matrix in matrices]
+        pickled = [pickle.dumps(matrix) for matrix in matrices]
+        mapped = []
+
+        timings = {
+            "nested lists": _timed(lambda: [Matrix(pickle.loads(data)) for data in nested]),
+            "pickle": _timed(lambda: [pickle.loads(data) for data in pickled]),
+            "load": _timed(lambda: [Matrix.load(path) for path in paths]),
+            "load mmap": _timed(lambda: mapped.extend(Matrix.load(path, mmap_mode="r") for path in paths)),
+        }
+        for matrix in mapped:
+            matrix.close()
+
+    print(f"{args.count} matrices of {args.size}x{args.size}")
+    for name, timing in timings.items():
+        print(f"{name:>14} {timing:>9.4f}s")
+
+
+if __name__ == "__main__":
+    main()
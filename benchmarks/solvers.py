@@ -0,0 +1,66 @@
+"""
+Benchmark the iterative solvers on the sparse 2D Poisson system of a square grid, against the dense LU solve while it
+still fits in memory.
+
+Run it from the root of the repository with ``python -m benchmarks.solvers``.
+"""
+import argparse
+import time
+
+from hypemaths import SparseMatrix, Vector
+from hypemaths.linalg import conjugate_gradient, gauss_seidel, gmres, jacobi, jacobi_preconditioner
+
+
+def poisson(edge: int) -> SparseMatrix:
+    """The five points Laplacian of a ``edge x edge`` grid, with ``edge ** 2`` unknowns."""
+    entries = []
+    for row in range(edge):
+        for col in range(edge):
+            index = row * edge + col
+            entries.append((index, index, 4.0))
+            for neighbour_row, neighbour_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if 0 <= neighbour_row < edge and 0 <= neighbour_col < edge:
+                    entries.append((index, neighbour_row * edge + neighbour_col, -1.0))
+
+    return SparseMatrix((edge * edge, edge * edge), entries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--edges", type=int, nargs="+", default=[16, 64, 128])
+    parser.add_argument("--tol", type=float, default=1e-6)
+    parser.add_argument("--dense-limit", type=int, default=1024, help="The largest system also solved by LU.")
+    args = parser.parse_args()
+
+    print(f"{'unknowns':>9} {'nonzeros':>9} {'solver':>22} {'iterations':>11} {'residual':>10} {'time':>9}")
+    for edge in args.edges:
+        matrix = poisson(edge)
+        rhs = Vector([1.0] * matrix.rows)
+
+        solvers = {
+            "conjugate_gradient": lambda: conjugate_gradient(matrix, rhs, tol=args.tol),
+            "conjugate_gradient+M": lambda: conjugate_gradient(
+                matrix, rhs, tol=args.tol, preconditioner=jacobi_preconditioner(matrix)
+            ),
+            "gmres(30)": lambda: gmres(matrix, rhs, tol=args.tol),
+            "gauss_seidel": lambda: gauss_seidel(matrix, rhs, tol=args.tol, max_iterations=200),
+            "jacobi": lambda: jacobi(matrix, rhs, tol=args.tol, max_iterations=200),
+        }
+        if matrix.rows <= args.dense_limit:
+            dense = matrix.to_dense()
+            solvers["lu (dense)"] = lambda: dense.solve(rhs)
+
+        for name, solve in solvers.items():
+            start = time.perf_counter()
+            solution = solve()
+            elapsed = time.perf_counter() - start
+
+            if isinstance(solution, Vector):
+                iterations, residual = "-", "-"
+            else:
+                iterations, residual = solution.iterations, f"{solution.residual:.1e}"
+            print(f"{matrix.rows:>9} {matrix.nnz:>9} {name:>22} {iterations:>11} {residual:>10} {elapsed:>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
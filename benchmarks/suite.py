@@ -0,0 +1,255 @@
+"""
+Time every public operation of `Matrix`, `Vector` and `hypemaths.utils` across a sweep of sizes and dtypes, and compare
+two runs to flag the regressions.
+
+Run it from the root of the repository with:
+
+- ``python -m benchmarks.suite run --output results.json`` to time the operations and save them as JSON.
+- ``python -m benchmarks.suite compare baseline.json results.json`` to compare two runs. It exits with the status 1
+  when an operation got slower by more than the threshold, so it can gate a CI job.
+
+A size ``n`` stands for ``n x n`` matrices, and vectors of ``n * n`` points.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+import typing as t
+
+import hypemaths as hm
+from hypemaths import Matrix, Vector, settings
+from hypemaths.utils import linspace, norm, scale_list
+
+DTYPES = ("int", "float")
+
+# The setup of every case, building the operands of a size and dtype, and returning the operation to be timed.
+Setup = t.Callable[[int, str], t.Callable[[], t.Any]]
+CASES: t.Dict[str, Setup] = {}
+
+
+def case(name: str) -> t.Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+def _values(count: int, dtype: str) -> list:
+    # Nonzero values, so that the divisions are defined.
+    if dtype == "int":
+        return [random.randint(1, 9) for _ in range(count)]
+    return [random.uniform(1, 2) for _ in range(count)]
+
+
+def _matrix(size: int, dtype: str) -> Matrix:
+    values = _values(size * size, dtype)
+    return Matrix([values[row * size:(row + 1) * size] for row in range(size)])
+
+
+def _vector(size: int, dtype: str) -> Vector:
+    return Vector(_values(size * size, dtype))
+
+
+def _binary_matrix_case(name: str, operation: t.Callable[[Matrix, Matrix], t.Any]) -> None:
+    @case(name)
+    def setup(size: int, dtype: str) -> t.Callable[[], t.Any]:
+        a, b = _matrix(size, dtype), _matrix(size, dtype)
+        return lambda: operation(a, b)
+
+
+def _unary_matrix_case(name: str, operation: t.Callable[[Matrix], t.Any]) -> None:
+    @case(name)
+    def setup(size: int, dtype: str) -> t.Callable[[], t.Any]:
+        a = _matrix(size, dtype)
+        return lambda: operation(a)
+
+
+def _binary_vector_case(name: str, operation: t.Callable[[Vector, Vector], t.Any]) -> None:
+    @case(name)
+    def setup(size: int, dtype: str) -> t.Callable[[], t.Any]:
+        a, b = _vector(size, dtype), _vector(size, dtype)
+        return lambda: operation(a, b)
+
+
+def _unary_vector_case(name: str, operation: t.Callable[[Vector], t.Any]) -> None:
+    @case(name)
+    def setup(size: int, dtype: str) -> t.Callable[[], t.Any]:
+        a = _vector(size, dtype)
+        return lambda: operation(a)
+
+
+@case("matrix.construct")
+def _matrix_construct(size: int, dtype: str) -> t.Callable[[], t.Any]:
+    values = _matrix(size, dtype).matrix
+    return lambda: Matrix(values)
+
+
+_binary_matrix_case("matrix.add", lambda a, b: a + b)
+_binary_matrix_case("matrix.sub", lambda a, b: a - b)
+_binary_matrix_case("matrix.matmul", lambda a, b: a @ b)
+_binary_matrix_case("matrix.divide", lambda a, b: a / b)
+_unary_matrix_case("matrix.scale", lambda a: a * 3)
+_unary_matrix_case("matrix.divide_scalar", lambda a: a / 3)
+_unary_matrix_case("matrix.abs", abs)
+_unary_matrix_case("matrix.transpose", lambda a: a.transpose())
+_unary_matrix_case("matrix.transpose_copy", lambda a: a.transpose().materialize())
+_unary_matrix_case("matrix.determinant", lambda a: a.determinant())
+_unary_matrix_case("matrix.trace", lambda a: a.trace())
+_unary_matrix_case("matrix.sum", lambda a: a.sum())
+_unary_matrix_case("matrix.sum_columns", lambda a: a.sum(0))
+_unary_matrix_case("matrix.sum_rows", lambda a: a.sum(1))
+_unary_matrix_case("matrix.frobenius_norm", lambda a: a.frobenius_norm())
+_unary_matrix_case("matrix.flatten", lambda a: a.flatten())
+_unary_matrix_case("matrix.clone", lambda a: a.clone())
+
+
+@case("vector.construct")
+def _vector_construct(size: int, dtype: str) -> t.Callable[[], t.Any]:
+    values = _values(size * size, dtype)
+    return lambda: Vector(values)
+
+
+_binary_vector_case("vector.add", lambda a, b: a + b)
+_binary_vector_case("vector.sub", lambda a, b: a - b)
+_binary_vector_case("vector.multiply", lambda a, b: a * b)
+_binary_vector_case("vector.divide", lambda a, b: a / b)
+_binary_vector_case("vector.dot", lambda a, b: a @ b)
+_binary_vector_case("vector.parallel_to", lambda a, b: a.parallel_to(b))
+_unary_vector_case("vector.abs", abs)
+_unary_vector_case("vector.mean", lambda a: a.mean())
+_unary_vector_case("utils.scale_list", lambda a: scale_list(a, (0, 1)))
+_unary_vector_case("utils.norm", norm)
+
+
+@case("utils.linspace")
+def _linspace(size: int, dtype: str) -> t.Callable[[], t.Any]:
+    end = 100 if dtype == "int" else 1.5
+    return lambda: linspace(0, end, size * size)
+
+
+def _best_time(operation: t.Callable[[], t.Any], repeat: int, min_time: float) -> float:
+    """
+    Returns
+    -------
+    float
+        The best time of a call, over `repeat` rounds of as many calls as take at least `min_time` seconds.
+    """
+    timer = timeit.Timer(operation)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 10
+
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(sizes: t.Sequence[int], dtypes: t.Sequence[str], repeat: int, min_time: float, pattern: str = "") -> dict:
+    """
+    Time every case matching the pattern, for every size and dtype.
+
+    Returns
+    -------
+    dict
+        The description of the machine and of the run, and the timings of every case.
+    """
+    # The same operands on every run, for the timings to be comparable.
+    random.seed(0)
+    results = []
+    for name, setup in CASES.items():
+        if pattern not in name:
+            continue
+
+        for dtype in dtypes:
+            for size in sizes:
+                seconds = _best_time(setup(size, dtype), repeat, min_time)
+                results.append({"name": name, "dtype": dtype, "size": size, "seconds": seconds})
+                print(f"{name:>24} {dtype:>6} {size:>6} {seconds * 1e6:>14.2f}us", file=sys.stderr)
+
+    return {
+        "metadata": {
+            "hypemaths": hm.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "backend": settings.backend,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": repeat,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+
+def _timings(report: dict) -> t.Dict[tuple, float]:
+    return {(result["name"], result["dtype"], result["size"]): result["seconds"] for result in report["results"]}
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> t.List[tuple]:
+    """
+    Compare the timings of the cases found in both runs.
+
+    Returns
+    -------
+    t.List[tuple]
+        The name, dtype and size of every case, its baseline and current timings, and whether it regressed, being
+        slower than the baseline by more than the `threshold` fraction.
+    """
+    before, after = _timings(baseline), _timings(current)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        ratio = after[key] / before[key]
+        rows.append(key + (before[key], after[key], ratio > 1 + threshold))
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Time the operations.")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=[4, 16, 64])
+    run_parser.add_argument("--dtypes", nargs="+", choices=DTYPES, default=list(DTYPES))
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.02, help="The shortest duration of a round, in seconds.")
+    run_parser.add_argument("--filter", default="", help="Only time the operations whose name contains this.")
+    run_parser.add_argument("--output", help="The JSON file to save the results into, printed if not given.")
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs, flagging the regressions.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="The slowdown tolerated, 0.1 for 10%%.")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = json.dumps(run(args.sizes, args.dtypes, args.repeat, args.min_time, args.filter), indent=2)
+        if args.output:
+            with open(args.output, "w") as file:
+                file.write(report + "\n")
+        else:
+            print(report)
+        return
+
+    with open(args.baseline) as baseline, open(args.current) as current:
+        rows = compare(json.load(baseline), json.load(current), args.threshold)
+
+    print(f"{'operation':>24} {'dtype':>6} {'size':>6} {'baseline':>14} {'current':>14} {'change':>8}")
+    for name, dtype, size, before, after, regressed in rows:
+        change = (after / before - 1) * 100
+        print(
+            f"{name:>24} {dtype:>6} {size:>6} {before * 1e6:>12.2f}us {after * 1e6:>12.2f}us {change:>+7.1f}%"
+            + ("  REGRESSION" if regressed else "")
+        )
+
+    regressions = sum(row[-1] for row in rows)
+    print(f"\n{len(rows)} operations compared, {regressions} regressed by more than {args.threshold:.0%}.")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark the construction of matrices and vectors under each validation level, and a chain of operations whose
+intermediate results skip the validation.
+
+Run it from the root of the repository with ``python -m benchmarks.validation``.
+"""
+import argparse
+import random
+import time
+import typing as t
+
+from hypemaths import Matrix, Vector, settings
+from hypemaths.config import VALIDATION_LEVELS
+
+
+def _best_of(func: t.Callable, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def _chain(matrix: Matrix, length: int) -> Matrix:
+    result = matrix
+    for _ in range(length):
+        result = result + matrix - matrix * 0.5
+    return result
+
+
+def _revalidated_chain(matrix: Matrix, length: int) -> Matrix:
+    # What the chain used to cost, when every intermediate result went through the public constructor.
+    result = matrix
+    for _ in range(length):
+        result = Matrix((result + matrix).matrix)
+        result = Matrix((result - matrix * 0.5).matrix)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--chain", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} " + " ".join(f"{level:>10}" for level in VALIDATION_LEVELS) + f" {'vector':>10}")
+    for size in args.sizes:
+        values = [[random.random() for _ in range(size)] for _ in range(size)]
+        points = [random.random() for _ in range(size * size)]
+
+        timings = []
+        for level in VALIDATION_LEVELS:
+            with settings.override(validation=level):
+                timings.append(_best_of(lambda: Matrix(values), args.repeat))
+
+        vector_timing = _best_of(lambda: Vector(points), args.repeat)
+        print(f"{size:>6} " + " ".join(f"{timing:>9.4f}s" for timing in timings) + f" {vector_timing:>9.4f}s")
+
+    print()
+    print(f"{'size':>6} {'trusted':>10} {'validated':>10}")
+    for size in args.sizes:
+        matrix = Matrix.get_randomized_matrix((size, size), 0, 1)
+        trusted = _best_of(lambda: _chain(matrix, args.chain), args.repeat)
+        validated = _best_of(lambda: _revalidated_chain(matrix, args.chain), args.repeat)
+        print(f"{size:>6} {trusted:>9.4f}s {validated:>9.4f}s")
+
+
+if __name__ == "__main__":
+    main()
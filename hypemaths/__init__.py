@@ -1,8 +1,26 @@
+from . import random
+from .backends import (
+    available_backends,
+    get_backend,
+    register_backend,
+    set_backend,
+    use_backend
+)
+from .caching import memoize
+from .config import settings
 from .models import (
+    FrozenMatrix,
+    FrozenVector,
+    LazyMatrix,
+    MappedMatrix,
     Matrix,
     Point,
-    Vector
+    PointSet,
+    SparseMatrix,
+    Vector,
+    VectorBatch
 )
+from .profiling import profile
 
 __author__ = "Deep Alchemy team"
 __email__ = "warriordefenderz@gmail.com"
@@ -0,0 +1,104 @@
+import contextlib
+import typing as t
+import warnings
+
+from .base import Backend
+from .numpy import NumpyBackend
+from .parallel import ParallelBackend
+from .python import PythonBackend
+from ..config import settings
+
+_backends: t.Dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend) -> None:
+    """
+    Register a compute backend, so it can be selected by its name.
+
+    Parameters
+    ----------
+    backend : Backend
+        The backend to be registered, under its `name`.
+    """
+    _backends[backend.name] = backend
+
+
+def available_backends() -> t.List[str]:
+    """
+    Returns
+    -------
+    t.List[str]
+        The names of the registered backends, which can be used in this environment.
+    """
+    return [name for name, backend in _backends.items() if backend.available]
+
+
+def get_backend(name: t.Optional[str] = None) -> Backend:
+    """
+    Parameters
+    ----------
+    name : t.Optional[str]
+        The name of the backend. Defaults to the one selected through `settings.backend`.
+
+    Returns
+    -------
+    Backend
+        The backend, or the pure Python one if its dependencies are not installed.
+
+    Raises
+    ------
+    ValueError
+        If no backend is registered with that name.
+    """
+    name = name or settings.backend
+
+    try:
+        backend = _backends[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend {name!r}, the registered backends are {list(_backends)}.") from None
+
+    if not backend.available:
+        warnings.warn(f"The {name!r} backend is not available, falling back to pure Python.", RuntimeWarning)
+        return _backends[PythonBackend.name]
+
+    return backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend used globally.
+
+    Parameters
+    ----------
+    name : str
+        The name of the backend.
+    """
+    get_backend(name)
+    settings.backend = name
+
+
+@contextlib.contextmanager
+def use_backend(name: str) -> t.Iterator[Backend]:
+    """
+    Select the backend used inside a ``with`` block.
+
+    Parameters
+    ----------
+    name : str
+        The name of the backend.
+
+    Examples
+    --------
+    >>> from hypemaths import Matrix, use_backend
+    >>> with use_backend("numpy"):
+    ...     Matrix([[1, 2], [3, 4]]).determinant()
+    -2.0000000000000004
+    """
+    backend = get_backend(name)
+    with settings.override(backend=name):
+        yield backend
+
+
+register_backend(PythonBackend())
+register_backend(NumpyBackend())
+register_backend(ParallelBackend())
@@ -0,0 +1,89 @@
+import abc
+import typing as t
+
+import hypemaths as hm
+
+
+class Backend(metaclass=abc.ABCMeta):
+    """
+    The interface of a compute backend, implementing the heavy `Matrix` and `Vector` operations.
+
+    The operands passed to a backend are always validated already, a backend only has to compute the result. The
+    operations returning a model take an optional destination ``out`` of the right dimensions, which the result has
+    to be written into and returned, instead of a new model.
+    """
+    name: str = None
+
+    @property
+    def available(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            If the dependencies of the backend are installed, and it can be used.
+        """
+        return True
+
+    @abc.abstractmethod
+    def matrix_add(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def matrix_sub(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def matrix_scale(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def matrix_divide(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def matrix_abs(self, a: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def matmul(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def transpose(self, a: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def determinant(self, a: "hm.Matrix") -> float:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def sum(self, a: "hm.Matrix", axis: t.Optional[int] = None) -> t.Union[int, float, "hm.Matrix"]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def frobenius_norm(self, a: "hm.Matrix") -> float:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def vector_add(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def vector_sub(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def vector_mul(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def vector_div(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def vector_dot(self, a: "hm.Vector", b: "hm.Vector") -> t.Union[int, float]:
+        raise NotImplementedError
@@ -0,0 +1,198 @@
+import typing as t
+from array import array
+
+import hypemaths as hm
+from .python import PythonBackend
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# The largest magnitude of the integer results computed by NumPy, under the 64 bits limit by a margin for the rounding
+# of the float bounds. NumPy wraps integers around silently, so the operations which could go past it are computed by
+# the pure Python backend, which raises an `OverflowError` if they do.
+INT_BOUND = 2.0 ** 62
+
+
+def to_numpy(matrix: "hm.Matrix") -> "np.ndarray":
+    """
+    Parameters
+    ----------
+    matrix : Matrix
+        The matrix, or the view, to be wrapped.
+
+    Returns
+    -------
+    np.ndarray
+        A read-only array over the buffer of the matrix, without copying it.
+    """
+    buffer = np.frombuffer(matrix._storage.data, dtype=np.int64 if matrix.typecode == "q" else np.float64)
+    row_stride, col_stride = matrix.strides
+
+    return np.lib.stride_tricks.as_strided(
+        buffer[matrix._offset:],
+        shape=matrix.dims,
+        strides=(row_stride * buffer.itemsize, col_stride * buffer.itemsize),
+        writeable=False
+    )
+
+
+def from_numpy(
+        cls: t.Type["hm.Matrix"], values: "np.ndarray", out: t.Optional["hm.Matrix"] = None
+) -> "hm.Matrix":
+    """
+    Parameters
+    ----------
+    cls : t.Type[Matrix]
+        The matrix class to be created.
+    values : np.ndarray
+        The 2D array to be converted.
+    out : t.Optional[Matrix]
+        The matrix to copy the values into, instead of a new one.
+
+    Returns
+    -------
+    Matrix
+        The matrix with a copy of the values of the array, integer arrays giving integer matrices.
+    """
+    if values.dtype.kind in "biu":
+        values, typecode = np.ascontiguousarray(values, dtype=np.int64), "q"
+    else:
+        values, typecode = np.ascontiguousarray(values, dtype=np.float64), "d"
+
+    data = array(typecode)
+    data.frombytes(values.tobytes())
+    if out is not None:
+        return out._assign(data, typecode)
+
+    return cls._from_flat(data, (int(values.shape[0]), int(values.shape[1])))
+
+
+def _is_integer(*arrays: "np.ndarray") -> bool:
+    return all(values.dtype.kind in "biu" for values in arrays)
+
+
+def _magnitude(values: "np.ndarray") -> float:
+    """The largest absolute value of the array, as a float so that it does not overflow itself."""
+    return float(np.abs(values, dtype=np.float64).max()) if values.size else 0.0
+
+
+def _total(values: "np.ndarray") -> float:
+    """The sum of the absolute values of the array, bounding any of its partial sums."""
+    return float(np.abs(values, dtype=np.float64).sum())
+
+
+def _vector_result(a: "hm.Vector", values: "np.ndarray", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+    """Convert the array of the result of an operation on a vector into a vector, or into ``out`` when given."""
+    if out is not None:
+        return out._assign(values.tolist())
+
+    return a._from_points(values.tolist())
+
+
+class NumpyBackend(PythonBackend):
+    """
+    The backend computing through NumPy, when it is installed.
+
+    The buffers of the models are wrapped by NumPy without being copied, only the results are copied back. The
+    operations NumPy cannot speed up, such as transposing which already is a view, are inherited from the pure Python
+    backend.
+    """
+    name = "numpy"
+
+    @property
+    def available(self) -> bool:
+        return np is not None
+
+    def matrix_add(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        x, y = to_numpy(a), to_numpy(b)
+        if _is_integer(x, y) and _magnitude(x) + _magnitude(y) >= INT_BOUND:
+            return super().matrix_add(a, b, out)
+
+        return from_numpy(a.__class__, x + y, out)
+
+    def matrix_sub(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        x, y = to_numpy(a), to_numpy(b)
+        if _is_integer(x, y) and _magnitude(x) + _magnitude(y) >= INT_BOUND:
+            return super().matrix_sub(a, b, out)
+
+        return from_numpy(a.__class__, x - y, out)
+
+    def matrix_scale(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        x = to_numpy(a)
+        if _is_integer(x) and isinstance(scalar, int) and _magnitude(x) * abs(scalar) >= INT_BOUND:
+            return super().matrix_scale(a, scalar, out)
+
+        return from_numpy(a.__class__, x * scalar, out)
+
+    def matrix_divide(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        return from_numpy(a.__class__, to_numpy(a) / scalar, out)
+
+    def matrix_abs(self, a: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        x = to_numpy(a)
+        if _is_integer(x) and _magnitude(x) >= INT_BOUND:
+            return super().matrix_abs(a, out)
+
+        return from_numpy(a.__class__, np.abs(x), out)
+
+    def matmul(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        x, y = to_numpy(a), to_numpy(b)
+        # Every partial sum of an element of the product is bounded by the largest absolute row sum of ``a`` times the
+        # largest absolute value of ``b``.
+        if _is_integer(x, y) and float(np.abs(x, dtype=np.float64).sum(axis=1).max()) * _magnitude(y) >= INT_BOUND:
+            return super().matmul(a, b, out)
+
+        return from_numpy(a.__class__, x @ y, out)
+
+    def determinant(self, a: "hm.Matrix") -> float:
+        return float(np.linalg.det(to_numpy(a)))
+
+    def sum(self, a: "hm.Matrix", axis: t.Optional[int] = None) -> t.Union[int, float, "hm.Matrix"]:
+        values = to_numpy(a)
+        if axis != 0 and _is_integer(values) and _total(values) >= INT_BOUND:
+            return super().sum(a, axis)
+
+        if axis is None:
+            return values.sum().item()
+        if axis == 0:
+            return from_numpy(a.__class__, values.sum(axis=0, dtype=np.float64).reshape(1, -1))
+        return from_numpy(a.__class__, values.sum(axis=1).reshape(-1, 1))
+
+    def frobenius_norm(self, a: "hm.Matrix") -> float:
+        return float(np.linalg.norm(to_numpy(a)))
+
+    def vector_add(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        x, y = np.asarray(a.points), np.asarray(b.points)
+        if _is_integer(x, y) and _magnitude(x) + _magnitude(y) >= INT_BOUND:
+            return super().vector_add(a, b, out)
+
+        return _vector_result(a, x + y, out)
+
+    def vector_sub(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        x, y = np.asarray(a.points), np.asarray(b.points)
+        if _is_integer(x, y) and _magnitude(x) + _magnitude(y) >= INT_BOUND:
+            return super().vector_sub(a, b, out)
+
+        return _vector_result(a, x - y, out)
+
+    def vector_mul(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        x, y = np.asarray(a.points), np.asarray(b.points)
+        if _is_integer(x, y) and _magnitude(x) * _magnitude(y) >= INT_BOUND:
+            return super().vector_mul(a, b, out)
+
+        return _vector_result(a, x * y, out)
+
+    def vector_div(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        return _vector_result(a, np.asarray(a.points) / np.asarray(b.points), out)
+
+    def vector_dot(self, a: "hm.Vector", b: "hm.Vector") -> t.Union[int, float]:
+        x, y = np.asarray(a.points), np.asarray(b.points)
+        if _is_integer(x, y) and _total(x) * _magnitude(y) >= INT_BOUND:
+            return super().vector_dot(a, b)
+
+        return np.dot(x, y).item()
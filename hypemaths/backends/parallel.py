@@ -0,0 +1,335 @@
+import atexit
+import operator
+import os
+import typing as t
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+
+import hypemaths as hm
+from .python import PythonBackend
+from ..config import settings
+from ..core import FLOAT_TYPECODE, infer_typecode, result_typecode
+from ..core.matmul import matmul
+
+# A matrix shared with the workers: the name of its shared memory block, its typecode, rows and columns.
+SharedSpec = t.Tuple[str, str, int, int]
+
+_executor: t.Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+
+def _attach(spec: SharedSpec) -> t.Tuple[SharedMemory, memoryview]:
+    """
+    Attach to the shared memory block of a matrix, from a worker.
+
+    Returns
+    -------
+    t.Tuple[SharedMemory, memoryview]
+        The block, and its values viewed with their typecode. The view has to be released before closing the block.
+    """
+    name, typecode, rows, cols = spec
+    shared = SharedMemory(name=name)
+    return shared, shared.buf[:rows * cols * array(typecode).itemsize].cast(typecode)
+
+
+def _detach(shared: SharedMemory, values: memoryview) -> None:
+    values.release()
+    shared.close()
+
+
+def _matmul_block(specs: t.Tuple[SharedSpec, ...], start: int, end: int) -> None:
+    """Multiply the rows ``start:end`` of the first matrix with the second one, writing them into the third one."""
+    attached = [_attach(spec) for spec in specs]
+    try:
+        (_, a), (_, b), (_, out) = attached
+        m, p = specs[0][3], specs[1][3]
+        product = matmul(a, b, end - start, m, p, a_layout=(start * m, m, 1), b_layout=(0, p, 1))
+        out[start * p:end * p] = array(specs[2][1], product)
+    finally:
+        for shared, values in attached:
+            _detach(shared, values)
+
+
+def _elementwise_block(
+        specs: t.Tuple[SharedSpec, ...], start: int, end: int, op: str, scalar: t.Optional[t.Union[int, float]]
+) -> None:
+    """
+    Apply an operation to the rows ``start:end`` of the matrices, and to the scalar if any, writing them into the last
+    matrix.
+    """
+    attached = [_attach(spec) for spec in specs]
+    cols = specs[-1][3]
+    rows = [values[start * cols:end * cols] for _, values in attached[:-1]]
+    try:
+        operands = rows + [repeat(scalar)] if scalar is not None else rows
+        attached[-1][1][start * cols:end * cols] = array(specs[-1][1], map(getattr(operator, op), *operands))
+    finally:
+        for row in rows:
+            row.release()
+        for shared, values in attached:
+            _detach(shared, values)
+
+
+def _transpose_block(specs: t.Tuple[SharedSpec, ...], start: int, end: int) -> None:
+    """Copy the columns ``start:end`` of the first matrix into the rows of the second one."""
+    attached = [_attach(spec) for spec in specs]
+    try:
+        (_, a), (_, out) = attached
+        rows, cols = specs[0][2], specs[0][3]
+        for col in range(start, end):
+            out[col * rows:(col + 1) * rows] = array(specs[1][1], a[col::cols])
+    finally:
+        for shared, values in attached:
+            _detach(shared, values)
+
+
+def _sum_block(specs: t.Tuple[SharedSpec, ...], start: int, end: int, axis: t.Optional[int]) -> t.Union[int, float, list]:
+    """Sum the rows ``start:end`` of the matrix, entirely or along an axis."""
+    shared, values = _attach(specs[0])
+    try:
+        cols = specs[0][3]
+        if axis is None:
+            return sum(values[start * cols:end * cols])
+        if axis == 0:
+            return [sum(values[start * cols + col:end * cols:cols]) for col in range(cols)]
+
+        return [sum(values[row * cols:(row + 1) * cols]) for row in range(start, end)]
+    finally:
+        _detach(shared, values)
+
+
+def _shutdown() -> None:
+    if _executor is not None:
+        _executor.shutdown()
+
+
+atexit.register(_shutdown)
+
+
+class ParallelBackend(PythonBackend):
+    """
+    A backend splitting the matrix products, the elementwise operations, the copying transposes and the sums into row
+    blocks, computed by a pool of worker processes.
+
+    The operands and the results are exchanged through `multiprocessing.shared_memory` blocks, instead of being
+    pickled. Every block of rows is computed by the pure Python kernels, so this backend pays off on large matrices
+    and many cores only: the operations smaller than `settings.parallel_threshold` scalar operations are computed in
+    the calling process, as the pure Python backend does.
+
+    On platforms starting the workers with ``spawn`` (Windows and macOS), the parallel operations have to be run from
+    code guarded by ``if __name__ == "__main__":``.
+    """
+    name = "parallel"
+
+    @staticmethod
+    def _workers() -> int:
+        return settings.parallel_workers or os.cpu_count() or 1
+
+    def _is_worth_it(self, operations: int) -> bool:
+        return self._workers() > 1 and operations >= settings.parallel_threshold
+
+    def _pool(self) -> ProcessPoolExecutor:
+        global _executor, _executor_workers
+
+        workers = self._workers()
+        if _executor is None or _executor_workers != workers:
+            _shutdown()
+            _executor, _executor_workers = ProcessPoolExecutor(max_workers=workers), workers
+
+        return _executor
+
+    def _row_blocks(self, rows: int) -> t.List[t.Tuple[int, int]]:
+        """
+        Returns
+        -------
+        t.List[t.Tuple[int, int]]
+            The ``(start, end)`` bounds of a block of rows per worker, as even as possible.
+        """
+        count = min(self._workers(), rows)
+        return [(rows * block // count, rows * (block + 1) // count) for block in range(count)]
+
+    @staticmethod
+    def _share(matrix: "hm.Matrix") -> t.Tuple[SharedMemory, SharedSpec]:
+        """
+        Copy the values of a matrix, or of a view, into a new shared memory block.
+
+        Returns
+        -------
+        t.Tuple[SharedMemory, SharedSpec]
+            The block, to be unlinked by the caller, and its description for the workers.
+        """
+        values = memoryview(matrix._values()).cast("B")
+        shared = SharedMemory(create=True, size=max(values.nbytes, 1))
+        shared.buf[:values.nbytes] = values
+        return shared, (shared.name, matrix.typecode, matrix.rows, matrix.cols)
+
+    @staticmethod
+    def _allocate(shape: tuple, typecode: str) -> t.Tuple[SharedMemory, SharedSpec]:
+        shared = SharedMemory(create=True, size=max(shape[0] * shape[1] * array(typecode).itemsize, 1))
+        return shared, (shared.name, typecode, shape[0], shape[1])
+
+    def _dispatch(
+            self,
+            function: t.Callable,
+            operands: t.Sequence["hm.Matrix"],
+            blocks_of: int,
+            arguments: tuple = (),
+            result: t.Optional[t.Tuple[tuple, str]] = None
+    ) -> t.Tuple[list, t.Optional[array]]:
+        """
+        Share the operands with the workers, and compute every block of rows in one of them.
+
+        Parameters
+        ----------
+        function : t.Callable
+            The worker function, called with the specs of the shared matrices, the bounds of a block, and `arguments`.
+        operands : t.Sequence[Matrix]
+            The matrices to be shared with the workers.
+        blocks_of : int
+            The number of rows to be split into blocks.
+        arguments : tuple
+            The extra arguments of the worker function.
+        result : t.Optional[t.Tuple[tuple, str]]
+            The shape and typecode of a result matrix, shared with the workers after the operands, for them to write
+            their blocks into.
+
+        Returns
+        -------
+        t.Tuple[list, t.Optional[array]]
+            What the worker function returned for every block, and the values of the result matrix if any.
+        """
+        shared_blocks = []
+        try:
+            specs = []
+            for operand in operands:
+                shared, spec = self._share(operand)
+                shared_blocks.append(shared)
+                specs.append(spec)
+
+            if result is not None:
+                shared, spec = self._allocate(*result)
+                shared_blocks.append(shared)
+                specs.append(spec)
+
+            pool = self._pool()
+            futures = [
+                pool.submit(function, tuple(specs), start, end, *arguments) for start, end in self._row_blocks(blocks_of)
+            ]
+            outputs = [future.result() for future in futures]
+
+            values = None
+            if result is not None:
+                (rows, cols), typecode = result
+                values = array(typecode)
+                values.frombytes(shared_blocks[-1].buf[:rows * cols * values.itemsize])
+        finally:
+            for shared in shared_blocks:
+                shared.close()
+                shared.unlink()
+
+        return outputs, values
+
+    @staticmethod
+    def _collected(values: array, shape: tuple, out: t.Optional["hm.Matrix"]) -> "hm.Matrix":
+        if out is not None:
+            return out._assign(values, values.typecode)
+
+        return hm.Matrix._from_flat(values, shape)
+
+    def _elementwise(
+            self,
+            op: str,
+            operands: t.Sequence["hm.Matrix"],
+            typecode: str,
+            scalar: t.Optional[t.Union[int, float]] = None,
+            out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The result of an operation of the `operator` module between the elements at the same position in the
+            matrices, and the scalar if any, computed by the workers.
+        """
+        shape = operands[0].dims
+        _, values = self._dispatch(_elementwise_block, operands, shape[0], (op, scalar), (shape, typecode))
+        return self._collected(values, shape, out)
+
+    def matrix_add(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        if not self._is_worth_it(a.size):
+            return super().matrix_add(a, b, out)
+
+        try:
+            return self._elementwise("add", (a, b), result_typecode(a.typecode, b.typecode), out=out)
+        except OverflowError:
+            return super().matrix_add(a, b, out)
+
+    def matrix_sub(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        if not self._is_worth_it(a.size):
+            return super().matrix_sub(a, b, out)
+
+        try:
+            return self._elementwise("sub", (a, b), result_typecode(a.typecode, b.typecode), out=out)
+        except OverflowError:
+            return super().matrix_sub(a, b, out)
+
+    def matrix_scale(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        if not self._is_worth_it(a.size):
+            return super().matrix_scale(a, scalar, out)
+
+        typecode = result_typecode(a.typecode, infer_typecode((scalar,)))
+        try:
+            return self._elementwise("mul", (a,), typecode, scalar, out)
+        except OverflowError:
+            return super().matrix_scale(a, scalar, out)
+
+    def matrix_divide(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        if not self._is_worth_it(a.size):
+            return super().matrix_divide(a, scalar, out)
+
+        return self._elementwise("truediv", (a,), FLOAT_TYPECODE, scalar, out)
+
+    def matmul(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        if not self._is_worth_it(a.rows * a.cols * b.cols):
+            return super().matmul(a, b, out)
+
+        shape = (a.rows, b.cols)
+        try:
+            _, values = self._dispatch(
+                _matmul_block, (a, b), a.rows, result=(shape, result_typecode(a.typecode, b.typecode))
+            )
+        except OverflowError:
+            # An integer product too large for 64 bits, the pure Python kernel raises the error with the value.
+            return super().matmul(a, b, out)
+
+        return self._collected(values, shape, out)
+
+    def transpose(self, a: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        # Without a destination, the transpose is a view and costs nothing to split.
+        if out is None or not self._is_worth_it(a.size):
+            return super().transpose(a, out)
+
+        shape = (a.cols, a.rows)
+        _, values = self._dispatch(_transpose_block, (a,), a.cols, result=(shape, a.typecode))
+        return self._collected(values, shape, out)
+
+    def sum(self, a: "hm.Matrix", axis: t.Optional[int] = None) -> t.Union[int, float, "hm.Matrix"]:
+        if not self._is_worth_it(a.size):
+            return super().sum(a, axis)
+
+        sums, _ = self._dispatch(_sum_block, (a,), a.rows, (axis,))
+        if axis is None:
+            return sum(sums)
+
+        if axis == 0:
+            columns = [float(sum(column)) for column in zip(*sums)]
+            return hm.Matrix._from_flat(array(FLOAT_TYPECODE, columns), (1, a.cols))
+
+        rows = [row_sum for block in sums for row_sum in block]
+        return hm.Matrix._from_flat(array(infer_typecode(rows), rows), (a.rows, 1))
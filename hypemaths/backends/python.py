@@ -0,0 +1,59 @@
+import operator
+import typing as t
+
+import hypemaths as hm
+from .base import Backend
+
+
+class PythonBackend(Backend):
+    """The default backend, computing everything in pure Python over the flat buffers of the models."""
+    name = "python"
+
+    def matrix_add(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        return a._elementwise(b, operator.add, out=out)
+
+    def matrix_sub(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        return a._elementwise(b, operator.sub, out=out)
+
+    def matrix_scale(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        return a._scaled(scalar, out)
+
+    def matrix_divide(
+            self, a: "hm.Matrix", scalar: t.Union[int, float], out: t.Optional["hm.Matrix"] = None
+    ) -> "hm.Matrix":
+        return a._divided(scalar, out)
+
+    def matrix_abs(self, a: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        return a._map(abs, a.typecode, out)
+
+    def matmul(self, a: "hm.Matrix", b: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        return a._matmul(b, out)
+
+    def transpose(self, a: "hm.Matrix", out: t.Optional["hm.Matrix"] = None) -> "hm.Matrix":
+        return a._transposed(out)
+
+    def determinant(self, a: "hm.Matrix") -> float:
+        return a._determinant()
+
+    def sum(self, a: "hm.Matrix", axis: t.Optional[int] = None) -> t.Union[int, float, "hm.Matrix"]:
+        return a._sum(axis)
+
+    def frobenius_norm(self, a: "hm.Matrix") -> float:
+        return a._frobenius_norm()
+
+    def vector_add(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        return a._elementwise(b, operator.add, out)
+
+    def vector_sub(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        return a._elementwise(b, operator.sub, out)
+
+    def vector_mul(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        return a._elementwise(b, operator.mul, out)
+
+    def vector_div(self, a: "hm.Vector", b: "hm.Vector", out: t.Optional["hm.Vector"] = None) -> "hm.Vector":
+        return a._elementwise(b, operator.truediv, out)
+
+    def vector_dot(self, a: "hm.Vector", b: "hm.Vector") -> t.Union[int, float]:
+        return sum(map(operator.mul, a.points, b.points))
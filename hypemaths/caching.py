@@ -0,0 +1,162 @@
+import functools
+import sys
+import threading
+import typing as t
+from collections import OrderedDict
+
+from .models import Matrix, Vector
+
+# The size of a value of a matrix or a vector, as stored in their buffers.
+VALUE_SIZE = 8
+
+# Separating the positional arguments from the keyword ones in the keys.
+_KEYWORDS = object()
+
+
+class CacheInfo(t.NamedTuple):
+    """
+    The statistics of a memoized function.
+
+    Attributes
+    ----------
+    hits : int
+        The number of calls answered from the cache.
+    misses : int
+        The number of calls which ran the function.
+    maxsize : t.Optional[int]
+        The largest number of results kept, `None` if unbounded.
+    currsize : int
+        The number of results kept.
+    maxbytes : t.Optional[int]
+        The largest estimated size of the results kept, `None` if unbounded.
+    currbytes : int
+        The estimated size of the results kept, 8 bytes per value of the matrices and vectors.
+    """
+    hits: int
+    misses: int
+    maxsize: t.Optional[int]
+    currsize: int
+    maxbytes: t.Optional[int]
+    currbytes: int
+
+
+def _frozen(value: t.Any) -> t.Any:
+    """
+    Returns
+    -------
+    t.Any
+        The value itself if it is hashable, or the frozen copy of a matrix or a vector.
+    """
+    if isinstance(value, (Matrix, Vector)):
+        return value.freeze()
+    return value
+
+
+def _nbytes(value: t.Any) -> int:
+    if isinstance(value, Matrix):
+        return value.size * VALUE_SIZE
+    if isinstance(value, Vector):
+        return len(value.points) * VALUE_SIZE
+    return sys.getsizeof(value)
+
+
+def memoize(
+        function: t.Optional[t.Callable] = None, *, maxsize: t.Optional[int] = 128, maxbytes: t.Optional[int] = None
+) -> t.Callable:
+    """
+    Cache the results of a function of matrices and vectors, evicting the least recently used ones past a number of
+    results or a total size.
+
+    The arguments are keyed by their values: the frozen matrices and vectors are keyed by their cached hash, in
+    constant time, and the mutable ones are frozen into a copy first, which costs a pass over their values. Freeze the
+    matrices passed again and again once, for them to be looked up for free.
+
+    The matrices and vectors returned are frozen before being cached, so that the callers sharing a result cannot
+    change it for the others, and thaw them for a mutable copy. The cache is safe to use from many threads.
+
+    Parameters
+    ----------
+    function : t.Optional[t.Callable]
+        The function to be memoized, when used as a bare ``@memoize`` decorator.
+    maxsize : t.Optional[int]
+        The largest number of results to keep, `None` for no bound. Defaults to 128.
+    maxbytes : t.Optional[int]
+        The largest estimated size of the results to keep, 8 bytes per value of the matrices and vectors, and
+        `sys.getsizeof` for anything else. Defaults to `None`, no bound. A single result larger than it is not kept.
+
+    Returns
+    -------
+    t.Callable
+        The memoized function, with a `cache_info()` method returning the `CacheInfo` statistics, and a
+        `cache_clear()` method emptying the cache.
+
+    Examples
+    --------
+    >>> import hypemaths as hm
+    >>> @hm.memoize(maxsize=4096)
+    ... def inverse(matrix):
+    ...     return matrix.inverse()
+    >>> matrix = hm.Matrix([[4, 7], [2, 6]]).freeze()
+    >>> inverse(matrix) is inverse(matrix)
+    True
+    >>> inverse.cache_info().hits
+    1
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError(f"The largest number of results must be non-negative, not {maxsize}.")
+
+    def decorate(function: t.Callable) -> t.Callable:
+        cache: "OrderedDict[tuple, t.Tuple[t.Any, int]]" = OrderedDict()
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "bytes": 0}
+
+        def evict() -> None:
+            while cache and (
+                    (maxsize is not None and len(cache) > maxsize)
+                    or (maxbytes is not None and stats["bytes"] > maxbytes)
+            ):
+                _, (_, nbytes) = cache.popitem(last=False)
+                stats["bytes"] -= nbytes
+
+        @functools.wraps(function)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            key = tuple(map(_frozen, args))
+            if kwargs:
+                key += (_KEYWORDS,) + tuple((name, _frozen(value)) for name, value in sorted(kwargs.items()))
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    cache.move_to_end(key)
+                    stats["hits"] += 1
+                    return entry[0]
+                stats["misses"] += 1
+
+            # The function runs out of the lock, so that the other keys are still served meanwhile.
+            result = _frozen(function(*args, **kwargs))
+            nbytes = _nbytes(result)
+
+            with lock:
+                if key not in cache and (maxbytes is None or nbytes <= maxbytes):
+                    cache[key] = (result, nbytes)
+                    stats["bytes"] += nbytes
+                    evict()
+
+            return result
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"], maxsize, len(cache), maxbytes, stats["bytes"])
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, bytes=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    if function is not None:
+        return decorate(function)
+    return decorate
@@ -0,0 +1,104 @@
+import contextlib
+import typing as t
+
+VALIDATION_LEVELS = ("strict", "shape", "off")
+
+
+class Settings:
+    """
+    The global, tunable settings of the library.
+
+    Attributes
+    ----------
+    backend : str
+        The name of the compute backend used by default, see `hypemaths.backends`.
+    validation : str
+        How much of the data passed by users to `Matrix` and `Vector` is validated:
+
+        - ``"strict"`` checks the type of every value, and the shape.
+        - ``"shape"`` only checks the shape, values which are not numbers still fail when packed into the buffer.
+        - ``"off"`` trusts the data entirely, ragged rows are not detected.
+
+        The results computed by the library itself are never validated again, whatever the level.
+    lazy : bool
+        If the operators of `Matrix` record a `LazyMatrix` expression, evaluated in a single fused pass when needed,
+        instead of computing every intermediate result.
+    lazy_max_depth : int
+        The largest number of operations chained in a `LazyMatrix` expression. A deeper expression, such as an
+        accumulation built in a loop, is evaluated as soon as it reaches it, and carries on from the result.
+    parallel_workers : t.Optional[int]
+        The number of worker processes of the ``"parallel"`` backend. Defaults to `None`, one per core.
+    parallel_threshold : int
+        The number of scalar operations from which the ``"parallel"`` backend splits an operation between its workers,
+        smaller operations are computed in the calling process.
+    matmul_block_size : int
+        The edge of the square tiles the blocked multiplication kernel works on.
+    blocked_threshold : int
+        The smallest dimension from which the blocked kernel is used instead of the plain one.
+    strassen_threshold : int
+        The smallest dimension from which the Strassen algorithm is used. The recursion also stops and falls back to
+        the blocked kernel once the sub-matrices are this small.
+    tile_size : int
+        The number of elements of a `MappedMatrix` read into memory at once by its out-of-core operations.
+    """
+    __slots__ = (
+        "backend",
+        "validation",
+        "lazy",
+        "lazy_max_depth",
+        "parallel_workers",
+        "parallel_threshold",
+        "matmul_block_size",
+        "blocked_threshold",
+        "strassen_threshold",
+        "tile_size"
+    )
+
+    def __init__(self) -> None:
+        self.backend = "python"
+        self.validation = "strict"
+        self.lazy = False
+        self.lazy_max_depth = 64
+        self.parallel_workers = None
+        self.parallel_threshold = 1 << 20
+        self.matmul_block_size = 64
+        self.blocked_threshold = 128
+        self.strassen_threshold = 256
+        self.tile_size = 1 << 18
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        )
+
+    @contextlib.contextmanager
+    def override(self, **options: t.Any) -> t.Iterator["Settings"]:
+        """
+        Temporarily change some settings, restoring the previous values on exit.
+
+        Parameters
+        ----------
+        options : t.Any
+            The settings to be changed and their new values.
+
+        Examples
+        --------
+        >>> from hypemaths import settings
+        >>> with settings.override(strassen_threshold=128):
+        ...     settings.strassen_threshold
+        128
+        """
+        previous = {name: getattr(self, name) for name in options}
+
+        for name, value in options.items():
+            setattr(self, name, value)
+
+        try:
+            yield self
+        finally:
+            for name, value in previous.items():
+                setattr(self, name, value)
+
+
+settings = Settings()
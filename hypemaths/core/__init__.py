@@ -0,0 +1,11 @@
+from .cache import DerivedCache, DerivedCacheInfo
+from .storage import (
+    FLOAT_TYPECODE,
+    INT_TYPECODE,
+    Storage,
+    infer_typecode,
+    pack,
+    result_typecode,
+    strided,
+    typed_view
+)
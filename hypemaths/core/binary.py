@@ -0,0 +1,184 @@
+"""
+The binary format of the matrices and vectors saved by the library.
+
+A file, or a buffer, is a fixed 32 bytes header followed by the raw values, contiguous and in row-major order:
+
+=======  =====  ==========================================================================
+Offset   Size   Content
+=======  =====  ==========================================================================
+0        4      The magic bytes ``b"HYPM"``.
+4        1      The version of the format, 1.
+5        1      The byte order of the values, ``b"<"`` for little endian or ``b">"`` for big endian.
+6        1      The typecode of the values, ``b"q"`` for 64 bits integers or ``b"d"`` for 64 bits floats.
+7        1      The number of dimensions, 2 for a matrix or 1 for a vector.
+8        8      Reserved, zeroed.
+16       8      The number of rows of a matrix, or of values of a vector, as a little endian integer.
+24       8      The number of columns of a matrix, or 0 for a vector, as a little endian integer.
+32              The values.
+=======  =====  ==========================================================================
+
+The values start at a multiple of their size, so a file in the byte order of the machine can be memory-mapped and
+read in place, without parsing anything.
+"""
+import struct
+import sys
+import typing as t
+from array import array
+
+from .storage import FLOAT_TYPECODE, INT_TYPECODE
+
+MAGIC = b"HYPM"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBccB8xQQ")
+NATIVE_BYTE_ORDER = b"<" if sys.byteorder == "little" else b">"
+
+
+def pack_header(typecode: str, shape: tuple) -> bytes:
+    """
+    Parameters
+    ----------
+    typecode : str
+        The typecode of the values.
+    shape : tuple
+        The rows and columns of a matrix, or the length of a vector.
+
+    Returns
+    -------
+    bytes
+        The header describing values of the machine's byte order.
+    """
+    rows, cols = shape if len(shape) == 2 else (shape[0], 0)
+    return HEADER.pack(MAGIC, FORMAT_VERSION, NATIVE_BYTE_ORDER, typecode.encode(), len(shape), rows, cols)
+
+
+def unpack_header(header: bytes) -> t.Tuple[str, tuple, bool]:
+    """
+    Parameters
+    ----------
+    header : bytes
+        A buffer starting with a header, at least `HEADER.size` bytes long.
+
+    Returns
+    -------
+    t.Tuple[str, tuple, bool]
+        The typecode of the values, their shape, and whether their byte order differs from the machine's one.
+
+    Raises
+    ------
+    ValueError
+        If the buffer does not start with a valid header.
+    """
+    if len(header) < HEADER.size:
+        raise ValueError(f"The buffer is too short for a header, {len(header)} bytes instead of {HEADER.size}.")
+
+    magic, version, byte_order, typecode, ndim, rows, cols = HEADER.unpack_from(header)
+    if magic != MAGIC:
+        raise ValueError("The buffer does not hold a saved matrix or vector, its magic bytes are wrong.")
+
+    if version != FORMAT_VERSION:
+        raise ValueError(f"The version {version} of the format is not supported, only the version {FORMAT_VERSION} is.")
+
+    typecode = typecode.decode()
+    if typecode not in (INT_TYPECODE, FLOAT_TYPECODE) or byte_order not in (b"<", b">") or ndim not in (1, 2):
+        raise ValueError("The header of the buffer is corrupted.")
+
+    return typecode, (rows, cols) if ndim == 2 else (rows,), byte_order != NATIVE_BYTE_ORDER
+
+
+def _value_count(shape: tuple) -> int:
+    return shape[0] * shape[1] if len(shape) == 2 else shape[0]
+
+
+def dumps(values: t.Union[array, memoryview], shape: tuple) -> bytes:
+    """
+    Parameters
+    ----------
+    values : t.Union[array, memoryview]
+        The contiguous values to be saved, an `array` or a `memoryview` cast to their typecode.
+    shape : tuple
+        The rows and columns of a matrix, or the length of a vector.
+
+    Returns
+    -------
+    bytes
+        The header followed by the values.
+    """
+    values = memoryview(values)
+    return pack_header(values.format, shape) + values.cast("B")
+
+
+def loads(buffer: t.Any, copy: bool = True) -> t.Tuple[t.Union[array, memoryview], tuple]:
+    """
+    Read values out of a buffer in the binary format.
+
+    Parameters
+    ----------
+    buffer : t.Any
+        Any object supporting the buffer protocol, such as `bytes`, a `bytearray` or a `mmap`.
+    copy : bool
+        If the values are copied into an `array`, instead of being viewed in place. Values in the other byte order
+        are always copied, to be swapped. Defaults to `True`.
+
+    Returns
+    -------
+    t.Tuple[t.Union[array, memoryview], tuple]
+        The values, as an `array` or a `memoryview` cast to their typecode, and their shape.
+
+    Raises
+    ------
+    ValueError
+        If the buffer does not hold a valid header, or is too short for the values it describes.
+    """
+    buffer = memoryview(buffer).cast("B")
+    typecode, shape, swapped = unpack_header(buffer)
+
+    values = array(typecode)
+    end = HEADER.size + _value_count(shape) * values.itemsize
+    if len(buffer) < end:
+        raise ValueError(f"The buffer is too short for the values of shape {shape}, {len(buffer)} bytes instead of {end}.")
+
+    if not copy and not swapped:
+        return buffer[HEADER.size:end].cast(typecode), shape
+
+    values.frombytes(buffer[HEADER.size:end])
+    if swapped:
+        values.byteswap()
+
+    return values, shape
+
+
+def save(path: t.Any, values: t.Union[array, memoryview], shape: tuple) -> None:
+    """Write the header and the contiguous values into a file, see `dumps`."""
+    values = memoryview(values)
+    with open(path, "wb") as file:
+        file.write(pack_header(values.format, shape))
+        file.write(values.cast("B"))
+
+
+def load(path: t.Any) -> t.Tuple[array, tuple]:
+    """
+    Read the values saved into a file, see `loads`.
+
+    Returns
+    -------
+    t.Tuple[array, tuple]
+        The values, and their shape.
+    """
+    with open(path, "rb") as file:
+        typecode, shape, swapped = unpack_header(file.read(HEADER.size))
+        values = array(typecode)
+        try:
+            values.fromfile(file, _value_count(shape))
+        except EOFError:
+            raise ValueError(f"The file is too short for the values of shape {shape}.") from None
+
+    if swapped:
+        values.byteswap()
+
+    return values, shape
+
+
+def read_header(path: t.Any) -> t.Tuple[str, tuple, bool]:
+    """Read the header of a file, see `unpack_header`."""
+    with open(path, "rb") as file:
+        return unpack_header(file.read(HEADER.size))
@@ -0,0 +1,113 @@
+"""
+The cache of the results derived from the values of a matrix, such as its trace, norm or factorizations.
+
+Every result is stamped with the `Storage.version` of the buffer it was computed from. The version is bumped by every
+write going through the matrix, its item assignments, its in-place operators and the `out=` destinations, so a
+result is reused for as long as the values it was computed from are unchanged, and recomputed on the next call
+after a write. Writes bypassing the matrix, such as through a NumPy array wrapping its memory, are not seen, and the
+matrices over memory they do not own, which can be written at any time, cache nothing.
+"""
+import typing as t
+
+from .storage import Storage
+
+
+class DerivedCacheInfo(t.NamedTuple):
+    """
+    The statistics of the cache of a matrix.
+
+    Attributes
+    ----------
+    hits : int
+        The number of results reused.
+    misses : int
+        The number of results computed, because they were never asked for, or went stale.
+    currsize : int
+        The number of results cached, and still fresh.
+    """
+    hits: int
+    misses: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The fraction of the results reused, 0 when nothing was asked for yet.
+        """
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    @property
+    def miss_rate(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The fraction of the results computed, 0 when nothing was asked for yet.
+        """
+        calls = self.hits + self.misses
+        return self.misses / calls if calls else 0.0
+
+
+class DerivedCache:
+    """
+    The results derived from the values of a storage, keyed by the operation and its parameters.
+
+    Reading and storing a result are single dictionary operations, so the cache can be shared between threads, at the
+    worst computing a result twice.
+    """
+    __slots__ = ("_entries", "hits", "misses")
+
+    def __init__(self) -> None:
+        # The storage, its version and the result, for every key.
+        self._entries: t.Dict[tuple, t.Tuple[Storage, int, t.Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, storage: Storage, key: tuple, compute: t.Callable[[], t.Any]) -> t.Any:
+        """
+        Parameters
+        ----------
+        storage : Storage
+            The storage the result is derived from.
+        key : tuple
+            The name of the operation, and its parameters.
+        compute : t.Callable[[], t.Any]
+            Computes the result, when it is not cached or went stale.
+
+        Returns
+        -------
+        t.Any
+            The cached result, if it was computed at the current version of the storage, or else the new one.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is storage and entry[1] == storage.version:
+            self.hits += 1
+            return entry[2]
+
+        # The version is read first, so that a write racing with the computation leaves the result stale.
+        version = storage.version
+        value = compute()
+
+        self.misses += 1
+        self._entries[key] = (storage, version, value)
+        return value
+
+    def info(self, storage: Storage) -> DerivedCacheInfo:
+        """
+        Returns
+        -------
+        DerivedCacheInfo
+            The statistics of the cache, counting the results still fresh for the storage.
+        """
+        fresh = sum(entry[0] is storage and entry[1] == storage.version for entry in list(self._entries.values()))
+        return DerivedCacheInfo(self.hits, self.misses, fresh)
+
+    def clear(self) -> None:
+        """Drop every result, and reset the statistics."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,282 @@
+import operator
+import typing as t
+
+from .storage import strided
+from ..config import settings
+
+NAIVE = "naive"
+BLOCKED = "blocked"
+STRASSEN = "strassen"
+
+# The largest ratio between the largest and the smallest dimension of a product run through Strassen, whose operands
+# are padded into squares of the largest dimension.
+STRASSEN_MAX_ASPECT = 2
+
+
+def _rows(x: t.Sequence, count: int, length: int, layout: t.Optional[tuple], start: int = 0) -> t.Iterator[list]:
+    """Yield ``count`` rows of ``length`` elements of a flat matrix with the ``(offset, row, col)`` stride layout."""
+    offset, row_stride, col_stride = layout or (0, length, 1)
+    for row in range(start, start + count):
+        yield list(strided(x, offset + row * row_stride, length, col_stride))
+
+
+def _columns(x: t.Sequence, count: int, length: int, layout: tuple, start: int = 0) -> t.Iterator[list]:
+    """Yield ``count`` columns of ``length`` elements of a flat matrix with the ``(offset, row, col)`` layout."""
+    offset, row_stride, col_stride = layout
+    for col in range(start, start + count):
+        yield list(strided(x, offset + col * col_stride, length, row_stride))
+
+
+def naive_matmul(
+        a: t.Sequence, b: t.Sequence, n: int, m: int, p: int, a_layout: tuple = None, b_layout: tuple = None
+) -> list:
+    """
+    Multiply a ``n x m`` and a ``m x p`` matrix, both given as flat sequences, with one dot product per element of
+    the result. All the columns of ``b`` are built once up front.
+
+    The operands are read through their ``(offset, row stride, column stride)`` layouts, which default to plain
+    row-major ones, so strided views are multiplied without being copied first.
+
+    Returns
+    -------
+    list
+        The flat row-major ``n x p`` product.
+    """
+    mul = operator.mul
+    columns = list(_columns(b, p, m, b_layout or (0, p, 1)))
+
+    product = []
+    for a_row in _rows(a, n, m, a_layout):
+        product.extend([sum(map(mul, a_row, column)) for column in columns])
+
+    return product
+
+
+def blocked_matmul(
+        a: t.Sequence,
+        b: t.Sequence,
+        n: int,
+        m: int,
+        p: int,
+        block_size: int = None,
+        a_layout: tuple = None,
+        b_layout: tuple = None
+) -> list:
+    """
+    Multiply a ``n x m`` and a ``m x p`` matrix, both given as flat sequences with optional layouts, tile by tile.
+
+    The result is computed in ``block_size x block_size`` tiles, so only a block of rows of ``a`` and a panel of
+    columns of ``b`` are unpacked into Python numbers at a time, keeping the working set small whatever the size of
+    the operands is.
+
+    Returns
+    -------
+    list
+        The flat row-major ``n x p`` product.
+    """
+    block_size = block_size or settings.matmul_block_size
+    mul = operator.mul
+
+    product = [0] * (n * p)
+    for row_start in range(0, n, block_size):
+        row_stop = min(row_start + block_size, n)
+        a_rows = list(_rows(a, row_stop - row_start, m, a_layout, row_start))
+
+        for col_start in range(0, p, block_size):
+            col_stop = min(col_start + block_size, p)
+            b_columns = list(_columns(b, col_stop - col_start, m, b_layout or (0, p, 1), col_start))
+
+            for row, a_row in enumerate(a_rows, start=row_start):
+                offset = row * p
+                product[offset + col_start:offset + col_stop] = [
+                    sum(map(mul, a_row, b_column)) for b_column in b_columns
+                ]
+
+    return product
+
+
+def _split(x: list, n: int) -> tuple:
+    """Split a flat ``n x n`` matrix into its four ``n/2 x n/2`` quadrants."""
+    half = n // 2
+    top_left, top_right, bottom_left, bottom_right = [], [], [], []
+
+    for row in range(half):
+        start = row * n
+        top_left.extend(x[start:start + half])
+        top_right.extend(x[start + half:start + n])
+
+    for row in range(half, n):
+        start = row * n
+        bottom_left.extend(x[start:start + half])
+        bottom_right.extend(x[start + half:start + n])
+
+    return top_left, top_right, bottom_left, bottom_right
+
+
+def _join(top_left: list, top_right: list, bottom_left: list, bottom_right: list, half: int) -> list:
+    """Join four flat ``half x half`` quadrants back into a single flat matrix."""
+    joined = []
+    for left, right in ((top_left, top_right), (bottom_left, bottom_right)):
+        for row in range(half):
+            start = row * half
+            joined.extend(left[start:start + half])
+            joined.extend(right[start:start + half])
+
+    return joined
+
+
+def _add(x: list, y: list) -> list:
+    return list(map(operator.add, x, y))
+
+
+def _sub(x: list, y: list) -> list:
+    return list(map(operator.sub, x, y))
+
+
+def _strassen_square(a: list, b: list, n: int, threshold: int, block_size: int) -> list:
+    if n <= threshold or n % 2:
+        return blocked_matmul(a, b, n, n, n, block_size)
+
+    half = n // 2
+    a11, a12, a21, a22 = _split(a, n)
+    b11, b12, b21, b22 = _split(b, n)
+
+    m1 = _strassen_square(_add(a11, a22), _add(b11, b22), half, threshold, block_size)
+    m2 = _strassen_square(_add(a21, a22), b11, half, threshold, block_size)
+    m3 = _strassen_square(a11, _sub(b12, b22), half, threshold, block_size)
+    m4 = _strassen_square(a22, _sub(b21, b11), half, threshold, block_size)
+    m5 = _strassen_square(_add(a11, a12), b22, half, threshold, block_size)
+    m6 = _strassen_square(_sub(a21, a11), _add(b11, b12), half, threshold, block_size)
+    m7 = _strassen_square(_sub(a12, a22), _add(b21, b22), half, threshold, block_size)
+
+    c11 = _add(_sub(_add(m1, m4), m5), m7)
+    c12 = _add(m3, m5)
+    c21 = _add(m2, m4)
+    c22 = _add(_add(_sub(m1, m2), m3), m6)
+
+    return _join(c11, c12, c21, c22, half)
+
+
+def _padded_size(n: int, threshold: int) -> int:
+    """
+    Returns
+    -------
+    int
+        The smallest size of the form ``q * 2 ** k`` with ``q <= threshold``, which is at least ``n``. Padding to it
+        lets the recursion halve the matrix all the way down to the threshold.
+    """
+    levels = 0
+    while -(-n // 2 ** levels) > threshold:
+        levels += 1
+
+    return -(-n // 2 ** levels) * 2 ** levels
+
+
+def _pad(x: t.Sequence, rows: int, cols: int, size: int, layout: t.Optional[tuple]) -> list:
+    """Pad a flat ``rows x cols`` matrix with zeros into a flat ``size x size`` one."""
+    padded = []
+    padding = [0] * (size - cols)
+    for row in _rows(x, rows, cols, layout):
+        padded.extend(row)
+        padded.extend(padding)
+
+    padded.extend([0] * (size * (size - rows)))
+    return padded
+
+
+def strassen_matmul(
+        a: t.Sequence,
+        b: t.Sequence,
+        n: int,
+        m: int,
+        p: int,
+        threshold: int = None,
+        block_size: int = None,
+        a_layout: tuple = None,
+        b_layout: tuple = None
+) -> list:
+    """
+    Multiply a ``n x m`` and a ``m x p`` matrix, both given as flat sequences with optional layouts, with the
+    Strassen algorithm.
+
+    The operands are padded with zeros into squares which can be halved down to ``threshold``, the quadrants are
+    multiplied recursively with 7 products instead of 8, and the recursion falls back to the blocked kernel once the
+    quadrants are small enough.
+
+    Returns
+    -------
+    list
+        The flat row-major ``n x p`` product.
+    """
+    threshold = threshold or settings.strassen_threshold
+    size = _padded_size(max(n, m, p), threshold)
+
+    product = _strassen_square(
+        _pad(a, n, m, size, a_layout), _pad(b, m, p, size, b_layout), size, threshold, block_size
+    )
+    if size == p:
+        return product[:n * p]
+
+    trimmed = []
+    for row in range(n):
+        trimmed.extend(product[row * size:row * size + p])
+    return trimmed
+
+
+def select_algorithm(n: int, m: int, p: int) -> str:
+    """
+    Returns
+    -------
+    str
+        The name of the kernel to be used for a ``n x m`` by ``m x p`` product, according to the global settings.
+        Strassen is only picked for nearly square products, the other large ones going through the blocked kernel.
+    """
+    smallest = min(n, m, p)
+    if smallest >= settings.strassen_threshold:
+        return STRASSEN if max(n, m, p) <= STRASSEN_MAX_ASPECT * smallest else BLOCKED
+    if smallest >= settings.blocked_threshold:
+        return BLOCKED
+    return NAIVE
+
+
+def matmul(
+        a: t.Sequence,
+        b: t.Sequence,
+        n: int,
+        m: int,
+        p: int,
+        algorithm: t.Optional[str] = None,
+        a_layout: tuple = None,
+        b_layout: tuple = None
+) -> list:
+    """
+    Multiply a ``n x m`` and a ``m x p`` matrix, both given as flat sequences.
+
+    Parameters
+    ----------
+    a : t.Sequence
+        The flat left operand.
+    b : t.Sequence
+        The flat right operand.
+    n, m, p : int
+        The dimensions of the operands.
+    algorithm : t.Optional[str]
+        One of ``"naive"``, ``"blocked"`` or ``"strassen"``. Picked from the sizes and the global settings by default.
+    a_layout, b_layout : tuple
+        The ``(offset, row stride, column stride)`` of the operands in their buffers. Plain row-major by default.
+
+    Returns
+    -------
+    list
+        The flat row-major ``n x p`` product.
+    """
+    algorithm = algorithm or select_algorithm(n, m, p)
+
+    if algorithm == STRASSEN:
+        return strassen_matmul(a, b, n, m, p, a_layout=a_layout, b_layout=b_layout)
+    if algorithm == BLOCKED:
+        return blocked_matmul(a, b, n, m, p, a_layout=a_layout, b_layout=b_layout)
+    if algorithm == NAIVE:
+        return naive_matmul(a, b, n, m, p, a_layout=a_layout, b_layout=b_layout)
+
+    raise ValueError(f"Unknown matrix multiplication algorithm {algorithm!r}.")
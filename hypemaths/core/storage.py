@@ -0,0 +1,198 @@
+import sys
+import typing as t
+from array import array
+
+INT_TYPECODE = "q"
+FLOAT_TYPECODE = "d"
+
+# The range of the integers held by an integer buffer.
+INT_MIN = -2 ** 63
+INT_MAX = 2 ** 63 - 1
+
+
+class Storage:
+    """
+    A flat, contiguous buffer of numbers.
+
+    The buffer is held behind this small wrapper instead of directly on the models, so that everything referencing the
+    same numbers keeps doing so even if the buffer has to be re-allocated, for example when an integer buffer is
+    promoted to floats.
+
+    The `version` is bumped on every write, so results derived from the numbers can tell when they went stale.
+
+    The buffer is usually an `array` owned by the storage, but it can also be a `memoryview` over memory owned by
+    something else, such as a memory-mapped file, cast to the typecode of its values. The writes into such memory do
+    not go through the storage and do not bump its version, so the storage is not `owned`, and nothing derived from it
+    is cached.
+    """
+    __slots__ = ("data", "version", "owned")
+
+    def __init__(self, data: t.Union[array, memoryview], owned: t.Optional[bool] = None) -> None:
+        """
+        Parameters
+        ----------
+        data : t.Union[array, memoryview]
+            The flat buffer of the numbers.
+        owned : t.Optional[bool]
+            If only the storage can write into the buffer. Defaults to `None`, true for an `array`.
+        """
+        self.data = data
+        self.version = 0
+        self.owned = isinstance(data, array) if owned is None else owned
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The `array` typecode of the buffer, either ``"q"`` for integers or ``"d"`` for floats.
+        """
+        data = self.data
+        return data.typecode if isinstance(data, array) else data.format
+
+    def upcast(self) -> None:
+        """
+        Promote an integer buffer to a float buffer, in place.
+
+        Raises
+        ------
+        TypeError
+            If the buffer is not owned by the storage, it cannot be re-allocated.
+        """
+        if self.typecode != FLOAT_TYPECODE:
+            if not isinstance(self.data, array):
+                raise TypeError("An integer buffer which is not owned by the matrix, such as a mapped file, cannot hold floats.")
+
+            self.data = array(FLOAT_TYPECODE, self.data)
+
+
+def infer_typecode(values: t.Iterable[t.Union[int, float]]) -> str:
+    """
+    Parameters
+    ----------
+    values : t.Iterable[t.Union[int, float]]
+        The values, which are going to be stored.
+
+    Returns
+    -------
+    str
+        ``"q"`` if every value is an integer, else ``"d"``.
+    """
+    if all(issubclass(kind, int) for kind in set(map(type, values))):
+        return INT_TYPECODE
+    return FLOAT_TYPECODE
+
+
+def result_typecode(*typecodes: str) -> str:
+    """
+    Returns
+    -------
+    str
+        The typecode of the result of an integer preserving operation (`+`, `-`, `*`) between the typecodes passed.
+    """
+    if all(typecode == INT_TYPECODE for typecode in typecodes):
+        return INT_TYPECODE
+    return FLOAT_TYPECODE
+
+
+def pack(values: t.Iterable[t.Union[int, float]], typecode: str) -> array:
+    """
+    Pack the values into a flat `array` of the typecode given.
+
+    Parameters
+    ----------
+    values : t.Iterable[t.Union[int, float]]
+        The values to be packed.
+    typecode : str
+        The typecode to be used.
+
+    Returns
+    -------
+    array
+        The packed buffer.
+
+    Raises
+    ------
+    OverflowError
+        If an integer does not fit into 64 bits. It is not rounded into a float silently.
+    """
+    if typecode == INT_TYPECODE:
+        if not isinstance(values, (list, array)):
+            values = list(values)
+
+        try:
+            return array(INT_TYPECODE, values)
+        except OverflowError:
+            value = next(value for value in values if not INT_MIN <= value <= INT_MAX)
+            raise OverflowError(
+                f"The integer {value} does not fit into 64 bits. Pass it as a float to store it approximately."
+            ) from None
+
+    return array(FLOAT_TYPECODE, values)
+
+
+def strided(data: t.Sequence, start: int, count: int, step: int) -> t.Sequence:
+    """
+    Slice ``count`` elements out of a flat buffer, ``step`` positions apart, starting from ``start``.
+
+    Slicing a `memoryview` this way does not copy anything.
+
+    Returns
+    -------
+    t.Sequence
+        The slice of the buffer, of the same type as the buffer.
+    """
+    stop = start + count * step
+    return data[start:stop if stop >= 0 else None:step]
+
+
+# The buffer formats of 64 bits numbers in the byte order of the machine, ``"l"`` being the one NumPy uses for int64.
+_FORMAT_TYPECODES = {("q", 8): INT_TYPECODE, ("l", 8): INT_TYPECODE, ("d", 8): FLOAT_TYPECODE}
+_NATIVE_PREFIXES = "@=" + ("<" if sys.byteorder == "little" else ">")
+
+
+def typed_view(buffer: t.Any, typecode: t.Optional[str] = None) -> memoryview:
+    """
+    View the memory of any object supporting the buffer protocol as a flat sequence of numbers, without copying it.
+
+    Parameters
+    ----------
+    buffer : t.Any
+        The object, whose memory has to be C-contiguous.
+    typecode : t.Optional[str]
+        The typecode to read raw bytes with. Defaults to `None`, the typecode matching the format of the buffer.
+
+    Returns
+    -------
+    memoryview
+        The flat view of the numbers, cast to ``"q"`` or ``"d"``. It is read-only if the buffer is.
+
+    Raises
+    ------
+    ValueError
+        If the buffer is not contiguous, or its size is not a multiple of the size of the numbers.
+    TypeError
+        If the buffer does not hold 64 bits integers or floats in the byte order of the machine, or raw bytes.
+    """
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        raise ValueError("Only a contiguous buffer can be wrapped without copying it.")
+
+    if view.format in ("B", "b", "c"):
+        if typecode not in (INT_TYPECODE, FLOAT_TYPECODE):
+            raise TypeError(f"The typecode of raw bytes must be {INT_TYPECODE!r} or {FLOAT_TYPECODE!r}, not {typecode!r}")
+    else:
+        found = _FORMAT_TYPECODES.get((view.format.lstrip(_NATIVE_PREFIXES), view.itemsize))
+        if found is None or typecode not in (None, found):
+            raise TypeError(f"A buffer of format {view.format!r} cannot be read as 64 bits integers or floats.")
+        typecode = found
+
+    view = view.cast("B")
+    if len(view) % 8:
+        raise ValueError(f"The buffer holds {len(view)} bytes, which is not a whole number of values.")
+
+    return view.cast(typecode)
@@ -10,6 +10,10 @@ class MatrixNotSquare(Exception):
     pass
 
 
+class SingularMatrixError(Exception):
+    pass
+
+
 class InvalidVectorError(Exception):
     pass
 
@@ -0,0 +1,12 @@
+from .decompositions import CholeskyDecomposition, LUDecomposition, QRDecomposition, SVDDecomposition
+from .eigen import eig, eigvals, is_symmetric, top_k_eigen
+from .functions import expm, matrix_power
+from .operators import LinearOperator
+from .solvers import (
+    Solution,
+    conjugate_gradient,
+    gauss_seidel,
+    gmres,
+    jacobi,
+    jacobi_preconditioner
+)
@@ -0,0 +1,741 @@
+import math
+import operator
+import typing as t
+from array import array
+from itertools import repeat
+
+import hypemaths as hm
+from ..exceptions import MatrixDimensionError, MatrixNotSquare, SingularMatrixError
+
+EPSILON = 2.0 ** -52
+
+
+class LUDecomposition:
+    """
+    The LU factorization with partial pivoting ``P A = L U`` of a square matrix.
+
+    The factorization is computed once, and reused for every determinant, solve and inverse asked from it. ``L`` is
+    unit lower triangular and ``U`` upper triangular, both are stored packed in a single flat list, and are available
+    as matrices through `lower` and `upper`, along with ``P`` through `permutation`.
+
+    The matrix is taken as singular when a pivot is zero up to the rounding errors, at most ``n`` times the machine
+    epsilon times the largest absolute value of the matrix.
+    """
+    def __init__(self, matrix: "hm.Matrix") -> None:
+        """
+        Parameters
+        ----------
+        matrix : Matrix
+            The square matrix to be factorized.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
+        """
+        if matrix.rows != matrix.cols:
+            raise MatrixNotSquare("Only square matrices can be LU factorized.")
+
+        self.size = size = matrix.rows
+        self.pivots = list(range(size))
+        self.sign = 1
+        self.singular = False
+
+        lu = [float(value) for value in matrix._iter_values()]
+        threshold = size * EPSILON * max(map(abs, lu), default=0.0)
+        sub, mul = operator.sub, operator.mul
+
+        for col in range(size):
+            pivot_row = max(range(col, size), key=lambda row: abs(lu[row * size + col]))
+            pivot = lu[pivot_row * size + col]
+
+            if abs(pivot) <= threshold:
+                self.singular = True
+                continue
+
+            if pivot_row != col:
+                top, bottom = col * size, pivot_row * size
+                lu[top:top + size], lu[bottom:bottom + size] = lu[bottom:bottom + size], lu[top:top + size]
+                self.pivots[col], self.pivots[pivot_row] = self.pivots[pivot_row], self.pivots[col]
+                self.sign = -self.sign
+
+            pivot_tail = lu[col * size + col + 1:(col + 1) * size]
+            for row in range(col + 1, size):
+                factor = lu[row * size + col] / pivot
+                lu[row * size + col] = factor
+
+                if factor:
+                    start, stop = row * size + col + 1, (row + 1) * size
+                    lu[start:stop] = map(sub, lu[start:stop], map(mul, pivot_tail, repeat(factor)))
+
+        self._lu = lu
+        self._inverse = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size}, singular={self.singular})"
+
+    @property
+    def lower(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The unit lower triangular factor.
+        """
+        size, lu = self.size, self._lu
+        values = array("d", bytes(8 * size * size))
+        for row in range(size):
+            values[row * size:row * size + row] = array("d", lu[row * size:row * size + row])
+            values[row * size + row] = 1.0
+
+        return hm.Matrix._from_flat(values, (size, size))
+
+    @property
+    def upper(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The upper triangular factor.
+        """
+        size, lu = self.size, self._lu
+        values = array("d", bytes(8 * size * size))
+        for row in range(size):
+            values[row * size + row:(row + 1) * size] = array("d", lu[row * size + row:(row + 1) * size])
+
+        return hm.Matrix._from_flat(values, (size, size))
+
+    @property
+    def permutation(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The permutation matrix, such that ``P A = L U``.
+        """
+        size = self.size
+        values = array("q", bytes(8 * size * size))
+        for row, pivot in enumerate(self.pivots):
+            values[row * size + pivot] = 1
+
+        return hm.Matrix._from_flat(values, (size, size))
+
+    def determinant(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The determinant of the factorized matrix, the signed product of the diagonal of ``U``.
+        """
+        if self.singular:
+            return 0.0
+
+        product = float(self.sign)
+        for index in range(0, self.size * self.size, self.size + 1):
+            product *= self._lu[index]
+        return product
+
+    def _solve_values(self, rhs: t.Sequence[t.Union[int, float]]) -> list:
+        """Solve the system for a single right hand side, given as a sequence of numbers."""
+        size, lu, mul = self.size, self._lu, operator.mul
+
+        solution = [float(rhs[pivot]) for pivot in self.pivots]
+        for row in range(1, size):
+            solution[row] -= sum(map(mul, lu[row * size:row * size + row], solution[:row]))
+
+        for row in reversed(range(size)):
+            tail = sum(map(mul, lu[row * size + row + 1:(row + 1) * size], solution[row + 1:]))
+            solution[row] = (solution[row] - tail) / lu[row * size + row]
+
+        return solution
+
+    def solve(self, rhs: t.Union["hm.Matrix", "hm.Vector"]) -> t.Union["hm.Matrix", "hm.Vector"]:
+        """
+        Solve the system ``A x = b`` for one, or many, right hand sides.
+
+        Parameters
+        ----------
+        rhs : t.Union[Matrix, Vector]
+            The right hand side ``b``, either as a vector, or as a matrix with one system per column.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution ``x``, of the same kind as the right hand side.
+
+        Raises
+        ------
+        SingularMatrixError
+            If the factorized matrix is singular.
+        MatrixDimensionError
+            If the size of the right hand side does not match the matrix.
+        """
+        if self.singular:
+            raise SingularMatrixError("The system cannot be solved as the matrix is singular.")
+
+        return _solved(self._solve_values, rhs, self.size)
+
+    def inverse(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The inverse of the factorized matrix. It is computed once, and copied on the next calls.
+
+        Raises
+        ------
+        SingularMatrixError
+            If the factorized matrix is singular.
+        """
+        if self.singular:
+            raise SingularMatrixError("The matrix is singular, and has no inverse.")
+
+        size = self.size
+        if self._inverse is None:
+            inverse = array("d")
+            for col in range(size):
+                unit = [0] * size
+                unit[col] = 1
+                inverse.extend(self._solve_values(unit))
+
+            self._inverse = hm.Matrix._from_flat(inverse, (size, size)).transpose().materialize()._storage.data
+
+        return hm.Matrix._from_flat(array("d", self._inverse), (size, size))
+
+
+def _solved(
+        solve_values: t.Callable[[list], list], rhs: t.Union["hm.Matrix", "hm.Vector"], rows: int
+) -> t.Union["hm.Matrix", "hm.Vector"]:
+    """
+    Solve a factorized system for one right hand side, or for every column of a matrix.
+
+    Parameters
+    ----------
+    solve_values : t.Callable[[list], list]
+        The solve of a single right hand side, given as a list of floats.
+    rhs : t.Union[Matrix, Vector]
+        The right hand side, either as a vector, or as a matrix with one system per column.
+    rows : int
+        The number of rows of the factorized matrix.
+
+    Returns
+    -------
+    t.Union[Matrix, Vector]
+        The solution, of the same kind as the right hand side.
+
+    Raises
+    ------
+    MatrixDimensionError
+        If the size of the right hand side does not match the matrix.
+    """
+    if isinstance(rhs, hm.Vector):
+        if rhs.dimensions != rows:
+            raise MatrixDimensionError("The right hand side does not match the size of the matrix.")
+        return rhs.__class__(solve_values([float(value) for value in rhs.points]))
+
+    if rhs.rows != rows:
+        raise MatrixDimensionError("The right hand side does not match the size of the matrix.")
+
+    solution = array("d")
+    for column in rhs._columns():
+        solution.extend(solve_values([float(value) for value in column]))
+
+    return hm.Matrix._from_flat(solution, (rhs.cols, len(solution) // rhs.cols)).transpose().materialize()
+
+
+def _dot(x: t.Sequence[float], y: t.Sequence[float]) -> float:
+    return sum(map(operator.mul, x, y))
+
+
+def _from_columns(columns: t.Sequence[t.Sequence[float]], rows: int) -> "hm.Matrix":
+    values = array("d")
+    for row in range(rows):
+        values.extend(column[row] for column in columns)
+    return hm.Matrix._from_flat(values, (rows, len(columns)))
+
+
+class QRDecomposition:
+    """
+    The QR factorization ``A = Q R`` of a ``m x n`` matrix, computed with Householder reflections.
+
+    ``Q`` is never formed while solving, the reflections are applied to the right hand sides instead. When the matrix
+    has more rows than columns, the solves are the least squares solutions of the overdetermined systems.
+    """
+    def __init__(self, matrix: "hm.Matrix") -> None:
+        """
+        Parameters
+        ----------
+        matrix : Matrix
+            The matrix to be factorized.
+        """
+        self.rows, self.cols = rows, cols = matrix.dims
+        columns = [[float(value) for value in column] for column in matrix._columns()]
+        # The Householder vectors ``v``, from the diagonal down, and their ``2 / v.v`` factors.
+        self._reflectors = []
+
+        for col in range(min(rows - 1, cols)):
+            column = columns[col]
+            norm = math.sqrt(_dot(column[col:], column[col:]))
+            if norm == 0:
+                self._reflectors.append(None)
+                continue
+
+            alpha = -math.copysign(norm, column[col])
+            vector = column[col:]
+            vector[0] -= alpha
+            factor = 2 / _dot(vector, vector)
+            self._reflectors.append((vector, factor))
+
+            column[col:] = [alpha] + [0.0] * (rows - col - 1)
+            for other in columns[col + 1:]:
+                scale = factor * _dot(vector, other[col:])
+                other[col:] = map(operator.sub, other[col:], map(operator.mul, vector, repeat(scale)))
+
+        # The upper triangle of every column.
+        self._r = [column[:min(col + 1, rows)] for col, column in enumerate(columns)]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dims={(self.rows, self.cols)})"
+
+    def _apply_q(self, values: list, transpose: bool) -> list:
+        """Apply ``Q``, or its transpose, to a list of ``m`` floats."""
+        reflectors = list(enumerate(self._reflectors))
+        for col, reflector in (reflectors if transpose else reversed(reflectors)):
+            if reflector is not None:
+                vector, factor = reflector
+                scale = factor * _dot(vector, values[col:])
+                values[col:] = map(operator.sub, values[col:], map(operator.mul, vector, repeat(scale)))
+        return values
+
+    @property
+    def q(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The ``m x min(m, n)`` factor of orthonormal columns.
+        """
+        size = min(self.rows, self.cols)
+        columns = []
+        for col in range(size):
+            unit = [0.0] * self.rows
+            unit[col] = 1.0
+            columns.append(self._apply_q(unit, transpose=False))
+
+        return _from_columns(columns, self.rows)
+
+    @property
+    def r(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The ``min(m, n) x n`` upper triangular factor.
+        """
+        size = min(self.rows, self.cols)
+        return _from_columns([column + [0.0] * (size - len(column)) for column in self._r], size)
+
+    @property
+    def full_rank(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            If no value of the diagonal of ``R`` is zero, up to the rounding errors relative to the largest one.
+        """
+        diagonal = [abs(self._r[index][index]) for index in range(min(self.rows, self.cols))]
+        threshold = max(self.rows, self.cols) * EPSILON * max(diagonal, default=0.0)
+        return all(value > threshold for value in diagonal)
+
+    def _solve_values(self, rhs: list) -> list:
+        """Solve for a single right hand side, by back substitution against ``Q^T b``."""
+        projected = self._apply_q(rhs, transpose=True)
+        r, cols = self._r, self.cols
+        solution = [0.0] * cols
+        for row in reversed(range(cols)):
+            tail = sum(r[col][row] * solution[col] for col in range(row + 1, cols))
+            solution[row] = (projected[row] - tail) / r[row][row]
+        return solution
+
+    def solve(self, rhs: t.Union["hm.Matrix", "hm.Vector"]) -> t.Union["hm.Matrix", "hm.Vector"]:
+        """
+        Solve ``A x = b`` for one, or many, right hand sides, in the least squares sense if ``A`` has more rows than
+        columns.
+
+        Parameters
+        ----------
+        rhs : t.Union[Matrix, Vector]
+            The right hand side ``b``, either as a vector, or as a matrix with one system per column.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution ``x`` minimizing the norm of ``A x - b``, of the same kind as the right hand side.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the matrix has fewer rows than columns, or the size of the right hand side does not match it.
+        SingularMatrixError
+            If the matrix does not have full column rank, use `SVDDecomposition.solve` for those.
+        """
+        if self.rows < self.cols:
+            raise MatrixDimensionError("The system is underdetermined, use the SVD for its minimum norm solution.")
+
+        if not self.full_rank:
+            raise SingularMatrixError("The system cannot be solved as the matrix does not have full rank.")
+
+        return _solved(self._solve_values, rhs, self.rows)
+
+    def determinant(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The determinant of the factorized square matrix, the product of the diagonal of ``R`` signed by the number
+            of reflections.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
+        """
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Only square matrices have a determinant.")
+
+        product = 1.0
+        for index in range(self.cols):
+            product *= self._r[index][index]
+
+        reflections = sum(reflector is not None for reflector in self._reflectors)
+        return -product if reflections % 2 else product
+
+
+class CholeskyDecomposition:
+    """
+    The Cholesky factorization ``A = L L^T`` of a symmetric positive definite matrix, with ``L`` lower triangular.
+
+    It takes about half the work of the LU factorization, and is the fastest way to solve, invert or find the
+    determinant of covariance matrices and other symmetric positive definite systems.
+    """
+    def __init__(self, matrix: "hm.Matrix") -> None:
+        """
+        Parameters
+        ----------
+        matrix : Matrix
+            The symmetric positive definite matrix to be factorized. Only its lower triangle is read.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
+        ValueError
+            If the matrix is not positive definite.
+        """
+        if matrix.rows != matrix.cols:
+            raise MatrixNotSquare("Only square matrices can be Cholesky factorized.")
+
+        self.size = matrix.rows
+        mul, sqrt = operator.mul, math.sqrt
+        # The rows of ``L``, each one stopping at the diagonal.
+        lower = []
+
+        for index in range(self.size):
+            values = matrix._row_values(index)
+            row = []
+            for col, previous in enumerate(lower):
+                # ``row`` holds ``col`` values so far, the product stops at them.
+                row.append((values[col] - sum(map(mul, row, previous))) / previous[col])
+
+            pivot = values[index] - sum(map(mul, row, row))
+            if pivot <= 0:
+                raise ValueError("The matrix is not positive definite, and cannot be Cholesky factorized.")
+
+            row.append(sqrt(pivot))
+            lower.append(row)
+
+        self._lower = lower
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size})"
+
+    @property
+    def lower(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The lower triangular factor ``L``.
+        """
+        size = self.size
+        values = array("d", bytes(8 * size * size))
+        for index, row in enumerate(self._lower):
+            values[index * size:index * size + index + 1] = array("d", row)
+
+        return hm.Matrix._from_flat(values, (size, size))
+
+    def _solve_values(self, rhs: list) -> list:
+        """Solve for a single right hand side, by forward substitution against ``L``, then backward against ``L^T``."""
+        lower, mul = self._lower, operator.mul
+
+        solution = []
+        for index, row in enumerate(lower):
+            solution.append((rhs[index] - sum(map(mul, row, solution))) / row[index])
+
+        for index in reversed(range(self.size)):
+            solution[index] /= lower[index][index]
+            value = solution[index]
+            if value:
+                row = lower[index]
+                for col in range(index):
+                    solution[col] -= row[col] * value
+
+        return solution
+
+    def solve(self, rhs: t.Union["hm.Matrix", "hm.Vector"]) -> t.Union["hm.Matrix", "hm.Vector"]:
+        """
+        Solve the system ``A x = b`` for one, or many, right hand sides.
+
+        Parameters
+        ----------
+        rhs : t.Union[Matrix, Vector]
+            The right hand side ``b``, either as a vector, or as a matrix with one system per column.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution ``x``, of the same kind as the right hand side.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the size of the right hand side does not match the matrix.
+        """
+        return _solved(self._solve_values, rhs, self.size)
+
+    def log_determinant(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The natural logarithm of the determinant, twice the sum of the logarithms of the diagonal of ``L``, which
+            does not overflow for large matrices.
+        """
+        return 2 * math.fsum(math.log(row[-1]) for row in self._lower)
+
+    def determinant(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The determinant of the factorized matrix, the squared product of the diagonal of ``L``.
+        """
+        product = 1.0
+        for row in self._lower:
+            product *= row[-1]
+        return product * product
+
+    def inverse(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The inverse of the factorized matrix.
+        """
+        size = self.size
+        inverse = array("d")
+        for col in range(size):
+            unit = [0.0] * size
+            unit[col] = 1.0
+            inverse.extend(self._solve_values(unit))
+
+        # The inverse is symmetric, its columns are its rows.
+        return hm.Matrix._from_flat(inverse, (size, size))
+
+
+class SVDDecomposition:
+    """
+    The thin singular value decomposition ``A = U S V^T`` of a ``m x n`` matrix, computed with the one-sided Jacobi
+    method, which finds the small singular values to a high relative accuracy.
+
+    ``U`` is ``m x k`` and ``V`` is ``n x k``, with ``k = min(m, n)``, and the singular values of ``S`` are sorted from
+    the largest. The decomposition gives the rank, the condition number, the pseudo-inverse and the minimum norm least
+    squares solutions of any matrix, even rank deficient ones.
+    """
+    max_sweeps = 60
+
+    def __init__(self, matrix: "hm.Matrix") -> None:
+        """
+        Parameters
+        ----------
+        matrix : Matrix
+            The matrix to be factorized.
+
+        Raises
+        ------
+        ValueError
+            If the method does not converge.
+        """
+        self.rows, self.cols = matrix.dims
+        # A wide matrix is decomposed through its transpose, whose factors are swapped back.
+        transposed = self.rows < self.cols
+        source = matrix.transpose() if transposed else matrix
+        rows, cols = source.dims
+
+        columns = [[float(value) for value in column] for column in source._columns()]
+        basis = [[float(row == col) for row in range(cols)] for col in range(cols)]
+        norms = [_dot(column, column) for column in columns]
+
+        for _ in range(self.max_sweeps):
+            rotated = False
+            for first in range(cols - 1):
+                for second in range(first + 1, cols):
+                    alpha, beta = norms[first], norms[second]
+                    gamma = _dot(columns[first], columns[second])
+                    if abs(gamma) <= EPSILON * math.sqrt(alpha * beta) or not gamma:
+                        continue
+
+                    rotated = True
+                    zeta = (beta - alpha) / (2 * gamma)
+                    tangent = math.copysign(1.0, zeta) / (abs(zeta) + math.sqrt(1 + zeta * zeta))
+                    cosine = 1 / math.sqrt(1 + tangent * tangent)
+                    sine = cosine * tangent
+
+                    for pair in (columns, basis):
+                        x, y = pair[first], pair[second]
+                        pair[first] = [cosine * x_i - sine * y_i for x_i, y_i in zip(x, y)]
+                        pair[second] = [sine * x_i + cosine * y_i for x_i, y_i in zip(x, y)]
+
+                    norms[first] -= tangent * gamma
+                    norms[second] += tangent * gamma
+
+            if not rotated:
+                break
+        else:
+            raise ValueError("The singular value decomposition did not converge.")
+
+        singular_values = [math.sqrt(_dot(column, column)) for column in columns]
+        order = sorted(range(cols), key=lambda index: -singular_values[index])
+
+        self.singular_values = [singular_values[index] for index in order]
+        left = [
+            [value / singular_values[index] for value in columns[index]] if singular_values[index] else [0.0] * rows
+            for index in order
+        ]
+        right = [basis[index] for index in order]
+        self._u, self._v = (right, left) if transposed else (left, right)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(dims={(self.rows, self.cols)}, rank={self.rank()})"
+
+    @property
+    def u(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The ``m x k`` factor of the left singular vectors as columns.
+        """
+        return _from_columns(self._u, self.rows)
+
+    @property
+    def v(self) -> "hm.Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The ``n x k`` factor of the right singular vectors as columns.
+        """
+        return _from_columns(self._v, self.cols)
+
+    def _tolerance(self, tol: t.Optional[float]) -> float:
+        if tol is not None:
+            return tol
+        return max(self.rows, self.cols) * EPSILON * (self.singular_values[0] if self.singular_values else 0.0)
+
+    def rank(self, tol: t.Optional[float] = None) -> int:
+        """
+        Parameters
+        ----------
+        tol : t.Optional[float]
+            The singular values up to this one are taken as zeros. Defaults to ``max(m, n)`` times the machine
+            epsilon times the largest singular value.
+
+        Returns
+        -------
+        int
+            The numerical rank of the matrix, its number of nonzero singular values.
+        """
+        threshold = self._tolerance(tol)
+        return sum(value > threshold for value in self.singular_values)
+
+    def condition_number(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The ratio of the largest singular value to the smallest one, in the 2-norm, infinite for singular matrices.
+        """
+        smallest = self.singular_values[-1] if self.singular_values else 0.0
+        return self.singular_values[0] / smallest if smallest else math.inf
+
+    def _solve_values(self, rhs: list, tol: t.Optional[float] = None) -> list:
+        """Solve for a single right hand side, as ``V S^+ U^T b``."""
+        threshold = self._tolerance(tol)
+        solution = [0.0] * self.cols
+        for value, left, right in zip(self.singular_values, self._u, self._v):
+            if value > threshold:
+                scale = _dot(left, rhs) / value
+                solution = [s_i + scale * r_i for s_i, r_i in zip(solution, right)]
+        return solution
+
+    def solve(
+            self, rhs: t.Union["hm.Matrix", "hm.Vector"], tol: t.Optional[float] = None
+    ) -> t.Union["hm.Matrix", "hm.Vector"]:
+        """
+        Find the minimum norm least squares solution of ``A x = b``, for one, or many, right hand sides.
+
+        Parameters
+        ----------
+        rhs : t.Union[Matrix, Vector]
+            The right hand side ``b``, either as a vector, or as a matrix with one system per column.
+        tol : t.Optional[float]
+            The singular values up to this one are taken as zeros, see `rank`.
+
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution ``x`` of the smallest norm among the ones minimizing the norm of ``A x - b``, of the same kind
+            as the right hand side.
+
+        Raises
+        ------
+        MatrixDimensionError
+            If the size of the right hand side does not match the matrix.
+        """
+        return _solved(lambda values: self._solve_values(values, tol), rhs, self.rows)
+
+    def pseudo_inverse(self, tol: t.Optional[float] = None) -> "hm.Matrix":
+        """
+        Parameters
+        ----------
+        tol : t.Optional[float]
+            The singular values up to this one are taken as zeros, see `rank`.
+
+        Returns
+        -------
+        Matrix
+            The ``n x m`` Moore-Penrose pseudo-inverse ``V S^+ U^T`` of the matrix.
+        """
+        threshold = self._tolerance(tol)
+        values = array("d", bytes(8 * self.cols * self.rows))
+        for value, left, right in zip(self.singular_values, self._u, self._v):
+            if value > threshold:
+                for row, right_value in enumerate(right):
+                    scale = right_value / value
+                    start = row * self.rows
+                    values[start:start + self.rows] = array(
+                        "d", map(operator.add, values[start:start + self.rows], map(operator.mul, left, repeat(scale)))
+                    )
+
+        return hm.Matrix._from_flat(values, (self.cols, self.rows))
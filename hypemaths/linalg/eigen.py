@@ -0,0 +1,737 @@
+"""
+The eigenvalues and eigenvectors of square matrices.
+
+The whole spectrum of a dense matrix is found by reducing it to a Hessenberg matrix, and running the shifted QR
+algorithm on it. Symmetric matrices are detected and take a faster path: a tridiagonal reduction followed by the
+implicit QL algorithm, whose eigenvalues are all real.
+
+When only the leading few eigenpairs of a large, sparse or matrix-free operator are needed, `top_k_eigen` only goes
+through products with vectors, with the Lanczos algorithm for the symmetric operators, and subspace iteration for the
+other ones.
+"""
+import math
+import random
+import typing as t
+from array import array
+
+import hypemaths as hm
+from .operators import LinearOperator, dot, euclidean_norm, operator_matvec, system_size
+from ..exceptions import MatrixNotSquare
+
+EPSILON = 2.0 ** -52
+
+# The eigenvalues, followed by the matrix of the eigenvectors as columns.
+EigenPairs = t.Tuple[t.List[t.Union[float, complex]], "hm.Matrix"]
+
+
+def _square_size(a: "hm.Matrix") -> int:
+    if not isinstance(a, hm.Matrix):
+        raise TypeError(f"The operand must be a Matrix, not {type(a)}.")
+
+    if a.rows != a.cols:
+        raise MatrixNotSquare("Only square matrices have eigenvalues.")
+
+    return a.rows
+
+
+def _dense_rows(a: "hm.Matrix") -> t.List[list]:
+    return [[float(value) for value in a._row_values(row)] for row in range(a.rows)]
+
+
+def is_symmetric(a: t.Union["hm.Matrix", "hm.SparseMatrix"]) -> bool:
+    """
+    Returns
+    -------
+    bool
+        If the matrix is square and equal to its transpose.
+    """
+    if a.rows != a.cols:
+        return False
+
+    if isinstance(a, hm.SparseMatrix):
+        return a == a.transpose()
+
+    rows = [list(a._row_values(row)) for row in range(a.rows)]
+    return all(rows[row][col] == rows[col][row] for row in range(a.rows) for col in range(row))
+
+
+def _tridiagonalize(v: t.List[list]) -> t.Tuple[list, list]:
+    """
+    Reduce a symmetric matrix to a tridiagonal one with Householder reflections, overwriting it with the orthogonal
+    transformation accumulated. This is the ``tred2`` procedure of EISPACK.
+
+    Returns
+    -------
+    t.Tuple[list, list]
+        The diagonal of the tridiagonal matrix, and its subdiagonal, shifted by one so that ``e[i]`` is next to
+        ``d[i]`` and ``d[i - 1]``.
+    """
+    n = len(v)
+    d = v[n - 1][:]
+    e = [0.0] * n
+
+    for i in range(n - 1, 0, -1):
+        scale = sum(abs(d[k]) for k in range(i))
+        h = 0.0
+
+        if scale == 0.0:
+            e[i] = d[i - 1]
+            for j in range(i):
+                d[j] = v[i - 1][j]
+                v[i][j] = 0.0
+                v[j][i] = 0.0
+        else:
+            for k in range(i):
+                d[k] /= scale
+                h += d[k] * d[k]
+
+            f = d[i - 1]
+            g = -math.sqrt(h) if f > 0 else math.sqrt(h)
+            e[i] = scale * g
+            h -= f * g
+            d[i - 1] = f - g
+            for j in range(i):
+                e[j] = 0.0
+
+            for j in range(i):
+                f = d[j]
+                v[j][i] = f
+                g = e[j] + v[j][j] * f
+                for k in range(j + 1, i):
+                    g += v[k][j] * d[k]
+                    e[k] += v[k][j] * f
+                e[j] = g
+
+            f = 0.0
+            for j in range(i):
+                e[j] /= h
+                f += e[j] * d[j]
+
+            hh = f / (h + h)
+            for j in range(i):
+                e[j] -= hh * d[j]
+
+            for j in range(i):
+                f, g = d[j], e[j]
+                for k in range(j, i):
+                    v[k][j] -= f * e[k] + g * d[k]
+                d[j] = v[i - 1][j]
+                v[i][j] = 0.0
+
+        d[i] = h
+
+    # Accumulate the transformations.
+    for i in range(n - 1):
+        v[n - 1][i] = v[i][i]
+        v[i][i] = 1.0
+        h = d[i + 1]
+
+        if h != 0.0:
+            for k in range(i + 1):
+                d[k] = v[k][i + 1] / h
+
+            for j in range(i + 1):
+                g = sum(v[k][i + 1] * v[k][j] for k in range(i + 1))
+                for k in range(i + 1):
+                    v[k][j] -= g * d[k]
+
+        for k in range(i + 1):
+            v[k][i + 1] = 0.0
+
+    for j in range(n):
+        d[j] = v[n - 1][j]
+        v[n - 1][j] = 0.0
+
+    v[n - 1][n - 1] = 1.0
+    e[0] = 0.0
+    return d, e
+
+
+def _tridiagonal_eigen(d: list, e: list, v: t.List[list]) -> None:
+    """
+    Diagonalize a symmetric tridiagonal matrix with the implicit QL algorithm, the ``tql2`` procedure of EISPACK.
+    The eigenvalues overwrite the diagonal `d`, and the rotations are applied to the columns of `v`.
+
+    Raises
+    ------
+    ValueError
+        If the algorithm does not converge.
+    """
+    n = len(d)
+    for i in range(1, n):
+        e[i - 1] = e[i]
+    e[n - 1] = 0.0
+
+    f = 0.0
+    largest = 0.0
+    for low in range(n):
+        largest = max(largest, abs(d[low]) + abs(e[low]))
+        m = low
+        while m < n - 1 and abs(e[m]) > EPSILON * largest:
+            m += 1
+
+        iterations = 0
+        while m > low and abs(e[low]) > EPSILON * largest:
+            iterations += 1
+            if iterations > 30 * n:
+                raise ValueError("The eigenvalues did not converge.")
+
+            g = d[low]
+            p = (d[low + 1] - g) / (2.0 * e[low])
+            r = math.copysign(math.hypot(p, 1.0), p)
+            d[low] = e[low] / (p + r)
+            d[low + 1] = e[low] * (p + r)
+            dl1 = d[low + 1]
+            h = g - d[low]
+            for i in range(low + 2, n):
+                d[i] -= h
+            f += h
+
+            p = d[m]
+            c = c2 = c3 = 1.0
+            el1 = e[low + 1]
+            s = s2 = 0.0
+            for i in range(m - 1, low - 1, -1):
+                c3, c2, s2 = c2, c, s
+                g = c * e[i]
+                h = c * p
+                r = math.hypot(p, e[i])
+                e[i + 1] = s * r
+                s = e[i] / r
+                c = p / r
+                p = c * d[i] - s * g
+                d[i + 1] = h + s * (c * g + s * d[i])
+
+                for row in v:
+                    h = row[i + 1]
+                    row[i + 1] = s * row[i] + c * h
+                    row[i] = c * row[i] - s * h
+
+            p = -s * s2 * c3 * el1 * e[low] / dl1
+            e[low] = s * p
+            d[low] = c * p
+
+        d[low] += f
+        e[low] = 0.0
+
+
+def _hessenberg(h: t.List[list]) -> None:
+    """Reduce a matrix to an upper Hessenberg one in place, with Householder reflections, as ``orthes`` of EISPACK."""
+    n = len(h)
+    ort = [0.0] * n
+
+    for m in range(1, n - 1):
+        scale = sum(abs(h[i][m - 1]) for i in range(m, n))
+        if scale == 0.0:
+            continue
+
+        norm = 0.0
+        for i in range(n - 1, m - 1, -1):
+            ort[i] = h[i][m - 1] / scale
+            norm += ort[i] * ort[i]
+
+        g = -math.sqrt(norm) if ort[m] > 0 else math.sqrt(norm)
+        norm -= ort[m] * g
+        ort[m] -= g
+
+        for j in range(m, n):
+            f = sum(ort[i] * h[i][j] for i in range(m, n)) / norm
+            for i in range(m, n):
+                h[i][j] -= f * ort[i]
+
+        for i in range(n):
+            row = h[i]
+            f = sum(ort[j] * row[j] for j in range(m, n)) / norm
+            for j in range(m, n):
+                row[j] -= f * ort[j]
+
+        h[m][m - 1] = scale * g
+
+
+def _hessenberg_eigenvalues(h: t.List[list]) -> t.List[t.Union[float, complex]]:
+    """
+    Find the eigenvalues of an upper Hessenberg matrix with the Francis double shift QR algorithm, destroying it.
+    This is the eigenvalue part of the ``hqr2`` procedure of EISPACK.
+
+    Raises
+    ------
+    ValueError
+        If the algorithm does not converge.
+    """
+    size = len(h)
+    values = [0.0] * size
+    n = size - 1
+    exshift = 0.0
+    p = q = r = s = z = 0.0
+    norm = sum(abs(h[i][j]) for i in range(size) for j in range(max(i - 1, 0), size))
+
+    iterations = 0
+    while n >= 0:
+        low = n
+        while low > 0:
+            s = abs(h[low - 1][low - 1]) + abs(h[low][low]) or norm
+            if abs(h[low][low - 1]) < EPSILON * s:
+                break
+            low -= 1
+
+        if low == n:
+            # A single root.
+            values[n] = h[n][n] + exshift
+            n -= 1
+            iterations = 0
+        elif low == n - 1:
+            # A pair of roots, either real or complex conjugates.
+            w = h[n][n - 1] * h[n - 1][n]
+            p = (h[n - 1][n - 1] - h[n][n]) / 2.0
+            q = p * p + w
+            z = math.sqrt(abs(q))
+            x = h[n][n] + exshift
+
+            if q >= 0:
+                z = p + z if p >= 0 else p - z
+                values[n - 1] = x + z
+                values[n] = x - w / z if z != 0.0 else x + z
+            else:
+                values[n - 1] = complex(x + p, z)
+                values[n] = complex(x + p, -z)
+
+            n -= 2
+            iterations = 0
+        else:
+            x = h[n][n]
+            y = w = 0.0
+            if low < n:
+                y = h[n - 1][n - 1]
+                w = h[n][n - 1] * h[n - 1][n]
+
+            # The exceptional shifts of Wilkinson, and of MATLAB, breaking the cycles.
+            if iterations == 10:
+                exshift += x
+                for i in range(n + 1):
+                    h[i][i] -= x
+                s = abs(h[n][n - 1]) + abs(h[n - 1][n - 2])
+                x = y = 0.75 * s
+                w = -0.4375 * s * s
+
+            if iterations == 30:
+                s = ((y - x) / 2.0) ** 2 + w
+                if s > 0:
+                    s = math.sqrt(s)
+                    if y < x:
+                        s = -s
+                    s = x - w / ((y - x) / 2.0 + s)
+                    for i in range(n + 1):
+                        h[i][i] -= s
+                    exshift += s
+                    x = y = w = 0.964
+
+            iterations += 1
+            if iterations > 30 * size:
+                raise ValueError("The eigenvalues did not converge.")
+
+            # Look for two consecutive small subdiagonal elements.
+            m = n - 2
+            while m >= low:
+                z = h[m][m]
+                r = x - z
+                s = y - z
+                p = (r * s - w) / h[m + 1][m] + h[m][m + 1]
+                q = h[m + 1][m + 1] - z - r - s
+                r = h[m + 2][m + 1]
+                s = abs(p) + abs(q) + abs(r)
+                p, q, r = p / s, q / s, r / s
+                if m == low:
+                    break
+                if abs(h[m][m - 1]) * (abs(q) + abs(r)) < EPSILON * (
+                        abs(p) * (abs(h[m - 1][m - 1]) + abs(z) + abs(h[m + 1][m + 1]))
+                ):
+                    break
+                m -= 1
+
+            for i in range(m + 2, n + 1):
+                h[i][i - 2] = 0.0
+                if i > m + 2:
+                    h[i][i - 3] = 0.0
+
+            # A double QR step on the rows low:n and the columns m:n.
+            for k in range(m, n):
+                not_last = k != n - 1
+                if k != m:
+                    p = h[k][k - 1]
+                    q = h[k + 1][k - 1]
+                    r = h[k + 2][k - 1] if not_last else 0.0
+                    x = abs(p) + abs(q) + abs(r)
+                    if x == 0.0:
+                        continue
+                    p, q, r = p / x, q / x, r / x
+
+                s = math.copysign(math.sqrt(p * p + q * q + r * r), p)
+                if s == 0:
+                    continue
+
+                if k != m:
+                    h[k][k - 1] = -s * x
+                elif low != m:
+                    h[k][k - 1] = -h[k][k - 1]
+
+                p += s
+                x, y, z = p / s, q / s, r / s
+                q, r = q / p, r / p
+
+                for j in range(k, size):
+                    p = h[k][j] + q * h[k + 1][j]
+                    if not_last:
+                        p += r * h[k + 2][j]
+                        h[k + 2][j] -= p * z
+                    h[k][j] -= p * x
+                    h[k + 1][j] -= p * y
+
+                for i in range(min(n, k + 3) + 1):
+                    row = h[i]
+                    p = x * row[k] + y * row[k + 1]
+                    if not_last:
+                        p += z * row[k + 2]
+                        row[k + 2] -= p * r
+                    row[k] -= p
+                    row[k + 1] -= p * q
+
+    return values
+
+
+def _magnitude_order(values: t.Sequence[t.Union[float, complex]]) -> t.List[int]:
+    """The positions of the values, from the largest in absolute value, the real ones first among equals."""
+    return sorted(range(len(values)), key=lambda index: (-abs(values[index]), -values[index].real))
+
+
+def _normalized(vector: list) -> list:
+    norm = euclidean_norm(vector)
+    return [component / norm for component in vector]
+
+
+def _inverse_iteration(rows: t.List[list], value: float) -> list:
+    """
+    Returns
+    -------
+    list
+        The unit eigenvector of a real eigenvalue, found by solving with the matrix shifted by a value very close to it.
+    """
+    n = len(rows)
+    scale = max(sum(map(abs, row)) for row in rows) or 1.0
+
+    # The shift is moved further away while the shifted matrix is exactly singular.
+    for perturbation in (1e-10, 1e-8, 1e-6):
+        shifted = array("d")
+        for index, row in enumerate(rows):
+            shifted.extend(row)
+            shifted[index * n + index] -= value + scale * perturbation
+
+        lu = hm.Matrix._from_flat(shifted, (n, n)).lu()
+        if not lu.singular:
+            break
+
+    generator = random.Random(n)
+    vector = [1.0 + generator.random() for _ in range(n)]
+    for _ in range(3):
+        vector = _normalized(lu._solve_values(vector))
+
+    return vector
+
+
+def _symmetric_eigen(rows: t.List[list]) -> t.Tuple[list, t.List[list]]:
+    """
+    Returns
+    -------
+    t.Tuple[list, t.List[list]]
+        The eigenvalues, and the matrix of the eigenvectors as columns, in the same order.
+    """
+    d, e = _tridiagonalize(rows)
+    _tridiagonal_eigen(d, e, rows)
+    return d, rows
+
+
+def _columns_matrix(columns: t.List[t.Sequence[float]], n: int) -> "hm.Matrix":
+    """
+    Returns
+    -------
+    Matrix
+        The matrix of the eigenvectors as columns, each one signed so that its largest component is positive, for the
+        results to be reproducible.
+    """
+    columns = [column if max(column, key=abs) >= 0 else [-component for component in column] for column in columns]
+
+    values = array("d")
+    for row in range(n):
+        values.extend(column[row] for column in columns)
+    return hm.Matrix._from_flat(values, (n, len(columns)))
+
+
+def eigvals(a: "hm.Matrix") -> t.List[t.Union[float, complex]]:
+    """
+    Parameters
+    ----------
+    a : Matrix
+        A square matrix.
+
+    Returns
+    -------
+    t.List[t.Union[float, complex]]
+        The eigenvalues, repeated as many times as their multiplicity, from the largest in absolute value. The complex
+        ones come in conjugate pairs, and are only found for matrices which are not symmetric.
+
+    Raises
+    ------
+    MatrixNotSquare
+        If the matrix is not square.
+    """
+    _square_size(a)
+    rows = _dense_rows(a)
+
+    if is_symmetric(a):
+        values, _ = _symmetric_eigen(rows)
+    else:
+        _hessenberg(rows)
+        values = _hessenberg_eigenvalues(rows)
+
+    return [values[index] for index in _magnitude_order(values)]
+
+
+def eig(a: "hm.Matrix") -> EigenPairs:
+    """
+    Parameters
+    ----------
+    a : Matrix
+        A square matrix, whose eigenvalues are all real.
+
+    Returns
+    -------
+    EigenPairs
+        The eigenvalues, from the largest in absolute value, and the matrix of the unit eigenvectors as columns, in the
+        same order. The eigenvectors of a symmetric matrix are orthonormal, the ones of other matrices are found by
+        inverse iteration, and a repeated eigenvalue gets the same eigenvector repeated.
+
+    Raises
+    ------
+    MatrixNotSquare
+        If the matrix is not square.
+    ValueError
+        If some eigenvalues are complex, as a `Matrix` only holds real values. `eigvals` still finds them.
+    """
+    size = _square_size(a)
+    rows = _dense_rows(a)
+
+    if is_symmetric(a):
+        values, vectors = _symmetric_eigen(rows)
+        order = _magnitude_order(values)
+        return [values[index] for index in order], _columns_matrix([[row[index] for row in vectors] for index in order], size)
+
+    hessenberg = [row[:] for row in rows]
+    _hessenberg(hessenberg)
+    values = _hessenberg_eigenvalues(hessenberg)
+    if any(isinstance(value, complex) for value in values):
+        raise ValueError("The matrix has complex eigenvalues, use `eigvals()` to find them.")
+
+    order = _magnitude_order(values)
+    values = [values[index] for index in order]
+    return values, _columns_matrix([_inverse_iteration(rows, value) for value in values], size)
+
+
+def _orthonormalized(vectors: t.List[list], basis: t.Sequence[t.Sequence[float]] = ()) -> t.List[list]:
+    """
+    Returns
+    -------
+    t.List[list]
+        The vectors made orthonormal, and orthogonal to the basis, by two passes of the modified Gram-Schmidt process.
+        The vectors falling in the span of the others are dropped.
+    """
+    result = []
+    for vector in vectors:
+        norm_before = euclidean_norm(vector)
+        for _ in range(2):
+            for other in (*basis, *result):
+                projection = dot(vector, other)
+                vector = [v_i - projection * o_i for v_i, o_i in zip(vector, other)]
+
+        norm = euclidean_norm(vector)
+        if norm > 1e-10 * norm_before:
+            result.append([component / norm for component in vector])
+
+    return result
+
+
+def _combination(coefficients: t.Sequence[float], vectors: t.Sequence[t.Sequence[float]], n: int) -> list:
+    """The linear combination of the vectors, with the coefficients."""
+    combination = [0.0] * n
+    for coefficient, vector in zip(coefficients, vectors):
+        combination = [c_i + coefficient * v_i for c_i, v_i in zip(combination, vector)]
+    return combination
+
+
+def _lanczos(matvec: t.Callable[[list], list], n: int, k: int, tol: float, max_steps: int) -> t.Tuple[list, list]:
+    """
+    Run the Lanczos algorithm with full reorthogonalization, until the `k` Ritz pairs of the largest absolute values
+    converge.
+
+    Returns
+    -------
+    t.Tuple[list, list]
+        The `k` eigenvalues, and their eigenvectors.
+    """
+    generator = random.Random(0)
+    # The basis is stored as arrays, a quarter of the memory of lists of floats.
+    basis = [array("d", _normalized([generator.random() - 0.5 for _ in range(n)]))]
+    alphas, betas = [], []
+
+    while True:
+        steps = len(basis)
+        w = matvec(list(basis[-1]))
+        alpha = dot(w, basis[-1])
+        alphas.append(alpha)
+
+        for _ in range(2):
+            for other in basis:
+                projection = dot(w, other)
+                w = [w_i - projection * o_i for w_i, o_i in zip(w, other)]
+        beta = euclidean_norm(w)
+        invariant = beta <= EPSILON * max(abs(alpha), 1.0)
+        last = steps >= max_steps or steps == n
+
+        if steps >= k and (steps % 5 == 0 or invariant or last):
+            # The residual of a Ritz pair is beta times the last component of its vector in the Krylov basis, so only
+            # the last row of the Ritz vectors is rotated, instead of the whole square of them.
+            d, e = alphas[:], [0.0] + betas
+            last_row = [[0.0] * (steps - 1) + [1.0]]
+            _tridiagonal_eigen(d, e, last_row)
+            order = _magnitude_order(d)[:k]
+
+            converged = all(abs(beta * last_row[0][index]) <= tol * max(abs(d[index]), EPSILON) for index in order)
+            if not converged and last and steps < n:
+                raise ValueError(f"The leading eigenvalues did not converge in {steps} Lanczos steps.")
+
+            if converged or last:
+                # The rotations are the same for every row, so the full Ritz vectors are built once, in the same order.
+                d, e = alphas[:], [0.0] + betas
+                ritz = [[float(row == col) for col in range(steps)] for row in range(steps)]
+                _tridiagonal_eigen(d, e, ritz)
+                vectors = [_combination([row[index] for row in ritz], basis, n) for index in order]
+                return [d[index] for index in order], vectors
+
+        if invariant:
+            # The Krylov subspace is invariant, carry on from a new direction orthogonal to it.
+            restart = _orthonormalized([[generator.random() - 0.5 for _ in range(n)]], basis)
+            w, beta = restart[0], 0.0
+        else:
+            w = [component / beta for component in w]
+
+        betas.append(beta)
+        basis.append(array("d", w))
+
+
+def _subspace_iteration(
+        matvec: t.Callable[[list], list], n: int, k: int, tol: float, max_iterations: int
+) -> t.Tuple[list, list]:
+    """
+    Run the subspace iteration with Rayleigh-Ritz projections, on a block a few vectors larger than `k`, until the `k`
+    Ritz pairs of the largest absolute values converge.
+
+    Returns
+    -------
+    t.Tuple[list, list]
+        The `k` eigenvalues, and their eigenvectors.
+
+    Raises
+    ------
+    ValueError
+        If the leading eigenvalues are complex, or do not converge.
+    """
+    generator = random.Random(0)
+    block = min(n, k + max(k, 5))
+    basis = _orthonormalized([[generator.random() - 0.5 for _ in range(n)] for _ in range(block)])
+
+    for _ in range(max_iterations):
+        images = [matvec(vector) for vector in basis]
+        projected = [[dot(vector, image) for image in images] for vector in basis]
+
+        hessenberg = [row[:] for row in projected]
+        _hessenberg(hessenberg)
+        values = _hessenberg_eigenvalues(hessenberg)
+        order = _magnitude_order(values)[:k]
+
+        if not any(isinstance(values[index], complex) for index in order):
+            vectors, converged = [], True
+            for index in order:
+                coefficients = _inverse_iteration(projected, values[index])
+                vector, image = _combination(coefficients, basis, n), _combination(coefficients, images, n)
+                residual = euclidean_norm([i_r - values[index] * v_r for i_r, v_r in zip(image, vector)])
+                converged = converged and residual <= tol * max(abs(values[index]), EPSILON) * euclidean_norm(vector)
+                vectors.append(vector)
+
+            if converged:
+                return [values[index] for index in order], [_normalized(vector) for vector in vectors]
+
+        basis = _orthonormalized(images)
+        while len(basis) < block:
+            basis += _orthonormalized([[generator.random() - 0.5 for _ in range(n)]], basis)
+
+    raise ValueError("The leading eigenvalues did not converge, or are complex.")
+
+
+def top_k_eigen(
+        a: t.Union["hm.Matrix", "hm.SparseMatrix", LinearOperator],
+        k: int,
+        symmetric: t.Optional[bool] = None,
+        tol: float = 1e-8,
+        max_iterations: t.Optional[int] = None
+) -> EigenPairs:
+    """
+    Find the `k` eigenvalues of the largest absolute values, and their eigenvectors, only going through products with
+    vectors.
+
+    Symmetric operators are run through the Lanczos algorithm, and the other ones through subspace iteration, which
+    needs their leading eigenvalues to be real.
+
+    Parameters
+    ----------
+    a : t.Union[Matrix, SparseMatrix, LinearOperator]
+        A square matrix, or an operator computing its products with vectors.
+    k : int
+        The number of eigenpairs.
+    symmetric : t.Optional[bool]
+        If the operator is symmetric. Defaults to detecting it for the matrices, and to `False` for the operators.
+    tol : float
+        The tolerance on the residual of every eigenpair, relative to its eigenvalue. Defaults to ``1e-8``.
+    max_iterations : t.Optional[int]
+        The largest size of the Lanczos basis, or number of subspace iterations. Defaults to the size of the operator
+        for Lanczos, and to 1000 for subspace iteration.
+
+    Returns
+    -------
+    EigenPairs
+        The eigenvalues, from the largest in absolute value, and the matrix of the unit eigenvectors as columns.
+
+    Raises
+    ------
+    ValueError
+        If `k` is not between 1 and the size of the operator, or the leading eigenvalues do not converge within
+        `max_iterations`.
+
+    Examples
+    --------
+    >>> from hypemaths import SparseMatrix
+    >>> from hypemaths.linalg import top_k_eigen
+    >>> laplacian = SparseMatrix((3, 3), [(0, 0, 2), (0, 1, -1), (1, 0, -1), (1, 1, 2), (1, 2, -1), (2, 1, -1), (2, 2, 2)])
+    >>> values, vectors = top_k_eigen(laplacian, 1)
+    """
+    n = system_size(a)
+    if not 1 <= k <= n:
+        raise ValueError(f"The number of eigenpairs must be between 1 and {n}, not {k}.")
+
+    if symmetric is None:
+        symmetric = not isinstance(a, LinearOperator) and is_symmetric(a)
+
+    matvec = operator_matvec(a, n)
+    if symmetric:
+        values, vectors = _lanczos(matvec, n, k, tol, n if max_iterations is None else max_iterations)
+    else:
+        values, vectors = _subspace_iteration(matvec, n, k, tol, 1000 if max_iterations is None else max_iterations)
+
+    return values, _columns_matrix(vectors, n)
@@ -0,0 +1,288 @@
+"""
+Functions of square matrices: the integer powers, and the exponential.
+
+Powers are computed by binary exponentiation, with about ``2 log2(k)`` products for ``A ** k`` instead of ``k - 1``,
+and the exponential by scaling and squaring around a Padé approximant (Higham, 2005). Both detect the diagonal
+matrices, whose functions are the functions of their diagonals, and the triangular ones, whose products only go
+through their nonzero triangles.
+"""
+import math
+import operator
+import typing as t
+from itertools import repeat
+
+import hypemaths as hm
+from .decompositions import LUDecomposition
+from ..core import FLOAT_TYPECODE, pack
+from ..core.matmul import matmul
+from ..exceptions import MatrixNotSquare, SingularMatrixError
+
+DIAGONAL = "diagonal"
+UPPER = "upper"
+LOWER = "lower"
+GENERAL = "general"
+
+# The coefficients of the numerators of the ``[m / m]`` Padé approximants of the exponential, from the constant term,
+# and the largest 1-norm each one is accurate to the double precision for.
+PADE_COEFFICIENTS = {
+    3: (120.0, 60.0, 12.0, 1.0),
+    5: (30240.0, 15120.0, 3360.0, 420.0, 30.0, 1.0),
+    7: (17297280.0, 8648640.0, 1995840.0, 277200.0, 25200.0, 1512.0, 56.0, 1.0),
+    9: (
+        17643225600.0, 8821612800.0, 2075673600.0, 302702400.0, 30270240.0, 2162160.0, 110880.0, 3960.0, 90.0, 1.0
+    ),
+    13: (
+        64764752532480000.0, 32382376266240000.0, 7771770303897600.0, 1187353796428800.0, 129060195264000.0,
+        10559470521600.0, 670442572800.0, 33522128640.0, 1323241920.0, 40840800.0, 960960.0, 16380.0, 182.0, 1.0
+    ),
+}
+PADE_THETAS = {
+    3: 1.495585217958292e-2,
+    5: 2.539398330063230e-1,
+    7: 9.504178996162932e-1,
+    9: 2.097847961257068e0,
+    13: 5.371920351148152e0,
+}
+
+
+def _square_size(a: "hm.Matrix") -> int:
+    if not isinstance(a, hm.Matrix):
+        raise TypeError(f"The operand must be a Matrix, not {type(a)}.")
+
+    if a.rows != a.cols:
+        raise MatrixNotSquare("Only square matrices have powers and an exponential.")
+
+    return a.rows
+
+
+def _structure(values: list, size: int) -> str:
+    """
+    Returns
+    -------
+    str
+        The kind of the flat square matrix from its zeros, `DIAGONAL`, `UPPER` or `LOWER` for the triangular ones, or
+        `GENERAL`.
+    """
+    below = any(any(values[row * size:row * size + row]) for row in range(size))
+    above = any(any(values[row * size + row + 1:(row + 1) * size]) for row in range(size))
+
+    if below:
+        return GENERAL if above else LOWER
+    return UPPER if above else DIAGONAL
+
+
+def _transposed(values: list, size: int) -> list:
+    return [value for col in range(size) for value in values[col::size]]
+
+
+def _identity(size: int) -> list:
+    values = [0] * (size * size)
+    values[::size + 1] = [1] * size
+    return values
+
+
+def _diagonal_matrix(diagonal: list, typecode: str) -> "hm.Matrix":
+    size = len(diagonal)
+    values = [0] * (size * size)
+    values[::size + 1] = diagonal
+    return hm.Matrix._from_flat(pack(values, typecode), (size, size))
+
+
+def _product(x: list, y: list, size: int) -> list:
+    return matmul(x, y, size, size, size)
+
+
+def _upper_product(x: list, y: list, size: int) -> list:
+    """The product of two upper triangular matrices, only going through the terms of their upper triangles."""
+    mul = operator.mul
+    # The row ``i`` of ``x`` from the diagonal, and the column ``j`` of ``y`` down to the diagonal.
+    tails = [x[row * size + row:(row + 1) * size] for row in range(size)]
+    heads = [y[col:col * size + col + 1:size] for col in range(size)]
+
+    product = [0] * (size * size)
+    for row, tail in enumerate(tails):
+        product[row * size + row:(row + 1) * size] = [sum(map(mul, tail, heads[col][row:])) for col in range(row, size)]
+
+    return product
+
+
+def matrix_power(a: "hm.Matrix", exponent: int) -> "hm.Matrix":
+    """
+    Raise a square matrix to an integer power, by binary exponentiation.
+
+    The diagonal matrices raise their diagonals to the power, and the triangular ones only multiply their triangles.
+    The negative powers are the powers of the inverse, computed from the cached LU factorization of the matrix and
+    cached along with it.
+
+    Parameters
+    ----------
+    a : Matrix
+        The square matrix.
+    exponent : int
+        The power, the identity for 0.
+
+    Returns
+    -------
+    Matrix
+        The matrix ``A ** exponent``, of integers if the matrix is and the power is not negative.
+
+    Raises
+    ------
+    TypeError
+        If the exponent is not an integer.
+    MatrixNotSquare
+        If the matrix is not square.
+    SingularMatrixError
+        If the power is negative and the matrix is singular.
+    """
+    if not isinstance(exponent, int) or isinstance(exponent, bool):
+        raise TypeError(f"Matrices can only be raised to integer powers, not {type(exponent)}.")
+
+    size = _square_size(a)
+    values = list(a._iter_values())
+    kind = _structure(values, size)
+    typecode = a.typecode if exponent >= 0 else FLOAT_TYPECODE
+
+    if kind == DIAGONAL:
+        diagonal = values[::size + 1]
+        if exponent < 0 and not all(diagonal):
+            raise SingularMatrixError("The matrix is singular, and has no negative powers.")
+        return _diagonal_matrix([value ** exponent for value in diagonal], typecode)
+
+    if exponent < 0:
+        values, exponent = list(a.inverse()._iter_values()), -exponent
+
+    if exponent == 0:
+        return hm.Matrix._from_flat(pack(_identity(size), typecode), (size, size))
+
+    # A lower triangular matrix is raised as the transpose of an upper triangular one.
+    if kind == LOWER:
+        values = _transposed(values, size)
+    multiply = _product if kind == GENERAL else _upper_product
+
+    power = None
+    while True:
+        if exponent & 1:
+            power = values if power is None else multiply(power, values, size)
+
+        exponent >>= 1
+        if not exponent:
+            break
+        values = multiply(values, values, size)
+
+    if kind == LOWER:
+        power = _transposed(power, size)
+
+    return hm.Matrix._from_flat(pack(power, typecode), (size, size))
+
+
+def _combination(terms: t.Iterable[t.Tuple[float, t.Optional[list]]], size: int) -> list:
+    """The sum of the matrices scaled by their coefficients, a matrix of `None` standing for the identity."""
+    add, mul = operator.add, operator.mul
+
+    combination = [0.0] * (size * size)
+    for coefficient, values in terms:
+        if values is None:
+            combination[::size + 1] = [value + coefficient for value in combination[::size + 1]]
+        else:
+            combination = list(map(add, combination, map(mul, values, repeat(coefficient))))
+
+    return combination
+
+
+def _pade(values: list, size: int, degree: int, multiply: t.Callable[[list, list, int], list]) -> t.Tuple[list, list]:
+    """
+    Returns
+    -------
+    t.Tuple[list, list]
+        The odd and even parts ``U`` and ``V`` of the numerator of the Padé approximant of the degree, whose
+        denominator is ``V - U``.
+    """
+    b = PADE_COEFFICIENTS[degree]
+    square = multiply(values, values, size)
+
+    if degree < 13:
+        # The even powers of the matrix, from the identity.
+        powers = [None, square]
+        while len(powers) <= degree // 2:
+            powers.append(multiply(powers[-1], square, size))
+
+        odd = _combination(zip(b[1::2], powers), size)
+        return multiply(values, odd, size), _combination(zip(b[0::2], powers), size)
+
+    fourth = multiply(square, square, size)
+    sixth = multiply(fourth, square, size)
+
+    odd = _combination(
+        [(1.0, multiply(sixth, _combination([(b[13], sixth), (b[11], fourth), (b[9], square)], size), size))]
+        + [(b[7], sixth), (b[5], fourth), (b[3], square), (b[1], None)],
+        size
+    )
+    even = _combination(
+        [(1.0, multiply(sixth, _combination([(b[12], sixth), (b[10], fourth), (b[8], square)], size), size))]
+        + [(b[6], sixth), (b[4], fourth), (b[2], square), (b[0], None)],
+        size
+    )
+    return multiply(values, odd, size), even
+
+
+def expm(a: "hm.Matrix") -> "hm.Matrix":
+    """
+    Compute the exponential of a square matrix, by scaling and squaring around a Padé approximant.
+
+    The degree of the approximant is the lowest one accurate to the double precision for the 1-norm of the matrix,
+    and when even the degree 13 is not, the matrix is scaled down by a power of 2 first, and the approximant squared
+    back as many times. The exponential of a diagonal matrix is the exponential of its diagonal, and the triangular
+    matrices only multiply their triangles, and get the exact exponentials of their diagonals.
+
+    Parameters
+    ----------
+    a : Matrix
+        The square matrix.
+
+    Returns
+    -------
+    Matrix
+        The matrix exponential ``e ** A``.
+
+    Raises
+    ------
+    MatrixNotSquare
+        If the matrix is not square.
+    """
+    size = _square_size(a)
+    values = [float(value) for value in a._iter_values()]
+    kind = _structure(values, size)
+    diagonal = values[::size + 1]
+
+    if kind == DIAGONAL:
+        return _diagonal_matrix([math.exp(value) for value in diagonal], FLOAT_TYPECODE)
+
+    if kind == LOWER:
+        values = _transposed(values, size)
+    multiply = _product if kind == GENERAL else _upper_product
+
+    norm = max(sum(map(abs, values[col::size])) for col in range(size))
+    scaling = 0
+    for degree, theta in PADE_THETAS.items():
+        if norm <= theta:
+            break
+    else:
+        scaling = max(0, math.ceil(math.log2(norm / theta)))
+        values = [value / 2 ** scaling for value in values]
+
+    odd, even = _pade(values, size, degree, multiply)
+    numerator = hm.Matrix._from_flat(pack(map(operator.add, even, odd), FLOAT_TYPECODE), (size, size))
+    denominator = hm.Matrix._from_flat(pack(map(operator.sub, even, odd), FLOAT_TYPECODE), (size, size))
+    # The denominator of a triangular matrix is triangular too, and factorizes without any elimination.
+    exponential = list(LUDecomposition(denominator).solve(numerator)._iter_values())
+
+    for _ in range(scaling):
+        exponential = multiply(exponential, exponential, size)
+
+    if kind != GENERAL:
+        exponential[::size + 1] = [math.exp(value) for value in diagonal]
+    if kind == LOWER:
+        exponential = _transposed(exponential, size)
+
+    return hm.Matrix._from_flat(pack(exponential, FLOAT_TYPECODE), (size, size))
@@ -0,0 +1,142 @@
+"""
+The square operators of the iterative algorithms, that are only gone through by products with vectors.
+
+The dense matrices, the sparse matrices and the matrix-free `LinearOperator` are all turned into a product taking and
+returning plain lists of floats, which the solvers and the eigenvalue algorithms share with the vector helpers below.
+"""
+import math
+import operator
+import typing as t
+
+import hypemaths as hm
+from ..exceptions import MatrixNotSquare, VectorDimensionError
+
+# A product with a vector, given and returned as plain lists of floats.
+Matvec = t.Callable[[list], list]
+
+
+class LinearOperator:
+    """
+    A matrix-free square linear operator, only known by its product with vectors.
+
+    Examples
+    --------
+    The one dimensional Laplacian, without storing any matrix:
+
+    >>> from hypemaths import Vector
+    >>> from hypemaths.linalg import conjugate_gradient
+    >>> def laplacian(x):
+    ...     points = x.points
+    ...     return Vector([2 * points[i] - (points[i - 1] if i else 0) - (points[i + 1] if i + 1 < len(points) else 0)
+    ...                    for i in range(len(points))])
+    >>> operator = LinearOperator(100, laplacian)
+    >>> solution = conjugate_gradient(operator, Vector([1.0] * 100))
+    """
+    def __init__(self, size: int, matvec: t.Callable[["hm.Vector"], "hm.Vector"]) -> None:
+        """
+        Parameters
+        ----------
+        size : int
+            The number of rows and columns of the operator.
+        matvec : t.Callable[[Vector], Vector]
+            The product of the operator with a vector of `size` points.
+        """
+        self.size = size
+        self.matvec = matvec
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.size})"
+
+    def __matmul__(self, other: "hm.Vector") -> "hm.Vector":
+        return self.matvec(other)
+
+
+def system_size(a: t.Any) -> int:
+    """
+    Returns
+    -------
+    int
+        The number of unknowns of the system of `a`.
+
+    Raises
+    ------
+    MatrixNotSquare
+        If `a` is not square.
+    TypeError
+        If `a` is neither a matrix nor a linear operator.
+    """
+    if isinstance(a, LinearOperator):
+        return a.size
+
+    if not isinstance(a, (hm.Matrix, hm.SparseMatrix)):
+        raise TypeError(f"The system must be a Matrix, a SparseMatrix or a LinearOperator. Not {type(a)}")
+
+    if a.rows != a.cols:
+        raise MatrixNotSquare("Only the systems of square matrices can be solved.")
+
+    return a.rows
+
+
+def row_entries(a: t.Union["hm.Matrix", "hm.SparseMatrix"]) -> t.List[t.Tuple[t.Optional[t.Sequence], t.Sequence]]:
+    """
+    Returns
+    -------
+    t.List[t.Tuple[t.Optional[t.Sequence], t.Sequence]]
+        The columns and the values of the nonzeros of every row, as views over the buffers of the matrix, without
+        unpacking them into lists. The columns of a dense row are `None`, as it holds a value for every column.
+    """
+    if isinstance(a, hm.SparseMatrix):
+        indptr, indices, data = a._indptr, memoryview(a._indices), memoryview(a._data)
+        return [(indices[start:end], data[start:end]) for start, end in zip(indptr, indptr[1:])]
+
+    return [(None, a._row_values(row)) for row in range(a.rows)]
+
+
+def operator_matvec(a: t.Any, size: int) -> Matvec:
+    """
+    Returns
+    -------
+    Matvec
+        The product of `a` with vectors of `size` points, given as lists.
+    """
+    mul = operator.mul
+
+    if isinstance(a, LinearOperator):
+        def product(x: list) -> list:
+            result = a.matvec(hm.Vector._from_points(x))
+            if result.dimensions != size:
+                raise VectorDimensionError(f"The operator returned {result.dimensions} points instead of {size}.")
+            return result.points
+
+        return product
+
+    rows = row_entries(a)
+
+    def product(x: list) -> list:
+        get = x.__getitem__
+        return [
+            sum(map(mul, values, x if cols is None else map(get, cols)))
+            for cols, values in rows
+        ]
+
+    return product
+
+
+def dot(x: list, y: list) -> float:
+    """
+    Returns
+    -------
+    float
+        The dot product of `x` and `y`, summed without losing precision.
+    """
+    return math.fsum(map(operator.mul, x, y))
+
+
+def euclidean_norm(x: list) -> float:
+    """
+    Returns
+    -------
+    float
+        The euclidean norm of `x`.
+    """
+    return math.sqrt(dot(x, x))
@@ -0,0 +1,446 @@
+"""
+Iterative solvers of the linear systems ``A x = b``, only going through ``A`` by products with vectors.
+
+``A`` can be a dense `Matrix`, a `SparseMatrix`, or a matrix-free `LinearOperator`, so the memory used by a solve is
+proportional to the nonzeros of the system, not to its square size. The vectors are kept as plain lists of floats
+between the iterations.
+"""
+import math
+import operator
+import typing as t
+
+import hypemaths as hm
+from .operators import LinearOperator, Matvec, dot, euclidean_norm, operator_matvec, row_entries, system_size
+from ..exceptions import VectorDimensionError
+
+# A callback run after every iteration, with its number and the norm of the residual.
+Callback = t.Callable[[int, float], t.Any]
+
+
+class Solution:
+    """
+    The result of an iterative solve.
+
+    Attributes
+    ----------
+    x : Vector
+        The last iterate, the solution if the solve converged.
+    converged : bool
+        If the norm of the residual went below the tolerance.
+    iterations : int
+        The number of iterations run.
+    residual : float
+        The norm of the residual ``b - A x`` of the last iterate.
+    """
+    def __init__(self, x: "hm.Vector", converged: bool, iterations: int, residual: float) -> None:
+        self.x = x
+        self.converged = converged
+        self.iterations = iterations
+        self.residual = residual
+
+    def __repr__(self) -> str:
+        return "{}(converged={}, iterations={}, residual={:.3e})".format(
+            self.__class__.__name__, self.converged, self.iterations, self.residual
+        )
+
+
+def _preconditioner(preconditioner: t.Any, size: int) -> Matvec:
+    if preconditioner is None:
+        return list
+
+    if callable(preconditioner) and not isinstance(preconditioner, LinearOperator):
+        preconditioner = LinearOperator(size, preconditioner)
+
+    if system_size(preconditioner) != size:
+        raise VectorDimensionError(f"The preconditioner must be of size {size}, not {system_size(preconditioner)}.")
+
+    return operator_matvec(preconditioner, size)
+
+
+def _diagonal(rows: t.List[t.Tuple[t.Optional[t.Sequence], t.Sequence]]) -> list:
+    """
+    Raises
+    ------
+    ValueError
+        If a value of the diagonal is zero.
+    """
+    diagonal = []
+    for row, (cols, values) in enumerate(rows):
+        value = values[row] if cols is None else dict(zip(cols, values)).get(row, 0.0)
+        if not value:
+            raise ValueError(f"The diagonal of the matrix must be nonzero, but the row {row} has a zero.")
+        diagonal.append(value)
+
+    return diagonal
+
+
+def _start(a: t.Any, b: "hm.Vector", x0: t.Optional["hm.Vector"]) -> t.Tuple[int, list, list]:
+    """
+    Returns
+    -------
+    t.Tuple[int, list, list]
+        The number of unknowns, the right hand side and the first iterate, as lists of floats.
+
+    Raises
+    ------
+    VectorDimensionError
+        If the right hand side or the first iterate do not have as many points as there are unknowns.
+    """
+    size = system_size(a)
+
+    if not isinstance(b, hm.Vector):
+        raise TypeError(f"The right hand side must be a Vector. Not {type(b)}")
+
+    if b.dimensions != size:
+        raise VectorDimensionError(f"The right hand side must have {size} points, not {b.dimensions}.")
+
+    if x0 is None:
+        return size, [float(value) for value in b.points], [0.0] * size
+
+    if x0.dimensions != size:
+        raise VectorDimensionError(f"The first iterate must have {size} points, not {x0.dimensions}.")
+
+    return size, [float(value) for value in b.points], [float(value) for value in x0.points]
+
+
+def jacobi_preconditioner(a: t.Union["hm.Matrix", "hm.SparseMatrix"]) -> LinearOperator:
+    """
+    Parameters
+    ----------
+    a : t.Union[Matrix, SparseMatrix]
+        The matrix of the system.
+
+    Returns
+    -------
+    LinearOperator
+        The inverse of the diagonal of the matrix, the cheapest preconditioner of `conjugate_gradient` and `gmres`.
+
+    Raises
+    ------
+    TypeError
+        If `a` is an operator, its diagonal being needed.
+    ValueError
+        If a value of the diagonal is zero.
+    """
+    if isinstance(a, LinearOperator):
+        raise TypeError("The Jacobi preconditioner needs the values of the matrix, not an operator.")
+
+    system_size(a)
+
+    inverse = [1 / value for value in _diagonal(row_entries(a))]
+    return LinearOperator(len(inverse), lambda x: hm.Vector._from_points(list(map(operator.mul, inverse, x.points))))
+
+
+def conjugate_gradient(
+        a: t.Union["hm.Matrix", "hm.SparseMatrix", LinearOperator],
+        b: "hm.Vector",
+        x0: t.Optional["hm.Vector"] = None,
+        tol: float = 1e-8,
+        max_iterations: t.Optional[int] = None,
+        preconditioner: t.Optional[t.Any] = None,
+        callback: t.Optional[Callback] = None
+) -> Solution:
+    """
+    Solve ``A x = b`` with the, optionally preconditioned, conjugate gradient method, for a symmetric positive definite
+    ``A``.
+
+    Parameters
+    ----------
+    a : t.Union[Matrix, SparseMatrix, LinearOperator]
+        The matrix of the system, or an operator computing its products with vectors.
+    b : Vector
+        The right hand side.
+    x0 : t.Optional[Vector]
+        The first iterate, to warm start from a previous solution. Defaults to zeros.
+    tol : float
+        The tolerance on the norm of the residual, relative to the norm of `b`. Defaults to ``1e-8``.
+    max_iterations : t.Optional[int]
+        The largest number of iterations. Defaults to 10 times the number of unknowns.
+    preconditioner : t.Optional[t.Any]
+        An approximation of the inverse of ``A``, also symmetric positive definite, as a matrix, a `LinearOperator`
+        or a callable taking and returning a `Vector`, such as `jacobi_preconditioner`.
+    callback : t.Optional[Callback]
+        Called after every iteration with its number and the norm of the residual.
+
+    Returns
+    -------
+    Solution
+        The solution, and whether it converged.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is found not to be positive definite.
+    """
+    size, rhs, x = _start(a, b, x0)
+    matvec, precondition = operator_matvec(a, size), _preconditioner(preconditioner, size)
+    threshold = tol * euclidean_norm(rhs)
+    max_iterations = 10 * size if max_iterations is None else max_iterations
+
+    r = list(map(operator.sub, rhs, matvec(x)))
+    residual = euclidean_norm(r)
+    z = precondition(r)
+    p = z
+    rz = dot(r, z)
+
+    iteration = 0
+    while residual > threshold and iteration < max_iterations:
+        iteration += 1
+
+        ap = matvec(p)
+        curvature = dot(p, ap)
+        if curvature <= 0:
+            raise ValueError("The matrix is not positive definite, the conjugate gradient method cannot solve it.")
+
+        alpha = rz / curvature
+        x = [x_i + alpha * p_i for x_i, p_i in zip(x, p)]
+        r = [r_i - alpha * ap_i for r_i, ap_i in zip(r, ap)]
+        residual = euclidean_norm(r)
+
+        if callback is not None:
+            callback(iteration, residual)
+
+        z = precondition(r)
+        rz, previous = dot(r, z), rz
+        beta = rz / previous
+        p = [z_i + beta * p_i for z_i, p_i in zip(z, p)]
+
+    return Solution(hm.Vector._from_points(x), residual <= threshold, iteration, residual)
+
+
+def _stationary(
+        a: t.Union["hm.Matrix", "hm.SparseMatrix"],
+        b: "hm.Vector",
+        x0: t.Optional["hm.Vector"],
+        tol: float,
+        max_iterations: t.Optional[int],
+        callback: t.Optional[Callback],
+        in_place: bool
+) -> Solution:
+    """
+    Run the Jacobi iterations, or the Gauss-Seidel ones when `in_place`, which use every updated unknown right away.
+
+    A Gauss-Seidel sweep measures the residual of every row as it updates it, against the unknowns updated so far,
+    which is free. That norm goes to zero along with the true residual, which costs a product with the matrix and is
+    only computed to confirm the convergence, and after the last iteration.
+
+    Raises
+    ------
+    TypeError
+        If `a` is an operator, its diagonal being needed.
+    """
+    if isinstance(a, LinearOperator):
+        raise TypeError("The Jacobi and Gauss-Seidel methods need the values of the matrix, not an operator.")
+
+    size, rhs, x = _start(a, b, x0)
+    rows = row_entries(a)
+    diagonal = _diagonal(rows)
+    matvec = operator_matvec(a, size)
+    threshold = tol * euclidean_norm(rhs)
+    max_iterations = 10 * size if max_iterations is None else max_iterations
+    mul = operator.mul
+
+    r = list(map(operator.sub, rhs, matvec(x)))
+    residual = euclidean_norm(r)
+
+    iteration = 0
+    while residual > threshold and iteration < max_iterations:
+        iteration += 1
+
+        if in_place:
+            get = x.__getitem__
+            for row, (cols, values) in enumerate(rows):
+                r[row] = rhs[row] - sum(map(mul, values, x if cols is None else map(get, cols)))
+                x[row] += r[row] / diagonal[row]
+            residual = euclidean_norm(r)
+
+            if residual <= threshold or iteration == max_iterations:
+                r = list(map(operator.sub, rhs, matvec(x)))
+                residual = euclidean_norm(r)
+        else:
+            x = [x_i + r_i / d_i for x_i, r_i, d_i in zip(x, r, diagonal)]
+            r = list(map(operator.sub, rhs, matvec(x)))
+            residual = euclidean_norm(r)
+
+        if callback is not None:
+            callback(iteration, residual)
+
+    return Solution(hm.Vector._from_points(x), residual <= threshold, iteration, residual)
+
+
+def jacobi(
+        a: t.Union["hm.Matrix", "hm.SparseMatrix"],
+        b: "hm.Vector",
+        x0: t.Optional["hm.Vector"] = None,
+        tol: float = 1e-8,
+        max_iterations: t.Optional[int] = None,
+        callback: t.Optional[Callback] = None
+) -> Solution:
+    """
+    Solve ``A x = b`` with the Jacobi method, which converges when ``A`` is strictly diagonally dominant.
+
+    Parameters
+    ----------
+    a : t.Union[Matrix, SparseMatrix]
+        The matrix of the system, with a nonzero diagonal.
+    b : Vector
+        The right hand side.
+    x0 : t.Optional[Vector]
+        The first iterate, to warm start from a previous solution. Defaults to zeros.
+    tol : float
+        The tolerance on the norm of the residual, relative to the norm of `b`. Defaults to ``1e-8``.
+    max_iterations : t.Optional[int]
+        The largest number of iterations. Defaults to 10 times the number of unknowns.
+    callback : t.Optional[Callback]
+        Called after every iteration with its number and the norm of the residual.
+
+    Returns
+    -------
+    Solution
+        The solution, and whether it converged.
+
+    Raises
+    ------
+    ValueError
+        If a value of the diagonal is zero.
+    """
+    return _stationary(a, b, x0, tol, max_iterations, callback, in_place=False)
+
+
+def gauss_seidel(
+        a: t.Union["hm.Matrix", "hm.SparseMatrix"],
+        b: "hm.Vector",
+        x0: t.Optional["hm.Vector"] = None,
+        tol: float = 1e-8,
+        max_iterations: t.Optional[int] = None,
+        callback: t.Optional[Callback] = None
+) -> Solution:
+    """
+    Solve ``A x = b`` with the Gauss-Seidel method, which converges when ``A`` is strictly diagonally dominant, or
+    symmetric positive definite, usually about twice as fast as `jacobi`.
+
+    The parameters are the ones of `jacobi`. The residual passed to the `callback` is measured during every sweep,
+    against the unknowns updated so far, and the exact one is computed once it falls below the tolerance.
+
+    Returns
+    -------
+    Solution
+        The solution, and whether it converged.
+
+    Raises
+    ------
+    ValueError
+        If a value of the diagonal is zero.
+    """
+    return _stationary(a, b, x0, tol, max_iterations, callback, in_place=True)
+
+
+def gmres(
+        a: t.Union["hm.Matrix", "hm.SparseMatrix", LinearOperator],
+        b: "hm.Vector",
+        x0: t.Optional["hm.Vector"] = None,
+        tol: float = 1e-8,
+        max_iterations: t.Optional[int] = None,
+        restart: int = 30,
+        preconditioner: t.Optional[t.Any] = None,
+        callback: t.Optional[Callback] = None
+) -> Solution:
+    """
+    Solve ``A x = b`` with the restarted GMRES method, for any nonsingular ``A``.
+
+    The Krylov basis is rebuilt from the current iterate every `restart` iterations, bounding the memory to `restart`
+    vectors. The preconditioner is applied on the right, so the residuals reported are the ones of the original system.
+
+    Parameters
+    ----------
+    a : t.Union[Matrix, SparseMatrix, LinearOperator]
+        The matrix of the system, or an operator computing its products with vectors.
+    b : Vector
+        The right hand side.
+    x0 : t.Optional[Vector]
+        The first iterate, to warm start from a previous solution. Defaults to zeros.
+    tol : float
+        The tolerance on the norm of the residual, relative to the norm of `b`. Defaults to ``1e-8``.
+    max_iterations : t.Optional[int]
+        The largest number of iterations, over all the restarts. Defaults to 10 times the number of unknowns.
+    restart : int
+        The number of iterations between two restarts. Defaults to 30.
+    preconditioner : t.Optional[t.Any]
+        An approximation of the inverse of ``A``, as a matrix, a `LinearOperator` or a callable taking and returning a
+        `Vector`.
+    callback : t.Optional[Callback]
+        Called after every iteration with its number and the estimated norm of the residual.
+
+    Returns
+    -------
+    Solution
+        The solution, and whether it converged.
+    """
+    size, rhs, x = _start(a, b, x0)
+    matvec, precondition = operator_matvec(a, size), _preconditioner(preconditioner, size)
+    threshold = tol * euclidean_norm(rhs)
+    max_iterations = 10 * size if max_iterations is None else max_iterations
+
+    r = list(map(operator.sub, rhs, matvec(x)))
+    residual = euclidean_norm(r)
+
+    iteration = 0
+    while residual > threshold and iteration < max_iterations:
+        basis = [[r_i / residual for r_i in r]]
+        # The columns of the Hessenberg matrix, made upper triangular by the Givens rotations as they are built.
+        columns = []
+        rotations = []
+        g = [residual]
+
+        for step in range(min(restart, max_iterations - iteration)):
+            iteration += 1
+
+            w = matvec(precondition(basis[step]))
+            h = []
+            for v in basis:
+                projection = dot(w, v)
+                h.append(projection)
+                w = [w_i - projection * v_i for w_i, v_i in zip(w, v)]
+            norm = euclidean_norm(w)
+            h.append(norm)
+
+            for row, (c, s) in enumerate(rotations):
+                h[row], h[row + 1] = c * h[row] + s * h[row + 1], -s * h[row] + c * h[row + 1]
+
+            radius = math.hypot(h[step], h[step + 1])
+            c, s = (h[step] / radius, h[step + 1] / radius) if radius else (1.0, 0.0)
+            rotations.append((c, s))
+            breakdown = norm == 0
+            h[step], h[step + 1] = radius, 0.0
+            g.append(-s * g[step])
+            g[step] *= c
+            columns.append(h)
+
+            residual = abs(g[step + 1])
+            if callback is not None:
+                callback(iteration, residual)
+
+            if residual <= threshold or breakdown:
+                break
+
+            basis.append([w_i / norm for w_i in w])
+
+        # Solve the triangular system of the rotated Hessenberg matrix, and move along the preconditioned basis.
+        steps = len(columns)
+        y = [0.0] * steps
+        for row in reversed(range(steps)):
+            tail = sum(columns[col][row] * y[col] for col in range(row + 1, steps))
+            y[row] = (g[row] - tail) / columns[row][row] if columns[row][row] else 0.0
+
+        update = [0.0] * size
+        for coefficient, v in zip(y, basis):
+            update = [u_i + coefficient * v_i for u_i, v_i in zip(update, v)]
+        x = list(map(operator.add, x, precondition(update)))
+
+        r = list(map(operator.sub, rhs, matvec(x)))
+        residual = euclidean_norm(r)
+
+        if breakdown and residual > threshold:
+            break
+
+    return Solution(hm.Vector._from_points(x), residual <= threshold, iteration, residual)
@@ -3,6 +3,8 @@ import typing as t
 
 
 class CopyMixin:
+    __slots__ = ()
+
     def copy(self) -> t.Any:
         return copy.copy(self)
 
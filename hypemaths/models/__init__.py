@@ -1,3 +1,9 @@
+from .batch import VectorBatch
+from .frozen import FrozenMatrix, FrozenVector
+from .lazy import LazyMatrix
+from .mapped import MappedMatrix
 from .matrix import Matrix
 from .point import Point
+from .point_set import PointSet
+from .sparse import SparseMatrix
 from .vector import Vector
@@ -0,0 +1,450 @@
+import math
+import operator
+import typing as t
+from array import array
+from itertools import chain, repeat
+
+from .vector import Vector
+from ..config import settings
+from ..core import FLOAT_TYPECODE, INT_TYPECODE, infer_typecode, pack, result_typecode
+from ..exceptions import VectorDimensionError
+from ..mixins import CopyMixin
+
+MASK_TYPECODE = "B"
+
+
+class VectorBatch(CopyMixin):
+    """
+    Many vectors of the same dimensions, stored together as a structure of arrays.
+
+    The points of all the vectors are held in a single flat buffer, component after component: the first points of
+    every vector, then their second points, and so on. Every operation is then a single loop over the whole buffer,
+    instead of one `Vector` object, its validation and its allocation per vector.
+    """
+    def __init__(self, vectors: t.Iterable[t.Union[Vector, t.Sequence[t.Union[int, float]]]]) -> None:
+        """
+        Parameters
+        ----------
+        vectors : t.Iterable[t.Union[Vector, t.Sequence[t.Union[int, float]]]]
+            The vectors of the batch, either as `Vector` objects or as sequences of points, all of the same dimensions.
+
+        Raises
+        ------
+        ValueError
+            If no vectors are passed.
+        VectorDimensionError
+            If the vectors are not all of the same dimensions.
+        """
+        points = [vector.points if isinstance(vector, Vector) else vector for vector in vectors]
+        if not points:
+            raise ValueError("You need to pass at least a vector for the batch!")
+
+        if settings.validation != "off" and len(set(map(len, points))) > 1:
+            raise VectorDimensionError("All the vectors of a batch must be of the same dimensions.")
+
+        data = self._cleaned_values(list(chain.from_iterable(zip(*points))))
+        self._data = pack(data, infer_typecode(data))
+        self._count = len(points)
+        self._dimensions = len(points[0])
+
+    @classmethod
+    def _from_flat(cls, data: array, count: int, dimensions: int) -> "VectorBatch":
+        """
+        Wrap an already validated component-major buffer into a batch, without copying or re-validating it.
+
+        Parameters
+        ----------
+        data : array
+            The flat buffer, holding the first points of every vector, then their second points, and so on.
+        count : int
+            The number of vectors.
+        dimensions : int
+            The dimensions of every vector.
+
+        Returns
+        -------
+        VectorBatch
+            The batch backed by the buffer passed.
+        """
+        batch = cls.__new__(cls)
+        batch._data = data
+        batch._count = count
+        batch._dimensions = dimensions
+        return batch
+
+    @staticmethod
+    def _cleaned_values(values: list) -> list:
+        """
+        Raises
+        ------
+        TypeError
+            If a value is not an integer or a float, unless the validation is relaxed through `settings.validation`.
+        """
+        if settings.validation == "strict":
+            for kind in set(map(type, values)):
+                if not issubclass(kind, (int, float)):
+                    raise TypeError(f"All points must be integers or floats, but a point is {kind}")
+
+        return values
+
+    @classmethod
+    def from_components(cls, *components: t.Sequence[t.Union[int, float]]) -> "VectorBatch":
+        """
+        Create a batch from the sequences of the points of every component, the cheapest way to build a batch.
+
+        Parameters
+        ----------
+        components : t.Sequence[t.Union[int, float]]
+            The first points of every vector, then their second points, and so on.
+
+        Returns
+        -------
+        VectorBatch
+            The batch of the vectors.
+
+        Examples
+        --------
+        >>> batch = VectorBatch.from_components([1, 2], [3, 4], [5, 6])
+        >>> batch[1]
+        Vector([2, 4, 6])
+        """
+        if not components or not len(components[0]):
+            raise ValueError("You need to pass at least a vector for the batch!")
+
+        if len(set(map(len, components))) > 1:
+            raise VectorDimensionError("All the components of a batch must be of the same length.")
+
+        data = cls._cleaned_values(list(chain.from_iterable(components)))
+        return cls._from_flat(pack(data, infer_typecode(data)), len(components[0]), len(components))
+
+    @classmethod
+    def get_filled_batch(cls, count: int, dimensions: int, fill: t.Union[int, float] = 0) -> "VectorBatch":
+        """
+        Create a batch of identical vectors, every point being the fill value.
+
+        Parameters
+        ----------
+        count : int
+            The number of vectors.
+        dimensions : int
+            The dimensions of every vector.
+        fill : t.Union[int, float]
+            The value of every point. Defaults to 0.
+
+        Returns
+        -------
+        VectorBatch
+            The filled batch.
+        """
+        if not isinstance(fill, (int, float)):
+            raise TypeError(f"The fill value must be an integer or a float, not {type(fill)}")
+
+        return cls._from_flat(array(infer_typecode((fill,)), [fill]) * (count * dimensions), count, dimensions)
+
+    @property
+    def dimensions(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The dimensions of every vector of the batch.
+        """
+        return self._dimensions
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The `array` typecode of the buffer, either ``"q"`` for integers or ``"d"`` for floats.
+        """
+        return self._data.typecode
+
+    def component(self, index: int) -> memoryview:
+        """
+        Read a component of every vector, without copying it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the component, ``0`` for the x points of the vectors, ``1`` for the y points and so on.
+
+        Returns
+        -------
+        memoryview
+            The points of the component, one per vector.
+        """
+        if not -self._dimensions <= index < self._dimensions:
+            raise IndexError(f"The vectors of the batch only have {self._dimensions} dimensions.")
+
+        start = (index % self._dimensions) * self._count
+        return memoryview(self._data)[start:start + self._count]
+
+    def _components(self) -> t.List[memoryview]:
+        return [self.component(index) for index in range(self._dimensions)]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(count={self._count}, dimensions={self._dimensions})"
+
+    def __eq__(self, other: "VectorBatch") -> bool:
+        if not isinstance(other, VectorBatch):
+            raise TypeError(
+                f"Equality comparison with VectorBatch can only be performed with another VectorBatch, got {type(other)}"
+            )
+
+        return (
+            self._dimensions == other._dimensions and self._count == other._count
+            and all(map(operator.eq, self._data, other._data))
+        )
+
+    def __getitem__(self, index: int) -> Vector:
+        if not -self._count <= index < self._count:
+            raise IndexError(f"The batch only has {self._count} vectors.")
+
+        return Vector._from_points(self._data[index % self._count::self._count].tolist())
+
+    def __iter__(self) -> t.Iterator[Vector]:
+        for points in zip(*self._components()):
+            yield Vector._from_points(list(points))
+
+    def _check_operand(self, other: t.Union["VectorBatch", Vector], action: str) -> None:
+        """
+        Raises
+        ------
+        TypeError
+            If the other operand is neither a batch nor a vector.
+        VectorDimensionError
+            If the other operand is a batch of another size, or if its vectors are of other dimensions.
+        """
+        if not isinstance(other, (VectorBatch, Vector)):
+            raise TypeError(f"VectorBatch can only be {action} with another VectorBatch or a Vector, not with {type(other)}")
+
+        if other.dimensions != self._dimensions or (isinstance(other, VectorBatch) and len(other) != self._count):
+            raise VectorDimensionError(f"These vectors cannot be {action} due to wrong dimensions.")
+
+    def _combined(self, other: t.Union["VectorBatch", Vector], op: t.Callable) -> t.Tuple[t.Iterable, str]:
+        """
+        Returns
+        -------
+        t.Tuple[t.Iterable, str]
+            The results of a binary operation between the points at the same position, component after component,
+            along with their typecode. A single vector is combined with every vector of the batch.
+        """
+        if isinstance(other, VectorBatch):
+            return map(op, self._data, other._data), result_typecode(self.typecode, other.typecode)
+
+        values = chain.from_iterable(
+            map(op, component, repeat(point)) for component, point in zip(self._components(), other.points)
+        )
+        return values, result_typecode(self.typecode, infer_typecode(other.points))
+
+    def _elementwise(
+            self, other: t.Union["VectorBatch", Vector], op: t.Callable, typecode: t.Optional[str] = None
+    ) -> "VectorBatch":
+        values, combined_typecode = self._combined(other, op)
+        return self._from_flat(pack(values, typecode or combined_typecode), self._count, self._dimensions)
+
+    def _summed_components(self, data: array) -> array:
+        """
+        Returns
+        -------
+        array
+            The sum of the points of every vector, from a component-major buffer of the shape of this batch.
+        """
+        view = memoryview(data)
+        count = self._count
+
+        total = view[:count].tolist()
+        for start in range(count, len(data), count):
+            total = list(map(operator.add, total, view[start:start + count]))
+
+        return pack(total, data.typecode)
+
+    def add(self, other: t.Union["VectorBatch", Vector]) -> "VectorBatch":
+        """
+        Add another batch of the same size, vector by vector, or a single vector to every vector of the batch.
+
+        Parameters
+        ----------
+        other : t.Union[VectorBatch, Vector]
+            The batch or vector to be added.
+
+        Returns
+        -------
+        VectorBatch
+            The batch of the sums.
+        """
+        self._check_operand(other, "added")
+        return self._elementwise(other, operator.add)
+
+    def sub(self, other: t.Union["VectorBatch", Vector]) -> "VectorBatch":
+        """
+        Subtract another batch of the same size, vector by vector, or a single vector from every vector of the batch.
+
+        Parameters
+        ----------
+        other : t.Union[VectorBatch, Vector]
+            The batch or vector to be subtracted.
+
+        Returns
+        -------
+        VectorBatch
+            The batch of the differences.
+        """
+        self._check_operand(other, "subtracted")
+        return self._elementwise(other, operator.sub)
+
+    def multiply(self, other: t.Union["VectorBatch", Vector]) -> "VectorBatch":
+        """
+        Multiply with another batch of the same size or with a single vector, point by point.
+
+        Parameters
+        ----------
+        other : t.Union[VectorBatch, Vector]
+            The batch or vector to be multiplied with.
+
+        Returns
+        -------
+        VectorBatch
+            The batch of the products.
+        """
+        self._check_operand(other, "multiplied")
+        return self._elementwise(other, operator.mul)
+
+    def scale(self, scalar: t.Union[int, float]) -> "VectorBatch":
+        """
+        Multiply every vector of the batch by a scalar.
+
+        Parameters
+        ----------
+        scalar : t.Union[int, float]
+            The scalar to be multiplied with.
+
+        Returns
+        -------
+        VectorBatch
+            The batch of the scaled vectors.
+        """
+        if not isinstance(scalar, (int, float)):
+            raise TypeError(f"VectorBatch can only be scaled by an integer or a float, not by {type(scalar)}")
+
+        typecode = result_typecode(self.typecode, FLOAT_TYPECODE if isinstance(scalar, float) else INT_TYPECODE)
+        values = map(operator.mul, self._data, repeat(scalar))
+        return self._from_flat(pack(values, typecode), self._count, self._dimensions)
+
+    def dot(self, other: t.Union["VectorBatch", Vector]) -> array:
+        """
+        Compute the dot products with another batch of the same size, vector by vector, or with a single vector.
+
+        Parameters
+        ----------
+        other : t.Union[VectorBatch, Vector]
+            The batch or vector of the other side of the products.
+
+        Returns
+        -------
+        array
+            The dot product of every vector of the batch.
+        """
+        self._check_operand(other, "multiplied")
+
+        values, typecode = self._combined(other, operator.mul)
+        return self._summed_components(pack(values, typecode))
+
+    def norms(self) -> array:
+        """
+        Returns
+        -------
+        array
+            The euclidean norm of every vector of the batch.
+        """
+        return array(FLOAT_TYPECODE, map(math.sqrt, self.dot(self)))
+
+    def parallel_to(self, other: t.Union["VectorBatch", Vector]) -> array:
+        """
+        Check which vectors are parallel to the vectors at the same position of another batch, or to a single vector.
+
+        Parameters
+        ----------
+        other : t.Union[VectorBatch, Vector]
+            The batch or vector to be compared.
+
+        Returns
+        -------
+        array
+            A flag per vector of the batch, ``1`` if it is parallel else ``0``.
+        """
+        dots = self.dot(other)
+        other_norms = other.norms() if isinstance(other, VectorBatch) else repeat(Vector.absolute(other))
+        return array(MASK_TYPECODE, map(math.isclose, map(abs, dots), map(operator.mul, self.norms(), other_norms)))
+
+    def orthogonal_to(self, other: t.Union["VectorBatch", Vector]) -> array:
+        """
+        Check which vectors are orthogonal to the vectors at the same position of another batch, or to a single vector.
+
+        Parameters
+        ----------
+        other : t.Union[VectorBatch, Vector]
+            The batch or vector to be compared.
+
+        Returns
+        -------
+        array
+            A flag per vector of the batch, ``1`` if it is orthogonal else ``0``.
+        """
+        return array(MASK_TYPECODE, map(math.isclose, self.dot(other), repeat(0)))
+
+    def mean(self, decimal: int = 2) -> array:
+        """
+        Returns the mean of the points of every vector, like `Vector.mean` does for a single vector.
+
+        Parameters
+        ----------
+        decimal: Optional, defaults to 2
+            To what decimal point the means should be rounded
+
+        Returns
+        -------
+        array
+            The mean of every vector of the batch.
+        """
+        if not isinstance(decimal, int):
+            raise TypeError(f"Decimal parameter should be an integer not {type(decimal)}")
+
+        means = map(operator.truediv, self._summed_components(self._data), repeat(self._dimensions))
+        return array(FLOAT_TYPECODE, map(round, means, repeat(decimal)))
+
+    def __add__(self, other: t.Union["VectorBatch", Vector]) -> "VectorBatch":
+        return self.add(other)
+
+    def __sub__(self, other: t.Union["VectorBatch", Vector]) -> "VectorBatch":
+        return self.sub(other)
+
+    def __mul__(self, other: t.Union["VectorBatch", Vector, int, float]) -> "VectorBatch":
+        if isinstance(other, (int, float)):
+            return self.scale(other)
+
+        return self.multiply(other)
+
+    def __rmul__(self, other: t.Union[int, float]) -> "VectorBatch":
+        return self.__mul__(other)
+
+    def __truediv__(self, other: t.Union[int, float]) -> "VectorBatch":
+        if not isinstance(other, (int, float)):
+            raise TypeError(f"VectorBatch can only be divided by an integer or a float, not by {type(other)}")
+
+        values = map(operator.truediv, self._data, repeat(other))
+        return self._from_flat(pack(values, FLOAT_TYPECODE), self._count, self._dimensions)
+
+    def __matmul__(self, other: t.Union["VectorBatch", Vector]) -> array:
+        return self.dot(other)
+
+    def __rmatmul__(self, other: Vector) -> array:
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.dot(other)
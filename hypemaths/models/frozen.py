@@ -0,0 +1,238 @@
+import typing as t
+
+from .matrix import Matrix
+from .vector import Vector
+from ..core import Storage
+
+
+class FrozenMatrix(Matrix):
+    """
+    An immutable matrix, hashable by its values, to be used as a dictionary key or an argument of a memoized function.
+
+    The values are copied once into a private read-only buffer, and hashed once along with the dimensions, so hashing
+    the matrix again costs nothing. Nothing can write into the buffer, so a frozen matrix is safely shared between
+    threads without any lock, and the results derived from it, such as its cached LU factorization, never go stale.
+
+    Reading the matrix works as for any `Matrix`, and so do the operations, which return new, mutable matrices. The
+    views of a frozen matrix are frozen too. The in-place operators rebind to a new matrix, as they do for a tuple.
+
+    Examples
+    --------
+    >>> frozen = Matrix([[1, 2], [3, 4]]).freeze()
+    >>> inverses = {frozen: frozen.inverse()}
+    >>> frozen in inverses
+    True
+    >>> matrix = frozen.thaw()
+    >>> matrix[0, 0] = 5
+    """
+    def __init__(self, matrix: t.Union[int, float, list, Matrix] = None) -> None:
+        """
+        Parameters
+        ----------
+        matrix : t.Union[int, float, list, Matrix]
+            The nested 2D lists of the values, as for a `Matrix`, or a matrix whose values are copied.
+        """
+        self._freeze(matrix if isinstance(matrix, Matrix) else Matrix(matrix))
+
+    @classmethod
+    def _from_matrix(cls, matrix: Matrix) -> "FrozenMatrix":
+        frozen = cls.__new__(cls)
+        frozen._freeze(matrix)
+        return frozen
+
+    def _freeze(self, matrix: Matrix) -> None:
+        values = matrix._values()
+        # Nothing can write into the private copy of the values, so the results derived from them are cached.
+        self._storage = Storage(memoryview(values).toreadonly(), owned=True)
+        self._shape = matrix._shape
+        self._strides = (matrix.cols, 1)
+        self._offset = 0
+        self._base = None
+        self._cache = None
+        self._hash = hash((self._shape, tuple(values)))
+
+    @classmethod
+    def _from_flat(cls, data: t.Any, shape: tuple) -> Matrix:
+        # The results computed from a frozen matrix are mutable.
+        return Matrix._from_flat(data, shape)
+
+    @classmethod
+    def _from_nested(cls, matrix: list) -> Matrix:
+        return Matrix._from_nested(matrix)
+
+    def _view(self, shape: tuple, strides: tuple, offset: int) -> "FrozenMatrix":
+        view = super()._view(shape, strides, offset)
+        # A view is only hashed if it is asked to be.
+        view._hash = None
+        return view
+
+    @property
+    def matrix(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The list of the rows of the matrix, which raise a `TypeError` when written into.
+        """
+        return Matrix.matrix.fget(self)
+
+    @matrix.setter
+    def matrix(self, matrix: list) -> None:
+        raise TypeError("A FrozenMatrix cannot be modified, thaw() it first.")
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self._shape, tuple(self._iter_values())))
+        return self._hash
+
+    def __eq__(self, other: Matrix) -> bool:
+        if not isinstance(other, Matrix):
+            return NotImplemented
+
+        if isinstance(other, FrozenMatrix) and hash(self) != hash(other):
+            return False
+
+        return super().__eq__(other)
+
+    def __setitem__(self, index: t.Union[int, slice, tuple], value: t.Union[int, float]) -> None:
+        raise TypeError("A FrozenMatrix does not support item assignment, thaw() it first.")
+
+    def _assign(self, values: t.Iterable[t.Union[int, float]], typecode: str) -> Matrix:
+        raise TypeError("A FrozenMatrix cannot be written into, thaw() it first.")
+
+    def __iadd__(self, other: Matrix) -> Matrix:
+        return self + other
+
+    def __isub__(self, other: Matrix) -> Matrix:
+        return self - other
+
+    def __imul__(self, other: t.Union[Matrix, int, float]) -> Matrix:
+        return self * other
+
+    def __imatmul__(self, other: Matrix) -> Matrix:
+        return self @ other
+
+    def __itruediv__(self, other: t.Union[Matrix, int, float]) -> Matrix:
+        return self / other
+
+    def __copy__(self) -> "FrozenMatrix":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenMatrix":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return FrozenMatrix, (self.thaw(),)
+
+    def freeze(self) -> "FrozenMatrix":
+        """
+        Returns
+        -------
+        FrozenMatrix
+            This matrix, which is already frozen.
+        """
+        return self
+
+    def thaw(self) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            A mutable copy of the matrix.
+        """
+        return Matrix._from_flat(self._values(), self._shape)
+
+
+class FrozenVector(Vector):
+    """
+    An immutable vector, hashable by its points, to be used as a dictionary key or an argument of a memoized function.
+
+    The points are held in a tuple, hashed once when the vector is frozen, and it is safely shared between threads.
+    The operations return new, mutable vectors, and the in-place operators rebind to them.
+    """
+    __slots__ = ("_hash",)
+
+    def __init__(self, *points: t.Union[int, tuple, list]) -> None:
+        """
+        Parameters
+        ----------
+        points: tuple
+            All the points for the vector.
+        """
+        super().__init__(*points)
+        self._frozen_points(self.points)
+
+    @classmethod
+    def _from_vector(cls, vector: Vector) -> "FrozenVector":
+        frozen = cls.__new__(cls)
+        frozen._frozen_points(vector.points)
+        return frozen
+
+    def _frozen_points(self, points: t.Sequence[t.Union[int, float]]) -> None:
+        self.points = tuple(points)
+        self._hash = hash(self.points)
+
+    @classmethod
+    def _from_points(cls, points: list) -> Vector:
+        # The results computed from a frozen vector are mutable.
+        return Vector._from_points(points)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Vector) -> bool:
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        if isinstance(other, FrozenVector):
+            return self._hash == other._hash and self.points == other.points
+
+        return self.points == tuple(other.points)
+
+    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float]) -> None:
+        raise TypeError("A FrozenVector does not support item assignment, thaw() it first.")
+
+    def __delitem__(self, index: int) -> None:
+        raise TypeError("A FrozenVector does not support item deletion, thaw() it first.")
+
+    def _assign(self, points: list) -> Vector:
+        raise TypeError("A FrozenVector cannot be written into, thaw() it first.")
+
+    def __iadd__(self, other: Vector) -> Vector:
+        return self + other
+
+    def __isub__(self, other: Vector) -> Vector:
+        return self - other
+
+    def __imul__(self, other: Vector) -> Vector:
+        return self * other
+
+    def __itruediv__(self, other: Vector) -> Vector:
+        return self / other
+
+    def __copy__(self) -> "FrozenVector":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenVector":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return FrozenVector, self.points
+
+    def freeze(self) -> "FrozenVector":
+        """
+        Returns
+        -------
+        FrozenVector
+            This vector, which is already frozen.
+        """
+        return self
+
+    def thaw(self) -> Vector:
+        """
+        Returns
+        -------
+        Vector
+            A mutable copy of the vector.
+        """
+        return Vector._from_points(list(self.points))
@@ -0,0 +1,309 @@
+import operator
+import typing as t
+from itertools import repeat
+
+from .matrix import Matrix
+from ..config import settings
+from ..core import FLOAT_TYPECODE, INT_TYPECODE, pack, result_typecode
+from ..exceptions import MatrixDimensionError
+
+_SYMBOLS = {"add": "+", "sub": "-", "scale": "*", "divide": "/", "matmul": "@"}
+
+
+class LazyMatrix:
+    """
+    A matrix expression, recorded instead of being computed.
+
+    The elementwise operations (``+``, ``-``, the products and divisions by a scalar, ``abs`` and negation) only build a
+    graph of the expression. It is evaluated when `evaluate` is called or when an element is read, in a single pass
+    which streams every element through the whole chain of operations, without allocating the intermediate matrices.
+
+    A few rewrites are applied while the graph is built:
+
+    - Transposes are pushed down to the matrices, where they are free views, so a double transpose vanishes.
+    - Consecutive products by scalars are folded into a single one, and a product by ``1`` is dropped.
+
+    Products of matrices are evaluated through `Matrix.matmul` and the compute backend, their operands being fused.
+
+    The expression is walked recursively, so it is evaluated as soon as it chains more than `settings.lazy_max_depth`
+    operations, a long accumulation being fused by chunks of that many operations instead of exceeding the recursion
+    limit.
+
+    Examples
+    --------
+    >>> a, b = Matrix([[1, 2], [3, 4]]), Matrix([[5, 6], [7, 8]])
+    >>> expression = (a.lazy() + b - a) * 2.0
+    >>> expression
+    LazyMatrix(((Matrix(2x2) + Matrix(2x2)) - Matrix(2x2)) * 2.0)
+    >>> expression.evaluate()
+    Matrix([[10.0, 12.0],
+             [14.0, 16.0]])
+    """
+    def __init__(self, matrix: Matrix) -> None:
+        """
+        Parameters
+        ----------
+        matrix : Matrix
+            The matrix to start the expression from.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError(f"A LazyMatrix can only be created from a Matrix, not from {type(matrix)}")
+
+        self._set_node("matrix", (matrix,), matrix.dims, matrix.typecode)
+
+    def _set_node(self, kind: str, operands: tuple, shape: tuple, typecode: str) -> None:
+        self._kind = kind
+        self._operands = operands
+        self._shape = shape
+        self._typecode = typecode
+        self._value = None
+        # The number of operations chained down to the deepest matrix.
+        self._depth = 1 + max((operand._depth for operand in operands if isinstance(operand, LazyMatrix)), default=-1)
+
+    @classmethod
+    def _node(cls, kind: str, operands: tuple, shape: tuple, typecode: str) -> "LazyMatrix":
+        """
+        Create a node of the expression graph.
+
+        Parameters
+        ----------
+        kind : str
+            The operation of the node.
+        operands : tuple
+            The operands of the operation, nodes and scalars.
+        shape : tuple
+            The rows and columns of the result.
+        typecode : str
+            The typecode of the result.
+
+        Returns
+        -------
+        LazyMatrix
+            The node, or the expression holding its result if it is deeper than `settings.lazy_max_depth`.
+        """
+        node = cls.__new__(cls)
+        node._set_node(kind, operands, shape, typecode)
+        if node._depth > settings.lazy_max_depth:
+            return LazyMatrix(node.evaluate())
+
+        return node
+
+    @property
+    def rows(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of rows of the result.
+        """
+        return self._shape[0]
+
+    @property
+    def cols(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of columns of the result.
+        """
+        return self._shape[1]
+
+    @property
+    def dims(self) -> tuple:
+        """
+        Returns
+        -------
+        tuple
+            The rows and columns of the result.
+        """
+        return self._shape
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The `array` typecode of the result, either ``"q"`` for integers or ``"d"`` for floats.
+        """
+        return self._typecode
+
+    def _expression(self) -> str:
+        kind, operands = self._kind, self._operands
+        if kind == "matrix":
+            return "Matrix({}x{})".format(*self._shape)
+        if kind == "abs":
+            return f"abs({operands[0]._expression()})"
+        if kind in ("scale", "divide"):
+            return f"({operands[0]._expression()} {_SYMBOLS[kind]} {operands[1]!r})"
+
+        return f"({operands[0]._expression()} {_SYMBOLS[kind]} {operands[1]._expression()})"
+
+    def __repr__(self) -> str:
+        expression = self._expression()
+        if expression.startswith("(") and expression.endswith(")"):
+            expression = expression[1:-1]
+
+        return f"{self.__class__.__name__}({expression})"
+
+    @staticmethod
+    def _wrapped(other: t.Union["LazyMatrix", Matrix]) -> t.Optional["LazyMatrix"]:
+        if isinstance(other, LazyMatrix):
+            return other
+        if isinstance(other, Matrix):
+            return LazyMatrix(other)
+
+        return None
+
+    def _elementwise(self, other: t.Union["LazyMatrix", Matrix], kind: str, action: str) -> "LazyMatrix":
+        other = self._wrapped(other)
+        if other is None:
+            return NotImplemented
+
+        if self._shape != other._shape:
+            raise MatrixDimensionError(f"These matrices cannot be {action} due to wrong dimensions.")
+
+        return self._node(kind, (self, other), self._shape, result_typecode(self._typecode, other._typecode))
+
+    def _scaled(self, scalar: t.Union[int, float]) -> "LazyMatrix":
+        typecode = result_typecode(self._typecode, FLOAT_TYPECODE if isinstance(scalar, float) else INT_TYPECODE)
+
+        if self._kind == "scale":
+            child, inner = self._operands
+            return child._scaled(inner * scalar)
+
+        if scalar == 1 and typecode == self._typecode:
+            return self
+
+        return self._node("scale", (self, scalar), self._shape, typecode)
+
+    def __add__(self, other: t.Union["LazyMatrix", Matrix]) -> "LazyMatrix":
+        return self._elementwise(other, "add", "added")
+
+    def __radd__(self, other: t.Union["LazyMatrix", Matrix]) -> "LazyMatrix":
+        other = self._wrapped(other)
+        return NotImplemented if other is None else other.__add__(self)
+
+    def __sub__(self, other: t.Union["LazyMatrix", Matrix]) -> "LazyMatrix":
+        return self._elementwise(other, "sub", "subtracted")
+
+    def __rsub__(self, other: t.Union["LazyMatrix", Matrix]) -> "LazyMatrix":
+        other = self._wrapped(other)
+        return NotImplemented if other is None else other.__sub__(self)
+
+    def __mul__(self, other: t.Union["LazyMatrix", Matrix, int, float]) -> "LazyMatrix":
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+
+        return self.__matmul__(other)
+
+    def __rmul__(self, other: t.Union["LazyMatrix", Matrix, int, float]) -> "LazyMatrix":
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+
+        return self.__rmatmul__(other)
+
+    def __matmul__(self, other: t.Union["LazyMatrix", Matrix]) -> "LazyMatrix":
+        other = self._wrapped(other)
+        if other is None:
+            return NotImplemented
+
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        return self._node(
+            "matmul", (self, other), (self.rows, other.cols), result_typecode(self._typecode, other._typecode)
+        )
+
+    def __rmatmul__(self, other: t.Union["LazyMatrix", Matrix]) -> "LazyMatrix":
+        other = self._wrapped(other)
+        return NotImplemented if other is None else other.__matmul__(self)
+
+    def __truediv__(self, other: t.Union[int, float, Matrix]) -> t.Union["LazyMatrix", Matrix]:
+        if isinstance(other, (int, float)):
+            return self._node("divide", (self, other), self._shape, FLOAT_TYPECODE)
+
+        # The division between matrices is not elementwise, it is computed by the matrices themselves.
+        return self.evaluate() / (other.evaluate() if isinstance(other, LazyMatrix) else other)
+
+    def __neg__(self) -> "LazyMatrix":
+        return self._scaled(-1)
+
+    def __abs__(self) -> "LazyMatrix":
+        return self._node("abs", (self,), self._shape, self._typecode)
+
+    def transpose(self) -> "LazyMatrix":
+        """
+        Transpose the expression, by pushing the transpose down to the matrices, where it is a free view.
+
+        Returns
+        -------
+        LazyMatrix
+            The transposed expression.
+        """
+        kind, operands = self._kind, self._operands
+        if kind == "matrix":
+            return LazyMatrix(operands[0]._transposed())
+        if kind == "matmul":
+            return operands[1].transpose().__matmul__(operands[0].transpose())
+        if kind in ("add", "sub"):
+            return self._node(kind, (operands[0].transpose(), operands[1].transpose()), self._shape[::-1], self._typecode)
+
+        return self._node(kind, (operands[0].transpose(),) + operands[1:], self._shape[::-1], self._typecode)
+
+    def _stream(self) -> t.Iterator[t.Union[int, float]]:
+        """
+        Returns
+        -------
+        t.Iterator[t.Union[int, float]]
+            The elements of the result in row-major order, every element going through the whole expression before
+            the next one is read.
+        """
+        if self._value is not None:
+            return self._value._iter_values()
+
+        kind, operands = self._kind, self._operands
+        if kind == "matrix":
+            return operands[0]._iter_values()
+        if kind == "add":
+            return map(operator.add, operands[0]._stream(), operands[1]._stream())
+        if kind == "sub":
+            return map(operator.sub, operands[0]._stream(), operands[1]._stream())
+        if kind == "scale":
+            return map(operator.mul, operands[0]._stream(), repeat(operands[1]))
+        if kind == "divide":
+            return map(operator.truediv, operands[0]._stream(), repeat(operands[1]))
+        if kind == "abs":
+            return map(abs, operands[0]._stream())
+
+        return self.evaluate()._iter_values()
+
+    def evaluate(self) -> Matrix:
+        """
+        Compute the expression, in a single fused pass over the elements. The result is computed once and kept, a
+        matrix of the expression modified afterwards is not taken into account.
+
+        Returns
+        -------
+        Matrix
+            The result of the expression.
+        """
+        if self._value is None:
+            kind, operands = self._kind, self._operands
+            if kind == "matrix":
+                self._value = operands[0]
+            elif kind == "matmul":
+                self._value = operands[0].evaluate().matmul(operands[1].evaluate())
+            else:
+                self._value = Matrix._from_flat(pack(self._stream(), self._typecode), self._shape)
+
+        return self._value
+
+    def __getitem__(self, index: t.Union[int, slice, tuple]) -> t.Union[int, float, list, Matrix]:
+        return self.evaluate()[index]
+
+    def __iter__(self) -> t.Iterator[list]:
+        return iter(self.evaluate())
+
+    def __eq__(self, other: t.Union["LazyMatrix", Matrix]) -> bool:
+        return self.evaluate() == (other.evaluate() if isinstance(other, LazyMatrix) else other)
@@ -0,0 +1,416 @@
+import math
+import mmap
+import operator
+import os
+import typing as t
+from array import array
+
+from .matrix import Matrix
+from ..config import settings
+from ..core import FLOAT_TYPECODE, INT_TYPECODE, Storage, infer_typecode, pack, result_typecode
+from ..core.matmul import matmul
+
+PathLike = t.Union[str, os.PathLike]
+
+ACCESS_MODES = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}
+
+
+class MappedMatrix(Matrix):
+    """
+    A matrix stored in a raw binary file and memory-mapped, for data larger than the memory.
+
+    The file holds the values in row-major order, as native 64 bits integers (typecode ``"q"``) or floats (typecode
+    ``"d"``), with nothing else. The mapped file is the buffer of the matrix, so rows, elements and views are read and
+    written as for any `Matrix`, and the operating system pages the file in and out as needed.
+
+    The matrix products, the copying transposes, the sums and the frobenius norm are streamed through tiles of
+    `settings.tile_size` elements, whose pages are released once consumed, so the memory in use stays bounded whatever
+    the size of the matrix. Passing a matrix created by `MappedMatrix.create` as their `out=` destination writes the
+    result straight into a new mapped file. Every other operation returns an in-memory `Matrix`.
+
+    Examples
+    --------
+    >>> matrix = MappedMatrix.create("a.bin", (10000, 10000), fill=1.0)
+    >>> product = matrix.matmul(matrix, out=MappedMatrix.create("product.bin", (10000, 10000)))
+    >>> product.flush()
+    """
+    def __init__(
+            self, path: PathLike, dims: tuple, typecode: str = FLOAT_TYPECODE, mode: str = "r", offset: int = 0
+    ) -> None:
+        """
+        Parameters
+        ----------
+        path : PathLike
+            The path of the file to be mapped.
+        dims : tuple
+            The rows and columns of the matrix.
+        typecode : str
+            The typecode of the values in the file, ``"q"`` or ``"d"``. Defaults to ``"d"``.
+        mode : str
+            ``"r"`` to only read the file, ``"r+"`` to also write into it, or ``"c"`` to write into a private copy
+            of the mapped pages, leaving the file untouched. Defaults to ``"r"``.
+        offset : int
+            The position of the first value in the file, in bytes. Defaults to 0.
+
+        Raises
+        ------
+        ValueError
+            If the dimensions, the typecode or the mode are not valid, or if the file is too small for the matrix.
+        """
+        self._check_layout(dims, typecode)
+        if mode not in ACCESS_MODES:
+            raise ValueError(f"The mode must be one of {', '.join(map(repr, ACCESS_MODES))}, not {mode!r}")
+
+        nbytes = dims[0] * dims[1] * array(typecode).itemsize
+        # A mapping has to start at a multiple of the allocation granularity of the file.
+        start = offset % mmap.ALLOCATIONGRANULARITY
+
+        with open(path, "rb" if mode == "r" else "r+b") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < offset + nbytes:
+                raise ValueError(
+                    f"The file holds {size} bytes, too few for a {dims[0]}x{dims[1]} matrix of typecode "
+                    f"{typecode!r} starting at byte {offset}."
+                )
+
+            self._mmap = mmap.mmap(file.fileno(), start + nbytes, access=ACCESS_MODES[mode], offset=offset - start)
+
+        self._path = os.fspath(path)
+        self._mode = mode
+        self._file_offset = offset
+        self._start = start
+
+        self._storage = Storage(memoryview(self._mmap)[start:start + nbytes].cast(typecode))
+        self._shape = tuple(dims)
+        self._strides = (dims[1], 1)
+        self._offset = 0
+        self._base = None
+        self._cache = None
+
+    @staticmethod
+    def _check_layout(dims: tuple, typecode: str) -> None:
+        """
+        Raises
+        ------
+        ValueError
+            If the dimensions are not two positive integers, or the typecode is neither ``"q"`` nor ``"d"``.
+        """
+        if len(dims) != 2 or not all(isinstance(dim, int) and dim > 0 for dim in dims):
+            raise ValueError(f"The dimensions of a matrix must be two positive integers, not {dims!r}")
+
+        if typecode not in (INT_TYPECODE, FLOAT_TYPECODE):
+            raise ValueError(f"The typecode must be {INT_TYPECODE!r} or {FLOAT_TYPECODE!r}, not {typecode!r}")
+
+    @classmethod
+    def create(
+            cls, path: PathLike, dims: tuple, typecode: str = FLOAT_TYPECODE, fill: t.Union[int, float] = 0
+    ) -> "MappedMatrix":
+        """
+        Create a file for a matrix, overwriting it if it exists, and map it for reading and writing. The arguments
+        are checked before the file is opened, so an existing file is left untouched if they are not valid.
+
+        Parameters
+        ----------
+        path : PathLike
+            The path of the file to be created.
+        dims : tuple
+            The rows and columns of the matrix.
+        typecode : str
+            The typecode of the values, ``"q"`` or ``"d"``. Defaults to ``"d"``.
+        fill : t.Union[int, float]
+            The value of every element. Defaults to 0, which costs nothing as the file is created empty.
+
+        Returns
+        -------
+        MappedMatrix
+            The matrix mapped over the new file.
+
+        Raises
+        ------
+        ValueError
+            If the dimensions or the typecode are not valid.
+        TypeError
+            If the fill value is not a number, or is a float for an integer matrix.
+        """
+        cls._check_layout(dims, typecode)
+
+        if not isinstance(fill, (int, float)) or (typecode == INT_TYPECODE and not isinstance(fill, int)):
+            raise TypeError(f"A matrix of typecode {typecode!r} cannot be filled with {fill!r}")
+        filler = array(typecode, [fill])
+
+        with open(path, "wb") as file:
+            file.truncate(dims[0] * dims[1] * filler.itemsize)
+
+        matrix = cls(path, dims, typecode, "r+")
+        if fill:
+            data = matrix._storage.data
+            for start, block in matrix._row_blocks():
+                data[block._offset:block._offset + block.size] = filler * block.size
+
+        return matrix
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, path: PathLike) -> "MappedMatrix":
+        """
+        Write a matrix, or a view, into a new file and map it.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            The matrix to be written.
+        path : PathLike
+            The path of the file to be created.
+
+        Returns
+        -------
+        MappedMatrix
+            The matrix mapped over the new file.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError(f"Only a Matrix can be written into a mapped file, not {type(matrix)}")
+
+        mapped = cls.create(path, matrix.dims, matrix.typecode)
+        for start, block in mapped._row_blocks():
+            block._assign(matrix[start:start + block.rows]._values(), matrix.typecode)
+
+        return mapped
+
+    @classmethod
+    def _from_flat(cls, data: array, shape: tuple) -> Matrix:
+        # The results computed from a mapped matrix are held in memory.
+        return Matrix._from_flat(data, shape)
+
+    @classmethod
+    def _from_nested(cls, matrix: list) -> Matrix:
+        return Matrix._from_nested(matrix)
+
+    @property
+    def _root(self) -> "MappedMatrix":
+        """
+        Returns
+        -------
+        MappedMatrix
+            The matrix owning the mapping, this one or the base of this view.
+        """
+        return self if self._base is None else self._base
+
+    @property
+    def path(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The path of the mapped file.
+        """
+        return self._root._path
+
+    @property
+    def mode(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The mode the file is mapped with, ``"r"``, ``"r+"`` or ``"c"``.
+        """
+        return self._root._mode
+
+    @property
+    def matrix(self) -> list:
+        return Matrix.matrix.fget(self)
+
+    @matrix.setter
+    def matrix(self, matrix: list) -> None:
+        # The values are written into the file, which cannot be resized.
+        self._check_out(self, (len(matrix), len(matrix[0])))
+        values = [value for row in matrix for value in row]
+        self._assign(values, infer_typecode(values))
+
+    def __reduce__(self) -> tuple:
+        # Pickling a mapped matrix maps its file again, use `clone` for an in-memory copy.
+        if self._base is not None:
+            return self.clone().__reduce__()
+
+        return self.__class__, (self._path, self._shape, self.typecode, self._mode, self._file_offset)
+
+    def __copy__(self) -> Matrix:
+        # A read-only mapping is mapped again, but the copies of a writable one are in memory, so that writing into
+        # them does not change the original.
+        if self.mode == "r" and self._base is None:
+            return self.__class__(self._path, self._shape, self.typecode, "r", self._file_offset)
+
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict) -> Matrix:
+        return self.__copy__()
+
+    def flush(self) -> None:
+        """Write the modified values back to the file, instead of leaving it to the operating system."""
+        if self.mode == "r+":
+            self._root._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Unmap the file. The matrix and its views cannot be used afterwards.
+
+        Raises
+        ------
+        BufferError
+            If a `memoryview` over the values is still alive.
+        """
+        root = self._root
+        if root._mmap.closed:
+            return
+
+        self.flush()
+        root._storage.data.release()
+        root._mmap.close()
+
+    def __enter__(self) -> "MappedMatrix":
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
+
+    def _row_blocks(self, rows: t.Optional[int] = None) -> t.Iterator[t.Tuple[int, Matrix]]:
+        """
+        Parameters
+        ----------
+        rows : t.Optional[int]
+            The number of rows of a block. Defaults to as many rows as fit in `settings.tile_size` elements.
+
+        Returns
+        -------
+        t.Iterator[t.Tuple[int, Matrix]]
+            The first row and the view of every block of consecutive rows. The pages of a block are released once
+            the next one is requested.
+        """
+        rows = rows or max(1, settings.tile_size // self.cols)
+        for start in range(0, self.rows, rows):
+            block = self._subview(slice(start, start + rows), slice(None))
+            yield start, block
+            self._release(block)
+
+    def _release(self, block: Matrix) -> None:
+        """
+        Release the pages holding a block of rows from the memory, they are read again from the file if needed.
+        The private pages of the ``"c"`` mode are kept, as they hold the only copy of what was written into them.
+        """
+        root = self._root
+        row_stride, col_stride = block._strides
+        if root._mmap.closed or root._mode == "c" or col_stride != 1 or row_stride < 0:
+            return
+
+        advise = getattr(root._mmap, "madvise", None)
+        if advise is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+
+        itemsize = block._storage.data.itemsize
+        first = root._start + block._offset * itemsize
+        last = root._start + (block._offset + (block.rows - 1) * row_stride + block.cols) * itemsize
+
+        # Only the pages entirely within the block are released, the ones it shares with its neighbours are kept.
+        first = -(-first // mmap.PAGESIZE) * mmap.PAGESIZE
+        last = last // mmap.PAGESIZE * mmap.PAGESIZE
+        if last > first:
+            advise(mmap.MADV_DONTNEED, first, last - first)
+
+    def _tile_edge(self) -> int:
+        return max(1, math.isqrt(settings.tile_size))
+
+    def _matmul(self, other: Matrix, out: t.Optional[Matrix] = None) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            The product with the other matrix, computed tile by tile. It is written into `out` when given, which can
+            be a mapped matrix, else it is returned in memory.
+        """
+        if out is not None and out._storage in (self._storage, other._storage):
+            # The tiles written would overwrite values still to be read.
+            return super()._matmul(other, out)
+
+        rows, inner, cols = self.rows, self.cols, other.cols
+        typecode = result_typecode(self.typecode, other.typecode)
+        if out is None:
+            out = Matrix._from_flat(array(typecode, [0]) * (rows * cols), (rows, cols))
+
+        a_data, b_data = memoryview(self._storage.data), memoryview(other._storage.data)
+        b_offset, b_row_stride, b_col_stride = other._layout
+        edge = self._tile_edge()
+
+        for start, band in self._row_blocks(edge):
+            band_offset, a_row_stride, a_col_stride = band._layout
+            for col in range(0, cols, edge):
+                width = min(edge, cols - col)
+                tile = [0] * (band.rows * width)
+                for step in range(0, inner, edge):
+                    depth = min(edge, inner - step)
+                    product = matmul(
+                        a_data,
+                        b_data,
+                        band.rows,
+                        depth,
+                        width,
+                        a_layout=(band_offset + step * a_col_stride, a_row_stride, a_col_stride),
+                        b_layout=(b_offset + step * b_row_stride + col * b_col_stride, b_row_stride, b_col_stride)
+                    )
+                    tile = list(map(operator.add, tile, product))
+
+                out[start:start + band.rows, col:col + width]._assign(tile, typecode)
+
+            if isinstance(out, MappedMatrix):
+                out._release(out[start:start + band.rows])
+
+        return out
+
+    def _transposed(self, out: t.Optional[Matrix] = None) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            The transposed view of the matrix, or `out` with the transposed elements copied into it tile by tile when
+            given.
+        """
+        if out is None or out._storage is self._storage:
+            return super()._transposed(out)
+
+        edge = self._tile_edge()
+        for start, band in self._row_blocks(edge):
+            for col in range(0, self.cols, edge):
+                tile = band[:, col:col + edge]
+                out[col:col + tile.cols, start:start + band.rows]._assign(tile._transposed()._values(), tile.typecode)
+
+        return out
+
+    def _sum(self, axis: t.Optional[int] = None) -> t.Union[int, float, Matrix]:
+        """
+        Returns
+        -------
+        t.Union[int, float, Matrix]
+            The sum of the matrix, or of its columns (axis ``0``) or rows (axis ``1``), computed block by block.
+        """
+        if axis is None:
+            return sum(sum(block._values()) for _, block in self._row_blocks())
+
+        if axis == 0:
+            sums = [0] * self.cols
+            for _, block in self._row_blocks():
+                sums = list(map(operator.add, sums, map(sum, block._columns())))
+            return Matrix._from_flat(pack(map(float, sums), FLOAT_TYPECODE), (1, self.cols))
+
+        sums = [sum(block._row_values(row)) for _, block in self._row_blocks() for row in range(block.rows)]
+        return Matrix._from_flat(pack(sums, infer_typecode(sums)), (self.rows, 1))
+
+    def _frobenius_norm(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The frobenius norm of the matrix, computed block by block.
+        """
+        squares = 0
+        for _, block in self._row_blocks():
+            values = block._values()
+            squares += sum(map(operator.mul, values, values))
+
+        return math.sqrt(squares)
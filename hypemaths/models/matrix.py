@@ -1,17 +1,109 @@
-import copy
 import math
+import operator
+import os
 import random
+import sys
 import typing as t
+from array import array
+from itertools import chain, repeat
 
 import hypemaths as hm
+from ..backends import get_backend
+from ..config import VALIDATION_LEVELS, settings
+from ..core import (
+    DerivedCache,
+    DerivedCacheInfo,
+    FLOAT_TYPECODE,
+    INT_TYPECODE,
+    Storage,
+    infer_typecode,
+    pack,
+    result_typecode,
+    strided,
+    typed_view
+)
+from ..core import binary
+from ..core.matmul import matmul
 from ..exceptions import (
     InvalidMatrixError,
     MatrixDimensionError,
     MatrixNotSquare,
 )
+from ..linalg import eigen, functions
+from ..linalg.decompositions import CholeskyDecomposition, LUDecomposition, QRDecomposition, SVDDecomposition
 from ..mixins import CopyMixin
 
 
+class MatrixRow(t.Sequence):
+    """
+    A row of a matrix, reading and writing the values in the buffer of the matrix, so that ``matrix[i][j] = value``
+    changes the matrix as ``matrix[i, j] = value`` does.
+
+    It compares equal to the lists and tuples of the same values, and ``list(row)`` copies it out.
+    """
+    __slots__ = ("_matrix", "_row")
+
+    def __init__(self, matrix: "Matrix", row: int) -> None:
+        """
+        Parameters
+        ----------
+        matrix : Matrix
+            The matrix holding the row.
+        row : int
+            The index of the row, negative values count from the end.
+
+        Raises
+        ------
+        IndexError
+            If the row is out of range.
+        """
+        self._matrix = matrix
+        self._row, _, _ = matrix._resolve_index(row, matrix.rows)
+
+    def __len__(self) -> int:
+        return self._matrix.cols
+
+    def __getitem__(self, index: t.Union[int, slice]) -> t.Union[int, float, list]:
+        if isinstance(index, slice):
+            return self.tolist()[index]
+
+        return self._matrix[self._row, index]
+
+    def __setitem__(self, index: t.Union[int, slice], value: t.Union[int, float, t.Iterable]) -> None:
+        if not isinstance(index, slice):
+            self._matrix[self._row, index] = value
+            return
+
+        cols, values = range(*index.indices(len(self))), list(value)
+        if len(values) != len(cols):
+            raise ValueError(f"The {len(cols)} values of a row cannot be replaced by {len(values)} values.")
+
+        for col, item in zip(cols, values):
+            self._matrix[self._row, col] = item
+
+    def __iter__(self) -> t.Iterator[t.Union[int, float]]:
+        return iter(self.tolist())
+
+    def __eq__(self, other: t.Any) -> bool:
+        if isinstance(other, (MatrixRow, list, tuple)):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self.tolist())
+
+    def tolist(self) -> list:
+        """
+        Returns
+        -------
+        list
+            A copy of the values of the row.
+        """
+        return self._matrix._row_values(self._row).tolist()
+
+
 class Matrix(CopyMixin):
     def __init__(
             self,
@@ -23,12 +115,112 @@ class Matrix(CopyMixin):
         matrix : t.Union[int, float, list]
             This is the nested 2D lists which will be converted into an efficient `Matrix` object capable of several
             calculations and features. Defaults to `None`.
+
+        Raises
+        ------
+        OverflowError
+            If an integer does not fit into 64 bits, as the integer matrices store them in a 64 bits buffer. Such
+            values can be passed as floats instead.
         """
         if not matrix:
             raise ValueError("You need to pass the 2D for the matrix object!")
         else:
             self.matrix = self._cleaned_matrix(matrix)
 
+    @classmethod
+    def _from_flat(cls, data: array, shape: tuple) -> "Matrix":
+        """
+        Wrap an already validated flat row-major buffer into a matrix, without copying or re-validating it.
+
+        Parameters
+        ----------
+        data : array
+            The flat row-major buffer of the values.
+        shape : tuple
+            The rows and columns of the matrix.
+
+        Returns
+        -------
+        Matrix
+            The matrix backed by the buffer passed.
+        """
+        matrix = cls.__new__(cls)
+        matrix._storage = Storage(data)
+        matrix._shape = shape
+        matrix._strides = (shape[1], 1)
+        matrix._offset = 0
+        matrix._base = None
+        matrix._cache = None
+        return matrix
+
+    @classmethod
+    def _from_nested(cls, matrix: list) -> "Matrix":
+        """
+        Pack an already validated nested 2D list into a matrix, without re-validating it.
+
+        Parameters
+        ----------
+        matrix : list
+            The nested 2D list of the values.
+
+        Returns
+        -------
+        Matrix
+            The matrix of the values.
+        """
+        instance = cls.__new__(cls)
+        instance.matrix = matrix
+        return instance
+
+    def _view(self, shape: tuple, strides: tuple, offset: int) -> "Matrix":
+        """
+        Create a matrix sharing the buffer of this one, reading it with another shape, strides and offset.
+
+        Parameters
+        ----------
+        shape : tuple
+            The rows and columns of the view.
+        strides : tuple
+            The number of elements to step in the buffer to move by one row and by one column of the view.
+        offset : int
+            The position of the first element of the view in the buffer.
+
+        Returns
+        -------
+        Matrix
+            The view over the buffer.
+        """
+        view = self.__class__.__new__(self.__class__)
+        view._storage = self._storage
+        view._shape = shape
+        view._strides = strides
+        view._offset = offset
+        view._base = self if self._base is None else self._base
+        view._cache = None
+        return view
+
+    @property
+    def matrix(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The list of the rows of the matrix, as `MatrixRow` objects reading and writing the underlying buffer.
+        """
+        return [MatrixRow(self, row) for row in range(self.rows)]
+
+    @matrix.setter
+    def matrix(self, matrix: list) -> None:
+        rows, cols = len(matrix), len(matrix[0])
+        values = [value for row in matrix for value in row]
+
+        self._storage = Storage(pack(values, infer_typecode(values)))
+        self._shape = (rows, cols)
+        self._strides = (cols, 1)
+        self._offset = 0
+        self._base = None
+        self._cache = None
+
     @property
     def rows(self) -> int:
         """
@@ -37,7 +229,7 @@ class Matrix(CopyMixin):
         int
             The number of rows in the 2D matrix created.
         """
-        return len(self.matrix)
+        return self._shape[0]
 
     @property
     def cols(self) -> int:
@@ -47,7 +239,7 @@ class Matrix(CopyMixin):
         int
             The number of the columns in the 2D matrix created.
         """
-        return len(self.matrix[0])
+        return self._shape[1]
 
     @property
     def dims(self) -> tuple:
@@ -57,7 +249,7 @@ class Matrix(CopyMixin):
         tuple
             The tuple containing the shape or the rows and columns in the matrix created.
         """
-        return tuple(self._get_mat_dimension(self.matrix))
+        return self._shape
 
     @property
     def size(self) -> int:
@@ -67,16 +259,57 @@ class Matrix(CopyMixin):
         int
             The integer which is the total number of items in the matrix
         """
-        matrix = Matrix(self.matrix)
-        return matrix.cols * matrix.rows
+        return self._shape[0] * self._shape[1]
+
+    @property
+    def strides(self) -> tuple:
+        """
+        Returns
+        -------
+        tuple
+            The number of elements to step in the underlying buffer to move by one row and by one column.
+        """
+        return self._strides
+
+    @property
+    def base(self) -> t.Optional["Matrix"]:
+        """
+        Returns
+        -------
+        t.Optional[Matrix]
+            The matrix owning the buffer this view reads from, or `None` if this matrix owns its buffer.
+        """
+        return self._base
+
+    @property
+    def is_contiguous(self) -> bool:
+        """
+        Returns
+        -------
+        bool
+            If the elements of the matrix are laid out in row-major order in a single block of the buffer.
+        """
+        rows, cols = self._shape
+        row_stride, col_stride = self._strides
+        return (rows == 1 or row_stride == cols) and (cols == 1 or col_stride == 1)
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The `array` typecode of the underlying buffer, ``"q"`` for integer matrices and ``"d"`` for float ones.
+        """
+        return self._storage.typecode
 
-    def __hash__(self):
-        return hash(self.matrix)
+    def __hash__(self) -> int:
+        raise TypeError(f"A {self.__class__.__name__} is mutable, and so unhashable. Use freeze() for a hashable copy.")
 
     def __repr__(self) -> str:
         return "{}([{}])".format(
             self.__class__.__name__,
-            ",\n         ".join([str(x) for x in self.matrix])
+            ",\n         ".join([str(self._row_values(row).tolist()) for row in range(self.rows)])
         )
 
     def __eq__(self, other: "Matrix") -> bool:
@@ -85,86 +318,565 @@ class Matrix(CopyMixin):
                 f"Equality comparison with Matrix can only be performed with another Matrix, got {type(other)}"
             )
 
-        return self.matrix == other.matrix
+        return self._shape == other._shape and all(map(operator.eq, self._iter_values(), other._iter_values()))
 
-    def __getitem__(self, index: t.Union[int, tuple]) -> t.Union[int, float, list]:
+    def __iter__(self) -> t.Iterator[MatrixRow]:
+        for row in range(self.rows):
+            yield MatrixRow(self, row)
+
+    def __getitem__(self, index: t.Union[int, slice, tuple]) -> t.Union[int, float, MatrixRow, "Matrix"]:
+        """
+        Parameters
+        ----------
+        index : t.Union[int, slice, tuple]
+            A row, a ``(row, col)`` position, or the slices of the rows and columns.
+
+        Returns
+        -------
+        t.Union[int, float, MatrixRow, Matrix]
+            A row writing into the matrix, an element, or a view sharing the values of the matrix for slices.
+        """
         if isinstance(index, int):
-            return self.matrix[index]
-        else:
-            return self.matrix[index[0]][index[1]]
+            return MatrixRow(self, index)
+
+        row, col = (index, slice(None)) if isinstance(index, slice) else index
+        if isinstance(row, int) and isinstance(col, int):
+            return self._storage.data[self._flat_index(row, col)]
+
+        return self._subview(row, col)
 
-    def __setitem__(self, index: t.Union[int, tuple], value: t.Union[int, float]) -> None:
+    def __setitem__(self, index: t.Union[int, slice, tuple], value: t.Union[int, float]) -> None:
         if isinstance(value, (int, float)):
-            if isinstance(index, int):
-                self.matrix[index] = value
+            if isinstance(value, float):
+                self._storage.upcast()
+            self._storage.version += 1
+
+            if isinstance(index, tuple) and all(isinstance(position, int) for position in index):
+                self._storage.data[self._flat_index(*index)] = value
             else:
-                self.matrix[index[0]][index[1]] = value
+                target = self._subview(index, slice(None)) if isinstance(index, (int, slice)) else self._subview(*index)
+                target._assign(repeat(value, target.size), infer_typecode((value,)))
         else:
             raise TypeError(
                 f"All values must be integers or floats, but value[{value}] is {type(value)}."
             )
 
-    def __add__(self, other: "Matrix") -> "Matrix":
-        cls = self.__class__
+    def _flat_index(self, row: int, col: int) -> int:
+        """
+        Parameters
+        ----------
+        row : int
+            The row of the element, negative values count from the end.
+        col : int
+            The column of the element, negative values count from the end.
+
+        Returns
+        -------
+        int
+            The position of the element in the underlying buffer.
+
+        Raises
+        ------
+        IndexError
+            If the row or the column is out of range.
+        """
+        rows, cols = self._shape
+        if row < 0:
+            row += rows
+        if col < 0:
+            col += cols
+
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise IndexError("Matrix index out of range.")
+
+        return self._offset + row * self._strides[0] + col * self._strides[1]
+
+    @property
+    def _layout(self) -> tuple:
+        """
+        Returns
+        -------
+        tuple
+            The offset, row stride and column stride of the matrix in its buffer.
+        """
+        return (self._offset,) + self._strides
+
+    @staticmethod
+    def _resolve_index(index: t.Union[int, slice], length: int) -> tuple:
+        """
+        Parameters
+        ----------
+        index : t.Union[int, slice]
+            The row or column index, or slice, to be resolved.
+        length : int
+            The number of rows or columns indexed into.
+
+        Returns
+        -------
+        tuple
+            The start, step and count of the rows or columns selected.
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range or the slice is empty.
+        """
+        if isinstance(index, int):
+            if index < 0:
+                index += length
+            if not 0 <= index < length:
+                raise IndexError("Matrix index out of range.")
+            return index, 1, 1
+
+        start, stop, step = index.indices(length)
+        count = len(range(start, stop, step))
+        if not count:
+            raise IndexError("Matrix slices cannot be empty.")
+        return start, step, count
+
+    def _subview(self, row: t.Union[int, slice], col: t.Union[int, slice]) -> "Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The view over the rectangular block of rows and columns selected, an integer selects a single one.
+        """
+        row_start, row_step, row_count = self._resolve_index(row, self.rows)
+        col_start, col_step, col_count = self._resolve_index(col, self.cols)
+        row_stride, col_stride = self._strides
+
+        return self._view(
+            (row_count, col_count),
+            (row_stride * row_step, col_stride * col_step),
+            self._offset + row_start * row_stride + col_start * col_stride
+        )
+
+    def _row_values(self, row: int) -> t.Sequence:
+        """
+        Returns
+        -------
+        t.Sequence
+            The values of the row, read from the underlying buffer without copying it.
+        """
+        start, _, _ = self._resolve_index(row, self.rows)
+        return strided(
+            memoryview(self._storage.data), self._offset + start * self._strides[0], self.cols, self._strides[1]
+        )
+
+    def _iter_values(self) -> t.Iterable[t.Union[int, float]]:
+        """
+        Returns
+        -------
+        t.Iterable[t.Union[int, float]]
+            The values of the matrix in row-major order, read from the underlying buffer without copying it.
+        """
+        if self.is_contiguous:
+            return memoryview(self._storage.data)[self._offset:self._offset + self.size]
+
+        return chain.from_iterable(self._row_values(row) for row in range(self.rows))
+
+    def _values(self) -> array:
+        """
+        Returns
+        -------
+        array
+            A contiguous row-major copy of the values of the matrix.
+        """
+        if self.is_contiguous:
+            values = self._storage.data[self._offset:self._offset + self.size]
+            if isinstance(values, array):
+                return values
+
+            # Slicing a buffer not owned by the matrix only views it.
+            copy = array(self.typecode)
+            copy.frombytes(values.cast("B"))
+            return copy
+
+        return array(self.typecode, self._iter_values())
+
+    def _assign(self, values: t.Iterable[t.Union[int, float]], typecode: str) -> "Matrix":
+        """
+        Write row-major values into the elements of the matrix, and so into every view sharing them.
+        The values are all packed before anything is written, so they can be computed from this very matrix.
+
+        Parameters
+        ----------
+        values : t.Iterable[t.Union[int, float]]
+            The values to be written, one for every element of the matrix.
+        typecode : str
+            The typecode of the values. Writing floats into an integer buffer promotes it to floats.
+
+        Returns
+        -------
+        Matrix
+            This matrix.
+        """
+        values = pack(values, typecode)
+        if values.typecode == FLOAT_TYPECODE:
+            self._storage.upcast()
+        elif self.typecode == FLOAT_TYPECODE:
+            values = array(FLOAT_TYPECODE, values)
+
+        data = self._storage.data
+        if self.is_contiguous:
+            data[self._offset:self._offset + self.size] = values
+        else:
+            cols = self.cols
+            row_stride, col_stride = self._strides
+            for row in range(self.rows):
+                start = self._offset + row * row_stride
+                stop = start + cols * col_stride
+                data[start:stop if stop >= 0 else None:col_stride] = values[row * cols:(row + 1) * cols]
 
-        if not isinstance(other, cls):
+        self._storage.version += 1
+        return self
+
+    def _check_out(self, out: t.Optional["Matrix"], shape: tuple) -> None:
+        """
+        Parameters
+        ----------
+        out : t.Optional[Matrix]
+            The destination passed for the result of an operation.
+        shape : tuple
+            The shape of the result.
+
+        Raises
+        ------
+        TypeError
+            If the destination is not a matrix.
+        MatrixDimensionError
+            If the destination does not have the shape of the result.
+        """
+        if out is None:
+            return
+
+        if not isinstance(out, Matrix):
+            raise TypeError(f"The destination of the result must be a Matrix. Not {type(out)}")
+
+        if out._shape != shape:
+            raise MatrixDimensionError(f"The destination must be of dimensions {shape}, not {out._shape}.")
+
+    def _elementwise(
+            self, other: "Matrix", op: t.Callable, typecode: t.Optional[str] = None, out: t.Optional["Matrix"] = None
+    ) -> "Matrix":
+        """
+        Apply a binary operation between the elements at the same position in two matrices of the same shape.
+
+        Parameters
+        ----------
+        other : Matrix
+            The other matrix of the operation.
+        op : t.Callable
+            The binary function to be applied.
+        typecode : t.Optional[str]
+            The typecode of the result. Defaults to an integer buffer only when both operands are integer buffers.
+        out : t.Optional[Matrix]
+            The matrix to write the results into, instead of a new one.
+
+        Returns
+        -------
+        Matrix
+            The matrix of the results.
+        """
+        if typecode is None:
+            typecode = result_typecode(self.typecode, other.typecode)
+
+        values = map(op, self._iter_values(), other._iter_values())
+        if out is not None:
+            return out._assign(values, typecode)
+
+        return self._from_flat(pack(values, typecode), self._shape)
+
+    def _map(self, func: t.Callable, typecode: str, out: t.Optional["Matrix"] = None) -> "Matrix":
+        """
+        Apply an unary function to every element of the matrix.
+
+        Parameters
+        ----------
+        func : t.Callable
+            The function to be applied.
+        typecode : str
+            The typecode of the result.
+        out : t.Optional[Matrix]
+            The matrix to write the results into, instead of a new one.
+
+        Returns
+        -------
+        Matrix
+            The matrix of the results.
+        """
+        values = map(func, self._iter_values())
+        if out is not None:
+            return out._assign(values, typecode)
+
+        return self._from_flat(pack(values, typecode), self._shape)
+
+    def _columns(self) -> list:
+        """
+        Returns
+        -------
+        list
+            The list of the columns of the matrix, each read from the underlying buffer without copying it.
+        """
+        data = memoryview(self._storage.data)
+        row_stride, col_stride = self._strides
+        return [strided(data, self._offset + col * col_stride, self.rows, row_stride) for col in range(self.cols)]
+
+    def _scaled(self, scalar: t.Union[int, float], out: t.Optional["Matrix"] = None) -> "Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The matrix with every element multiplied by the scalar, computed in pure Python. It is written into `out`
+            when given.
+        """
+        typecode = result_typecode(self.typecode, FLOAT_TYPECODE if isinstance(scalar, float) else INT_TYPECODE)
+        values = map(operator.mul, self._iter_values(), repeat(scalar))
+        if out is not None:
+            return out._assign(values, typecode)
+
+        return self._from_flat(pack(values, typecode), self._shape)
+
+    def _divided(self, scalar: t.Union[int, float], out: t.Optional["Matrix"] = None) -> "Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The matrix with every element divided by the scalar, computed in pure Python. It is written into `out`
+            when given.
+        """
+        values = map(operator.truediv, self._iter_values(), repeat(scalar))
+        if out is not None:
+            return out._assign(values, FLOAT_TYPECODE)
+
+        return self._from_flat(pack(values, FLOAT_TYPECODE), self._shape)
+
+    def _matmul(self, other: "Matrix", out: t.Optional["Matrix"] = None) -> "Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The product with the other matrix, computed in pure Python by the kernels of `hypemaths.core.matmul`. It
+            is written into `out` when given.
+        """
+        product = matmul(
+            memoryview(self._storage.data),
+            memoryview(other._storage.data),
+            self.rows,
+            self.cols,
+            other.cols,
+            a_layout=self._layout,
+            b_layout=other._layout
+        )
+        typecode = result_typecode(self.typecode, other.typecode)
+        if out is not None:
+            return out._assign(product, typecode)
+
+        return self._from_flat(pack(product, typecode), (self.rows, other.cols))
+
+    def add(
+            self, other: t.Union["Matrix", "hm.SparseMatrix"], out: t.Optional["Matrix"] = None, backend: t.Optional[str] = None
+    ) -> "Matrix":
+        """
+        Add another matrix of the same dimensions, element by element.
+
+        Parameters
+        ----------
+        other : t.Union[Matrix, SparseMatrix]
+            The matrix to be added. The nonzero values of a sparse matrix are added without reading the others.
+        out : t.Optional[Matrix]
+            A matrix of the same dimensions to write the result into, instead of allocating a new one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
+
+        Returns
+        -------
+        Matrix
+            The sum of the matrices.
+        """
+        if isinstance(other, hm.SparseMatrix):
+            if self._shape != other.dims:
+                raise MatrixDimensionError("These matrices cannot be added due to wrong dimensions.")
+
+            self._check_out(out, self._shape)
+            return other._scattered(self, 1, out=out)
+
+        if not isinstance(other, Matrix):
             raise TypeError(f"Matrix can only be added with other matrix. Not {type(other)}")
 
         if not (self.rows, self.cols) == (other.rows, other.cols):
             raise MatrixDimensionError("These matrices cannot be added due to wrong dimensions.")
 
-        matrix = [[self[row][cols] + other[row][cols] for cols in range(self.cols)] for row in range(self.rows)]
-        return cls(matrix)
+        self._check_out(out, self._shape)
+        return get_backend(backend).matrix_add(self, other, out)
 
-    def __sub__(self, other: "Matrix") -> "Matrix":
-        cls = self.__class__
+    def sub(
+            self, other: t.Union["Matrix", "hm.SparseMatrix"], out: t.Optional["Matrix"] = None, backend: t.Optional[str] = None
+    ) -> "Matrix":
+        """
+        Subtract another matrix of the same dimensions, element by element.
 
-        if not isinstance(other, cls):
+        Parameters
+        ----------
+        other : t.Union[Matrix, SparseMatrix]
+            The matrix to be subtracted. The nonzero values of a sparse matrix are subtracted without reading the others.
+        out : t.Optional[Matrix]
+            A matrix of the same dimensions to write the result into, instead of allocating a new one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
+
+        Returns
+        -------
+        Matrix
+            The difference of the matrices.
+        """
+        if isinstance(other, hm.SparseMatrix):
+            if self._shape != other.dims:
+                raise MatrixDimensionError("These matrices cannot be subtracted due to wrong dimensions.")
+
+            self._check_out(out, self._shape)
+            return other._scattered(self, -1, out=out)
+
+        if not isinstance(other, Matrix):
             raise TypeError(f"Matrix can only be subtracted with other matrix. Not {type(other)}")
 
         if not (self.rows, self.cols) == (other.rows, other.cols):
             raise MatrixDimensionError("These matrices cannot be subtracted due to wrong dimensions.")
 
-        matrix = [[self[row][cols] - other[row][cols] for cols in range(self.cols)] for row in range(self.rows)]
-        return cls(matrix)
+        self._check_out(out, self._shape)
+        return get_backend(backend).matrix_sub(self, other, out)
 
-    def __mul__(self, other: t.Union["Matrix"]) -> "Matrix":
-        cls = self.__class__
+    def matmul(
+            self, other: t.Union["Matrix", "hm.SparseMatrix"], out: t.Optional["Matrix"] = None, backend: t.Optional[str] = None
+    ) -> "Matrix":
+        """
+        Multiply with another matrix, whose number of rows is the number of columns of this one.
 
-        if isinstance(other, (int, float)):
-            matrix = [[element * other for element in row] for row in self]
-            return cls(matrix)
+        Parameters
+        ----------
+        other : t.Union[Matrix, SparseMatrix]
+            The right hand side of the product. The product with a sparse matrix reads only its nonzero values.
+        out : t.Optional[Matrix]
+            A matrix of the dimensions of the product to write it into, instead of allocating a new one. It may be one
+            of the operands, the product is fully computed before being written.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
-        if not isinstance(other, cls):
+        Returns
+        -------
+        Matrix
+            The product of the matrices.
+        """
+        if not isinstance(other, (Matrix, hm.SparseMatrix)):
             raise TypeError(f"Matrix can only be multiplied with other matrix. Not {type(other)}")
 
         if self.cols != other.rows:
             raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
 
-        matrix = [[
-            sum(a * b for a, b in zip(self_row, other_col)) for other_col in zip(*other)] for self_row in self
-        ]
+        self._check_out(out, (self.rows, other.cols))
+        if isinstance(other, hm.SparseMatrix):
+            return other._rmatmul_dense(self, out)
+
+        return get_backend(backend).matmul(self, other, out)
+
+    def lazy(self) -> "hm.LazyMatrix":
+        """
+        Start a lazy expression from this matrix, whose operators record the operations instead of computing them.
+
+        Returns
+        -------
+        LazyMatrix
+            The expression holding this matrix, see `LazyMatrix`.
+
+        Examples
+        --------
+        >>> a = Matrix([[1, 2], [3, 4]])
+        >>> ((a.lazy() + a) * 3).evaluate()
+        Matrix([[6, 12],
+                 [18, 24]])
+        """
+        return hm.LazyMatrix(self)
 
-        return cls(matrix)
+    def _is_lazy(self, other: t.Any) -> bool:
+        """
+        Returns
+        -------
+        bool
+            If an operation with the other operand has to be recorded into a `LazyMatrix` expression, either because
+            it is one or because the lazy mode is enabled through `settings.lazy`.
+        """
+        return isinstance(other, hm.LazyMatrix) or (settings.lazy and isinstance(other, (Matrix, int, float)))
 
-    def __truediv__(self, other: "Matrix") -> "Matrix":
-        cls = self.__class__
+    def __add__(self, other: "Matrix") -> "Matrix":
+        if self._is_lazy(other):
+            return self.lazy() + other
+
+        return self.add(other)
+
+    def __sub__(self, other: "Matrix") -> "Matrix":
+        if self._is_lazy(other):
+            return self.lazy() - other
+
+        return self.sub(other)
+
+    def __mul__(self, other: t.Union["Matrix", int, float]) -> "Matrix":
+        if self._is_lazy(other):
+            return self.lazy() * other
 
         if isinstance(other, (int, float)):
-            matrix = [[element / other for element in row] for row in self]
-            return cls(matrix)
+            return get_backend().matrix_scale(self, other)
+
+        return self.matmul(other)
+
+    def __truediv__(self, other: t.Union["Matrix", int, float]) -> "Matrix":
+        if isinstance(other, hm.LazyMatrix):
+            other = other.evaluate()
 
-        if not isinstance(other, cls):
+        if settings.lazy and isinstance(other, (int, float)):
+            return self.lazy() / other
+
+        if isinstance(other, (int, float)):
+            return get_backend().matrix_divide(self, other)
+
+        if not isinstance(other, Matrix):
             raise TypeError(f"Matrix can only be divided with other matrix. Not {type(other)}")
 
         if self.cols != other.rows:
             raise MatrixDimensionError("These matrices cannot be divided due to wrong dimensions.")
 
-        matrix = [[
-            sum(a / b for a, b in zip(self_row, other_col)) for other_col in zip(*other)] for self_row in self
-        ]
+        other_cols = other._columns()
+        quotient = pack(
+            [
+                sum(map(operator.truediv, self._row_values(row), other_col))
+                for row in range(self.rows) for other_col in other_cols
+            ],
+            FLOAT_TYPECODE
+        )
+
+        return self._from_flat(quotient, (self.rows, other.cols))
 
-        return cls(matrix)
+    def __iadd__(self, other: "Matrix") -> "Matrix":
+        return self.add(other, out=self)
+
+    def __isub__(self, other: "Matrix") -> "Matrix":
+        return self.sub(other, out=self)
+
+    def __imul__(self, other: t.Union["Matrix", int, float]) -> "Matrix":
+        if isinstance(other, (int, float)):
+            return get_backend().matrix_scale(self, other, self)
+
+        return self.matmul(other, out=self)
+
+    def __imatmul__(self, other: "Matrix") -> "Matrix":
+        return self.matmul(other, out=self)
+
+    def __itruediv__(self, other: t.Union["Matrix", int, float]) -> "Matrix":
+        if isinstance(other, (int, float)):
+            return get_backend().matrix_divide(self, other, self)
+
+        quotient = self / other
+        self._check_out(self, quotient._shape)
+        return self._assign(quotient._iter_values(), quotient.typecode)
 
     def __radd__(self, other: "Matrix") -> "Matrix":
         return self.__add__(other)
@@ -175,40 +887,24 @@ class Matrix(CopyMixin):
     def __matmul__(self, other: "Matrix") -> "Matrix":
         return self.__mul__(other)
 
+    def __pow__(self, exponent: int) -> "Matrix":
+        return functions.matrix_power(self, exponent)
+
     def __abs__(self) -> "Matrix":
-        cls = self.__class__
+        if settings.lazy:
+            return abs(self.lazy())
 
-        matrix = [
-            [abs(self[row][cols]) for cols in range(self.cols)]
-            for row in range(self.rows)
-        ]
-        return cls(matrix)
+        return get_backend().matrix_abs(self)
 
     def __round__(self, n: t.Optional[int] = None) -> "Matrix":
-        cls = self.__class__
-
-        matrix = [
-            [round(self[row][cols], ndigits=n) for cols in range(self.cols)] for row in range(self.rows)
-        ]
-        return cls(matrix)
+        typecode = INT_TYPECODE if n is None else self.typecode
+        return self._map(lambda element: round(element, n), typecode)
 
     def __int__(self) -> "Matrix":
-        cls = self.__class__
-
-        matrix = [
-            [int(self[row][cols]) for cols in range(self.cols)]
-            for row in range(self.rows)
-        ]
-        return cls(matrix)
+        return self._map(int, INT_TYPECODE)
 
     def __float__(self) -> "Matrix":
-        cls = self.__class__
-
-        matrix = [
-            [float(self[row][cols]) for cols in range(self.cols)]
-            for row in range(self.rows)
-        ]
-        return cls(matrix)
+        return self._map(float, FLOAT_TYPECODE)
 
     @classmethod
     def get_filled_matrix(cls, dims: tuple, fill: t.Union[int, float]) -> "Matrix":
@@ -241,7 +937,7 @@ class Matrix(CopyMixin):
         >>> matrix
         Matrix([[9, 9, 9], [9, 9, 9], [9, 9, 9], [9, 9, 9]])
         """
-        return cls(cls._create_filled_matrix(dims, fill))
+        return cls._from_nested(cls._create_filled_matrix(dims, fill))
 
     @classmethod
     def get_randomized_matrix(
@@ -259,7 +955,8 @@ class Matrix(CopyMixin):
         max_value: int
             The maximum value for random number generation
         seed: int
-            The seed for random numer generation which can be recreated later.
+            The seed for random numer generation which can be recreated later. The global state of `random` is left
+            untouched, see `hypemaths.random.Generator` for more distributions and independent parallel streams.
         round_digits: int
             The number of digits to be in the number after decimal. Set the value as number for integer values.
 
@@ -296,21 +993,18 @@ class Matrix(CopyMixin):
             raise ValueError("You must pass the 2 DIMENSIONS for the Matrix fill.")
 
         if is_float_or_int(min_value) and is_float_or_int(max_value):
-            if seed is not None:
-                random.seed(seed)
+            # A generator of its own, so that seeding it does not reset the global state of `random`.
+            uniform = random.Random(seed).uniform
+            size = dims[0] * dims[1]
 
             if not round_digits:
-                matrix = [
-                    [round(random.uniform(min_value, max_value)) for _ in range(dims[1])] for _ in range(dims[0])
-                ]
-                return cls(matrix)
+                values = array(INT_TYPECODE, [round(uniform(min_value, max_value)) for _ in repeat(None, size)])
             else:
-                matrix = [
-                    [
-                        round(random.uniform(min_value, max_value), ndigits=round_digits) for _ in range(dims[1])
-                    ] for _ in range(dims[0])
-                ]
-                return cls(matrix)
+                values = array(
+                    FLOAT_TYPECODE, [round(uniform(min_value, max_value), round_digits) for _ in repeat(None, size)]
+                )
+
+            return cls._from_flat(values, (dims[0], dims[1]))
 
     @staticmethod
     def _cleaned_matrix(matrix: list) -> list:
@@ -366,6 +1060,10 @@ class Matrix(CopyMixin):
                 Raised if the matrix consists of value which is not a `int` or `float`.
             """
             for row, row_values in enumerate(mat):
+                # Checking the distinct types of a row is much cheaper than checking every value.
+                if all(issubclass(kind, (int, float)) for kind in set(map(type, row_values))):
+                    continue
+
                 for col, value in enumerate(row_values):
                     if not isinstance(value, (int, float)):
                         raise TypeError(
@@ -376,8 +1074,19 @@ class Matrix(CopyMixin):
         if isinstance(matrix, (int, float)):
             return [[matrix]]
 
+        # The rows of another matrix, such as ``Matrix(other.matrix)``, are copied out of it.
+        if isinstance(matrix, list) and any(isinstance(row, MatrixRow) for row in matrix):
+            matrix = [row.tolist() if isinstance(row, MatrixRow) else row for row in matrix]
+
+        level = settings.validation
+        if level not in VALIDATION_LEVELS:
+            raise ValueError(f"Unknown validation level {level!r}, must be one of {VALIDATION_LEVELS}.")
+
+        if level == "off":
+            return matrix if isinstance(matrix[0], list) else [matrix]
+
         matrix = [matrix] if not contains_sublist(matrix) else matrix
-        if value_check(matrix):
+        if level == "shape" or value_check(matrix):
             len_set = set([len(x) for x in matrix])
             if len(len_set) > 1 and value_check(matrix):
                 raise InvalidMatrixError(
@@ -385,179 +1094,483 @@ class Matrix(CopyMixin):
                 )
             return matrix
 
-    @staticmethod
-    def _create_filled_matrix(dims: tuple, fill: t.Union[int, float] = None) -> list:
-        """
+    @staticmethod
+    def _create_filled_matrix(dims: tuple, fill: t.Union[int, float] = None) -> list:
+        """
+        Parameters
+        ----------
+        dims: tuple
+            The dimensions for the matrix to be initialized. Only 2 dimensions (X, Y) are allowed.
+        fill: t.Union[int, float]
+            The value to be filled across the matrix of the specified dimension.
+
+        Returns
+        -------
+        list
+            The 2D python list, to be converted into `Matrix` object.
+
+        Raises
+        ------
+        ValueError
+            If the number of dimensions don't equal to 2.
+        TypeError
+            If the fill value isn't either `int` or `float`.
+        """
+        if len(dims) != 2:
+            raise ValueError(
+                "You must pass the 2 DIMENSIONS for the Matrix fill.")
+
+        if not fill:
+            fill = 0
+
+        if not isinstance(fill, (int, float)):
+            raise TypeError(
+                f"The fill value must be integer or float, but the given fill value is {type(fill)}."
+            )
+
+        matrix_structure = []
+        first_row = [fill] * dims[1]
+        for _ in range(dims[0]):
+            matrix_structure.append(first_row.copy())
+
+        return matrix_structure
+
+    def clone(self) -> "Matrix":
+        """
+        Returns the copy of the matrix.
+
+        Returns
+        -------
+        Matrix
+            The copy of the present matrix.
+
+        Examples
+        --------
+        Getting the copy instead of directly assigning, when you want to modify the matrix without disturbing the first
+        one.
+        >>> matrix = Matrix([[1, 2], [3, 4]])
+        >>> matrix.clone()
+        Matrix([[1, 2], [3, 4]])
+        """
+        return self._from_flat(self._values(), self._shape)
+
+    def freeze(self) -> "hm.FrozenMatrix":
+        """
+        Returns
+        -------
+        FrozenMatrix
+            An immutable, hashable copy of the matrix, to be used as a dictionary key or shared between threads.
+
+        Examples
+        --------
+        >>> matrix = Matrix([[1, 2], [3, 4]])
+        >>> {matrix.freeze(): "cached"}[Matrix([[1, 2], [3, 4]]).freeze()]
+        'cached'
+        """
+        return hm.FrozenMatrix._from_matrix(self)
+
+    def materialize(self) -> "Matrix":
+        """
+        Copy a view into a new, contiguous matrix owning its buffer.
+        If the matrix already owns its buffer, it is returned as is.
+
+        Returns
+        -------
+        Matrix
+            The materialized matrix.
+
+        Examples
+        --------
+        >>> matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        >>> view = matrix[:, 1:]
+        >>> view.base is matrix
+        True
+        >>> view.materialize()
+        Matrix([[2, 3],
+                 [5, 6]])
+        """
+        if self._base is None:
+            return self
+
+        return self._from_flat(self._values(), self._shape)
+
+    def trace(self) -> t.Union[int, float]:
+        """
+        Returns the sum of the diagonals of the matrix
+
+        Returns
+        -------
+        t.Union[int, float]
+            The sum of the diagonals of the current `Matrix`
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the number of columns and rows are not equal in the `Matrix`.
+
+        Examples
+        --------
+        Getting the sum of the rows of the specified matrix.
+        >>> matrix = Matrix([[5, 5], [3, 4]])
+        >>> matrix.trace()
+        9
+        """
+        if self.rows != self.cols:
+            raise MatrixNotSquare("Cannot retrieve the sum of diagonals as the row and column count are not same.")
+
+        return self._cached(
+            ("trace",), lambda: sum(strided(memoryview(self._storage.data), self._offset, self.rows, sum(self._strides)))
+        )
+
+    def transpose(self, out: t.Optional["Matrix"] = None, backend: t.Optional[str] = None) -> "Matrix":
+        """
+        Transposes the matrix.
+        This converts the matrix elements order, by converting the rows into columns and vice versa.
+        The transposed matrix is a view sharing the buffer of this one, use `materialize` to get an independent copy.
+
+        Parameters
+        ----------
+        out : t.Optional[Matrix]
+            A matrix of the transposed dimensions to copy the transposed elements into, instead of returning a view.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
+
+        Returns
+        -------
+        Matrix
+            The transposed matrix.
+
+        Examples
+        --------
+        >>> mat = Matrix([[1, 2], [3, 4]])
+        >>> mat.transpose()
+        Matrix([[1, 3], [2, 4]])
+        """
+        self._check_out(out, self._shape[::-1])
+        return get_backend(backend).transpose(self, out)
+
+    def _transposed(self, out: t.Optional["Matrix"] = None) -> "Matrix":
+        """
+        Returns
+        -------
+        Matrix
+            The transposed view of the matrix, or `out` with the transposed elements copied into it when given.
+        """
+        view = self._view((self.cols, self.rows), self._strides[::-1], self._offset)
+        if out is not None:
+            return out._assign(view._iter_values(), view.typecode)
+
+        return view
+
+    def frobenius_norm(self, backend: t.Optional[str] = None) -> float:
+        """
+        Calculate the frobenius norm of the matrix.
+        The frobenius norm is computed by taking square root of the sums the squares of each entry of the matrix.
+        This can be used to calculate the 2-norm of a column vector.
+
+        Parameters
+        ----------
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
+
+        Returns
+        -------
+        float:
+            The computed frobenius norm.
+        """
+        backend = get_backend(backend)
+        return self._cached(("frobenius_norm", backend.name), lambda: backend.frobenius_norm(self))
+
+    def _frobenius_norm(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The frobenius norm of the matrix, computed in pure Python.
+        """
+        return math.sqrt(sum(map(operator.mul, self._iter_values(), self._iter_values())))
+
+    def determinant(self, backend: t.Optional[str] = None) -> float:
+        """
+        Get the determinant of a matrix.
+        In linear algebra, the determinant is a scalar value that can be computed from the elements of a square
+        matrix and encodes certain properties of the linear transformation described by the matrix. The determinant of
+        a matrix ``A`` is denoted det, det ``A``, or ``|A|``.
+
         Parameters
         ----------
-        dims: tuple
-            The dimensions for the matrix to be initialized. Only 2 dimensions (X, Y) are allowed.
-        fill: t.Union[int, float]
-            The value to be filled across the matrix of the specified dimension.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
         Returns
         -------
-        list
-            The 2D python list, to be converted into `Matrix` object.
-
-        Raises
-        ------
-        ValueError
-            If the number of dimensions don't equal to 2.
-        TypeError
-            If the fill value isn't either `int` or `float`.
+        float:
+            The determinant of the matrix.
         """
-        if len(dims) != 2:
-            raise ValueError(
-                "You must pass the 2 DIMENSIONS for the Matrix fill.")
-
-        if not fill:
-            fill = 0
-
-        if not isinstance(fill, (int, float)):
-            raise TypeError(
-                f"The fill value must be integer or float, but the given fill value is {type(fill)}."
-            )
-
-        matrix_structure = []
-        first_row = [fill] * dims[1]
-        for _ in range(dims[0]):
-            matrix_structure.append(first_row.copy())
+        backend = get_backend(backend)
+        return self._cached(("determinant", backend.name), lambda: backend.determinant(self))
 
-        return matrix_structure
+    def _determinant(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The determinant of the matrix, computed in pure Python from its cached LU factorization.
+        """
+        return self.lu().determinant()
 
-    def _get_mat_dimension(self, matrix: list) -> list:
+    def _cached(self, key: tuple, compute: t.Callable[[], t.Any]) -> t.Any:
         """
         Parameters
         ----------
-        matrix : list
-            The matrix whose dimensions are to be figured out.
+        key : tuple
+            The name of the operation, and its parameters.
+        compute : t.Callable[[], t.Any]
+            Computes the result from the values of the matrix.
 
         Returns
         -------
-        list
-            A tuple containing the dimensions of the matrix passed.
+        t.Any
+            The result cached on the matrix, computed again only if the matrix was modified since. The results of a
+            matrix over memory it does not own, which can be written without it knowing, are computed on every call.
         """
-        if not isinstance(matrix, list):
-            return []
-        return [len(matrix)] + self._get_mat_dimension(matrix[0])
+        if not self._storage.owned:
+            return compute()
 
-    def clone(self) -> "Matrix":
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = DerivedCache()
+        return cache.get(self._storage, key, compute)
+
+    def cache_info(self) -> DerivedCacheInfo:
         """
-        Returns the copy of the matrix.
+        The statistics of the results derived from the values of the matrix and cached on it, its trace, sum, norm,
+        determinant and factorizations. They are reused until the matrix is modified.
+
+        Only the writes going through the matrix are seen: its item assignments, in-place operators and the `out=`
+        destinations. The matrices wrapping memory they do not own, with `frombuffer` or as a `MappedMatrix`, cache
+        nothing. The writes through the `data` memoryview or a NumPy array wrapping the matrix are not seen either,
+        call `cache_clear()` after them.
 
         Returns
         -------
-        Matrix
-            The copy of the present matrix.
+        DerivedCacheInfo
+            The hits, the misses and the number of fresh results of the cache, along with its hit and miss rates.
 
         Examples
         --------
-        Getting the copy instead of directly assigning, when you want to modify the matrix without disturbing the first
-        one.
         >>> matrix = Matrix([[1, 2], [3, 4]])
-        >>> matrix.clone()
-        Matrix([[1, 2], [3, 4]])
+        >>> matrix.trace(), matrix.trace()
+        (5, 5)
+        >>> matrix.cache_info()
+        DerivedCacheInfo(hits=1, misses=1, currsize=1)
+        >>> matrix.cache_info().hit_rate
+        0.5
         """
-        return copy.deepcopy(self)
+        if self._cache is None:
+            return DerivedCacheInfo(0, 0, 0)
+        return self._cache.info(self._storage)
 
-    def trace(self) -> t.Union[int, float]:
+    def cache_clear(self) -> None:
+        """Drop the results cached on the matrix, and reset the statistics of its cache."""
+        self._cache = None
+
+    def lu(self) -> LUDecomposition:
         """
-        Returns the sum of the diagonals of the matrix
+        Factorize the matrix into ``P A = L U``, with partial pivoting.
+        The factorization is cached on the matrix and reused until the matrix is modified.
 
         Returns
         -------
-        t.Union[int, float]
-            The sum of the diagonals of the current `Matrix`
+        LUDecomposition
+            The factorization, which can compute the determinant, the inverse and solve systems.
 
         Raises
         ------
         MatrixNotSquare
-            If the number of columns and rows are not equal in the `Matrix`.
+            If the matrix is not square.
 
         Examples
         --------
-        Getting the sum of the rows of the specified matrix.
-        >>> matrix = Matrix([[5, 5], [3, 4]])
-        >>> matrix.trace()
-        9
+        >>> matrix = Matrix([[4, 3], [6, 3]])
+        >>> matrix.lu().upper
+        Matrix([[6.0, 3.0],
+                 [0.0, 1.0]])
         """
-        if self.rows != self.cols:
-            raise MatrixNotSquare("Cannot retrieve the sum of diagonals as the row and column count are not same.")
+        return self._cached(("lu",), lambda: LUDecomposition(self))
+
+    def solve(self, rhs: t.Union["Matrix", "hm.Vector"]) -> t.Union["Matrix", "hm.Vector"]:
+        """
+        Solve the system ``A x = b``, reusing the cached LU factorization of the matrix.
+
+        Parameters
+        ----------
+        rhs : t.Union[Matrix, Vector]
+            The right hand side ``b``, either as a vector, or as a matrix with one system per column.
 
-        total = 0
-        for i in range(self.rows):
-            total += self[i, i]
-        return total
+        Returns
+        -------
+        t.Union[Matrix, Vector]
+            The solution ``x``, of the same kind as the right hand side.
 
-    def transpose(self) -> "Matrix":
+        Examples
+        --------
+        >>> from hypemaths import Vector
+        >>> Matrix([[2, 1], [1, 3]]).solve(Vector(3, 5))
+        Vector([0.8, 1.4])
         """
-        Transposes the matrix.
-        This converts the matrix elements order, by converting the rows into columns and vice versa.
+        return self.lu().solve(rhs)
 
+    def inverse(self) -> "Matrix":
+        """
         Returns
         -------
         Matrix
-            The transposed matrix.
+            The inverse of the matrix, computed from its cached LU factorization.
+
+        Raises
+        ------
+        SingularMatrixError
+            If the matrix is singular.
+        """
+        return self.lu().inverse()
+
+    def expm(self) -> "Matrix":
+        """
+        Compute the matrix exponential, by scaling and squaring around a Padé approximant. The diagonal and triangular
+        matrices take faster paths.
+
+        Returns
+        -------
+        Matrix
+            The matrix ``e ** A``.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
 
         Examples
         --------
-        >>> mat = Matrix([[1, 2], [3, 4]])
-        >>> mat.transpose()
-        Matrix([[1, 3], [2, 4]])
+        >>> Matrix([[0, 0], [0, 1]]).expm()
+        Matrix([[1.0, 0.0],
+                 [0.0, 2.718281828459045]])
+        """
+        return functions.expm(self)
+
+    def qr(self) -> QRDecomposition:
         """
-        cls = self.__class__
+        Factorize the matrix into ``A = Q R`` with Householder reflections, ``Q`` of orthonormal columns and ``R``
+        upper triangular. The factorization is cached on the matrix and reused until the matrix is modified.
 
-        matrix = [[self[cols][row] for cols in range(self.rows)] for row in range(self.cols)]
-        return cls(matrix)
+        Returns
+        -------
+        QRDecomposition
+            The factorization, which can solve least squares problems and compute the determinant.
 
-    def frobenius_norm(self) -> float:
+        Examples
+        --------
+        >>> Matrix([[3, 0], [4, 5]]).qr().r
+        Matrix([[-5.0, -4.0],
+                 [0.0, 3.0]])
         """
-        Calculate the frobenius norm of the matrix.
-        The frobenius norm is computed by taking square root of the sums the squares of each entry of the matrix.
-        This can be used to calculate the 2-norm of a column vector.
+        return self._cached(("qr",), lambda: QRDecomposition(self))
+
+    def cholesky(self) -> CholeskyDecomposition:
+        """
+        Factorize the symmetric positive definite matrix into ``A = L L^T``, in about half the work of `lu`.
+        The factorization is cached on the matrix and reused until the matrix is modified.
 
         Returns
         -------
-        float:
-            The computed frobenius norm.
+        CholeskyDecomposition
+            The factorization, which can compute the determinant, its logarithm, the inverse and solve systems.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
+        ValueError
+            If the matrix is not positive definite.
+
+        Examples
+        --------
+        >>> Matrix([[4, 2], [2, 5]]).cholesky().lower
+        Matrix([[2.0, 0.0],
+                 [1.0, 2.0]])
         """
-        sum_of_squares = 0
-        for column in self.matrix:
-            for elem in column:
-                sum_of_squares += elem ** 2
-        return math.sqrt(sum_of_squares)
+        return self._cached(("cholesky",), lambda: CholeskyDecomposition(self))
 
-    def determinant(self) -> float:
+    def svd(self) -> SVDDecomposition:
         """
-        Get the determinant of a matrix.
-        In linear algebra, the determinant is a scalar value that can be computed from the elements of a square
-        matrix and encodes certain properties of the linear transformation described by the matrix. The determinant of
-        a matrix ``A`` is denoted det, det ``A``, or ``|A|``.
+        Factorize the matrix into ``A = U S V^T`` with the one-sided Jacobi method.
+        The factorization is cached on the matrix and reused until the matrix is modified.
 
         Returns
         -------
-        float:
-            The determinant of the matrix.
+        SVDDecomposition
+            The factorization, which can compute the rank, the condition number, the pseudo-inverse and the minimum
+            norm least squares solutions.
+
+        Examples
+        --------
+        >>> Matrix([[3, 0], [0, 4]]).svd().singular_values
+        [4.0, 3.0]
         """
-        matrix_size = len(self.matrix)
-        matrix_copy = self.clone()
+        return self._cached(("svd",), lambda: SVDDecomposition(self))
+
+    def eigvals(self) -> t.List[t.Union[float, complex]]:
+        """
+        Compute every eigenvalue, with a Hessenberg reduction and the shifted QR algorithm, or with a tridiagonal
+        reduction and the QL algorithm when the matrix is symmetric.
+
+        Returns
+        -------
+        t.List[t.Union[float, complex]]
+            The eigenvalues, repeated as many times as their multiplicity, from the largest in absolute value.
+
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
 
-        for fd in range(matrix_size):  # FD - The focus diagonal.
-            for i in range(fd + 1, matrix_size):
-                if matrix_copy[fd][fd] == 0:
-                    matrix_copy[fd][fd] = 1.0e-18
+        Examples
+        --------
+        >>> Matrix([[2, 1], [1, 2]]).eigvals()
+        [3.0, 1.0]
+        >>> Matrix([[0, 1], [-1, 0]]).eigvals()
+        [1j, -1j]
+        """
+        return eigen.eigvals(self)
 
-                current_row_scaler = matrix_copy[i][fd] / matrix_copy[fd][fd]
+    def eig(self) -> eigen.EigenPairs:
+        """
+        Returns
+        -------
+        eigen.EigenPairs
+            The eigenvalues, from the largest in absolute value, and the matrix of the unit eigenvectors as columns.
 
-                for j in range(matrix_size):
-                    matrix_copy[i][j] = matrix_copy[i][j] - current_row_scaler * matrix_copy[fd][j]
+        Raises
+        ------
+        MatrixNotSquare
+            If the matrix is not square.
+        ValueError
+            If some eigenvalues are complex.
+        """
+        return eigen.eig(self)
 
-        product = 1.0
-        for i in range(matrix_size):
-            product *= matrix_copy[i][i]
+    def top_k_eigen(self, k: int, tol: float = 1e-8, max_iterations: t.Optional[int] = None) -> eigen.EigenPairs:
+        """
+        Find the `k` eigenvalues of the largest absolute values, and their eigenvectors, with the Lanczos algorithm
+        when the matrix is symmetric, and subspace iteration otherwise. Only products with vectors are computed, see
+        `hypemaths.linalg.top_k_eigen` for sparse matrices and matrix-free operators.
 
-        return product
+        Returns
+        -------
+        eigen.EigenPairs
+            The eigenvalues, from the largest in absolute value, and the matrix of the unit eigenvectors as columns.
+        """
+        return eigen.top_k_eigen(self, k, tol=tol, max_iterations=max_iterations)
 
     @classmethod
     def from_vector(cls, vector: "hm.Vector") -> "Matrix":
@@ -602,25 +1615,228 @@ class Matrix(CopyMixin):
         >>> m.flatten()
         Vector([[1, 2, 3, 4]])
         """
+        return hm.Vector._from_points(list(self._iter_values()))
 
-        flat_list = []
-        for element in self.matrix:
-            if type(element) is list:
-                # If the element is of type list, iterate through the sublist
-                for item in element:
-                    flat_list.append(item)
-            else:
-                flat_list.append(element)
-        return hm.Vector(flat_list)
+    def _contiguous_values(self) -> t.Sequence[t.Union[int, float]]:
+        """
+        Returns
+        -------
+        t.Sequence[t.Union[int, float]]
+            The values of the matrix in row-major order, viewed in place if they are contiguous, else copied.
+        """
+        return self._iter_values() if self.is_contiguous else self._values()
+
+    @property
+    def data(self) -> memoryview:
+        """
+        Returns
+        -------
+        memoryview
+            The values as a 2D `memoryview` of the rows and columns. It is over the memory of the matrix if its values
+            are contiguous, and over a read-only copy of them for other views.
+        """
+        view = memoryview(self._contiguous_values()).cast("B").cast(self.typecode, list(self._shape))
+        return view if self.is_contiguous else view.toreadonly()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # The buffer protocol of Python 3.12 and later, so that `memoryview(matrix)` is `matrix.data`.
+        return self.data
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            The description of the memory of the matrix, its views included, for NumPy to wrap it without copying it.
+            The memory is shared as long as the matrix is not promoted from integers to floats. The writes through
+            the NumPy array are not seen by the results cached on the matrix, call `cache_clear()` after them.
+        """
+        data = self._storage.data
+        itemsize = data.itemsize
+        return {
+            "version": 3,
+            "shape": self._shape,
+            "typestr": ("<" if sys.byteorder == "little" else ">") + ("i8" if self.typecode == INT_TYPECODE else "f8"),
+            "data": data,
+            "offset": self._offset * itemsize,
+            "strides": (self._strides[0] * itemsize, self._strides[1] * itemsize),
+        }
+
+    def tobytes(self) -> bytes:
+        """
+        Serialize the matrix into the binary format of `hypemaths.core.binary`, a small header followed by the raw
+        values.
+
+        Returns
+        -------
+        bytes
+            The serialized matrix.
+
+        Examples
+        --------
+        >>> matrix = Matrix([[1, 2], [3, 4]])
+        >>> Matrix.frombytes(matrix.tobytes())
+        Matrix([[1, 2],
+                 [3, 4]])
+        """
+        return binary.dumps(self._contiguous_values(), self._shape)
+
+    @classmethod
+    def frombytes(cls, data: t.Any) -> "Matrix":
+        """
+        Copy a matrix out of a buffer in the binary format, as written by `tobytes`.
+
+        Parameters
+        ----------
+        data : t.Any
+            The serialized matrix, `bytes` or any other object supporting the buffer protocol.
+
+        Returns
+        -------
+        Matrix
+            The matrix, owning its values.
+
+        Raises
+        ------
+        ValueError
+            If the buffer does not hold a serialized matrix.
+        """
+        values, shape = binary.loads(data)
+        return cls._from_flat(values, cls._matrix_shape(shape))
+
+    @classmethod
+    def frombuffer(cls, buffer: t.Any, shape: t.Optional[tuple] = None, typecode: t.Optional[str] = None) -> "Matrix":
+        """
+        Wrap the memory of any object supporting the buffer protocol into a matrix, without copying it.
+
+        The buffer is read in one of three ways:
+
+        - A buffer with two dimensions, such as a 2D NumPy array or `memoryview`, gives its own shape.
+        - Given a `shape`, the buffer is read as raw row-major values, of the `typecode` given for raw bytes.
+        - Else, the buffer holds a matrix in the binary format, as written by `tobytes`. Values saved in the other
+          byte order are copied.
+
+        The matrix reads and writes the memory of the buffer, it is read-only if the buffer is, and an integer matrix
+        cannot be promoted to floats. As the buffer can be written without the matrix knowing, the results derived
+        from it, such as its trace or determinant, are not cached, and are computed from the live values on every call.
+
+        Parameters
+        ----------
+        buffer : t.Any
+            Any object supporting the buffer protocol, such as `bytes`, a `bytearray`, an `array`, a `mmap` or a
+            NumPy array, holding 64 bits integers or floats in the byte order of the machine.
+        shape : t.Optional[tuple]
+            The rows and columns of the matrix, for a buffer of raw values. Defaults to `None`.
+        typecode : t.Optional[str]
+            The typecode of raw bytes, ``"q"`` or ``"d"``. Defaults to `None`, the typecode of the buffer format.
+
+        Returns
+        -------
+        Matrix
+            The matrix over the buffer.
+
+        Raises
+        ------
+        ValueError
+            If the buffer does not hold a serialized matrix, or does not hold as many values as the shape.
+        TypeError
+            If the buffer does not hold 64 bits integers or floats, or raw bytes.
+
+        Examples
+        --------
+        >>> values = array("d", [1.0, 2.0, 3.0, 4.0])
+        >>> matrix = Matrix.frombuffer(values, shape=(2, 2))
+        >>> matrix[0, 1] = 5.0
+        >>> values
+        array('d', [1.0, 5.0, 3.0, 4.0])
+        """
+        view = memoryview(buffer)
+        if shape is None and view.ndim == 2:
+            shape = view.shape
+
+        if shape is None:
+            values, shape = binary.loads(view, copy=False)
+            return cls._from_flat(values, cls._matrix_shape(shape))
+
+        values = typed_view(view, typecode)
+        if len(shape) != 2 or len(values) != shape[0] * shape[1] or not values:
+            raise ValueError(f"A buffer of {len(values)} values cannot be read as a matrix of dimensions {shape}.")
+
+        return cls._from_flat(values, tuple(shape))
+
+    @staticmethod
+    def _matrix_shape(shape: tuple) -> tuple:
+        if len(shape) != 2:
+            raise ValueError("The data holds a vector, not a matrix.")
+
+        return shape
+
+    def save(self, path: t.Union[str, os.PathLike]) -> None:
+        """
+        Save the matrix into a file, in the binary format of `hypemaths.core.binary`.
+
+        Parameters
+        ----------
+        path : t.Union[str, os.PathLike]
+            The path of the file, overwritten if it exists.
+        """
+        binary.save(path, self._contiguous_values(), self._shape)
 
-    def sum(self, axis: int = None) -> t.Union[int, float, "hm.Vector", "hm.Matrix"]:
+    @classmethod
+    def load(cls, path: t.Union[str, os.PathLike], mmap_mode: t.Optional[str] = None) -> "Matrix":
+        """
+        Load a matrix saved by `save`.
+
+        Parameters
+        ----------
+        path : t.Union[str, os.PathLike]
+            The path of the file.
+        mmap_mode : t.Optional[str]
+            If given, the file is memory-mapped in this mode instead of being read, see `MappedMatrix`. Nothing is
+            parsed but the header, the values being read from the file as they are accessed. Defaults to `None`.
+
+        Returns
+        -------
+        Matrix
+            The matrix loaded, a `MappedMatrix` if `mmap_mode` is given.
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold a saved matrix, or if it is mapped while saved in the other byte order.
+
+        Examples
+        --------
+        >>> Matrix([[1, 2], [3, 4]]).save("matrix.hm")
+        >>> Matrix.load("matrix.hm", mmap_mode="r")
+        MappedMatrix([[1, 2],
+                       [3, 4]])
+        """
+        if mmap_mode is None:
+            values, shape = binary.load(path)
+            return cls._from_flat(values, cls._matrix_shape(shape))
+
+        typecode, shape, swapped = binary.read_header(path)
+        if swapped:
+            raise ValueError("A matrix saved in the other byte order cannot be mapped, it has to be loaded.")
+
+        return hm.MappedMatrix(path, cls._matrix_shape(shape), typecode, mmap_mode, offset=binary.HEADER.size)
+
+    def __reduce__(self) -> tuple:
+        # Pickled as the binary format, which is far more compact and faster to load than the nested values.
+        return Matrix.frombytes, (self.tobytes(),)
+
+    def sum(self, axis: int = None, backend: t.Optional[str] = None) -> t.Union[int, float, "hm.Vector", "hm.Matrix"]:
         """
         Returns the sum of the entire matrix or along a specific axis
 
         Parameters
         ----------
-        axis: {0, 1}, Optional
-            The sum of the matrix along which axis
+        axis: {0, 1, -1}, Optional
+            The sum of the matrix along which axis, ``-1`` being the last one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
         Returns
         -------
@@ -637,17 +1853,30 @@ class Matrix(CopyMixin):
         >>> m.sum(1)
         Matrix([[3], [6], [9]])
         """
-        matrix = Matrix(self.matrix)
-        if axis is None:
-            return sum(matrix.flatten())
-
         if axis not in [-1, 0, 1, None]:
             raise TypeError(f"Axis {axis} is out of bounds for array of 2nd dimension.")
 
-        if not isinstance(axis, (list, int)):
+        if axis is not None and not isinstance(axis, (list, int)):
             raise TypeError(f"Axis should be inteer or list indices. Got {type(axis)}")
 
+        backend = get_backend(backend)
+        if axis is None:
+            return self._cached(("sum", backend.name), lambda: backend.sum(self, None))
+
+        return backend.sum(self, 1 if axis == -1 else axis)
+
+    def _sum(self, axis: t.Optional[int] = None) -> t.Union[int, float, "hm.Matrix"]:
+        """
+        Returns
+        -------
+        t.Union[int, float, Matrix]
+            The sum of the matrix, or of its columns (axis ``0``) or rows (axis ``1``), computed in pure Python.
+        """
+        if axis is None:
+            return sum(self._iter_values())
+
         if axis == 0:
-            return Matrix([float(sum(i)) for i in zip(*matrix)])
+            return self._from_flat(pack([float(sum(column)) for column in self._columns()], FLOAT_TYPECODE), (1, self.cols))
         elif axis == 1:
-            return Matrix([[sum(i)] for i in matrix])
+            sums = [sum(self._row_values(row)) for row in range(self.rows)]
+            return self._from_flat(pack(sums, infer_typecode(sums)), (self.rows, 1))
@@ -5,6 +5,8 @@ from ..mixins import CopyMixin
 
 
 class Point(CopyMixin):
+    __slots__ = ("x", "y")
+
     def __init__(self, x: t.Union[int, float], y: t.Union[int, float]) -> None:
         self.x = self.cleaned_point_value(x)
         self.y = self.cleaned_point_value(y)
@@ -0,0 +1,279 @@
+import heapq
+import math
+import typing as t
+from itertools import chain, compress, filterfalse
+
+from .point import Point
+
+Coordinates = t.Union[Point, t.Sequence[t.Union[int, float]]]
+
+
+class PointSet:
+    """
+    A k-d tree index over many points, answering nearest neighbours, radius and bounding box queries.
+
+    The tree is implicit: the points are ordered so that the median of every range splits it, along the axis where the
+    points of the range are the most spread out, and ranges of at most `leaf_size` points are scanned directly. It is
+    built in O(n log n), by sorting the points along every axis once and then splitting the sorted orders at every
+    level, instead of sorting again.
+
+    Queries return the indices of the points, in the order they were passed.
+    """
+    def __init__(self, points: t.Iterable[Coordinates], leaf_size: int = 16) -> None:
+        """
+        Parameters
+        ----------
+        points : t.Iterable[Coordinates]
+            The points to be indexed, either `Point` objects or sequences of coordinates, all of the same dimensions.
+        leaf_size : int
+            The largest number of points scanned directly instead of being split further. Defaults to 16.
+
+        Raises
+        ------
+        ValueError
+            If no points are passed, or if the leaf size is not positive.
+        TypeError
+            If a coordinate is not an integer or a float.
+        """
+        self._points = self._cleaned_points(points)
+        if not self._points:
+            raise ValueError("You need to pass at least a point for the set!")
+
+        if not isinstance(leaf_size, int) or leaf_size < 1:
+            raise ValueError(f"The leaf size must be a positive integer, not {leaf_size!r}")
+
+        self.dimensions = len(self._points[0])
+        if any(len(point) != self.dimensions for point in self._points):
+            raise ValueError("All the points of a set must be of the same dimensions.")
+
+        self.leaf_size = leaf_size
+        self._order = [0] * len(self._points)
+        self._axes = bytearray(len(self._points))
+        self._build()
+
+    @staticmethod
+    def _cleaned_points(points: t.Iterable[Coordinates]) -> t.List[tuple]:
+        """
+        Returns
+        -------
+        t.List[tuple]
+            The coordinates of every point.
+
+        Raises
+        ------
+        TypeError
+            If a coordinate is not an integer or a float.
+        """
+        points = [point.to_tuple() if isinstance(point, Point) else tuple(point) for point in points]
+        for kind in set(map(type, chain.from_iterable(points))):
+            if not issubclass(kind, (int, float)):
+                raise TypeError(f"All coordinates must be integers or floats, but a coordinate is {kind}")
+
+        return points
+
+    def _build(self) -> None:
+        """Order the points into the implicit tree, writing the median and split axis of every range."""
+        columns = [[point[axis] for point in self._points] for axis in range(self.dimensions)]
+        order, axes, leaf_size = self._order, self._axes, self.leaf_size
+
+        def spread(axis: int, sorted_indices: list) -> float:
+            return columns[axis][sorted_indices[-1]] - columns[axis][sorted_indices[0]]
+
+        def build(lo: int, hi: int, sorted_by_axis: t.List[list]) -> None:
+            if hi - lo <= leaf_size:
+                order[lo:hi] = sorted_by_axis[0]
+                return
+
+            axis = max(range(self.dimensions), key=lambda candidate: spread(candidate, sorted_by_axis[candidate]))
+            mid = (lo + hi) // 2
+            split = sorted_by_axis[axis]
+            median = split[mid - lo]
+            order[mid] = median
+            axes[mid] = axis
+
+            # Every other axis keeps its sorted order, split in linear time by the side of every point.
+            is_left = set(split[:mid - lo]).__contains__
+            left, right = [], []
+            for other_axis, indices in enumerate(sorted_by_axis):
+                if other_axis == axis:
+                    left.append(split[:mid - lo])
+                    right.append(split[mid - lo + 1:])
+                    continue
+
+                left.append(list(compress(indices, map(is_left, indices))))
+                right_indices = list(filterfalse(is_left, indices))
+                right_indices.remove(median)
+                right.append(right_indices)
+
+            build(lo, mid, left)
+            build(mid + 1, hi, right)
+
+        build(
+            0,
+            len(self._points),
+            [sorted(range(len(self._points)), key=column.__getitem__) for column in columns]
+        )
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(points={len(self)}, dimensions={self.dimensions})"
+
+    def __getitem__(self, index: int) -> tuple:
+        return self._points[index]
+
+    def _cleaned_query(self, point: Coordinates) -> tuple:
+        coordinates, = self._cleaned_points((point,))
+        if len(coordinates) != self.dimensions:
+            raise ValueError(f"The query must be of {self.dimensions} dimensions, not {len(coordinates)}.")
+
+        return coordinates
+
+    def nearest(self, point: Coordinates, k: int = 1) -> t.List[t.Tuple[int, float]]:
+        """
+        Find the `k` points nearest to a point.
+
+        Parameters
+        ----------
+        point : Coordinates
+            The point to search around.
+        k : int
+            The number of neighbours to be found. Defaults to 1.
+
+        Returns
+        -------
+        t.List[t.Tuple[int, float]]
+            The index and the distance of the nearest points, from the nearest to the farthest.
+
+        Examples
+        --------
+        >>> points = PointSet([(0, 0), (5, 5), (1, 2)])
+        >>> points.nearest((1, 1))
+        [(2, 1.0)]
+        """
+        query = self._cleaned_query(point)
+        if not isinstance(k, int) or k < 1:
+            raise ValueError(f"The number of neighbours must be a positive integer, not {k!r}")
+
+        points, order, axes, leaf_size = self._points, self._order, self._axes, self.leaf_size
+        dist = math.dist
+        # A max-heap of the best candidates so far, through their negated distances.
+        heap = []
+
+        def consider(index: int) -> None:
+            distance = dist(query, points[index])
+            if len(heap) < k:
+                heapq.heappush(heap, (-distance, index))
+            elif distance < -heap[0][0]:
+                heapq.heapreplace(heap, (-distance, index))
+
+        def search(lo: int, hi: int) -> None:
+            if hi - lo <= leaf_size:
+                for index in order[lo:hi]:
+                    consider(index)
+                return
+
+            mid = (lo + hi) // 2
+            median = order[mid]
+            consider(median)
+
+            difference = query[axes[mid]] - points[median][axes[mid]]
+            if difference < 0:
+                search(lo, mid)
+                if len(heap) < k or -difference < -heap[0][0]:
+                    search(mid + 1, hi)
+            else:
+                search(mid + 1, hi)
+                if len(heap) < k or difference < -heap[0][0]:
+                    search(lo, mid)
+
+        search(0, len(points))
+        return [(index, distance) for distance, index in sorted((-distance, index) for distance, index in heap)]
+
+    def within_radius(self, point: Coordinates, radius: t.Union[int, float]) -> t.List[int]:
+        """
+        Find the points within a distance of a point.
+
+        Parameters
+        ----------
+        point : Coordinates
+            The center of the search.
+        radius : t.Union[int, float]
+            The largest distance from the center, included.
+
+        Returns
+        -------
+        t.List[int]
+            The sorted indices of the points found.
+        """
+        query = self._cleaned_query(point)
+        if radius < 0:
+            raise ValueError(f"The radius must not be negative, not {radius}")
+
+        points, order, axes, leaf_size = self._points, self._order, self._axes, self.leaf_size
+        dist = math.dist
+        found = []
+
+        def search(lo: int, hi: int) -> None:
+            if hi - lo <= leaf_size:
+                found.extend(index for index in order[lo:hi] if dist(query, points[index]) <= radius)
+                return
+
+            mid = (lo + hi) // 2
+            median = order[mid]
+            if dist(query, points[median]) <= radius:
+                found.append(median)
+
+            difference = query[axes[mid]] - points[median][axes[mid]]
+            if difference <= radius:
+                search(lo, mid)
+            if -difference <= radius:
+                search(mid + 1, hi)
+
+        search(0, len(points))
+        return sorted(found)
+
+    def within_box(self, lower: Coordinates, upper: Coordinates) -> t.List[int]:
+        """
+        Find the points within an axis-aligned bounding box.
+
+        Parameters
+        ----------
+        lower : Coordinates
+            The lowest coordinates of the box, included.
+        upper : Coordinates
+            The highest coordinates of the box, included.
+
+        Returns
+        -------
+        t.List[int]
+            The sorted indices of the points found.
+        """
+        lower, upper = self._cleaned_query(lower), self._cleaned_query(upper)
+        points, order, axes, leaf_size = self._points, self._order, self._axes, self.leaf_size
+
+        def inside(index: int) -> bool:
+            return all(low <= coordinate <= high for low, coordinate, high in zip(lower, points[index], upper))
+
+        found = []
+
+        def search(lo: int, hi: int) -> None:
+            if hi - lo <= leaf_size:
+                found.extend(filter(inside, order[lo:hi]))
+                return
+
+            mid = (lo + hi) // 2
+            median = order[mid]
+            if inside(median):
+                found.append(median)
+
+            axis = axes[mid]
+            split = points[median][axis]
+            if lower[axis] <= split:
+                search(lo, mid)
+            if upper[axis] >= split:
+                search(mid + 1, hi)
+
+        search(0, len(points))
+        return sorted(found)
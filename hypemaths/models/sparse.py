@@ -0,0 +1,642 @@
+import operator
+import typing as t
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, repeat
+
+from .matrix import Matrix
+from .vector import Vector
+from ..core import FLOAT_TYPECODE, INT_TYPECODE, infer_typecode, pack, result_typecode
+from ..exceptions import MatrixDimensionError, VectorDimensionError
+from ..mixins import CopyMixin
+
+
+def _zeros(typecode: str, length: int) -> array:
+    """
+    Returns
+    -------
+    array
+        A buffer of `length` zeros, allocated without going through Python integers.
+    """
+    return array(typecode, bytes(length * array(typecode).itemsize))
+
+
+class SparseMatrix(CopyMixin):
+    """
+    A matrix storing only its nonzero values, for matrices which are mostly zeros.
+
+    It is built from coordinates (COO), the ``(row, col, value)`` triplets of the nonzero values, and stored in the
+    compressed sparse row (CSR) format: the columns and values of the nonzeros row after row, along with the position
+    where every row starts. The compressed sparse column (CSC) format is derived from it when columns are needed, and
+    cached. The memory used and the cost of the operations grow with the number of nonzeros, not with the rows times
+    the columns.
+
+    Sparse matrices are not modified once built, every operation returns a new matrix.
+    """
+    def __init__(self, dims: tuple, entries: t.Iterable[tuple] = ()) -> None:
+        """
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        entries : t.Iterable[tuple]
+            The ``(row, col, value)`` triplets of the nonzero values, in any order. The values given for the same
+            position are summed, and zeros are dropped. Defaults to no values, the zero matrix.
+
+        Raises
+        ------
+        TypeError
+            If a value is not an integer or a float.
+        IndexError
+            If a position is out of the dimensions of the matrix.
+        """
+        rows, cols = self._cleaned_dims(dims)
+
+        cells = {}
+        for row, col, value in entries:
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"All values must be integers or floats, but value[{row}][{col}] is {type(value)}")
+
+            if not (0 <= row < rows and 0 <= col < cols):
+                raise IndexError(f"The position ({row}, {col}) is out of the dimensions {(rows, cols)}.")
+
+            cells[row, col] = cells.get((row, col), 0) + value
+
+        positions = sorted(position for position, value in cells.items() if value)
+
+        counts = [0] * (rows + 1)
+        for row, _ in positions:
+            counts[row + 1] += 1
+
+        self._shape = (rows, cols)
+        self._indptr = array(INT_TYPECODE, accumulate(counts))
+        self._indices = array(INT_TYPECODE, [col for _, col in positions])
+        self._data = pack([cells[position] for position in positions], infer_typecode(cells.values()))
+        self._csc = None
+
+    @classmethod
+    def _from_csr(cls, dims: tuple, indptr: array, indices: array, data: array) -> "SparseMatrix":
+        """
+        Wrap already validated CSR buffers into a sparse matrix, without copying or re-validating them.
+
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        indptr : array
+            The position of the first nonzero of every row in `indices` and `data`, followed by the number of nonzeros.
+        indices : array
+            The column of every nonzero, sorted within each row.
+        data : array
+            The value of every nonzero.
+
+        Returns
+        -------
+        SparseMatrix
+            The sparse matrix backed by the buffers passed.
+        """
+        matrix = cls.__new__(cls)
+        matrix._shape = dims
+        matrix._indptr = indptr
+        matrix._indices = indices
+        matrix._data = data
+        matrix._csc = None
+        return matrix
+
+    @classmethod
+    def _from_rows(cls, dims: tuple, rows: t.Iterable[dict], typecode: str) -> "SparseMatrix":
+        """
+        Compress the nonzero values of every row, given as mappings from their column to their value.
+
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        rows : t.Iterable[dict]
+            The values of every row, by column. Zeros are dropped.
+        typecode : str
+            The typecode of the values.
+
+        Returns
+        -------
+        SparseMatrix
+            The sparse matrix of the rows.
+        """
+        indptr = [0]
+        indices = []
+        values = []
+        for cells in rows:
+            for col in sorted(cells):
+                value = cells[col]
+                if value:
+                    indices.append(col)
+                    values.append(value)
+            indptr.append(len(indices))
+
+        return cls._from_csr(dims, array(INT_TYPECODE, indptr), array(INT_TYPECODE, indices), pack(values, typecode))
+
+    @staticmethod
+    def _cleaned_dims(dims: tuple) -> tuple:
+        """
+        Raises
+        ------
+        TypeError
+            If the dimensions are not a pair of integers.
+        ValueError
+            If a dimension is not positive.
+        """
+        if not isinstance(dims, tuple) or len(dims) != 2 or not all(isinstance(dim, int) for dim in dims):
+            raise TypeError(f"The dimensions must be a tuple of 2 integers, not {dims!r}")
+
+        if dims[0] <= 0 or dims[1] <= 0:
+            raise ValueError(f"The dimensions must be positive, not {dims}")
+
+        return dims
+
+    @classmethod
+    def from_coo(
+            cls, dims: tuple, rows: t.Sequence[int], cols: t.Sequence[int], values: t.Sequence[t.Union[int, float]]
+    ) -> "SparseMatrix":
+        """
+        Create a sparse matrix from the coordinates of its nonzero values, given as three parallel sequences.
+
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        rows : t.Sequence[int]
+            The row of every value.
+        cols : t.Sequence[int]
+            The column of every value.
+        values : t.Sequence[t.Union[int, float]]
+            The values.
+
+        Returns
+        -------
+        SparseMatrix
+            The sparse matrix of the values.
+
+        Examples
+        --------
+        >>> SparseMatrix.from_coo((2, 3), [0, 1], [2, 0], [5, 7]).to_dense()
+        Matrix([[0, 0, 5],
+                 [7, 0, 0]])
+        """
+        if not len(rows) == len(cols) == len(values):
+            raise ValueError("The rows, columns and values must be of the same length.")
+
+        return cls(dims, zip(rows, cols, values))
+
+    @classmethod
+    def from_dense(cls, matrix: Matrix) -> "SparseMatrix":
+        """
+        Create a sparse matrix holding the nonzero values of a dense matrix.
+
+        Parameters
+        ----------
+        matrix : Matrix
+            The dense matrix to be converted.
+
+        Returns
+        -------
+        SparseMatrix
+            The sparse matrix of the nonzero values, keeping the typecode of the dense one.
+        """
+        if not isinstance(matrix, Matrix):
+            raise TypeError(f"Only a Matrix can be converted into a SparseMatrix, not {type(matrix)}")
+
+        indptr = [0]
+        indices = []
+        values = []
+        for row in range(matrix.rows):
+            for col, value in enumerate(matrix._row_values(row)):
+                if value:
+                    indices.append(col)
+                    values.append(value)
+            indptr.append(len(indices))
+
+        return cls._from_csr(
+            matrix.dims, array(INT_TYPECODE, indptr), array(INT_TYPECODE, indices), pack(values, matrix.typecode)
+        )
+
+    def to_dense(self) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            The dense matrix of the same values.
+        """
+        rows, cols = self._shape
+        data = _zeros(self.typecode, rows * cols)
+        for row in range(rows):
+            start = row * cols
+            for col, value in self._row_items(row):
+                data[start + col] = value
+
+        return Matrix._from_flat(data, self._shape)
+
+    def to_coo(self) -> t.List[tuple]:
+        """
+        Returns
+        -------
+        t.List[tuple]
+            The ``(row, col, value)`` triplets of the nonzero values, row after row.
+        """
+        return [(row, col, value) for row in range(self.rows) for col, value in self._row_items(row)]
+
+    @property
+    def rows(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of rows.
+        """
+        return self._shape[0]
+
+    @property
+    def cols(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of columns.
+        """
+        return self._shape[1]
+
+    @property
+    def dims(self) -> tuple:
+        """
+        Returns
+        -------
+        tuple
+            The rows and columns of the matrix.
+        """
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The number of nonzero values stored.
+        """
+        return len(self._data)
+
+    @property
+    def density(self) -> float:
+        """
+        Returns
+        -------
+        float
+            The fraction of the values of the matrix which are nonzero.
+        """
+        return self.nnz / (self.rows * self.cols)
+
+    @property
+    def typecode(self) -> str:
+        """
+        Returns
+        -------
+        str
+            The `array` typecode of the nonzero values, either ``"q"`` for integers or ``"d"`` for floats.
+        """
+        return self._data.typecode
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._shape}, nnz={self.nnz})"
+
+    def __eq__(self, other: "SparseMatrix") -> bool:
+        if not isinstance(other, SparseMatrix):
+            raise TypeError(
+                f"Equality comparison with SparseMatrix can only be performed with another SparseMatrix, got {type(other)}"
+            )
+
+        return (
+            self._shape == other._shape and self._indptr == other._indptr and self._indices == other._indices
+            and all(map(operator.eq, self._data, other._data))
+        )
+
+    def __getitem__(self, index: t.Union[int, tuple]) -> t.Union[int, float, list]:
+        if isinstance(index, int):
+            if not -self.rows <= index < self.rows:
+                raise IndexError(f"The row {index} is out of the dimensions {self._shape}.")
+
+            values = [0] * self.cols
+            for col, value in self._row_items(index % self.rows):
+                values[col] = value
+            return values
+
+        row, col = index
+        row = row + self.rows if row < 0 else row
+        col = col + self.cols if col < 0 else col
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            raise IndexError(f"The position {index} is out of the dimensions {self._shape}.")
+
+        start, end = self._indptr[row], self._indptr[row + 1]
+        position = bisect_left(self._indices, col, start, end)
+        if position < end and self._indices[position] == col:
+            return self._data[position]
+        return 0
+
+    def _row_items(self, row: int) -> t.Iterator[tuple]:
+        """
+        Returns
+        -------
+        t.Iterator[tuple]
+            The ``(col, value)`` pairs of the nonzero values of a row.
+        """
+        start, end = self._indptr[row], self._indptr[row + 1]
+        return zip(self._indices[start:end], self._data[start:end])
+
+    def _compressed_columns(self) -> tuple:
+        """
+        Returns
+        -------
+        tuple
+            The CSC buffers of the matrix, the position where every column starts, the row and the value of every
+            nonzero column after column. They are computed once, by a counting sort of the CSR buffers.
+        """
+        if self._csc is None:
+            rows, cols = self._shape
+
+            counts = [0] * (cols + 1)
+            for col in self._indices:
+                counts[col + 1] += 1
+            indptr = list(accumulate(counts))
+
+            following = indptr[:-1]
+            indices = _zeros(INT_TYPECODE, self.nnz)
+            data = _zeros(self.typecode, self.nnz)
+            for row in range(rows):
+                for position in range(self._indptr[row], self._indptr[row + 1]):
+                    col = self._indices[position]
+                    target = following[col]
+                    indices[target] = row
+                    data[target] = self._data[position]
+                    following[col] = target + 1
+
+            self._csc = (array(INT_TYPECODE, indptr), indices, data)
+
+        return self._csc
+
+    def transpose(self) -> "SparseMatrix":
+        """
+        Returns
+        -------
+        SparseMatrix
+            The transpose of the matrix, whose CSR buffers are the CSC buffers of this one.
+        """
+        transposed = self._from_csr((self.cols, self.rows), *self._compressed_columns())
+        transposed._csc = (self._indptr, self._indices, self._data)
+        return transposed
+
+    def _merged(self, other: "SparseMatrix", op: t.Callable) -> "SparseMatrix":
+        """
+        Returns
+        -------
+        SparseMatrix
+            The result of a binary operation between the values at the same position, computed over the union of the
+            nonzeros of both matrices, row after row.
+        """
+        def merged_rows() -> t.Iterator[dict]:
+            for row in range(self.rows):
+                cells = dict(self._row_items(row))
+                for col, value in other._row_items(row):
+                    cells[col] = op(cells.get(col, 0), value)
+                yield cells
+
+        return self._from_rows(self._shape, merged_rows(), result_typecode(self.typecode, other.typecode))
+
+    def _scattered(
+            self, dense: Matrix, sign: int = 1, dense_sign: int = 1, out: t.Optional[Matrix] = None
+    ) -> Matrix:
+        """
+        Add the nonzero values to a dense matrix, touching only their positions.
+
+        Parameters
+        ----------
+        dense : Matrix
+            The dense matrix, of the same dimensions.
+        sign : int
+            The sign of the sparse matrix in the sum.
+        dense_sign : int
+            The sign of the dense matrix in the sum.
+        out : t.Optional[Matrix]
+            The matrix to write the sum into, instead of a new one. It may be the dense matrix itself.
+
+        Returns
+        -------
+        Matrix
+            The sum ``sign * self + dense_sign * dense``.
+        """
+        if dense_sign < 0:
+            result = dense._scaled(-1, out)
+        elif out is None:
+            result = dense.clone()
+        elif out is not dense:
+            result = out._assign(dense._iter_values(), dense.typecode)
+        else:
+            result = dense
+
+        storage = result._storage
+        if self.typecode == FLOAT_TYPECODE:
+            storage.upcast()
+        storage.version += 1
+
+        data = storage.data
+        offset, row_stride, col_stride = result._layout
+        for row in range(self.rows):
+            start = offset + row * row_stride
+            for col, value in self._row_items(row):
+                data[start + col * col_stride] += sign * value
+
+        return result
+
+    def _matmul_dense(self, dense: Matrix) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            The dense product with a dense matrix, every nonzero scaling and accumulating a row of the dense matrix.
+        """
+        cols = dense.cols
+        add, mul = operator.add, operator.mul
+
+        values = []
+        for row in range(self.rows):
+            accumulator = [0] * cols
+            for col, value in self._row_items(row):
+                accumulator = list(map(add, accumulator, map(mul, dense._row_values(col), repeat(value))))
+            values.extend(accumulator)
+
+        return Matrix._from_flat(pack(values, result_typecode(self.typecode, dense.typecode)), (self.rows, cols))
+
+    def _rmatmul_dense(self, dense: Matrix, out: t.Optional[Matrix] = None) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            The dense product of a dense matrix with this one, computed as ``(self.T @ dense.T).T`` from the CSC
+            buffers and a transposed view, without copying the dense matrix. It is written into `out` when given.
+        """
+        product = self.transpose()._matmul_dense(dense.transpose()).transpose()
+        if out is not None:
+            return out._assign(product._iter_values(), product.typecode)
+
+        return product.materialize()
+
+    def add(self, other: t.Union["SparseMatrix", Matrix]) -> t.Union["SparseMatrix", Matrix]:
+        """
+        Add another matrix of the same dimensions, element by element.
+
+        Parameters
+        ----------
+        other : t.Union[SparseMatrix, Matrix]
+            The matrix to be added.
+
+        Returns
+        -------
+        t.Union[SparseMatrix, Matrix]
+            The sum, sparse when both matrices are sparse, else dense.
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            raise TypeError(f"SparseMatrix can only be added with other matrix. Not {type(other)}")
+
+        if self._shape != other.dims:
+            raise MatrixDimensionError("These matrices cannot be added due to wrong dimensions.")
+
+        if isinstance(other, Matrix):
+            return self._scattered(other)
+
+        return self._merged(other, operator.add)
+
+    def sub(self, other: t.Union["SparseMatrix", Matrix]) -> t.Union["SparseMatrix", Matrix]:
+        """
+        Subtract another matrix of the same dimensions, element by element.
+
+        Parameters
+        ----------
+        other : t.Union[SparseMatrix, Matrix]
+            The matrix to be subtracted.
+
+        Returns
+        -------
+        t.Union[SparseMatrix, Matrix]
+            The difference, sparse when both matrices are sparse, else dense.
+        """
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            raise TypeError(f"SparseMatrix can only be subtracted with other matrix. Not {type(other)}")
+
+        if self._shape != other.dims:
+            raise MatrixDimensionError("These matrices cannot be subtracted due to wrong dimensions.")
+
+        if isinstance(other, Matrix):
+            return self._scattered(other, dense_sign=-1)
+
+        return self._merged(other, operator.sub)
+
+    def matmul(self, other: t.Union["SparseMatrix", Matrix, Vector]) -> t.Union["SparseMatrix", Matrix, Vector]:
+        """
+        Multiply with another matrix whose number of rows is the number of columns of this one, or with a vector.
+
+        Parameters
+        ----------
+        other : t.Union[SparseMatrix, Matrix, Vector]
+            The right hand side of the product.
+
+        Returns
+        -------
+        t.Union[SparseMatrix, Matrix, Vector]
+            The product, of the same kind as the right hand side.
+        """
+        if isinstance(other, Vector):
+            if self.cols != other.dimensions:
+                raise VectorDimensionError("The vector cannot be multiplied due to wrong dimensions.")
+
+            points = other.points
+            return Vector._from_points([
+                sum(map(operator.mul, (points[col] for col, _ in items), (value for _, value in items)))
+                for items in (list(self._row_items(row)) for row in range(self.rows))
+            ])
+
+        if not isinstance(other, (SparseMatrix, Matrix)):
+            raise TypeError(f"SparseMatrix can only be multiplied with other matrix or vector. Not {type(other)}")
+
+        if self.cols != other.rows:
+            raise MatrixDimensionError("These matrices cannot be multiplied due to wrong dimensions.")
+
+        if isinstance(other, Matrix):
+            return self._matmul_dense(other)
+
+        def product_rows() -> t.Iterator[dict]:
+            # Gustavson's algorithm, every nonzero of a row scales and accumulates a row of the other matrix.
+            for row in range(self.rows):
+                cells = {}
+                for inner, value in self._row_items(row):
+                    for col, other_value in other._row_items(inner):
+                        cells[col] = cells.get(col, 0) + value * other_value
+                yield cells
+
+        return self._from_rows(
+            (self.rows, other.cols), product_rows(), result_typecode(self.typecode, other.typecode)
+        )
+
+    def _scaled(self, scalar: t.Union[int, float], op: t.Callable, typecode: str) -> "SparseMatrix":
+        """
+        Returns
+        -------
+        SparseMatrix
+            The matrix with every nonzero combined with the scalar, keeping the sparsity structure unless a value
+            becomes zero.
+        """
+        values = pack(map(op, self._data, repeat(scalar)), typecode)
+        if all(values):
+            return self._from_csr(self._shape, self._indptr, self._indices, values)
+
+        return self._from_rows(
+            self._shape,
+            ({col: op(value, scalar) for col, value in self._row_items(row)} for row in range(self.rows)),
+            typecode
+        )
+
+    def __add__(self, other: t.Union["SparseMatrix", Matrix]) -> t.Union["SparseMatrix", Matrix]:
+        return self.add(other)
+
+    def __sub__(self, other: t.Union["SparseMatrix", Matrix]) -> t.Union["SparseMatrix", Matrix]:
+        return self.sub(other)
+
+    def __mul__(
+            self, other: t.Union["SparseMatrix", Matrix, Vector, int, float]
+    ) -> t.Union["SparseMatrix", Matrix, Vector]:
+        if isinstance(other, (int, float)):
+            typecode = result_typecode(self.typecode, FLOAT_TYPECODE if isinstance(other, float) else INT_TYPECODE)
+            return self._scaled(other, operator.mul, typecode)
+
+        return self.matmul(other)
+
+    def __rmul__(self, other: t.Union[int, float]) -> "SparseMatrix":
+        if isinstance(other, (int, float)):
+            return self.__mul__(other)
+
+        return NotImplemented
+
+    def __truediv__(self, other: t.Union[int, float]) -> "SparseMatrix":
+        if not isinstance(other, (int, float)):
+            raise TypeError(f"SparseMatrix can only be divided by a scalar. Not {type(other)}")
+
+        return self._scaled(other, operator.truediv, FLOAT_TYPECODE)
+
+    def __neg__(self) -> "SparseMatrix":
+        return self.__mul__(-1)
+
+    def __matmul__(self, other: t.Union["SparseMatrix", Matrix, Vector]) -> t.Union["SparseMatrix", Matrix, Vector]:
+        return self.matmul(other)
+
+    def __rmatmul__(self, other: Vector) -> Vector:
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        # The product of a row vector with the matrix is the product of the transpose with the column vector.
+        return self.transpose().matmul(other)
@@ -1,12 +1,46 @@
 import math
+import os
+import sys
 import typing as t
+from array import array
 
 import hypemaths as hm
+from ..backends import get_backend
+from ..config import VALIDATION_LEVELS, settings
+from ..core import FLOAT_TYPECODE, binary, infer_typecode, pack, typed_view
 from ..exceptions import MatrixDimensionError, VectorDimensionError
 from ..mixins import CopyMixin
 
 
+def _coordinate(index: int, name: str) -> property:
+    """
+    Returns
+    -------
+    property
+        A property reading and writing a point of the vector, raising an `AttributeError` if the vector has too few
+        dimensions for it.
+    """
+    def getter(vector: "Vector") -> t.Union[int, float]:
+        if index >= len(vector.points):
+            raise AttributeError(f"A vector of {len(vector.points)} dimensions has no {name!r} coordinate.")
+        return vector.points[index]
+
+    def setter(vector: "Vector", value: t.Union[int, float]) -> None:
+        if index >= len(vector.points):
+            raise AttributeError(f"A vector of {len(vector.points)} dimensions has no {name!r} coordinate.")
+        vector[index] = value
+
+    return property(getter, setter, doc=f"The point of the vector at the index {index}, read from the points.")
+
+
 class Vector(CopyMixin):
+    __slots__ = ("points",)
+
+    x = _coordinate(0, "x")
+    y = _coordinate(1, "y")
+    z = _coordinate(2, "z")
+    w = _coordinate(3, "w")
+
     def __init__(self, *points: t.Union[int, tuple, list]) -> None:
         """
         Constructor for the `Vector` class.
@@ -17,10 +51,24 @@ class Vector(CopyMixin):
         """
         self.points = self._cleaned_vector(points)
 
-        # Get the XYZW Dimensions
-        if self.dimensions <= 4:
-            for attribute, value in zip(list("xyzw"), self.points):
-                setattr(self, attribute, value)
+    @classmethod
+    def _from_points(cls, points: list) -> "Vector":
+        """
+        Wrap an already validated list of points into a vector, without copying or re-validating it.
+
+        Parameters
+        ----------
+        points : list
+            The points of the vector.
+
+        Returns
+        -------
+        Vector
+            The vector of the points.
+        """
+        vector = cls.__new__(cls)
+        vector.points = points
+        return vector
 
     @staticmethod
     def _cleaned_vector(points: tuple) -> list:
@@ -36,6 +84,9 @@ class Vector(CopyMixin):
             The cleaned vector,
         """
         def value_check(vector_points: list) -> bool:
+            if all(issubclass(kind, (int, float)) for kind in set(map(type, vector_points))):
+                return True
+
             for index, point in enumerate(vector_points):
                 if not isinstance(point, (int, float)):
                     raise TypeError(f"All points must be integers or floats, but point[{index}] is {type(point)}")
@@ -47,7 +98,11 @@ class Vector(CopyMixin):
         else:
             points = list(points)
 
-        if not value_check(points):
+        level = settings.validation
+        if level not in VALIDATION_LEVELS:
+            raise ValueError(f"Unknown validation level {level!r}, must be one of {VALIDATION_LEVELS}.")
+
+        if level == "strict" and not value_check(points):
             pass
 
         return points
@@ -90,10 +145,84 @@ class Vector(CopyMixin):
     def __delitem__(self, index: int) -> None:
         del self.points[index]
 
-    def __add__(self, other: "Vector") -> "Vector":
-        cls = self.__class__
+    def _elementwise(self, other: "Vector", op: t.Callable, out: t.Optional["Vector"] = None) -> "Vector":
+        """
+        Apply a binary operation between the points at the same position in two vectors, in pure Python.
+
+        Parameters
+        ----------
+        other : Vector
+            The other vector of the operation.
+        op : t.Callable
+            The binary function to be applied.
+        out : t.Optional[Vector]
+            The vector to write the results into, instead of a new one.
+
+        Returns
+        -------
+        Vector
+            The vector of the results.
+        """
+        points = list(map(op, self.points, other.points))
+        if out is not None:
+            return out._assign(points)
+
+        return self._from_points(points)
+
+    def _assign(self, points: list) -> "Vector":
+        """
+        Write the points passed into this vector, keeping its storage.
+
+        Parameters
+        ----------
+        points : list
+            The new points, as many as the dimensions of the vector.
+
+        Returns
+        -------
+        Vector
+            This vector.
+        """
+        self.points[:] = points
+        return self
+
+    def _check_out(self, out: t.Optional["Vector"]) -> None:
+        """
+        Raises
+        ------
+        TypeError
+            If the destination passed for the result of an operation is not a vector.
+        VectorDimensionError
+            If the destination does not have the dimensions of this vector.
+        """
+        if out is None:
+            return
+
+        if not isinstance(out, Vector):
+            raise TypeError(f"The destination of the result must be a Vector, not {type(out)}")
+
+        if out.dimensions != self.dimensions:
+            raise VectorDimensionError("The destination does not have the dimensions of the result.")
+
+    def add(self, other: "Vector", out: t.Optional["Vector"] = None, backend: t.Optional[str] = None) -> "Vector":
+        """
+        Add another vector of the same dimensions, point by point.
+
+        Parameters
+        ----------
+        other : Vector
+            The vector to be added.
+        out : t.Optional[Vector]
+            A vector of the same dimensions to write the result into, instead of allocating a new one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
-        if not isinstance(other, cls):
+        Returns
+        -------
+        Vector
+            The sum of the vectors.
+        """
+        if not isinstance(other, Vector):
             raise TypeError(
                 f"Vector can only be added with another Vector, not with {type(other)}")
 
@@ -102,14 +231,28 @@ class Vector(CopyMixin):
                 "These vectors cannot be added due to wrong dimensions."
             )
 
-        vector = [self[index] + other[index]
-                  for index in range(self.dimensions)]
-        return cls(vector)
+        self._check_out(out)
+        return get_backend(backend).vector_add(self, other, out)
 
-    def __sub__(self, other: "Vector") -> "Vector":
-        cls = self.__class__
+    def sub(self, other: "Vector", out: t.Optional["Vector"] = None, backend: t.Optional[str] = None) -> "Vector":
+        """
+        Subtract another vector of the same dimensions, point by point.
+
+        Parameters
+        ----------
+        other : Vector
+            The vector to be subtracted.
+        out : t.Optional[Vector]
+            A vector of the same dimensions to write the result into, instead of allocating a new one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
-        if not isinstance(other, cls):
+        Returns
+        -------
+        Vector
+            The difference of the vectors.
+        """
+        if not isinstance(other, Vector):
             raise TypeError(
                 f"Vector can only be subtracted with another Vector, not with {type(other)}")
 
@@ -118,45 +261,119 @@ class Vector(CopyMixin):
                 "These vectors cannot be subtracted due to wrong dimensions."
             )
 
-        vector = [self[index] - other[index] for index in range(self.dimensions)]
-        return cls(vector)
+        self._check_out(out)
+        return get_backend(backend).vector_sub(self, other, out)
 
-    def __matmul__(self, other: "Vector") -> float:
+    def dot(self, other: "Vector", backend: t.Optional[str] = None) -> t.Union[int, float]:
+        """
+        Compute the dot product with another vector of the same dimensions.
+
+        Parameters
+        ----------
+        other : Vector
+            The other vector of the product.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
+
+        Returns
+        -------
+        t.Union[int, float]
+            The dot product of the vectors.
+        """
         if self.dimensions != other.dimensions:
             raise VectorDimensionError("These vectors cannot be multiplied due to wrong dimensions.")
 
-        return sum(x * y for x, y in zip(self, other))
+        return get_backend(backend).vector_dot(self, other)
 
-    def __mul__(self, other: "Vector") -> "Vector":
-        cls = self.__class__
+    def __add__(self, other: "Vector") -> "Vector":
+        return self.add(other)
+
+    def __sub__(self, other: "Vector") -> "Vector":
+        return self.sub(other)
+
+    def __matmul__(self, other: "Vector") -> float:
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return self.dot(other)
+
+    def multiply(self, other: "Vector", out: t.Optional["Vector"] = None, backend: t.Optional[str] = None) -> "Vector":
+        """
+        Multiply with another vector of the same dimensions, point by point.
+
+        Parameters
+        ----------
+        other : Vector
+            The vector to be multiplied with.
+        out : t.Optional[Vector]
+            A vector of the same dimensions to write the result into, instead of allocating a new one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
-        if not isinstance(other, cls):
+        Returns
+        -------
+        Vector
+            The product of the vectors.
+        """
+        if not isinstance(other, Vector):
             raise TypeError(
-                f"Vector can only be added with another Vector, not with {type(other)}")
+                f"Vector can only be multiplied with another Vector, not with {type(other)}")
 
         if self.dimensions != other.dimensions:
             raise VectorDimensionError(
-                "These vectors cannot be added due to wrong dimensions."
+                "These vectors cannot be multiplied due to wrong dimensions."
             )
 
-        vector = [self[index] * other[index]
-                  for index in range(self.dimensions)]
-        return cls(vector)
+        self._check_out(out)
+        return get_backend(backend).vector_mul(self, other, out)
 
-    def __truediv__(self, other: "Vector") -> "Vector":
-        cls = self.__class__
+    def divide(self, other: "Vector", out: t.Optional["Vector"] = None, backend: t.Optional[str] = None) -> "Vector":
+        """
+        Divide by another vector of the same dimensions, point by point.
+
+        Parameters
+        ----------
+        other : Vector
+            The vector to be divided by.
+        out : t.Optional[Vector]
+            A vector of the same dimensions to write the result into, instead of allocating a new one.
+        backend : t.Optional[str]
+            The name of the compute backend to be used, instead of the one selected globally.
 
-        if not isinstance(other, cls):
+        Returns
+        -------
+        Vector
+            The quotient of the vectors.
+        """
+        if not isinstance(other, Vector):
             raise TypeError(
-                f"Vector can only be added with another Vector, not with {type(other)}")
+                f"Vector can only be divided by another Vector, not with {type(other)}")
 
         if self.dimensions != other.dimensions:
             raise VectorDimensionError(
-                "These vectors cannot be added due to wrong dimensions."
+                "These vectors cannot be divided due to wrong dimensions."
             )
 
-        vector = [self[index] / other[index] for index in range(self.dimensions)]
-        return cls(vector)
+        self._check_out(out)
+        return get_backend(backend).vector_div(self, other, out)
+
+    def __mul__(self, other: "Vector") -> "Vector":
+        return self.multiply(other)
+
+    def __truediv__(self, other: "Vector") -> "Vector":
+        return self.divide(other)
+
+    def __iadd__(self, other: "Vector") -> "Vector":
+        return self.add(other, out=self)
+
+    def __isub__(self, other: "Vector") -> "Vector":
+        return self.sub(other, out=self)
+
+    def __imul__(self, other: "Vector") -> "Vector":
+        return self.multiply(other, out=self)
+
+    def __itruediv__(self, other: "Vector") -> "Vector":
+        return self.divide(other, out=self)
 
     def __floordiv__(self, other: "Vector") -> "Vector":
         return self.__truediv__(other)
@@ -165,16 +382,22 @@ class Vector(CopyMixin):
         return self.__add__(other)
 
     def __abs__(self) -> "Vector":
-        cls = self.__class__
-
-        points = [abs(point) for point in self.points]
-        return cls(*points)
+        return self._from_points(list(map(abs, self.points)))
 
     @staticmethod
     def absolute(param: t.Any) -> float:
         points = math.sqrt(param @ param)
         return points
 
+    def freeze(self) -> "hm.FrozenVector":
+        """
+        Returns
+        -------
+        FrozenVector
+            An immutable, hashable copy of the vector, to be used as a dictionary key or shared between threads.
+        """
+        return hm.FrozenVector._from_vector(self)
+
     @classmethod
     def from_matrix(cls, matrix: "hm.Matrix") -> "Vector":
         """
@@ -191,14 +414,168 @@ class Vector(CopyMixin):
         if matrix.cols != 1:
             raise MatrixDimensionError("Matrix must only have 1 column.")
 
-        points = [column[0] for column in matrix]
-        return cls(*points)
+        return cls._from_points(list(matrix._iter_values()))
 
     @classmethod
     def from_point(cls, point: "hm.Point") -> "Vector":
         points = point.x, point.y
         return cls(*points)
 
+    def _packed(self) -> array:
+        return pack(self.points, infer_typecode(self.points))
+
+    @property
+    def data(self) -> memoryview:
+        """
+        Returns
+        -------
+        memoryview
+            The points packed into a read-only `memoryview`. The points of a vector are held in a list, so this is a
+            copy made in a single pass, and writing into it does not change the vector.
+        """
+        return memoryview(self._packed()).toreadonly()
+
+    def __buffer__(self, flags: int) -> memoryview:
+        # The buffer protocol of Python 3.12 and later, so that `memoryview(vector)` is `vector.data`.
+        return self.data
+
+    @property
+    def __array_interface__(self) -> dict:
+        """
+        Returns
+        -------
+        dict
+            The description of the packed points, see `data`, for NumPy to wrap them as a read-only array.
+        """
+        data = self.data
+        return {
+            "version": 3,
+            "shape": (len(data),),
+            "typestr": ("<" if sys.byteorder == "little" else ">") + ("f8" if data.format == FLOAT_TYPECODE else "i8"),
+            "data": data,
+        }
+
+    @classmethod
+    def frombuffer(cls, buffer: t.Any, typecode: t.Optional[str] = None) -> "Vector":
+        """
+        Read the points of a vector out of any object supporting the buffer protocol, without validating them again.
+        The points of a vector are held in a list, so they are copied, in a single pass.
+
+        Parameters
+        ----------
+        buffer : t.Any
+            Any object supporting the buffer protocol, such as an `array`, a `memoryview` or a NumPy array, holding
+            contiguous 64 bits integers or floats in the byte order of the machine.
+        typecode : t.Optional[str]
+            The typecode of raw bytes, ``"q"`` or ``"d"``. Defaults to `None`, the typecode of the buffer format.
+
+        Returns
+        -------
+        Vector
+            The vector of the points.
+
+        Raises
+        ------
+        ValueError
+            If the buffer is empty or not contiguous.
+        TypeError
+            If the buffer does not hold 64 bits integers or floats, or raw bytes.
+        """
+        points = typed_view(buffer, typecode).tolist()
+        if not points:
+            raise ValueError("You need to pass at least a point for the vector!")
+
+        return cls._from_points(points)
+
+    def tobytes(self) -> bytes:
+        """
+        Serialize the vector into the binary format of `hypemaths.core.binary`, a small header followed by the raw
+        points.
+
+        Returns
+        -------
+        bytes
+            The serialized vector.
+        """
+        return binary.dumps(self._packed(), (len(self.points),))
+
+    @classmethod
+    def frombytes(cls, data: t.Any) -> "Vector":
+        """
+        Read a vector out of a buffer in the binary format, as written by `tobytes`.
+
+        Parameters
+        ----------
+        data : t.Any
+            The serialized vector, `bytes` or any other object supporting the buffer protocol.
+
+        Returns
+        -------
+        Vector
+            The vector.
+
+        Raises
+        ------
+        ValueError
+            If the buffer does not hold a serialized vector.
+        """
+        values, shape = binary.loads(data)
+        return cls._from_points(cls._vector_points(values, shape))
+
+    @staticmethod
+    def _vector_points(values: array, shape: tuple) -> list:
+        if len(shape) != 1:
+            raise ValueError("The data holds a matrix, not a vector.")
+
+        return values.tolist()
+
+    def save(self, path: t.Union[str, os.PathLike]) -> None:
+        """
+        Save the vector into a file, in the binary format of `hypemaths.core.binary`.
+
+        Parameters
+        ----------
+        path : t.Union[str, os.PathLike]
+            The path of the file, overwritten if it exists.
+        """
+        binary.save(path, self._packed(), (len(self.points),))
+
+    @classmethod
+    def load(cls, path: t.Union[str, os.PathLike]) -> "Vector":
+        """
+        Load a vector saved by `save`.
+
+        Parameters
+        ----------
+        path : t.Union[str, os.PathLike]
+            The path of the file.
+
+        Returns
+        -------
+        Vector
+            The vector loaded.
+
+        Raises
+        ------
+        ValueError
+            If the file does not hold a saved vector.
+        """
+        return cls._from_points(cls._vector_points(*binary.load(path)))
+
+    def __reduce__(self) -> tuple:
+        # Pickled as the binary format, which is more compact and faster to load than the list of points, when the
+        # points come back from it unchanged: only floats, or only integers fitting into 64 bits.
+        kinds = set(map(type, self.points))
+        if kinds == {float}:
+            return Vector.frombytes, (self.tobytes(),)
+        if kinds == {int}:
+            try:
+                return Vector.frombytes, (self.tobytes(),)
+            except OverflowError:
+                pass
+
+        return Vector._from_points, (list(self.points),)
+
     def parallel_to(self, other: "Vector") -> bool:
         """
         Check if the Vectors are parallel to each other.
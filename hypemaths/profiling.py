@@ -0,0 +1,370 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+import typing as t
+
+from .models import LazyMatrix, Matrix, Point, Vector
+
+# The number of elements and the estimated floating point operations of a call, from its arguments.
+CostModel = t.Callable[..., t.Tuple[int, int]]
+
+VALUE_SIZE = 8
+
+
+class OperationStats:
+    """
+    The totals recorded for an operation.
+
+    Attributes
+    ----------
+    calls : int
+        The number of calls.
+    seconds : float
+        The wall time spent in the calls.
+    elements : int
+        The number of elements the calls went through, those of the operands or of the results.
+    flops : int
+        The estimated number of arithmetic operations of the calls.
+    bytes : int
+        The bytes of the values of the new results, 8 per value. The results sharing the memory of an operand, such
+        as views and in-place results, allocate nothing.
+    """
+    __slots__ = ("calls", "seconds", "elements", "flops", "bytes")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+        self.elements = 0
+        self.flops = 0
+        self.bytes = 0
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        )
+
+
+class Profile:
+    """
+    The operations recorded while a `profile` block was running.
+
+    Only the outermost operation is recorded when an operation calls others, so ``a @ b`` is recorded once, as
+    ``Matrix.__matmul__``, and the totals do not count anything twice.
+    """
+    def __init__(self, trace: bool = True) -> None:
+        """
+        Parameters
+        ----------
+        trace : bool
+            If every call is kept as an event for `trace_events`, on top of the totals. Defaults to `True`.
+        """
+        self.stats: t.Dict[str, OperationStats] = {}
+        self.trace = trace
+        self._events = []
+        self._origin = time.perf_counter_ns()
+
+    def _record(self, name: str, start: int, end: int, elements: int, flops: int, allocated: int) -> None:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = OperationStats()
+
+        stats.calls += 1
+        stats.seconds += (end - start) / 1e9
+        stats.elements += elements
+        stats.flops += flops
+        stats.bytes += allocated
+
+        if self.trace:
+            self._events.append((name, start, end, threading.get_ident(), elements, flops, allocated))
+
+    def table(self, sort_by: str = "seconds") -> str:
+        """
+        Parameters
+        ----------
+        sort_by : str
+            The total to sort the operations by, from the largest, one of the attributes of `OperationStats`.
+            Defaults to ``"seconds"``.
+
+        Returns
+        -------
+        str
+            The totals of every operation, as a table.
+        """
+        header = f"{'operation':<28} {'calls':>8} {'total (s)':>11} {'per call (us)':>14} {'elements':>12} " \
+                 f"{'flops':>14} {'GFLOP/s':>8} {'bytes':>14}"
+        lines = [header, "-" * len(header)]
+        for name, stats in sorted(self.stats.items(), key=lambda item: getattr(item[1], sort_by), reverse=True):
+            rate = stats.flops / stats.seconds / 1e9 if stats.seconds else 0.0
+            lines.append(
+                f"{name:<28} {stats.calls:>8} {stats.seconds:>11.6f} {stats.seconds / stats.calls * 1e6:>14.2f} "
+                f"{stats.elements:>12} {stats.flops:>14} {rate:>8.3f} {stats.bytes:>14}"
+            )
+
+        return "\n".join(lines)
+
+    def trace_events(self) -> t.List[dict]:
+        """
+        Returns
+        -------
+        t.List[dict]
+            Every call recorded as a complete event of the Chrome trace event format, to be viewed in
+            ``chrome://tracing`` or Perfetto.
+        """
+        pid = os.getpid()
+        return [
+            {
+                "name": name,
+                "cat": "hypemaths",
+                "ph": "X",
+                "ts": (start - self._origin) / 1e3,
+                "dur": (end - start) / 1e3,
+                "pid": pid,
+                "tid": tid,
+                "args": {"elements": elements, "flops": flops, "bytes": allocated},
+            }
+            for name, start, end, tid, elements, flops, allocated in self._events
+        ]
+
+    def save_trace(self, path: t.Union[str, os.PathLike]) -> None:
+        """
+        Save the calls recorded into a JSON file of the Chrome trace event format.
+
+        Parameters
+        ----------
+        path : t.Union[str, os.PathLike]
+            The path of the file, overwritten if it exists.
+        """
+        with open(path, "w") as file:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, file)
+
+
+def _size(operand: t.Any) -> int:
+    if isinstance(operand, (Matrix, LazyMatrix)):
+        return operand.rows * operand.cols
+    if isinstance(operand, Vector):
+        return len(operand.points)
+    return 1
+
+
+def _elementwise(operand: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    size = _size(operand)
+    return size, size
+
+
+def _multiply_add(operand: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    size = _size(operand)
+    return size, 2 * size
+
+
+def _copy(operand: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    return _size(operand), 0
+
+
+def _product(a: t.Any, b: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    if isinstance(b, (int, float)):
+        return _elementwise(a)
+
+    if isinstance(b, Vector):
+        return a.rows * a.cols, 2 * a.rows * a.cols
+
+    return a.rows * b.cols, 2 * a.rows * a.cols * b.cols
+
+
+def _factorization(a: Matrix, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    return a.size, 2 * a.rows ** 3 // 3
+
+
+def _solve(a: Matrix, rhs: t.Any, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    columns = rhs.cols if isinstance(rhs, Matrix) else 1
+    return a.size, 2 * a.rows ** 3 // 3 + 2 * a.rows ** 2 * columns
+
+
+def _inverse(a: Matrix, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    return a.size, 2 * a.rows ** 3
+
+
+def _trace(a: Matrix, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    return a.rows, a.rows
+
+
+def _comparison(a: Vector, *args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    size = _size(a)
+    return size, 3 * size
+
+
+def _distance(*args: t.Any, **kwargs: t.Any) -> t.Tuple[int, int]:
+    return 2, 5
+
+
+# Every operation instrumented, with its cost model.
+OPERATIONS: t.Dict[type, t.Dict[str, CostModel]] = {
+    Matrix: {
+        "add": _elementwise,
+        "sub": _elementwise,
+        "matmul": _product,
+        "__add__": _elementwise,
+        "__radd__": _elementwise,
+        "__sub__": _elementwise,
+        "__mul__": _product,
+        "__rmul__": _product,
+        "__matmul__": _product,
+        "__truediv__": _product,
+        "__abs__": _elementwise,
+        "__iadd__": _elementwise,
+        "__isub__": _elementwise,
+        "__imul__": _product,
+        "__imatmul__": _product,
+        "__itruediv__": _product,
+        "transpose": _copy,
+        "determinant": _factorization,
+        "lu": _factorization,
+        "solve": _solve,
+        "inverse": _inverse,
+        "trace": _trace,
+        "sum": _elementwise,
+        "frobenius_norm": _multiply_add,
+        "flatten": _copy,
+        "clone": _copy,
+        "materialize": _copy,
+    },
+    Vector: {
+        "add": _elementwise,
+        "sub": _elementwise,
+        "multiply": _elementwise,
+        "divide": _elementwise,
+        "dot": _multiply_add,
+        "__add__": _elementwise,
+        "__radd__": _elementwise,
+        "__sub__": _elementwise,
+        "__mul__": _elementwise,
+        "__truediv__": _elementwise,
+        "__matmul__": _multiply_add,
+        "__abs__": _elementwise,
+        "__iadd__": _elementwise,
+        "__isub__": _elementwise,
+        "__imul__": _elementwise,
+        "__itruediv__": _elementwise,
+        "mean": _elementwise,
+        "parallel_to": _comparison,
+        "orthogonal_to": _comparison,
+    },
+    Point: {
+        "calculate_distance": _distance,
+    },
+}
+
+
+def _allocated(result: t.Any, operands: t.Iterable[t.Any]) -> int:
+    """
+    Returns
+    -------
+    int
+        The bytes of the values of the result, if it does not share the memory of one of the operands.
+    """
+    if isinstance(result, Matrix):
+        shared = any(isinstance(operand, Matrix) and operand._storage is result._storage for operand in operands)
+        return 0 if shared else result.size * VALUE_SIZE
+
+    if isinstance(result, Vector):
+        shared = any(isinstance(operand, Vector) and operand.points is result.points for operand in operands)
+        return 0 if shared else len(result.points) * VALUE_SIZE
+
+    return 0
+
+
+_active: t.List[Profile] = []
+_originals: t.List[t.Tuple[type, str, t.Callable]] = []
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _instrumented(name: str, function: t.Callable, cost: CostModel) -> t.Callable:
+    @functools.wraps(function)
+    def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+        if getattr(_local, "depth", 0):
+            return function(*args, **kwargs)
+
+        _local.depth = 1
+        start = time.perf_counter_ns()
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _local.depth = 0
+        end = time.perf_counter_ns()
+
+        try:
+            elements, flops = cost(*args, **kwargs)
+        except (AttributeError, TypeError):
+            # An operand the cost model does not know, such as a sparse matrix.
+            elements, flops = _size(args[0]), 0
+
+        allocated = _allocated(result, args + tuple(kwargs.values()))
+        for profile_ in list(_active):
+            profile_._record(name, start, end, elements, flops, allocated)
+
+        return result
+
+    return wrapper
+
+
+def _patch() -> None:
+    for owner, operations in OPERATIONS.items():
+        for attribute, cost in operations.items():
+            function = owner.__dict__[attribute]
+            _originals.append((owner, attribute, function))
+            setattr(owner, attribute, _instrumented(f"{owner.__name__}.{attribute}", function, cost))
+
+
+def _unpatch() -> None:
+    while _originals:
+        owner, attribute, function = _originals.pop()
+        setattr(owner, attribute, function)
+
+
+@contextlib.contextmanager
+def profile(trace: bool = True) -> t.Iterator[Profile]:
+    """
+    Record the calls, wall time, elements, estimated floating point operations and allocated bytes of every operation
+    of `Matrix`, `Vector` and `Point` run inside the block.
+
+    The operations are only instrumented while a block is running, they are restored on exit, so the profiler costs
+    nothing when it is not used. Blocks can be nested, every one of them records the operations run inside it.
+
+    Parameters
+    ----------
+    trace : bool
+        If every call is also kept as an event, for `Profile.trace_events` and `Profile.save_trace`. Defaults to
+        `True`, disable it for long runs to only keep the totals.
+
+    Returns
+    -------
+    t.Iterator[Profile]
+        The profile, filled while the block runs.
+
+    Examples
+    --------
+    >>> import hypemaths as hm
+    >>> with hm.profile() as profiled:
+    ...     product = hm.Matrix([[1, 2], [3, 4]]) @ hm.Matrix([[5, 6], [7, 8]])
+    >>> profiled.stats["Matrix.__matmul__"].flops
+    16
+    >>> print(profiled.table())
+    >>> profiled.save_trace("trace.json")
+    """
+    profiled = Profile(trace)
+    with _lock:
+        if not _active:
+            _patch()
+        _active.append(profiled)
+
+    try:
+        yield profiled
+    finally:
+        with _lock:
+            _active.remove(profiled)
+            if not _active:
+                _unpatch()
@@ -0,0 +1,346 @@
+"""
+Reproducible random matrices, drawn from generators owning their state instead of the global one of `random`.
+
+Every `Generator` is seeded by a `SeedSequence`, which spawns as many independent child sequences as needed, so the
+workers of a parallel job each get their own stream, and the results do not depend on how many workers there are.
+"""
+import hashlib
+import random
+import secrets
+import typing as t
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
+
+from .core import FLOAT_TYPECODE, INT_TYPECODE
+from .models import Matrix, SparseMatrix
+
+# What a generator can be seeded with.
+Seed = t.Union[None, int, "SeedSequence", random.Random]
+
+DISTRIBUTIONS = ("uniform", "normal", "integers", "sparse")
+
+
+class SeedSequence:
+    """
+    The entropy of a tree of random streams.
+
+    A sequence is identified by its root entropy and its spawn key, the path of child indices leading to it from the
+    root. Both are hashed into the state of the generators it seeds, so the children of a sequence, the children of
+    those children and so on all seed statistically independent streams, which are reproduced from the root entropy
+    alone.
+    """
+    def __init__(self, entropy: t.Optional[int] = None, spawn_key: t.Tuple[int, ...] = ()) -> None:
+        """
+        Parameters
+        ----------
+        entropy : t.Optional[int]
+            The root entropy, a non-negative integer. Defaults to `None`, 128 bits drawn from the operating system,
+            which are kept in `entropy` to reproduce the streams later.
+        spawn_key : t.Tuple[int, ...]
+            The indices of the children leading to this sequence from the root. Defaults to the root itself.
+
+        Raises
+        ------
+        TypeError
+            If the entropy is not an integer.
+        ValueError
+            If the entropy is negative.
+        """
+        if entropy is None:
+            entropy = secrets.randbits(128)
+
+        if not isinstance(entropy, int) or isinstance(entropy, bool):
+            raise TypeError(f"The entropy must be an integer, not {type(entropy)}.")
+
+        if entropy < 0:
+            raise ValueError(f"The entropy must be non-negative, not {entropy}.")
+
+        self.entropy = entropy
+        self.spawn_key = tuple(spawn_key)
+        self.children_spawned = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(entropy={self.entropy}, spawn_key={self.spawn_key})"
+
+    def state(self) -> int:
+        """
+        Returns
+        -------
+        int
+            The 256 bits seeding the generators of this sequence, hashed from its entropy and spawn key.
+        """
+        key = ",".join(map(str, (self.entropy,) + self.spawn_key)).encode()
+        return int.from_bytes(hashlib.blake2b(key, digest_size=32).digest(), "little")
+
+    def spawn(self, count: int) -> t.List["SeedSequence"]:
+        """
+        Parameters
+        ----------
+        count : int
+            The number of child sequences.
+
+        Returns
+        -------
+        t.List[SeedSequence]
+            New child sequences, never handed out before by this sequence.
+        """
+        start = self.children_spawned
+        self.children_spawned += count
+        return [SeedSequence(self.entropy, self.spawn_key + (index,)) for index in range(start, start + count)]
+
+
+def _generate(seed_sequence: SeedSequence, dims: tuple, distribution: str, parameters: dict) -> Matrix:
+    # Run by the worker processes of `Generator.matrices`.
+    return getattr(Generator(seed_sequence), distribution)(dims, **parameters)
+
+
+class Generator:
+    """
+    A source of random matrices, owning its own `random.Random` so that it never touches the global state of the
+    `random` module, and is safe to use next to other generators in other threads.
+
+    Every distribution draws all the values of a matrix in a single pass, straight into the flat buffer of the result.
+
+    Examples
+    --------
+    >>> from hypemaths.random import Generator
+    >>> generator = Generator(42)
+    >>> matrix = generator.normal((3, 3))
+    >>> workers = generator.spawn(4)
+    >>> batch = generator.matrices(1000, (8, 8), "uniform", workers=4)
+    """
+    def __init__(self, seed: Seed = None) -> None:
+        """
+        Parameters
+        ----------
+        seed : Seed
+            An integer or a `SeedSequence` to seed the generator from, or a `random.Random` to draw from directly.
+            Defaults to `None`, a new `SeedSequence` of fresh entropy.
+
+        Raises
+        ------
+        TypeError
+            If the seed is none of those.
+        """
+        if isinstance(seed, random.Random):
+            self.seed_sequence = None
+            self._random = seed
+            return
+
+        if not isinstance(seed, SeedSequence):
+            seed = SeedSequence(seed)
+
+        self.seed_sequence = seed
+        self._random = random.Random(seed.state())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.seed_sequence!r})"
+
+    def spawn(self, count: int) -> t.List["Generator"]:
+        """
+        Parameters
+        ----------
+        count : int
+            The number of generators.
+
+        Returns
+        -------
+        t.List[Generator]
+            Independent generators, one per worker, seeded from the children of the seed sequence of this generator.
+            A generator drawing from a `random.Random` seeds a new sequence from it first.
+        """
+        seed_sequence = self.seed_sequence or SeedSequence(self._random.getrandbits(128))
+        return [Generator(child) for child in seed_sequence.spawn(count)]
+
+    @staticmethod
+    def _matrix(dims: tuple, values: t.Iterable, typecode: str, out: t.Optional[Matrix]) -> Matrix:
+        """
+        Returns
+        -------
+        Matrix
+            A new matrix of the values, or the matrix `out` they were written into.
+        """
+        if out is None:
+            return Matrix._from_flat(array(typecode, values), dims)
+
+        if not isinstance(out, Matrix):
+            raise TypeError(f"The destination of the result must be a Matrix. Not {type(out)}")
+
+        out._check_out(out, dims)
+        return out._assign(values, typecode)
+
+    @staticmethod
+    def _size(dims: tuple) -> int:
+        if len(dims) != 2:
+            raise ValueError("You must pass the 2 DIMENSIONS for the Matrix fill.")
+
+        return dims[0] * dims[1]
+
+    def uniform(
+            self, dims: tuple, low: float = 0.0, high: float = 1.0, out: t.Optional[Matrix] = None
+    ) -> Matrix:
+        """
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        low : float
+            The lower bound of the values, included. Defaults to 0.
+        high : float
+            The upper bound of the values, excluded. Defaults to 1.
+        out : t.Optional[Matrix]
+            The matrix to write the values into, instead of a new one.
+
+        Returns
+        -------
+        Matrix
+            A matrix of floats drawn uniformly between the bounds.
+        """
+        draw, span = self._random.random, high - low
+        return self._matrix(dims, [low + span * draw() for _ in repeat(None, self._size(dims))], FLOAT_TYPECODE, out)
+
+    def normal(
+            self, dims: tuple, mean: float = 0.0, std: float = 1.0, out: t.Optional[Matrix] = None
+    ) -> Matrix:
+        """
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        mean : float
+            The mean of the distribution. Defaults to 0.
+        std : float
+            The standard deviation of the distribution. Defaults to 1.
+        out : t.Optional[Matrix]
+            The matrix to write the values into, instead of a new one.
+
+        Returns
+        -------
+        Matrix
+            A matrix of floats drawn from the normal distribution.
+        """
+        gauss = self._random.gauss
+        return self._matrix(dims, [gauss(mean, std) for _ in repeat(None, self._size(dims))], FLOAT_TYPECODE, out)
+
+    def integers(self, dims: tuple, low: int, high: int, out: t.Optional[Matrix] = None) -> Matrix:
+        """
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        low : int
+            The lower bound of the values, included.
+        high : int
+            The upper bound of the values, excluded.
+        out : t.Optional[Matrix]
+            The matrix to write the values into, instead of a new one.
+
+        Returns
+        -------
+        Matrix
+            A matrix of integers drawn uniformly between the bounds.
+
+        Raises
+        ------
+        ValueError
+            If the bounds are empty.
+        """
+        if high <= low:
+            raise ValueError(f"The upper bound {high} must be greater than the lower bound {low}.")
+
+        values = self._random.choices(range(low, high), k=self._size(dims))
+        return self._matrix(dims, values, INT_TYPECODE, out)
+
+    def sparse(self, dims: tuple, density: float, low: float = 0.0, high: float = 1.0) -> SparseMatrix:
+        """
+        Parameters
+        ----------
+        dims : tuple
+            The rows and columns of the matrix.
+        density : float
+            The fraction of the elements which are nonzero, between 0 and 1.
+        low : float
+            The lower bound of the nonzero values, included. Defaults to 0.
+        high : float
+            The upper bound of the nonzero values, excluded. Defaults to 1.
+
+        Returns
+        -------
+        SparseMatrix
+            A sparse matrix with nonzeros at positions drawn without replacement, holding values drawn uniformly
+            between the bounds.
+
+        Raises
+        ------
+        ValueError
+            If the density is not between 0 and 1.
+        """
+        if not 0 <= density <= 1:
+            raise ValueError(f"The density must be between 0 and 1, not {density}.")
+
+        rows, cols = dims
+        size = self._size(dims)
+        positions = sorted(self._random.sample(range(size), round(density * size)))
+
+        counts = [0] * (rows + 1)
+        for position in positions:
+            counts[position // cols + 1] += 1
+
+        draw, span = self._random.random, high - low
+        return SparseMatrix._from_csr(
+            (rows, cols),
+            array(INT_TYPECODE, accumulate(counts)),
+            array(INT_TYPECODE, [position % cols for position in positions]),
+            # A value drawn as exactly 0 is replaced by a tiny one, a nonzero must not be stored as a zero.
+            array(FLOAT_TYPECODE, [low + span * draw() or span * 2 ** -53 for _ in positions])
+        )
+
+    def matrices(
+            self, count: int, dims: tuple, distribution: str = "uniform", workers: int = 1, **parameters: t.Any
+    ) -> t.List[t.Union[Matrix, SparseMatrix]]:
+        """
+        Draw many matrices, optionally split between worker processes.
+
+        Every matrix is drawn from its own child stream of this generator, so the same matrices are returned whatever
+        the number of workers.
+
+        Parameters
+        ----------
+        count : int
+            The number of matrices.
+        dims : tuple
+            The rows and columns of every matrix.
+        distribution : str
+            The method drawing every matrix, one of `DISTRIBUTIONS`. Defaults to ``"uniform"``.
+        workers : int
+            The number of worker processes. Defaults to 1, drawing everything in the calling process.
+        **parameters : t.Any
+            The parameters of the distribution, such as ``low`` and ``high``.
+
+        Returns
+        -------
+        t.List[t.Union[Matrix, SparseMatrix]]
+            The matrices, in the order of the child streams.
+
+        Raises
+        ------
+        ValueError
+            If the distribution is unknown.
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {distribution!r}, expected one of {DISTRIBUTIONS}.")
+
+        children = self.spawn(count)
+        if workers <= 1:
+            return [getattr(child, distribution)(dims, **parameters) for child in children]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _generate,
+                [child.seed_sequence for child in children],
+                repeat(dims),
+                repeat(distribution),
+                repeat(parameters),
+                chunksize=max(1, count // (4 * workers))
+            ))
@@ -22,7 +22,7 @@ def scale_list(dataframe: Vector, range_: tuple) -> Vector:
     old_range = (min(dataframe.points), max(dataframe.points))
 
     scaled_list = [round(scale_value(elem, old_range, range_)) for elem in dataframe.points]
-    return Vector(scaled_list)
+    return Vector._from_points(scaled_list)
 
 
 def norm(vector: Vector, p: t.Union[int, float] = 2) -> t.Union[int, float]:
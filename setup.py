@@ -43,6 +43,9 @@ setuptools.setup(
         exclude=["tests", "tests.*", "tools", "tools.*"]
     ),
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy"],
+    },
 
     classifiers=[
         "Programming Language :: Python :: 3",
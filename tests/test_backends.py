@@ -0,0 +1,151 @@
+import unittest
+
+from hypemaths import Matrix, Vector, available_backends, get_backend, settings, use_backend
+
+
+class BackendSelectionTests(unittest.TestCase):
+    """Tests for selecting the compute backend."""
+    def test_default_backend(self) -> None:
+        self.assertEqual(get_backend().name, settings.backend)
+        self.assertIn("python", available_backends())
+
+    def test_use_backend(self) -> None:
+        with use_backend("python"):
+            self.assertEqual(settings.backend, "python")
+
+    def test_unknown_backend(self) -> None:
+        with self.assertRaises(ValueError):
+            get_backend("fortran")
+
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2], [3, 4]]).determinant(backend="fortran")
+
+
+@unittest.skipUnless("numpy" in available_backends(), "NumPy is not installed.")
+class NumpyBackendTests(unittest.TestCase):
+    """Tests for checking that the NumPy backend gives the same results as the pure Python one."""
+    def setUp(self) -> None:
+        self.matrices = (
+            Matrix([[1, 2], [3, 4]]),
+            Matrix([[1.5, -2, 3], [4, 5.25, -6], [7, 8, 9.5]]),
+            Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]]).transpose(),
+            Matrix([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]])[::2, 1:]
+        )
+
+    def assertSameMatrix(self, first: Matrix, second: Matrix) -> None:
+        self.assertEqual(first.dims, second.dims)
+        self.assertEqual(first.typecode, second.typecode)
+        for row_first, row_second in zip(first, second):
+            for value_first, value_second in zip(row_first, row_second):
+                self.assertAlmostEqual(value_first, value_second)
+
+    def test_matrix_arithmetic(self) -> None:
+        for matrix in self.matrices:
+            for backend in ("python", "numpy"):
+                with use_backend(backend):
+                    results = (matrix + matrix, matrix - matrix, matrix * 3, matrix * 0.5, matrix / 2, abs(matrix))
+                if backend == "python":
+                    expected = results
+
+            for result, expected_result in zip(results, expected):
+                self.assertSameMatrix(result, expected_result)
+
+            self.assertSameMatrix(
+                matrix.matmul(matrix.transpose(), backend="numpy"), matrix.matmul(matrix.transpose(), backend="python")
+            )
+
+    def test_integer_overflow(self) -> None:
+        large = Matrix([[2 ** 62, 1], [1, 1]])
+        operations = (
+            lambda: large + large,
+            lambda: large - large * -1,
+            lambda: large * 4,
+            lambda: large.matmul(large),
+            lambda: abs(Matrix([[-2 ** 63, 1]])),
+            lambda: Matrix([[2 ** 62, 2 ** 62]]).sum(1),
+        )
+
+        for backend in ("python", "numpy"):
+            with use_backend(backend):
+                for operation in operations:
+                    with self.assertRaises(OverflowError):
+                        operation()
+
+                # The bounds are conservative, the results which fit are still exact.
+                self.assertEqual(large - large, Matrix([[0, 0], [0, 0]]))
+                self.assertEqual(Matrix([[2 ** 62, -2 ** 62]]).sum(), 0)
+                self.assertEqual(Vector(2 ** 62, 1) + Vector(2 ** 62, 1), Vector(2 ** 63, 2))
+
+    def test_matrix_reductions(self) -> None:
+        for matrix in self.matrices:
+            self.assertAlmostEqual(matrix.sum(backend="numpy"), matrix.sum(backend="python"))
+            self.assertSameMatrix(matrix.sum(0, backend="numpy"), matrix.sum(0, backend="python"))
+            self.assertSameMatrix(matrix.sum(1, backend="numpy"), matrix.sum(1, backend="python"))
+            self.assertAlmostEqual(matrix.frobenius_norm(backend="numpy"), matrix.frobenius_norm(backend="python"))
+            self.assertSameMatrix(matrix.transpose(backend="numpy"), matrix.transpose(backend="python"))
+
+            if matrix.rows == matrix.cols:
+                self.assertAlmostEqual(matrix.determinant(backend="numpy"), matrix.determinant(backend="python"))
+
+    def test_vector_arithmetic(self) -> None:
+        vector_a, vector_b = Vector(1, 2, 3), Vector(4.5, -5, 6)
+
+        for backend in ("python", "numpy"):
+            with use_backend(backend):
+                results = (vector_a + vector_b, vector_a - vector_b, vector_a * vector_b, vector_a / vector_b)
+                dot = vector_a @ vector_b
+            if backend == "python":
+                expected, expected_dot = results, dot
+
+        self.assertEqual(results, expected)
+        self.assertAlmostEqual(dot, expected_dot)
+
+    def test_array_interface(self) -> None:
+        import numpy as np
+
+        for matrix in self.matrices:
+            self.assertEqual(np.asarray(matrix).tolist(), matrix.matrix)
+
+        matrix = Matrix([[1, 2], [3, 4]])
+        np.asarray(matrix)[0, 0] = 10
+        self.assertEqual(matrix[0, 0], 10)
+
+        values = np.arange(6, dtype=np.float64).reshape(2, 3)
+        wrapped = Matrix.frombuffer(values)
+        wrapped[1, 1] = -1.0
+        self.assertEqual(values[1, 1], -1.0)
+        self.assertEqual(np.asarray(Vector(1, 2.5)).tolist(), [1.0, 2.5])
+
+
+class ParallelBackendTests(unittest.TestCase):
+    """Tests for checking that the parallel backend gives the same results as the pure Python one."""
+    def setUp(self) -> None:
+        self.matrix = Matrix([[row * 7 + col for col in range(7)] for row in range(9)])
+        self.view = Matrix([[1.5, -2, 3, 4], [5, 6.25, -7, 8], [9, 10, 11, -12]])[:, 1:]
+
+    def test_operations(self) -> None:
+        product = self.matrix.transpose()
+        with settings.override(parallel_workers=2, parallel_threshold=0), use_backend("parallel"):
+            results = (
+                self.matrix + self.matrix, self.matrix - self.matrix, self.matrix * 3, self.view * 0.5, self.view / 4,
+                self.matrix.matmul(product), self.view.matmul(self.view.transpose()), self.matrix.sum(0),
+                self.matrix.sum(1)
+            )
+            total = self.matrix.sum()
+            transposed = self.matrix.transpose(out=Matrix.get_filled_matrix((7, 9), 0))
+
+        expected = (
+            self.matrix + self.matrix, self.matrix - self.matrix, self.matrix * 3, self.view * 0.5, self.view / 4,
+            self.matrix.matmul(product), self.view.matmul(self.view.transpose()), self.matrix.sum(0),
+            self.matrix.sum(1)
+        )
+        for result, expected_result in zip(results, expected):
+            self.assertEqual(result, expected_result)
+            self.assertEqual(result.typecode, expected_result.typecode)
+
+        self.assertEqual(total, self.matrix.sum())
+        self.assertEqual(transposed, product)
+
+    def test_threshold(self) -> None:
+        with settings.override(parallel_workers=2), use_backend("parallel"):
+            self.assertEqual(self.matrix + self.matrix, self.matrix * 2)
@@ -0,0 +1,50 @@
+import unittest
+
+from hypemaths import Vector, VectorBatch
+from hypemaths.exceptions import VectorDimensionError
+
+
+class VectorBatchTests(unittest.TestCase):
+    """Tests for checking the batched operations against the ones of single vectors."""
+    def setUp(self) -> None:
+        self.first = [Vector(1, 2, 3), Vector(4, 5, 6), Vector(-1, 0, 2)]
+        self.second = [Vector(2, 4, 6), Vector(1, 1, 1), Vector(0, 3, 0)]
+        self.batch_first = VectorBatch(self.first)
+        self.batch_second = VectorBatch(self.second)
+
+    def test_construction(self) -> None:
+        self.assertEqual(len(self.batch_first), 3)
+        self.assertEqual(self.batch_first.dimensions, 3)
+        self.assertEqual(list(self.batch_first), self.first)
+        self.assertEqual(self.batch_first[-1], Vector(-1, 0, 2))
+        self.assertEqual(self.batch_first.component(1).tolist(), [2, 5, 0])
+        self.assertEqual(VectorBatch.from_components([1, 4, -1], [2, 5, 0], [3, 6, 2]), self.batch_first)
+        self.assertEqual(list(VectorBatch.get_filled_batch(2, 3, 1.5)), [Vector(1.5, 1.5, 1.5)] * 2)
+
+        with self.assertRaises(VectorDimensionError):
+            VectorBatch([[1, 2], [1, 2, 3]])
+
+        with self.assertRaises(TypeError):
+            VectorBatch([[1, "2"]])
+
+    def test_arithmetic(self) -> None:
+        self.assertEqual(list(self.batch_first + self.batch_second), [a + b for a, b in zip(self.first, self.second)])
+        self.assertEqual(list(self.batch_first - self.batch_second), [a - b for a, b in zip(self.first, self.second)])
+        self.assertEqual(list(self.batch_first + Vector(1, 1, 1)), [a + Vector(1, 1, 1) for a in self.first])
+        self.assertEqual(list(self.batch_first * 2), [Vector(2, 4, 6), Vector(8, 10, 12), Vector(-2, 0, 4)])
+        self.assertEqual((self.batch_first / 2).typecode, "d")
+
+        with self.assertRaises(VectorDimensionError):
+            self.batch_first + VectorBatch([[1, 2, 3]])
+
+    def test_reductions(self) -> None:
+        self.assertEqual(list(self.batch_first @ self.batch_second), [a @ b for a, b in zip(self.first, self.second)])
+        self.assertEqual(list(Vector(1, 0, 0) @ self.batch_first), [1, 4, -1])
+
+        for norm, vector in zip(self.batch_first.norms(), self.first):
+            self.assertAlmostEqual(norm, Vector.absolute(vector))
+
+        self.assertEqual(list(self.batch_first.mean()), [vector.mean() for vector in self.first])
+        self.assertEqual(list(self.batch_first.parallel_to(self.batch_second)), [1, 0, 0])
+        self.assertEqual(list(self.batch_first.orthogonal_to(Vector(0, 0, 1))), [0, 0, 0])
+        self.assertEqual(list(self.batch_second.orthogonal_to(Vector(0, 0, 1))), [0, 0, 1])
@@ -0,0 +1,159 @@
+import copy
+import pickle
+import threading
+import unittest
+
+import hypemaths as hm
+from hypemaths import FrozenMatrix, FrozenVector, Matrix, Vector
+
+
+class FrozenMatrixTests(unittest.TestCase):
+    """Tests for the immutable, hashable matrices."""
+    def test_hash(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        frozen = matrix.freeze()
+
+        self.assertEqual(hash(frozen), hash(FrozenMatrix([[1, 2], [3, 4]])))
+        self.assertEqual(hash(frozen), hash(Matrix([[1.0, 2.0], [3.0, 4.0]]).freeze()))
+        self.assertEqual({frozen: "cached"}[FrozenMatrix(matrix)], "cached")
+        self.assertEqual(frozen, matrix)
+        self.assertEqual(matrix, frozen)
+        self.assertNotEqual(frozen, Matrix([[1, 2], [3, 5]]).freeze())
+        self.assertEqual(hash(frozen.transpose()), hash(FrozenMatrix([[1, 3], [2, 4]])))
+
+        with self.assertRaises(TypeError):
+            hash(matrix)
+
+    def test_immutable(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        frozen = matrix.freeze()
+
+        # The frozen matrix holds a copy, which does not follow the original.
+        matrix[0, 0] = 5
+        self.assertEqual(frozen[0, 0], 1)
+
+        for mutate in (
+                lambda: frozen.__setitem__((0, 0), 5),
+                lambda: frozen.transpose().__setitem__((0, 1), 5),
+                lambda: setattr(frozen, "matrix", [[5]]),
+                lambda: frozen[0].__setitem__(0, 5),
+                lambda: matrix.add(matrix, out=frozen),
+        ):
+            with self.assertRaises(TypeError):
+                mutate()
+
+        result = frozen
+        result += Matrix([[1, 1], [1, 1]])
+        self.assertEqual(result, Matrix([[2, 3], [4, 5]]))
+        self.assertIsNot(result, frozen)
+        self.assertEqual(frozen, Matrix([[1, 2], [3, 4]]))
+
+    def test_operations(self) -> None:
+        frozen = FrozenMatrix([[4, 7], [2, 6]])
+
+        self.assertEqual(type(frozen + frozen), Matrix)
+        self.assertEqual(frozen @ frozen, Matrix([[30, 70], [20, 50]]))
+        self.assertAlmostEqual(frozen.determinant(), 10)
+        self.assertIs(frozen.lu(), frozen.lu())
+
+        thawed = frozen.thaw()
+        self.assertEqual(type(thawed), Matrix)
+        thawed[0, 0] = 1
+        self.assertEqual(frozen[0, 0], 4)
+
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+
+        unpickled = pickle.loads(pickle.dumps(frozen))
+        self.assertIsInstance(unpickled, FrozenMatrix)
+        self.assertEqual(unpickled, frozen)
+
+
+class FrozenVectorTests(unittest.TestCase):
+    """Tests for the immutable, hashable vectors."""
+    def test_frozen_vector(self) -> None:
+        vector = Vector(1, 2, 3)
+        frozen = vector.freeze()
+
+        self.assertEqual(hash(frozen), hash(FrozenVector(1, 2, 3)))
+        self.assertEqual(frozen, vector)
+        self.assertEqual(vector, frozen)
+        self.assertEqual(frozen.y, 2)
+        self.assertEqual(frozen + vector, Vector(2, 4, 6))
+        self.assertEqual(type(vector - frozen), Vector)
+
+        with self.assertRaises(TypeError):
+            frozen[0] = 5
+
+        with self.assertRaises(TypeError):
+            vector.add(vector, out=frozen)
+
+        thawed = frozen.thaw()
+        thawed[0] = 5
+        self.assertEqual(frozen[0], 1)
+        self.assertEqual(pickle.loads(pickle.dumps(frozen)), frozen)
+
+
+class MemoizeTests(unittest.TestCase):
+    """Tests for the memoization of functions of matrices."""
+    def test_memoize(self) -> None:
+        calls = []
+
+        @hm.memoize(maxsize=2)
+        def inverse(matrix: Matrix) -> Matrix:
+            calls.append(matrix)
+            return matrix.inverse()
+
+        first, second, third = (FrozenMatrix([[size, 1], [1, size]]) for size in (2, 3, 4))
+
+        result = inverse(first)
+        self.assertIsInstance(result, FrozenMatrix)
+        self.assertIs(inverse(first), result)
+        # A mutable matrix of the same values hits the same entry.
+        self.assertIs(inverse(first.thaw()), result)
+
+        inverse(second)
+        inverse(third)
+        inverse(first)
+        self.assertEqual(len(calls), 4)
+
+        info = inverse.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize, info.currbytes), (2, 4, 2, 64))
+
+        inverse.cache_clear()
+        self.assertEqual(inverse.cache_info().currsize, 0)
+
+    def test_maxbytes(self) -> None:
+        @hm.memoize(maxsize=None, maxbytes=80)
+        def scaled(matrix: Matrix, scale: int = 1) -> Matrix:
+            return matrix * scale
+
+        matrix = FrozenMatrix([[1, 2], [3, 4]])
+        for scale in range(1, 5):
+            scaled(matrix, scale=scale)
+
+        info = scaled.cache_info()
+        self.assertEqual((info.currsize, info.currbytes), (2, 64))
+        self.assertEqual(scaled(matrix, scale=4), Matrix([[4, 8], [12, 16]]))
+        self.assertEqual(scaled.cache_info().hits, 1)
+
+    def test_threads(self) -> None:
+        @hm.memoize
+        def determinant(matrix: Matrix) -> float:
+            return matrix.determinant()
+
+        matrices = [FrozenMatrix([[row + 1, 2], [3, 4]]) for row in range(8)]
+        results = []
+
+        def worker() -> None:
+            results.append([determinant(matrix) for matrix in matrices])
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(determinant.cache_info().currsize, 8)
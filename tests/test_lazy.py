@@ -0,0 +1,57 @@
+import unittest
+
+from hypemaths import LazyMatrix, Matrix, settings
+from hypemaths.exceptions import MatrixDimensionError
+
+
+class LazyMatrixTests(unittest.TestCase):
+    """Tests for checking that lazy expressions give the results of the eager operations."""
+    def setUp(self) -> None:
+        self.a = Matrix([[1, 2], [3, 4]])
+        self.b = Matrix([[5, 6], [7, 8]])
+        self.c = Matrix([[1.5, 0], [2, -1]])
+
+    def test_fused_evaluation(self) -> None:
+        expression = (self.a.lazy() + self.b - self.c) * 2.0
+
+        self.assertIsInstance(expression, LazyMatrix)
+        self.assertEqual(expression.evaluate(), (self.a + self.b - self.c) * 2.0)
+        self.assertEqual(expression[1, 1], 26.0)
+        self.assertEqual(abs(self.a.lazy() - self.b).evaluate(), abs(self.a - self.b))
+        self.assertEqual((self.a.lazy() / 2).evaluate(), self.a / 2)
+        self.assertEqual(((self.a.lazy() + self.b) @ self.c).evaluate(), (self.a + self.b) @ self.c)
+
+    def test_lazy_mode(self) -> None:
+        with settings.override(lazy=True):
+            expression = (self.a + self.b) * 3 - self.c
+
+        self.assertIsInstance(expression, LazyMatrix)
+        self.assertEqual(expression, (self.a + self.b) * 3 - self.c)
+        self.assertIsInstance(self.a + self.b, Matrix)
+
+    def test_rewrites(self) -> None:
+        expression = self.a.lazy() + self.b
+
+        self.assertEqual(repr(expression.transpose().transpose()), repr(expression))
+        self.assertEqual(expression.transpose().evaluate(), (self.a + self.b).transpose())
+        self.assertEqual((self.a.lazy() @ self.b).transpose().evaluate(), (self.a @ self.b).transpose())
+        self.assertEqual(repr(expression * 2 * 3), "LazyMatrix((Matrix(2x2) + Matrix(2x2)) * 6)")
+        self.assertIs(expression * 1, expression)
+        self.assertEqual((expression * 1.0).typecode, "d")
+
+    def test_long_chain(self) -> None:
+        with settings.override(lazy=True):
+            total = self.a
+            for _ in range(3000):
+                total = total + self.a
+
+        self.assertLessEqual(total._depth, settings.lazy_max_depth)
+        self.assertEqual(total.evaluate(), self.a * 3001)
+        self.assertTrue(repr(total).startswith("LazyMatrix("))
+
+    def test_wrong_dimensions(self) -> None:
+        with self.assertRaises(MatrixDimensionError):
+            self.a.lazy() + Matrix([[1, 2, 3]])
+
+        with self.assertRaises(MatrixDimensionError):
+            self.a.lazy() @ Matrix([[1, 2, 3]])
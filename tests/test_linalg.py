@@ -0,0 +1,357 @@
+import math
+import unittest
+
+from hypemaths import Matrix, SparseMatrix, Vector
+from hypemaths.exceptions import MatrixDimensionError, MatrixNotSquare, SingularMatrixError, VectorDimensionError
+from hypemaths.linalg import (
+    LinearOperator,
+    Solution,
+    conjugate_gradient,
+    eigvals,
+    gauss_seidel,
+    gmres,
+    jacobi,
+    jacobi_preconditioner,
+    top_k_eigen
+)
+
+
+def assert_matrix_almost_equal(test: unittest.TestCase, first: Matrix, second: Matrix) -> None:
+    test.assertEqual(first.dims, second.dims)
+    for row_first, row_second in zip(first, second):
+        for value_first, value_second in zip(row_first, row_second):
+            test.assertAlmostEqual(value_first, value_second)
+
+
+class LUDecompositionTests(unittest.TestCase):
+    """Tests for the LU factorization and everything built on it."""
+    def test_factors(self) -> None:
+        matrix = Matrix([[0, 2, 1], [1, 1, 1], [2, 1, 0]])
+        lu = matrix.lu()
+
+        assert_matrix_almost_equal(self, lu.permutation * matrix, lu.lower * lu.upper)
+
+    def test_determinant(self) -> None:
+        test_cases = (
+            (Matrix([[1, 2], [3, 4]]), -2),
+            (Matrix([[0, 2, 1], [1, 1, 1], [2, 1, 0]]), 3),
+            (Matrix([[1, 2], [2, 4]]), 0),
+            (Matrix(5), 5)
+        )
+
+        for matrix, determinant in test_cases:
+            self.assertAlmostEqual(matrix.determinant(), determinant)
+
+    def test_solve(self) -> None:
+        matrix = Matrix([[2, 1, 1], [1, 3, 2], [1, 0, 0]])
+
+        solution = matrix.solve(Vector(4, 5, 6))
+        self.assertEqual(len(solution), 3)
+        for value, expected in zip(solution, (6, 15, -23)):
+            self.assertAlmostEqual(value, expected)
+
+        assert_matrix_almost_equal(self, matrix * matrix.solve(Matrix([[1, 2], [3, 4], [5, 6]])), Matrix([[1, 2], [3, 4], [5, 6]]))
+
+    def test_inverse(self) -> None:
+        matrix = Matrix([[4, 7], [2, 6]])
+
+        assert_matrix_almost_equal(self, matrix.inverse(), Matrix([[0.6, -0.7], [-0.2, 0.4]]))
+        assert_matrix_almost_equal(self, matrix * matrix.inverse(), Matrix([[1, 0], [0, 1]]))
+
+    def test_errors(self) -> None:
+        with self.assertRaises(MatrixNotSquare):
+            Matrix([[1, 2, 3], [4, 5, 6]]).lu()
+
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4]]).inverse()
+
+        with self.assertRaises(MatrixDimensionError):
+            Matrix([[1, 2], [3, 4]]).lu().solve(Vector(1, 2, 3))
+
+    def test_singularity_tolerance(self) -> None:
+        # The rounding errors leave a tiny nonzero last pivot, which is still taken as zero.
+        lu = Matrix([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]]).lu()
+        self.assertTrue(lu.singular)
+        self.assertEqual(lu.determinant(), 0.0)
+        with self.assertRaises(SingularMatrixError):
+            lu.solve(Vector(1, 2, 3))
+
+        # The tolerance is relative to the values of the matrix, so a small scale is not singular.
+        lu = Matrix([[1e-20, 2e-20], [3e-20, 4e-20]]).lu()
+        self.assertFalse(lu.singular)
+        for value, expected in zip(lu.solve(Vector(1e-20, 1e-20)), (-1, 1)):
+            self.assertAlmostEqual(value, expected)
+
+    def test_cache_invalidation(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        lu = matrix.lu()
+        self.assertIs(matrix.lu(), lu)
+
+        matrix[0, 0] = 2
+        self.assertIsNot(matrix.lu(), lu)
+        self.assertAlmostEqual(matrix.determinant(), 2)
+
+        matrix.transpose()[1, 0] = 4
+        self.assertAlmostEqual(matrix.determinant(), -4)
+
+
+class FactorizationTests(unittest.TestCase):
+    """Tests for the QR, Cholesky and singular value factorizations."""
+    def test_qr(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4], [5, 7]])
+        qr = matrix.qr()
+
+        assert_matrix_almost_equal(self, qr.q @ qr.r, matrix)
+        assert_matrix_almost_equal(self, qr.q.transpose() @ qr.q, Matrix([[1, 0], [0, 1]]))
+        self.assertEqual(qr.r[1, 0], 0)
+
+        # The least squares solution satisfies the normal equations.
+        rhs = Vector(1, 2, 4)
+        normal = (matrix.transpose() @ matrix).solve(matrix.transpose() @ Matrix([[1], [2], [4]]))
+        for value, expected in zip(qr.solve(rhs), normal.flatten()):
+            self.assertAlmostEqual(value, expected)
+
+        square = Matrix([[0, 2, 1], [1, 1, 1], [2, 1, 0]])
+        self.assertAlmostEqual(square.qr().determinant(), square.determinant())
+
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4], [3, 6]]).qr().solve(rhs)
+
+        with self.assertRaises(MatrixDimensionError):
+            matrix.transpose().qr().solve(Vector(1, 2))
+
+    def test_cholesky(self) -> None:
+        matrix = Matrix([[4, 2, 2], [2, 5, 3], [2, 3, 6]])
+        cholesky = matrix.cholesky()
+
+        assert_matrix_almost_equal(self, cholesky.lower @ cholesky.lower.transpose(), matrix)
+        self.assertAlmostEqual(cholesky.determinant(), matrix.determinant())
+        self.assertAlmostEqual(cholesky.log_determinant(), math.log(matrix.determinant()))
+        assert_matrix_almost_equal(self, cholesky.inverse(), matrix.inverse())
+
+        for value, expected in zip(cholesky.solve(Vector(1, 2, 3)), matrix.solve(Vector(1, 2, 3))):
+            self.assertAlmostEqual(value, expected)
+        rhs = Matrix([[1, 2], [3, 4], [5, 6]])
+        assert_matrix_almost_equal(self, cholesky.solve(rhs), matrix.solve(rhs))
+
+        with self.assertRaises(ValueError):
+            Matrix([[1, 2], [2, 1]]).cholesky()
+
+        with self.assertRaises(MatrixNotSquare):
+            Matrix([[1, 2, 3], [4, 5, 6]]).cholesky()
+
+    def test_svd(self) -> None:
+        for matrix in (Matrix([[3, 1], [1, 3], [0, 2]]), Matrix([[3, 1, 0], [1, 3, 2]])):
+            svd = matrix.svd()
+            values = svd.singular_values
+            sigma = Matrix([[values[row] if row == col else 0 for col in range(2)] for row in range(2)])
+
+            self.assertEqual(values, sorted(values, reverse=True))
+            assert_matrix_almost_equal(self, svd.u @ sigma @ svd.v.transpose(), matrix)
+            assert_matrix_almost_equal(self, matrix @ svd.pseudo_inverse() @ matrix, matrix)
+            self.assertEqual(svd.rank(), 2)
+            self.assertAlmostEqual(svd.condition_number(), values[0] / values[1])
+
+    def test_svd_rank_deficient(self) -> None:
+        svd = Matrix([[1, 2], [2, 4], [3, 6]]).svd()
+
+        self.assertEqual(svd.rank(), 1)
+        self.assertEqual(svd.condition_number(), math.inf)
+
+        # The minimum norm solution is a multiple of the row space vector (1, 2).
+        solution = svd.solve(Vector(1, 2, 3))
+        self.assertAlmostEqual(solution[0], 0.2)
+        self.assertAlmostEqual(solution[1], 0.4)
+
+
+class MatrixFunctionTests(unittest.TestCase):
+    """Tests for the integer powers and the exponential of matrices."""
+    def test_power(self) -> None:
+        fibonacci = Matrix([[1, 1], [1, 0]])
+        self.assertEqual(fibonacci ** 10, Matrix([[89, 55], [55, 34]]))
+        self.assertEqual((fibonacci ** 10).typecode, "q")
+        self.assertEqual(fibonacci ** 0, Matrix([[1, 0], [0, 1]]))
+
+        matrix = Matrix([[2, 1, 0], [1, 3, 1], [0, 1, 4]])
+        assert_matrix_almost_equal(self, matrix ** 5, matrix @ matrix @ matrix @ matrix @ matrix)
+        assert_matrix_almost_equal(self, matrix ** -2, matrix.inverse() @ matrix.inverse())
+
+        with self.assertRaises(TypeError):
+            matrix ** 0.5
+
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[1, 2], [2, 4]]) ** -1
+
+        with self.assertRaises(MatrixNotSquare):
+            Matrix([[1, 2, 3], [4, 5, 6]]) ** 2
+
+    def test_structured_power(self) -> None:
+        self.assertEqual(Matrix([[2, 0], [0, -3]]) ** 3, Matrix([[8, 0], [0, -27]]))
+        self.assertEqual(Matrix([[1, 1], [0, 1]]) ** 7, Matrix([[1, 7], [0, 1]]))
+        self.assertEqual(Matrix([[1, 0], [1, 1]]) ** 7, Matrix([[1, 0], [7, 1]]))
+
+        upper = Matrix([[2, 1, 3], [0, 1, 4], [0, 0, 3]])
+        assert_matrix_almost_equal(self, upper ** 4, upper @ upper @ upper @ upper)
+        assert_matrix_almost_equal(self, upper.transpose() ** -3, (upper.transpose() @ upper.transpose() @ upper.transpose()).inverse())
+
+        with self.assertRaises(SingularMatrixError):
+            Matrix([[0, 0], [0, 1]]) ** -1
+
+    def test_expm(self) -> None:
+        self.assertEqual(Matrix([[0, 0], [0, 0]]).expm(), Matrix([[1.0, 0.0], [0.0, 1.0]]))
+        assert_matrix_almost_equal(self, Matrix([[1, 0], [0, 2]]).expm(), Matrix([[math.e, 0], [0, math.e ** 2]]))
+
+        # A nilpotent matrix, whose exponential is a finite sum.
+        assert_matrix_almost_equal(self, Matrix([[0, 1, 2], [0, 0, 3], [0, 0, 0]]).expm(), Matrix([[1, 1, 3.5], [0, 1, 3], [0, 0, 1]]))
+
+        # The rotations, also scaled far beyond the norm of a single Padé approximant.
+        for angle in (0.1, 1.0, 20.0):
+            rotation = Matrix([[math.cos(angle), -math.sin(angle)], [math.sin(angle), math.cos(angle)]])
+            assert_matrix_almost_equal(self, Matrix([[0, -angle], [angle, 0]]).expm(), rotation)
+
+        matrix = Matrix([[1, 2], [0.5, -1]])
+        assert_matrix_almost_equal(self, matrix.expm() @ (matrix * -1).expm(), Matrix([[1, 0], [0, 1]]))
+
+        with self.assertRaises(MatrixNotSquare):
+            Matrix([[1, 2, 3], [4, 5, 6]]).expm()
+
+
+class IterativeSolverTests(unittest.TestCase):
+    """Tests for the iterative solvers, against the direct LU solve."""
+    def setUp(self) -> None:
+        size = 12
+        self.matrix = Matrix([
+            [4 if row == col else -1 if abs(row - col) == 1 else 0 for col in range(size)] for row in range(size)
+        ])
+        self.rhs = Vector([float(index % 5) for index in range(size)])
+        self.expected = self.matrix.solve(self.rhs)
+
+    def assert_solves(self, solution: Solution, expected: Vector) -> None:
+        self.assertTrue(solution.converged)
+        for value, expected_value in zip(solution.x, expected):
+            self.assertAlmostEqual(value, expected_value, places=6)
+
+    def test_solvers(self) -> None:
+        sparse = SparseMatrix.from_dense(self.matrix)
+        operator = LinearOperator(self.matrix.rows, lambda x: sparse @ x)
+
+        for solver in (conjugate_gradient, jacobi, gauss_seidel, gmres):
+            for system in (self.matrix, sparse):
+                self.assert_solves(solver(system, self.rhs), self.expected)
+
+        for solver in (conjugate_gradient, gmres):
+            self.assert_solves(solver(operator, self.rhs), self.expected)
+            self.assert_solves(solver(sparse, self.rhs, preconditioner=jacobi_preconditioner(sparse)), self.expected)
+
+        self.assert_solves(gmres(self.matrix, self.rhs, restart=3), self.expected)
+
+    def test_nonsymmetric(self) -> None:
+        matrix = Matrix([[4, 1, 0], [-2, 5, 1], [1, -1, 3]])
+        rhs = Vector(1.0, 2.0, 3.0)
+
+        self.assert_solves(gmres(matrix, rhs), matrix.solve(rhs))
+        self.assert_solves(gauss_seidel(matrix, rhs), matrix.solve(rhs))
+
+    def test_controls(self) -> None:
+        residuals = []
+        solution = jacobi(self.matrix, self.rhs, max_iterations=3, callback=lambda _, residual: residuals.append(residual))
+        self.assertFalse(solution.converged)
+        self.assertEqual(solution.iterations, 3)
+        self.assertEqual(len(residuals), 3)
+        self.assertEqual(residuals, sorted(residuals, reverse=True))
+
+        warm = conjugate_gradient(self.matrix, self.rhs, x0=self.expected)
+        self.assertEqual(warm.iterations, 0)
+
+    def true_residual(self, x: Vector) -> float:
+        return math.sqrt(sum((b - sum(value * point for value, point in zip(row, x))) ** 2 for row, b in zip(self.matrix, self.rhs)))
+
+    def test_gauss_seidel_residuals(self) -> None:
+        # The residuals measured during the sweeps are estimates, the exact one is computed to confirm the convergence.
+        residuals = []
+        solution = gauss_seidel(self.matrix, self.rhs, tol=1e-10, callback=lambda _, residual: residuals.append(residual))
+        self.assertTrue(solution.converged)
+        self.assertAlmostEqual(solution.residual, self.true_residual(solution.x), places=12)
+        self.assertLessEqual(solution.residual, 1e-10 * math.sqrt(sum(b * b for b in self.rhs)))
+        self.assertEqual(residuals[-1], solution.residual)
+
+        # The last iteration computes the exact residual too, even without converging.
+        residuals = []
+        solution = gauss_seidel(self.matrix, self.rhs, max_iterations=3, callback=lambda _, residual: residuals.append(residual))
+        self.assertFalse(solution.converged)
+        self.assertAlmostEqual(solution.residual, self.true_residual(solution.x), places=12)
+        self.assertEqual(residuals[-1], solution.residual)
+        self.assertGreater(residuals[-2], residuals[-1])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(MatrixNotSquare):
+            conjugate_gradient(Matrix([[1, 2, 3], [4, 5, 6]]), Vector(1, 2))
+
+        with self.assertRaises(VectorDimensionError):
+            gmres(self.matrix, Vector(1, 2))
+
+        with self.assertRaises(ValueError):
+            jacobi(Matrix([[0, 1], [1, 0]]), Vector(1, 2))
+
+        with self.assertRaises(ValueError):
+            conjugate_gradient(Matrix([[-1, 0], [0, -1]]), Vector(1, 2))
+
+        with self.assertRaises(TypeError):
+            gauss_seidel(LinearOperator(2, lambda x: x), Vector(1, 2))
+
+
+class EigenTests(unittest.TestCase):
+    """Tests for the dense eigensolvers, and the iterative ones only finding the leading eigenpairs."""
+    def assert_eigenpairs(self, matrix: Matrix, values: list, vectors: Matrix) -> None:
+        for col, value in enumerate(values):
+            vector = vectors[:, col]
+            assert_matrix_almost_equal(self, matrix @ vector, vector * value)
+
+    def test_symmetric(self) -> None:
+        matrix = Matrix([[4, 1, 2], [1, 3, 0], [2, 0, 5]])
+        values, vectors = matrix.eig()
+
+        self.assertEqual(values, sorted(values, key=abs, reverse=True))
+        self.assertAlmostEqual(sum(values), matrix.trace())
+        self.assert_eigenpairs(matrix, values, vectors)
+        assert_matrix_almost_equal(self, vectors.transpose() @ vectors, Matrix([[1, 0, 0], [0, 1, 0], [0, 0, 1]]))
+
+    def test_nonsymmetric(self) -> None:
+        matrix = Matrix([[2, 1, 0], [1, 3, 1], [0, 2, 4]])
+        values, vectors = matrix.eig()
+
+        for value, expected in zip(values, eigvals(matrix)):
+            self.assertAlmostEqual(value, expected)
+        self.assert_eigenpairs(matrix, values, vectors)
+
+        rotation = Matrix([[0, -1], [1, 0]]).eigvals()
+        self.assertAlmostEqual(rotation[0], 1j)
+        self.assertAlmostEqual(rotation[1], -1j)
+
+        with self.assertRaises(ValueError):
+            Matrix([[0, -1], [1, 0]]).eig()
+
+        with self.assertRaisesRegex(MatrixNotSquare, "eigenvalues"):
+            Matrix([[1, 2, 3], [4, 5, 6]]).eigvals()
+
+    def test_top_k(self) -> None:
+        size = 40
+        matrix = Matrix([
+            [(10 - row if row < 3 else 1) if row == col else 0.1 / (1 + abs(row - col)) for col in range(size)]
+            for row in range(size)
+        ])
+        expected = matrix.eigvals()[:2]
+
+        for system in (matrix, SparseMatrix.from_dense(matrix)):
+            values, vectors = top_k_eigen(system, 2)
+            for value, expected_value in zip(values, expected):
+                self.assertAlmostEqual(value, expected_value, places=6)
+            self.assertEqual(vectors.dims, (size, 2))
+
+        sparse = SparseMatrix.from_dense(matrix)
+        for symmetric in (True, False):
+            values, _ = top_k_eigen(LinearOperator(size, lambda x: sparse @ x), 2, symmetric=symmetric)
+            self.assertAlmostEqual(values[0], expected[0], places=6)
+
+        with self.assertRaises(ValueError):
+            matrix.top_k_eigen(0)
@@ -0,0 +1,103 @@
+import copy
+import os
+import pickle
+import tempfile
+import unittest
+
+from hypemaths import MappedMatrix, Matrix, settings
+
+
+class MappedMatrixTests(unittest.TestCase):
+    """Tests for the matrices memory-mapped over files, and their out-of-core operations."""
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        self.mapped = MappedMatrix.from_matrix(self.matrix, self.path("matrix.bin"))
+
+    def tearDown(self) -> None:
+        self.mapped.close()
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def test_access(self) -> None:
+        self.assertEqual(self.mapped, self.matrix)
+        self.assertEqual(self.mapped[1], [4, 5, 6])
+        self.assertEqual(self.mapped[0, 2], 3)
+        self.assertEqual(self.mapped[:, 1:], self.matrix[:, 1:])
+        self.assertIs(type(self.mapped + self.mapped), Matrix)
+
+        self.mapped[0, 0] = 10
+        self.mapped.flush()
+        with MappedMatrix(self.path("matrix.bin"), (2, 3), "q") as reopened:
+            self.assertEqual(reopened[0], [10, 2, 3])
+            self.assertEqual(pickle.loads(pickle.dumps(reopened)), reopened)
+
+            with self.assertRaises(TypeError):
+                reopened[0, 0] = 1
+
+        with MappedMatrix(self.path("matrix.bin"), (1, 3), "q", offset=24) as second_row:
+            self.assertEqual(second_row, Matrix([[4, 5, 6]]))
+
+    def test_copy(self) -> None:
+        for copied in (copy.copy(self.mapped), copy.deepcopy(self.mapped), self.mapped.deepcopy()):
+            self.assertIs(type(copied), Matrix)
+            copied[0, 0] = 99
+            self.assertEqual(self.mapped[0, 0], 1)
+
+        with MappedMatrix(self.path("matrix.bin"), (2, 3), "q") as read_only:
+            copied = copy.deepcopy(read_only)
+            self.assertIsInstance(copied, MappedMatrix)
+            self.assertEqual(copied, self.matrix)
+            copied.close()
+
+    def test_invalid_mapping(self) -> None:
+        with self.assertRaises(ValueError):
+            MappedMatrix(self.path("matrix.bin"), (3, 3), "q")
+
+        with self.assertRaises(ValueError):
+            MappedMatrix(self.path("matrix.bin"), (2, 3), "q", mode="w")
+
+        with self.assertRaises(TypeError):
+            self.mapped[0, 0] = 1.5
+
+    def test_tiled_operations(self) -> None:
+        other = Matrix([[1, 2], [3, 4], [5, 6]])
+
+        with settings.override(tile_size=4):
+            self.assertEqual(self.mapped @ other, self.matrix @ other)
+            self.assertEqual(self.mapped.transpose() @ self.mapped, self.matrix.transpose() @ self.matrix)
+            self.assertEqual(self.mapped.sum(), 21)
+            self.assertEqual(self.mapped.sum(0), self.matrix.sum(0))
+            self.assertEqual(self.mapped.sum(1), self.matrix.sum(1))
+            self.assertAlmostEqual(self.mapped.frobenius_norm(), self.matrix.frobenius_norm())
+
+            product = self.mapped.matmul(other, out=MappedMatrix.create(self.path("product.bin"), (2, 2), "q"))
+            self.assertEqual(product, self.matrix @ other)
+
+            transposed = self.mapped.transpose(out=MappedMatrix.create(self.path("transposed.bin"), (3, 2), "q"))
+            self.assertEqual(transposed, self.matrix.transpose())
+
+        product.close()
+        transposed.close()
+
+    def test_create(self) -> None:
+        with MappedMatrix.create(self.path("filled.bin"), (3, 2), fill=0.5) as filled:
+            self.assertEqual(filled, Matrix.get_filled_matrix((3, 2), 0.5))
+            self.assertEqual(os.path.getsize(filled.path), 3 * 2 * 8)
+
+        # The arguments are checked before the existing file is overwritten.
+        with self.assertRaises(TypeError):
+            MappedMatrix.create(self.path("matrix.bin"), (2, 3), "q", fill=0.5)
+        with self.assertRaises(ValueError):
+            MappedMatrix.create(self.path("matrix.bin"), (2, 3), "f")
+        with self.assertRaises(TypeError):
+            MappedMatrix.create(self.path("missing.bin"), (2, 3), fill="1")
+
+        self.assertEqual(os.path.getsize(self.path("matrix.bin")), 2 * 3 * 8)
+        self.assertFalse(os.path.exists(self.path("missing.bin")))
+
+
+if __name__ == "__main__":
+    unittest.main()
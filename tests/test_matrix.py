@@ -1,6 +1,12 @@
+import os
+import pickle
+import sys
+import tempfile
 import unittest
+from array import array
 
-from hypemaths import Matrix
+from hypemaths import Matrix, settings
+from hypemaths.core.matmul import BLOCKED, NAIVE, STRASSEN, select_algorithm, strassen_matmul
 from hypemaths.exceptions import (
     InvalidMatrixError,
     MatrixDimensionError
@@ -30,6 +36,31 @@ class ValidMatrixTests(unittest.TestCase):
             with self.assertRaises((TypeError, InvalidMatrixError)):
                 Matrix(test)
 
+    def test_validation_levels(self) -> None:
+        with settings.override(validation="shape"):
+            self.assertEqual(Matrix([[1, 2.5], [3, 4]]).matrix, [[1, 2.5], [3, 4]])
+
+            with self.assertRaises(InvalidMatrixError):
+                Matrix([[1, 2], [3]])
+
+            with self.assertRaises(TypeError):
+                Matrix([["a", "b"], ["c", "d"]])
+
+        with settings.override(validation="off"):
+            self.assertEqual(Matrix([[1, 2], [3, 4]]).matrix, [[1, 2], [3, 4]])
+            self.assertEqual(Matrix([1, 2]).matrix, [[1, 2]])
+
+        with settings.override(validation="lenient"), self.assertRaises(ValueError):
+            Matrix([[1, 2], [3, 4]])
+
+    def test_trusted_results(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        with settings.override(validation="lenient"):
+            self.assertEqual(Matrix.get_filled_matrix((2, 2), 1).matrix, [[1, 1], [1, 1]])
+            self.assertEqual(matrix.flatten().points, [1, 2, 3, 4])
+            self.assertEqual((matrix + matrix).matrix, [[2, 4], [6, 8]])
+
 
 class MatrixAttributesTests(unittest.TestCase):
     """Tests for checking the attributes when a Matrix is created."""
@@ -168,3 +199,293 @@ class MatrixMethodTests(unittest.TestCase):
 
         for matrix, diagonal_sum in test_cases:
             self.assertEqual(matrix.trace(), diagonal_sum)
+
+
+class MatrixStorageTests(unittest.TestCase):
+    """Tests for the flat buffer backing the Matrix."""
+    def test_matrix_typecode(self) -> None:
+        test_cases = (
+            (Matrix([[1, 2], [3, 4]]), "q"),
+            (Matrix([[1.5, 2], [3, 4]]), "d"),
+            (Matrix([[1, 2], [3, 4]]) / 2, "d"),
+            (Matrix([[1, 2], [3, 4]]) * 2, "q")
+        )
+
+        for matrix, typecode in test_cases:
+            self.assertEqual(matrix.typecode, typecode)
+
+        with self.assertRaises(OverflowError):
+            Matrix([[2 ** 70 + 1, 1]])
+        self.assertEqual(Matrix([[float(2 ** 70), 1]]).typecode, "d")
+
+    def test_matrix_strides(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+
+        self.assertEqual(matrix.strides, (3, 1))
+        self.assertEqual(matrix[1, 0], 4)
+        self.assertEqual(matrix[-1, -1], 6)
+        self.assertEqual(matrix[1], [4, 5, 6])
+
+        # The rows write into the buffer.
+        matrix[1][0] = 0
+        matrix.matrix[0][-1] = 7
+        self.assertEqual(matrix, Matrix([[1, 2, 7], [0, 5, 6]]))
+        self.assertEqual([list(row) for row in matrix], [[1, 2, 7], [0, 5, 6]])
+        self.assertEqual(Matrix(matrix.matrix), matrix)
+
+    def test_matrix_setitem_upcast(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        matrix[0, 1] = 2.5
+
+        self.assertEqual(matrix.typecode, "d")
+        self.assertEqual(matrix.matrix, [[1, 2.5], [3, 4]])
+
+
+class MatrixMultiplicationKernelTests(unittest.TestCase):
+    """Tests for checking the blocked and Strassen kernels against the plain one."""
+    def test_kernels_agree(self) -> None:
+        test_cases = (
+            ((5, 7), (7, 3)),
+            ((8, 8), (8, 8)),
+            ((9, 4), (4, 11))
+        )
+
+        for dims_a, dims_b in test_cases:
+            matrix_a = Matrix.get_randomized_matrix(dims_a, -10, 10, seed=1, round_digits=None)
+            matrix_b = Matrix.get_randomized_matrix(dims_b, -10, 10, seed=2, round_digits=None)
+            expected = matrix_a * matrix_b
+
+            with settings.override(blocked_threshold=1, matmul_block_size=2):
+                self.assertEqual(matrix_a * matrix_b, expected)
+
+            with settings.override(strassen_threshold=2, matmul_block_size=2):
+                self.assertEqual(matrix_a * matrix_b, expected)
+
+            # Strassen is not picked for the rectangular products, so it is checked directly on them.
+            n, m, p = dims_a + dims_b[1:]
+            product = strassen_matmul(matrix_a._values(), matrix_b._values(), n, m, p, threshold=2, block_size=2)
+            self.assertEqual(Matrix._from_flat(array("d", product), (n, p)), expected)
+
+    def test_algorithm_selection(self) -> None:
+        with settings.override(blocked_threshold=8, strassen_threshold=16):
+            self.assertEqual(select_algorithm(4, 4, 4), NAIVE)
+            self.assertEqual(select_algorithm(8, 12, 8), BLOCKED)
+            self.assertEqual(select_algorithm(32, 32, 32), STRASSEN)
+            self.assertEqual(select_algorithm(16, 24, 32), STRASSEN)
+            # A rectangular product would be padded into a much larger square.
+            self.assertEqual(select_algorithm(16, 1024, 16), BLOCKED)
+            self.assertEqual(select_algorithm(1024, 16, 1024), BLOCKED)
+
+
+class MatrixViewTests(unittest.TestCase):
+    """Tests for the views sharing the buffer of a Matrix."""
+    def test_matrix_slicing(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        test_cases = (
+            (matrix[1:], Matrix([[4, 5, 6], [7, 8, 9]])),
+            (matrix[:, 1], Matrix([[2], [5], [8]])),
+            (matrix[0, :], Matrix([[1, 2, 3]])),
+            (matrix[::2, 1:], Matrix([[2, 3], [8, 9]])),
+            (matrix[::-1, ::-1], Matrix([[9, 8, 7], [6, 5, 4], [3, 2, 1]]))
+        )
+
+        for view, output_matrix in test_cases:
+            self.assertIs(view.base, matrix)
+            self.assertEqual(view, output_matrix)
+
+    def test_views_share_buffer(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        transposed = matrix.transpose()
+        column = matrix[:, 1]
+
+        column[1, 0] = 10
+        self.assertEqual(transposed, Matrix([[1, 3], [2, 10]]))
+
+        transposed[0, 1] = 2.5
+        self.assertEqual(matrix, Matrix([[1, 2], [2.5, 10]]))
+        self.assertEqual(column.typecode, "d")
+
+    def test_operations_on_views(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+        transposed = matrix.transpose()
+
+        self.assertEqual(transposed + transposed, Matrix([[2, 8], [4, 10], [6, 12]]))
+        self.assertEqual(matrix * transposed, Matrix([[14, 32], [32, 77]]))
+        self.assertEqual(transposed.sum(0), Matrix([[6.0, 15.0]]))
+        self.assertEqual(matrix[:, :2].trace(), 6)
+
+    def test_materialize(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        materialized = matrix.transpose().materialize()
+
+        self.assertIsNone(materialized.base)
+        self.assertTrue(materialized.is_contiguous)
+        self.assertIs(matrix.materialize(), matrix)
+
+        materialized[0, 0] = 5
+        self.assertEqual(matrix[0, 0], 1)
+
+
+class MatrixInPlaceTests(unittest.TestCase):
+    """Tests for the in-place operators, and the destinations of the named operations."""
+    def test_inplace_operators(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        storage = matrix._storage
+        original = matrix
+
+        matrix += Matrix([[1, 1], [1, 1]])
+        matrix -= Matrix([[0, 1], [0, 1]])
+        matrix *= 2
+        matrix @= Matrix([[0, 1], [1, 0]])
+        matrix /= 2
+
+        self.assertIs(matrix, original)
+        self.assertIs(matrix._storage, storage)
+        self.assertEqual(matrix, Matrix([[2, 2], [4, 4]]))
+        self.assertEqual(matrix.typecode, "d")
+
+    def test_inplace_on_view(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        column = matrix[:, 0]
+        column *= 10
+
+        self.assertEqual(matrix, Matrix([[10, 2], [30, 4]]))
+
+    def test_out_parameter(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        out = Matrix.get_filled_matrix((2, 2), 0)
+
+        self.assertIs(matrix.add(matrix, out=out), out)
+        self.assertEqual(out, Matrix([[2, 4], [6, 8]]))
+
+        matrix.matmul(matrix, out=out)
+        self.assertEqual(out, Matrix([[7, 10], [15, 22]]))
+
+        matrix.transpose(out=out)
+        self.assertEqual(out, Matrix([[1, 3], [2, 4]]))
+        self.assertIsNone(out.base)
+
+        matrix.matmul(matrix, out=matrix)
+        self.assertEqual(matrix, Matrix([[7, 10], [15, 22]]))
+
+    def test_out_dimensions(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+
+        with self.assertRaises(MatrixDimensionError):
+            matrix.add(matrix, out=Matrix([[0, 0], [0, 0]]))
+
+        with self.assertRaises(MatrixDimensionError):
+            matrix.transpose(out=Matrix([[0, 0, 0], [0, 0, 0]]))
+
+        with self.assertRaises(MatrixDimensionError):
+            matrix *= Matrix([[1, 2], [3, 4], [5, 6]])
+
+
+class MatrixSerializationTests(unittest.TestCase):
+    """Tests for saving and loading matrices in the binary format."""
+    def test_bytes_round_trip(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+
+        self.assertEqual(Matrix.frombytes(matrix.tobytes()), matrix)
+        self.assertEqual(Matrix.frombytes(matrix.transpose().tobytes()), matrix.transpose())
+        self.assertEqual(pickle.loads(pickle.dumps(matrix * 0.5)), matrix * 0.5)
+
+        with self.assertRaises(ValueError):
+            Matrix.frombytes(b"not a matrix")
+
+    def test_frombuffer_shares_memory(self) -> None:
+        buffer = bytearray(Matrix([[1.5, 2.5], [3.5, 4.5]]).tobytes())
+        matrix = Matrix.frombuffer(buffer)
+
+        matrix[0, 0] = 10.0
+        self.assertEqual(Matrix.frombytes(buffer)[0], [10.0, 2.5])
+
+    def test_save_and_load(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matrix.hm")
+            matrix.save(path)
+
+            self.assertEqual(Matrix.load(path), matrix)
+
+            mapped = Matrix.load(path, mmap_mode="r")
+            self.assertEqual(mapped, matrix)
+            mapped.close()
+
+
+class MatrixBufferTests(unittest.TestCase):
+    """Tests for exporting the memory of matrices, and wrapping buffers into matrices."""
+    def test_export(self) -> None:
+        matrix = Matrix([[1, 2, 3], [4, 5, 6]])
+
+        self.assertEqual(matrix.data.tolist(), matrix.matrix)
+        self.assertEqual(matrix[:, 1:].data.tolist(), [[2, 3], [5, 6]])
+        self.assertTrue(matrix[:, 1:].data.readonly)
+
+        if sys.version_info >= (3, 12):
+            self.assertEqual(memoryview(matrix).shape, (2, 3))
+
+    def test_frombuffer(self) -> None:
+        values = array("d", [1.0, 2.0, 3.0, 4.0])
+        matrix = Matrix.frombuffer(values, shape=(2, 2))
+
+        matrix[0, 1] = 5.0
+        self.assertEqual(values[1], 5.0)
+        self.assertEqual(Matrix.frombuffer(bytes(16), shape=(1, 2), typecode="q"), Matrix([[0, 0]]))
+        self.assertEqual(Matrix.frombuffer(memoryview(values).cast("B").cast("d", [1, 4])).dims, (1, 4))
+
+        with self.assertRaises(ValueError):
+            Matrix.frombuffer(values, shape=(3, 2))
+
+        with self.assertRaises(TypeError):
+            Matrix.frombuffer(array("i", [1, 2]), shape=(1, 2))
+
+
+class MatrixCacheTests(unittest.TestCase):
+    """Tests for the results derived from the values of a matrix, cached until it is modified."""
+    def test_hits_and_misses(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        for _ in range(3):
+            self.assertEqual(matrix.trace(), 5)
+            self.assertEqual(matrix.sum(), 10)
+
+        info = matrix.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (4, 2, 2))
+        self.assertAlmostEqual(info.hit_rate, 4 / 6)
+
+        matrix.cache_clear()
+        self.assertEqual(matrix.cache_info().misses, 0)
+
+    def test_invalidation(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+        self.assertEqual(matrix.trace(), 5)
+        self.assertAlmostEqual(matrix.determinant(), -2)
+
+        matrix[0, 0] = 2
+        self.assertEqual(matrix.cache_info().currsize, 0)
+        self.assertEqual(matrix.trace(), 6)
+
+        matrix += Matrix([[1, 1], [1, 1]])
+        self.assertEqual(matrix.trace(), 8)
+        self.assertAlmostEqual(matrix.determinant(), 3)
+
+        # A write through a view invalidates the results of the matrix it views.
+        matrix[1:, 1:][0, 0] = 0
+        self.assertEqual(matrix.trace(), 3)
+
+        Matrix([[1, 0], [0, 1]]).matmul(Matrix([[4, 0], [0, 4]]), out=matrix)
+        self.assertEqual(matrix.sum(), 8)
+
+    def test_buffer_not_cached(self) -> None:
+        values = array("d", [1, 2, 3, 4])
+        matrix = Matrix.frombuffer(values, shape=(2, 2))
+        self.assertAlmostEqual(matrix.determinant(), -2)
+        self.assertEqual(matrix.sum(), 10)
+
+        # The buffer is written without the matrix knowing, so nothing is cached.
+        values[0] = 100.0
+        self.assertAlmostEqual(matrix.determinant(), 394)
+        self.assertEqual(matrix.sum(), 109)
+        self.assertEqual(matrix.cache_info().misses, 0)
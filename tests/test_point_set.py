@@ -0,0 +1,54 @@
+import math
+import random
+import unittest
+
+from hypemaths import Point, PointSet
+
+
+class PointSetTests(unittest.TestCase):
+    """Tests for checking the queries of the k-d tree against a brute force search."""
+    def setUp(self) -> None:
+        generator = random.Random(42)
+        self.points = [(generator.uniform(-50, 50), generator.uniform(-50, 50)) for _ in range(500)]
+        self.point_set = PointSet(self.points, leaf_size=4)
+
+    def test_nearest(self) -> None:
+        for query in ((0, 0), (49.5, -49.5), (12.25, 7)):
+            expected = sorted(range(len(self.points)), key=lambda index: math.dist(query, self.points[index]))[:5]
+            self.assertEqual([index for index, _ in self.point_set.nearest(query, k=5)], expected)
+
+        index, distance = self.point_set.nearest(self.points[7])[0]
+        self.assertEqual((index, distance), (7, 0))
+
+    def test_range_queries(self) -> None:
+        self.assertEqual(
+            self.point_set.within_radius((10, -10), 15),
+            [index for index, point in enumerate(self.points) if math.dist((10, -10), point) <= 15]
+        )
+        self.assertEqual(
+            self.point_set.within_box((-20, 0), (5, 30)),
+            [index for index, (x, y) in enumerate(self.points) if -20 <= x <= 5 and 0 <= y <= 30]
+        )
+
+    def test_points_and_duplicates(self) -> None:
+        point_set = PointSet([Point(1, 1)] * 20 + [Point(3, 4), (0, 0)], leaf_size=2)
+
+        self.assertEqual(point_set[20], (3, 4))
+        self.assertEqual(len(point_set.within_radius(Point(1, 1), 0)), 20)
+        (first, first_distance), (second, second_distance) = point_set.nearest((0, 0), k=2)
+        self.assertEqual((first, first_distance), (21, 0))
+        self.assertLess(second, 20)
+        self.assertAlmostEqual(second_distance, math.sqrt(2))
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            PointSet([])
+
+        with self.assertRaises(ValueError):
+            PointSet([(1, 2), (1, 2, 3)])
+
+        with self.assertRaises(TypeError):
+            PointSet([(1, "2")])
+
+        with self.assertRaises(ValueError):
+            self.point_set.nearest((1, 2, 3))
@@ -0,0 +1,57 @@
+import json
+import os
+import tempfile
+import unittest
+
+import hypemaths as hm
+from hypemaths import Matrix, Vector
+
+
+class ProfileTests(unittest.TestCase):
+    """Tests for recording the operations run inside a profile block."""
+    def test_counters(self) -> None:
+        matrix = Matrix([[1, 2], [3, 4]])
+
+        with hm.profile() as profiled:
+            product = matrix @ matrix
+            product += matrix
+            Vector(1, 2, 3) @ Vector(4, 5, 6)
+
+        self.assertEqual(product, Matrix([[8, 12], [18, 26]]))
+        self.assertEqual(set(profiled.stats), {"Matrix.__matmul__", "Matrix.__iadd__", "Vector.__matmul__"})
+
+        matmul = profiled.stats["Matrix.__matmul__"]
+        self.assertEqual((matmul.calls, matmul.elements, matmul.flops, matmul.bytes), (1, 4, 16, 32))
+        self.assertEqual(profiled.stats["Matrix.__iadd__"].bytes, 0)
+        self.assertIn("Matrix.__matmul__", profiled.table())
+
+    def test_restored_on_exit(self) -> None:
+        add = Matrix.__add__
+
+        with hm.profile() as outer:
+            self.assertIsNot(Matrix.__add__, add)
+            with hm.profile(trace=False) as inner:
+                Matrix([[1]]) + Matrix([[2]])
+
+        self.assertIs(Matrix.__add__, add)
+        self.assertEqual(outer.stats["Matrix.__add__"].calls, inner.stats["Matrix.__add__"].calls)
+
+        Matrix([[1]]) + Matrix([[2]])
+        self.assertEqual(outer.stats["Matrix.__add__"].calls, 1)
+
+    def test_trace_events(self) -> None:
+        with hm.profile() as profiled:
+            Matrix([[1, 2]]).transpose()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            profiled.save_trace(path)
+            with open(path) as file:
+                event, = json.load(file)["traceEvents"]
+
+        self.assertEqual((event["name"], event["ph"]), ("Matrix.transpose", "X"))
+        self.assertEqual(event["args"]["bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
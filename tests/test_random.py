@@ -0,0 +1,69 @@
+import random
+import statistics
+import unittest
+
+from hypemaths import Matrix
+from hypemaths.random import Generator, SeedSequence
+
+
+class GeneratorTests(unittest.TestCase):
+    """Tests for the reproducible random generators, and their independent streams."""
+    def test_reproducible(self) -> None:
+        self.assertEqual(Generator(7).uniform((3, 4), -1, 1), Generator(7).uniform((3, 4), -1, 1))
+        self.assertNotEqual(Generator(7).uniform((3, 4)), Generator(8).uniform((3, 4)))
+        self.assertEqual(Generator(random.Random(3)).normal((2, 2)), Generator(random.Random(3)).normal((2, 2)))
+
+        state = random.getstate()
+        Generator(1).integers((4, 4), 0, 10)
+        Matrix.get_randomized_matrix((2, 2), 1, 10, seed=1)
+        self.assertEqual(random.getstate(), state)
+
+    def test_spawn(self) -> None:
+        first, second = Generator(SeedSequence(5)).spawn(2)
+        self.assertNotEqual(first.uniform((2, 2)), second.uniform((2, 2)))
+        self.assertEqual(first.seed_sequence.spawn_key, (0,))
+
+        generator = Generator(5)
+        self.assertEqual(generator.spawn(1)[0].seed_sequence.spawn_key, (0,))
+        self.assertEqual(generator.spawn(1)[0].seed_sequence.spawn_key, (1,))
+
+        serial = Generator(11).matrices(6, (3, 3), "normal", std=2)
+        self.assertEqual(Generator(11).matrices(6, (3, 3), "normal", workers=2, std=2), serial)
+
+    def test_distributions(self) -> None:
+        generator = Generator(0)
+
+        values = generator.uniform((50, 50), 2, 3).flatten().points
+        self.assertTrue(all(2 <= value < 3 for value in values))
+
+        values = generator.normal((50, 50), 10, 2).flatten().points
+        self.assertAlmostEqual(statistics.mean(values), 10, delta=0.2)
+        self.assertAlmostEqual(statistics.stdev(values), 2, delta=0.2)
+
+        integers = generator.integers((20, 20), -3, 3)
+        self.assertEqual(integers.typecode, "q")
+        self.assertEqual(set(integers.flatten().points), set(range(-3, 3)))
+
+        sparse = generator.sparse((20, 10), 0.25, 1, 2)
+        self.assertEqual(sparse.nnz, 50)
+
+        out = Matrix.get_filled_matrix((2, 3), 0)
+        self.assertIs(generator.uniform((2, 3), out=out), out)
+        self.assertEqual(out.typecode, "d")
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(TypeError):
+            Generator("seed")
+
+        with self.assertRaises(ValueError):
+            Generator(0).integers((2, 2), 3, 3)
+
+        with self.assertRaises(ValueError):
+            Generator(0).sparse((2, 2), 1.5)
+
+        with self.assertRaises(ValueError):
+            Generator(0).matrices(2, (2, 2), "poisson")
+
+
+if __name__ == "__main__":
+    unittest.main()
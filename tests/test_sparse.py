@@ -0,0 +1,89 @@
+import unittest
+
+from hypemaths import Matrix, SparseMatrix, Vector
+from hypemaths.exceptions import MatrixDimensionError, VectorDimensionError
+
+
+class SparseMatrixConstructionTests(unittest.TestCase):
+    """Tests for building sparse matrices and converting them from and to dense ones."""
+    def test_coo_construction(self) -> None:
+        matrix = SparseMatrix((3, 4), [(2, 1, 5), (0, 3, 1.5), (2, 1, 2), (1, 0, 0)])
+
+        self.assertEqual(matrix.nnz, 2)
+        self.assertEqual(matrix.to_coo(), [(0, 3, 1.5), (2, 1, 7.0)])
+        self.assertEqual(matrix[2, 1], 7)
+        self.assertEqual(matrix[1, 1], 0)
+        self.assertEqual(matrix[-1], [0, 7, 0, 0])
+        self.assertEqual(SparseMatrix.from_coo((3, 4), [0, 2], [3, 1], [1.5, 7]), matrix)
+
+    def test_invalid_construction(self) -> None:
+        with self.assertRaises(IndexError):
+            SparseMatrix((2, 2), [(2, 0, 1)])
+
+        with self.assertRaises(TypeError):
+            SparseMatrix((2, 2), [(0, 0, "1")])
+
+        with self.assertRaises(ValueError):
+            SparseMatrix((0, 2))
+
+    def test_dense_conversion(self) -> None:
+        dense = Matrix([[0, 2, 0], [0, 0, 0], [3, 0, 4]])
+        sparse = SparseMatrix.from_dense(dense)
+
+        self.assertEqual(sparse.nnz, 3)
+        self.assertEqual(sparse.to_dense(), dense)
+        self.assertEqual(SparseMatrix.from_dense(dense.transpose()), sparse.transpose())
+        self.assertEqual(sparse.transpose().transpose(), sparse)
+
+
+class SparseMatrixOperationTests(unittest.TestCase):
+    """Tests for checking the operations of sparse matrices against their dense counterparts."""
+    def setUp(self) -> None:
+        self.first = Matrix([[1, 0, 0], [0, 0, 2], [0, 3, 0]])
+        self.second = Matrix([[0, 4, 0], [0, 0, 0], [5, 0, 6]])
+        self.sparse_first = SparseMatrix.from_dense(self.first)
+        self.sparse_second = SparseMatrix.from_dense(self.second)
+
+    def test_sparse_sparse(self) -> None:
+        self.assertEqual((self.sparse_first + self.sparse_second).to_dense(), self.first + self.second)
+        self.assertEqual((self.sparse_first - self.sparse_first).nnz, 0)
+        self.assertEqual((self.sparse_first @ self.sparse_second).to_dense(), self.first @ self.second)
+        self.assertEqual((self.sparse_first * 0.5).to_dense(), self.first * 0.5)
+        self.assertEqual((self.sparse_first * 0).nnz, 0)
+
+    def test_sparse_dense(self) -> None:
+        self.assertEqual(self.sparse_first + self.second, self.first + self.second)
+        self.assertEqual(self.sparse_first - self.second, self.first - self.second)
+        self.assertEqual(self.second - self.sparse_first, self.second - self.first)
+        self.assertEqual(self.sparse_first @ self.second, self.first @ self.second)
+        self.assertEqual(self.second @ self.sparse_first, self.second @ self.first)
+
+        view = Matrix([[7, 0, 4, 1], [2, 5, 0, 3], [1, 1, 1, 1]])[:, 1:]
+        self.assertEqual(view @ self.sparse_first, view.materialize() @ self.first)
+
+    def test_sparse_vector(self) -> None:
+        vector = Vector(1, 2, 3)
+
+        self.assertEqual(self.sparse_first @ vector, Vector(1, 6, 6))
+        self.assertEqual(vector @ self.sparse_first, Vector(1, 9, 4))
+
+        with self.assertRaises(VectorDimensionError):
+            self.sparse_first @ Vector(1, 2)
+
+    def test_inplace_dense(self) -> None:
+        dense = self.second.clone()
+        original = dense
+
+        dense += self.sparse_first
+        self.assertIs(dense, original)
+        self.assertEqual(dense, self.first + self.second)
+
+        dense -= self.sparse_first * 0.5
+        self.assertEqual(dense, self.first * 0.5 + self.second)
+
+    def test_wrong_dimensions(self) -> None:
+        with self.assertRaises(MatrixDimensionError):
+            self.sparse_first + SparseMatrix((2, 3))
+
+        with self.assertRaises(MatrixDimensionError):
+            Matrix([[1, 2], [3, 4]]) @ self.sparse_first
@@ -1,8 +1,13 @@
+import copy
+import os
+import pickle
+import tempfile
 import unittest
 
-from hypemaths import Vector
+from hypemaths import Matrix, Vector, settings
 from hypemaths.exceptions import (
-    InvalidVectorError
+    InvalidVectorError,
+    VectorDimensionError
 )
 
 
@@ -18,6 +23,18 @@ class ValidVectorTests(unittest.TestCase):
         for vector, vector_values in test_cases:
             self.assertEqual(vector.points, vector_values)
 
+    def test_coordinates(self) -> None:
+        vector = Vector(1, 2, 3)
+        vector[0] = 5
+        vector.y = 6
+
+        self.assertEqual((vector.x, vector.y, vector.z), (5, 6, 3))
+        self.assertEqual(vector.points, [5, 6, 3])
+        self.assertFalse(hasattr(vector, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            vector.w
+
     def test_invalid_vector(self) -> None:
         test_cases = (
             "test",
@@ -29,6 +46,16 @@ class ValidVectorTests(unittest.TestCase):
             with self.assertRaises((TypeError, InvalidVectorError)):
                 Vector(test)
 
+    def test_validation_levels(self) -> None:
+        with settings.override(validation="off"):
+            self.assertEqual(Vector(1, 2.5, 3).points, [1, 2.5, 3])
+
+        with settings.override(validation="lenient"):
+            with self.assertRaises(ValueError):
+                Vector(1, 2)
+
+            self.assertEqual((Vector._from_points([1, 2]) + Vector._from_points([3, 4])).points, [4, 6])
+
 
 class VectorComparisonTests(unittest.TestCase):
     def test_vector_equality(self) -> None:
@@ -49,3 +76,60 @@ class VectorComparisonTests(unittest.TestCase):
 
         for vector_1, vector_2 in test_cases:
             self.assertEqual(vector_1, vector_2)
+
+
+class VectorInPlaceTests(unittest.TestCase):
+    def test_inplace_operators(self) -> None:
+        vector = Vector(1, 2, 3)
+        points = vector.points
+        original = vector
+
+        vector += Vector(1, 1, 1)
+        vector -= Vector(0, 1, 0)
+        vector *= Vector(2, 2, 2)
+        vector /= Vector(2, 2, 4)
+
+        self.assertIs(vector, original)
+        self.assertIs(vector.points, points)
+        self.assertEqual(vector, Vector(2, 2, 2))
+        self.assertEqual(vector.z, 2)
+
+    def test_out_parameter(self) -> None:
+        out = Vector(0, 0)
+
+        self.assertIs(Vector(1, 2).add(Vector(3, 4), out=out), out)
+        self.assertEqual(out, Vector(4, 6))
+
+        with self.assertRaises(VectorDimensionError):
+            Vector(1, 2).sub(Vector(3, 4), out=Vector(0, 0, 0))
+
+
+class VectorSerializationTests(unittest.TestCase):
+    """Tests for saving and loading vectors in the binary format."""
+    def test_round_trip(self) -> None:
+        vector = Vector(1.5, 2, 3)
+
+        self.assertEqual(Vector.frombytes(vector.tobytes()), vector)
+        self.assertEqual(pickle.loads(pickle.dumps(vector)), vector)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "vector.hm")
+            vector.save(path)
+            self.assertEqual(Vector.load(path), vector)
+
+            Matrix([[1, 2]]).save(path)
+            with self.assertRaises(ValueError):
+                Vector.load(path)
+
+    def test_lossless_copies(self) -> None:
+        for vector in (Vector(2 ** 70, 1), Vector(True, 2), Vector(1, 2.5), Vector(1, 2)):
+            for copied in (copy.copy(vector), copy.deepcopy(vector), pickle.loads(pickle.dumps(vector))):
+                self.assertEqual(copied.points, vector.points)
+                self.assertEqual(list(map(type, copied.points)), list(map(type, vector.points)))
+
+    def test_buffer(self) -> None:
+        vector = Vector(1.5, 2, 3)
+
+        self.assertEqual(vector.data.tolist(), [1.5, 2.0, 3.0])
+        self.assertEqual(Vector.frombuffer(vector.data), vector)
+        self.assertEqual(Vector.frombuffer(bytes(16), typecode="q"), Vector(0, 0))